@@ -11,7 +11,7 @@ from core.models import Board, BoardNew, Scrap, BoardFile, BoardGood
 from core.formclass import BoardForm
 from core.template import AdminTemplates
 from lib.common import (
-    dynamic_create_write_table, FileCache, get_from_list,
+    dynamic_create_write_table, get_from_list,
     safe_int_convert, select_query, set_url_query_params
 )
 from lib.dependency.board import get_board
@@ -22,7 +22,9 @@ from lib.template_functions import (
     get_editor_select, get_group_select,
     get_member_level_select, get_paging, get_skin_select,
 )
+from lib.render_cache import invalidate_latest_cache
 from service.board_file_service import BoardFileService
+from service.thumbnail_service import delete_thumbnail_manifest
 
 
 router = APIRouter()
@@ -105,7 +107,7 @@ async def board_list_update(
             db.commit()
 
             # 최신글 캐시 삭제
-            FileCache().delete_prefix(f'latest-{board.bo_table}')
+            invalidate_latest_cache(board.bo_table)
 
     url = "/admin/board_list"
     query_params = request.query_params
@@ -135,6 +137,8 @@ async def board_list_delete(
             db.execute(delete(Scrap).where(Scrap.bo_table == board.bo_table))
             # 파일 삭제
             db.execute(delete(BoardFile).where(BoardFile.bo_table == board.bo_table))
+            # 섬네일 목록 삭제
+            delete_thumbnail_manifest(db, board.bo_table)
             # 좋아요 기록 삭제
             db.execute(delete(BoardGood).where(BoardGood.bo_table == board.bo_table))
 
@@ -147,7 +151,7 @@ async def board_list_delete(
             _created_models.pop(board.bo_table, None)  # 동적 모델 캐싱 삭제
 
             # 최신글 캐시 삭제
-            FileCache().delete_prefix(f'latest-{board.bo_table}')
+            invalidate_latest_cache(board.bo_table)
 
     url = "/admin/board_list"
     query_params = request.query_params
@@ -274,7 +278,7 @@ async def board_form_update(
             db.commit()
 
     # 최신글 캐시 삭제
-    FileCache().delete_prefix(f'latest-{bo_table}')
+    invalidate_latest_cache(bo_table)
 
     url = f"/admin/board_form/{bo_table}"
     query_params = request.query_params
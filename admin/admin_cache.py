@@ -8,6 +8,8 @@ from sse_starlette import EventSourceResponse
 from core.database import db_session
 from core.template import AdminTemplates
 from lib.dependency.dependencies import validate_super_admin
+from lib.layout_cache import get_layout_cache_stats, invalidate_layout_cache
+from lib.render_cache import get_render_cache_stats, latest_cache
 
 router = APIRouter(dependencies=[Depends(validate_super_admin)])
 templates = AdminTemplates()
@@ -19,10 +21,16 @@ CACHE_MENU_KEY = "100900"
 async def cache_file_delete(request: Request, db: db_session):
     """
     캐시파일 일괄삭제 화면
+    - 렌더링/레이아웃 데이터 캐시 적중/실패 통계는 현재 워커(프로세스) 기준입니다.
     """
     request.session["menu_key"] = CACHE_MENU_KEY
 
-    return templates.TemplateResponse("cache_file_delete.html", {"request": request})
+    context = {
+        "request": request,
+        "render_cache_stats": get_render_cache_stats(),
+        "layout_cache_stats": get_layout_cache_stats(),
+    }
+    return templates.TemplateResponse("cache_file_delete.html", context)
 
 
 @router.get("/cache_file_deleting")
@@ -60,6 +68,10 @@ async def cache_file_deleting(request: Request, db: db_session):
             yield f"data: [끝]오류가 발생했습니다. {str(e)} \n\n"
             raise
 
+        # 메모리에 남아있는 렌더링/레이아웃 데이터 캐시도 무효화
+        latest_cache.clear()
+        invalidate_layout_cache()
+
         # 종료 메시지 전송
         yield f"data: 총 {count}개의 파일과 디렉토리를 삭제했습니다.\n\n"
         yield "data: [끝]\n\n"
@@ -1,4 +1,3 @@
-import asyncio
 import hashlib
 import re
 from datetime import datetime
@@ -18,12 +17,14 @@ from lib.common import get_admin_email, get_admin_email_name, select_query
 from lib.dependency.dependencies import common_search_query_params, validate_token
 from lib.mail import mailer
 from lib.template_functions import get_group_select, get_paging
+from service.mail_queue_service import enqueue_mails
 
 router = APIRouter()
 templates = AdminTemplates()
 templates.env.globals["get_group_select"] = get_group_select
 
 MAIL_MENU_KEY = "200300"
+MAIL_ENQUEUE_CHUNK_SIZE = 100  # 회원메일발송시 한번에 대기열에 등록할 메일 수
 
 
 @router.get("/mail_list")
@@ -361,9 +362,14 @@ async def mail_select_send(
     """
     회원메일발송 처리
     """
+    def _enqueue_mails(mails: list):
+        # 응답을 보내는 중에는 요청의 DB 세션이 닫혔을 수 있으므로 별도 세션을 사용
+        with db_connect.sessionLocal() as mail_db:
+            enqueue_mails(mail_db, mails)
+
     async def send_events(members: list, mail_subject: str, mail_content: str):
         count = 0
-        sleepsec = 1  # 1초 간격으로 조정
+        mails = []
         try:
             for member in members:
                 mb_name, mb_nick, mb_id, mb_email = member.split("||")
@@ -381,17 +387,26 @@ async def mail_select_send(
                 content = content.replace("{이메일}", mb_email)
                 content = content + f"<hr size=0><p><span style='font-size:10pt; font-family:돋움'>▶ 더 이상 정보 수신을 원치 않으시면 [<a href='/bbs/email_stop/{mb_id}&mb_md5={mb_md5}' target='_blank'>수신거부</a>] 해 주십시오.</span></p>"           
                 
-                # 메일 발송
-                mailer(from_mail, mb_email, subject, content, from_name)
+                # 메일 발송 대기열에 모아서 등록합니다. (SMTP 발송은 스케줄러에서 처리)
+                mails.append({
+                    "from_email": from_mail,
+                    "to_email": mb_email,
+                    "subject": subject,
+                    "body": content,
+                    "from_name": from_name,
+                    "to_name": mb_name,
+                })
                 count += 1
-
-                # 10명마다 1초씩 쉬어줍니다.
-                if count % 10 == 0:
-                    await asyncio.sleep(sleepsec)  # 비동기 sleep 사용
+                if len(mails) >= MAIL_ENQUEUE_CHUNK_SIZE:
+                    _enqueue_mails(mails)
+                    mails = []
 
                 # 발송 상태를 'yield'를 사용하여 전송합니다.
                 # 전송시 필히 data: 로 시작하고 \n\n으로 끝나야 합니다.
-                yield f"data: {count}. {mb_name}({mb_email})님께 메일을 보내고 있습니다.\n\n"
+                yield f"data: {count}. {mb_name}({mb_email})님께 보낼 메일을 등록했습니다.\n\n"
+
+            if mails:
+                _enqueue_mails(mails)
 
             # 멤버 리스트 메일발송 완료 후 함수 종료
             # 종료 메시지 전송
@@ -11,7 +11,7 @@ from bbs.social import SocialAuthService
 from core.database import db_session
 from core.exception import AlertException
 from core.formclass import AdminMemberForm
-from core.models import Auth, Board, Group, GroupMember, Member, Memo, Point, Scrap
+from core.models import Auth, Board, Group, GroupMember, Member, Memo, Scrap
 from core.template import AdminTemplates
 from lib.common import (
     get_from_list, is_none_datetime, select_query, set_url_query_params
@@ -20,6 +20,7 @@ from lib.dependency.dependencies import common_search_query_params, validate_tok
 from lib.pbkdf2 import create_hash
 from lib.template_functions import get_member_level_select, get_paging
 from service.member_service import MemberImageService
+from service.point_service import delete_member_points
 
 
 router = APIRouter()
@@ -171,8 +172,8 @@ async def member_list_delete(
             member.mb_dupinfo = ""
 
             # 나머지 테이블에서도 삭제
-            # 포인트 테이블에서 삭제
-            db.execute(delete(Point).where(Point.mb_id == member.mb_id))
+            # 포인트 테이블에서 삭제 (만료 예정 포인트 포함)
+            delete_member_points(db, member.mb_id)
 
             # 그룹접근가능 테이블에서 삭제
             db.execute(delete(GroupMember).where(GroupMember.mb_id == member.mb_id))
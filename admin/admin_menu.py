@@ -1,7 +1,6 @@
 """메뉴 관리 Template Router"""
 import re
 from typing import List
-from typing_extensions import Annotated
 
 import bleach
 from fastapi import APIRouter, Depends, Form, Query, Request
@@ -13,7 +12,7 @@ from core.exception import AlertException
 from core.models import Board, Content, Group, Menu
 from core.template import AdminTemplates
 from lib.dependency.dependencies import validate_token
-from service.menu_service import MenuService
+from lib.layout_cache import invalidate_layout_cache
 
 router = APIRouter()
 templates = AdminTemplates()
@@ -103,7 +102,6 @@ async def menu_form_search(
 @router.post("/menu_list_update", dependencies=[Depends(validate_token)])
 async def menu_list_update(
     db: db_session,
-    menu_service: Annotated[MenuService, Depends()],
     parent_code: List[str] = Form(None, alias="code[]"),
     me_name: List[str] = Form(None, alias="me_name[]"),
     me_link: List[str] = Form(None, alias="me_link[]"),
@@ -161,7 +159,7 @@ async def menu_list_update(
             db.commit()
 
         # 기존캐시 삭제
-        menu_service.fetch_menus.cache_clear()
+        invalidate_layout_cache()
 
     except Exception as e:
         db.rollback()
@@ -5,7 +5,7 @@ from typing_extensions import Annotated
 
 from fastapi import APIRouter, Depends, Request, Form
 from fastapi.responses import RedirectResponse
-from sqlalchemy import select, update, func
+from sqlalchemy import select, func
 
 from core.database import db_session
 from core.exception import AlertException
@@ -14,7 +14,6 @@ from core.template import AdminTemplates
 from lib.common import select_query, set_url_query_params
 from lib.dependency.dependencies import common_search_query_params, validate_token
 from lib.template_functions import get_paging
-from service.member_service import MemberService
 from service.point_service import PointService
 
 router = APIRouter()
@@ -106,7 +105,6 @@ async def point_update(
 async def point_list_delete(
     request: Request,
     db: db_session,
-    member_service: Annotated[MemberService, Depends()],
     service: Annotated[PointService, Depends()],
     checks: List[int] = Form(None, alias="chk[]"),
     po_id: List[int] = Form(None, alias="po_id[]"),
@@ -119,31 +117,8 @@ async def point_list_delete(
         if not point:
             continue
 
-        if point.po_point < 0:
-            abs_po_point = abs(point.po_point)
-
-            if point.po_rel_table == "@expire":
-                service.delete_expire_point(point.mb_id, abs_po_point)
-            else:
-                service.delete_use_point(point.mb_id, abs_po_point)
-        elif point.po_use_point > 0:
-            service.insert_use_point(point.mb_id, point.po_use_point, point.po_id)
-
-        # 포인트 내역 삭제
-        db.delete(point)
-        db.commit()
-
-        # po_mb_point에 반영
-        db.execute(
-            update(Point)
-            .values(po_mb_point=Point.po_mb_point - point.po_point)
-            .where(Point.mb_id == point.mb_id, Point.po_id > point.po_id)
-        )
-        db.commit()
-
-        # 회원 포인트 갱신
-        sum_point = service.get_total_point(point.mb_id)
-        member_service.update_member_point(point.mb_id, sum_point)
+        # 포인트 내역 삭제 (po_mb_point, 회원 포인트 반영)
+        service.delete_point_row(point)
 
     url = "/admin/point_list"
     query_params = request.query_params
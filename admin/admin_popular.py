@@ -2,7 +2,6 @@
 import re
 from datetime import datetime
 from typing import List
-from typing_extensions import Annotated
 
 from fastapi import APIRouter, Depends, Form, Query, Request
 from fastapi.responses import RedirectResponse
@@ -14,8 +13,8 @@ from core.models import Popular
 from core.template import AdminTemplates
 from lib.common import select_query, set_url_query_params
 from lib.dependency.dependencies import common_search_query_params, validate_token
+from lib.layout_cache import invalidate_layout_cache
 from lib.template_functions import get_paging
-from service.popular_service import PopularService
 
 router = APIRouter()
 templates = AdminTemplates()
@@ -59,7 +58,6 @@ async def popular_list(
 async def popular_delete(
     request: Request,
     db: db_session,
-    service: Annotated[PopularService, Depends()],
     checks: List[int] = Form(..., alias="chk[]")
 ):
     """
@@ -70,7 +68,7 @@ async def popular_delete(
     db.commit()
 
     # 기존 캐시 삭제
-    service.fetch_populars().cache_clear()
+    invalidate_layout_cache()
 
     url = "/admin/popular_list"
     query_params = request.query_params
@@ -48,8 +48,8 @@ async def sendmail_test_result(
     from_email = get_admin_email(request)
     from_name = get_admin_email_name(request)
     real_emails = to_email.split(',') if ',' in to_email else [to_email]
-    for to_email in real_emails:
-        mailer(from_email, to_email, subject, body, from_name)
+    # 받는 사람별로 발송 대기열에 한번에 등록 (SMTP 발송은 스케줄러에서 처리)
+    mailer(from_email, ",".join(real_emails), subject, body, from_name)
 
     context = {
         "request": request,
@@ -3,7 +3,6 @@ import logging
 import os.path
 from typing_extensions import Annotated
 
-from jinja2 import FileSystemLoader
 from fastapi import APIRouter, Depends, HTTPException, Path, Request
 from fastapi.responses import FileResponse
 from sqlalchemy import select, update
@@ -14,7 +13,9 @@ from core.template import (
     AdminTemplates, TEMPLATES, TemplateService, UserTemplates,
     get_current_theme, get_theme_list, get_theme_info, register_theme_statics,
 )
+from lib.config_cache import invalidate_config_cache
 from lib.dependency.dependencies import validate_super_admin, validate_theme
+from lib.render_cache import latest_cache
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -41,6 +42,7 @@ async def theme(request: Request, db: db_session):
     if current_theme not in theme_list:
         config.cf_theme = current_theme = "basic"
         db.commit()
+        invalidate_config_cache()
 
     # 현재 사용 중인 테마를 목록 맨 앞으로 이동
     if current_theme and current_theme in theme_list:
@@ -99,15 +101,12 @@ async def theme_update(
 
     db.execute(update(Config).values(cf_theme=select_theme))
     db.commit()
+    invalidate_config_cache()
 
     # 선택한 테마로 캐시&설정 데이터들을 갱신합니다.
     get_current_theme.cache_clear()
     TemplateService.set_templates_dir()
-    cache_directory = "data/cache"
-    for filename in os.listdir(cache_directory):
-        if filename.startswith("latest-"):
-            file_path = os.path.join(cache_directory, filename)
-            os.unlink(file_path)
+    latest_cache.clear()
 
     # 테마 관련 정적 파일을 등록합니다.
     register_theme_statics(app)
@@ -118,8 +117,7 @@ async def theme_update(
     theme_path = [path for path in current_theme_path if not path.startswith(before_theme_path)]
     theme_path.insert(0, f"{TEMPLATES}/{select_theme}")
 
-    user_template.default_directories = theme_path
-    user_template.env.loader = FileSystemLoader(theme_path)
+    user_template.set_directories(theme_path)
 
     # 현재 테마 정보를 가져옵니다.
     info = get_theme_info(select_theme)
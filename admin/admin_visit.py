@@ -10,8 +10,11 @@ from core.exception import AlertException
 from core.models import Visit
 from core.template import AdminTemplates
 from lib.dependency.dependencies import validate_super_admin, validate_token
-from lib.pbkdf2 import validate_password
+from lib.pbkdf2 import validate_password_async
 from lib.template_functions import get_paging
+from service.visit_rollup_service import (
+    delete_visit_rollups, get_rollup_counts, get_visit_sum_counts
+)
 
 router = APIRouter()
 templates = AdminTemplates()
@@ -112,7 +115,7 @@ async def visit_delete_update(
     """
     member = request.state.login_member
 
-    if not validate_password(admin_password, member.mb_password):
+    if not await validate_password_async(admin_password, member.mb_password):
         raise AlertException("관리자 비밀번호가 일치하지 않습니다.")
 
     if not year:
@@ -141,6 +144,11 @@ async def visit_delete_update(
         raise AlertException("잘못된 요청입니다.", 400)
 
     result = db.execute(query)
+    # 같은 기간의 방문자 집계도 삭제
+    if method == "before":
+        delete_visit_rollups(db, before=delete_date.date())
+    else:
+        delete_visit_rollups(db, year=year, month=month)
     db.commit()
 
     raise AlertException(
@@ -234,35 +242,19 @@ async def visit_domain(
     request.session["menu_key"] = VISIT_MENU_KEY
     from_date, to_date = validate_time(from_date, to_date)
 
-    # 초기 쿼리 설정
-    visits = db.scalars(
-        select(Visit)
-        .where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    ).all()
-
     site_url = f"{request.base_url.scheme}://{request.base_url.hostname}"
     if request.base_url.port:
         site_url += f":{request.base_url.port}"
-    # referer에서 도메인 필터링
+    # 도메인별 집계에서 사이트 주소로 시작하는 referer는 직접 접속으로 표시
     filtered_visits = []
     total_records = 0
-    for visit in visits:
-        # http or https
-        match = re.search(r'^http[s]*\S+', visit.vi_referer)
-        if match:
-            match_group = match.group()
-            referer: str = re.sub(r"^(www\.|search\.|dirsearch\.|dir\.search\.|dir\.|kr\.search\.|myhome\.)(.*)",
-                                  "\\2", match_group)
-            filtered_visits.append({
-                "vi_referer": '직접' if referer.startswith(site_url) else referer,
-                "count": 1,
-            })
-        else:
-            filtered_visits.append({
-                "vi_referer": '직접',
-                "count": 1,
-            })
-        total_records += 1
+    for row in get_rollup_counts(db, "referer", from_date, to_date):
+        referer = row["value"]
+        filtered_visits.append({
+            "vi_referer": '직접' if not referer or referer.startswith(site_url.lower()) else referer,
+            "count": row["count"],
+        })
+        total_records += row["count"]
 
     visits = count_by_field(filtered_visits, "vi_referer")
     visits = add_percent_field(visits)
@@ -290,22 +282,15 @@ async def visit_browser(
     request.session["menu_key"] = VISIT_MENU_KEY
     from_date, to_date = validate_time(from_date, to_date)
 
-    # 초기 쿼리 설정
-    visits = db.scalars(
-        select(Visit)
-        .where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    ).all()
-
     # 브라우저별 접속자집계
     filtered_visits = []
     total_records = 0
-    for visit in visits:
+    for row in get_rollup_counts(db, "browser", from_date, to_date):
         filtered_visits.append({
-            "vi_browser": visit.vi_browser or get_browser(visit.vi_agent),
-            "count": 1,
+            "vi_browser": row["value"],
+            "count": row["count"],
         })
-
-        total_records += 1
+        total_records += row["count"]
 
     visits = count_by_field(filtered_visits, "vi_browser")
     visits = add_percent_field(visits)
@@ -333,22 +318,15 @@ async def visit_os(
     request.session["menu_key"] = VISIT_MENU_KEY
     from_date, to_date = validate_time(from_date, to_date)
 
-    # 초기 쿼리 설정
-    visits = db.scalars(
-        select(Visit)
-        .where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    ).all()
-
     # OS별 접속자집계
     filtered_visits = []
     total_records = 0
-    for visit in visits:
+    for row in get_rollup_counts(db, "os", from_date, to_date):
         filtered_visits.append({
-            "vi_os": visit.vi_os or get_os(visit.vi_agent),
-            "count": 1,
+            "vi_os": row["value"],
+            "count": row["count"],
         })
-
-        total_records += 1
+        total_records += row["count"]
 
     visits = count_by_field(filtered_visits, "vi_os")
     visits = add_percent_field(visits)
@@ -376,22 +354,15 @@ async def visit_device(
     request.session["menu_key"] = VISIT_MENU_KEY
     from_date, to_date = validate_time(from_date, to_date)
 
-    # 초기 쿼리 설정
-    visits = db.scalars(
-        select(Visit)
-        .where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    ).all()
-
     # 접속기기별 접속자집계
     filtered_visits = []
     total_records = 0
-    for visit in visits:
+    for row in get_rollup_counts(db, "device", from_date, to_date):
         filtered_visits.append({
-            "vi_device": visit.vi_device,
-            "count": 1,
+            "vi_device": row["value"],
+            "count": row["count"],
         })
-
-        total_records += 1
+        total_records += row["count"]
 
     visits = count_by_field(filtered_visits, "vi_device")
     visits = add_percent_field(visits)
@@ -528,22 +499,15 @@ async def visit_date(
     request.session["menu_key"] = VISIT_MENU_KEY
     from_date, to_date = validate_time(from_date, to_date)
 
-    # 초기 쿼리 설정
-    visits = db.scalars(
-        select(Visit)
-        .where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    ).all()
-
-    # 접속자집계
+    # 접속자집계 (방문자 합계 테이블)
     filtered_visits = []
     total_records = 0
-    for visit in visits:
+    for row in get_visit_sum_counts(db, from_date, to_date, "%Y-%m-%d"):
         filtered_visits.append({
-            "visit_date": visit.vi_date.strftime("%Y-%m-%d"),
-            "count": 1,
+            "visit_date": row["value"],
+            "count": row["count"],
         })
-
-        total_records += 1
+        total_records += row["count"]
 
     visits = count_by_field(filtered_visits, "visit_date")
     visits = add_percent_field(visits)
@@ -571,22 +535,15 @@ async def visit_month(
     request.session["menu_key"] = VISIT_MENU_KEY
     from_date, to_date = validate_time(from_date, to_date)
 
-    # 초기 쿼리 설정
-    visits = db.scalars(
-        select(Visit)
-        .where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    ).all()
-
-    # 접속자집계
+    # 접속자집계 (방문자 합계 테이블)
     filtered_visits = []
     total_records = 0
-    for visit in visits:
+    for row in get_visit_sum_counts(db, from_date, to_date, "%Y-%m"):
         filtered_visits.append({
-            "visit_month": visit.vi_date.strftime("%Y-%m"),
-            "count": 1,
+            "visit_month": row["value"],
+            "count": row["count"],
         })
-
-        total_records += 1
+        total_records += row["count"]
 
     visits = count_by_field(filtered_visits, "visit_month")
     visits = add_percent_field(visits)
@@ -614,22 +571,15 @@ async def visit_year(
     request.session["menu_key"] = VISIT_MENU_KEY
     from_date, to_date = validate_time(from_date, to_date)
 
-    # 초기 쿼리 설정
-    visits = db.scalars(
-        select(Visit)
-        .where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    ).all()
-
-    # 접속자집계
+    # 접속자집계 (방문자 합계 테이블)
     filtered_visits = []
     total_records = 0
-    for visit in visits:
+    for row in get_visit_sum_counts(db, from_date, to_date, "%Y"):
         filtered_visits.append({
-            "visit_year": visit.vi_date.strftime("%Y"),
-            "count": 1,
+            "visit_year": row["value"],
+            "count": row["count"],
         })
-
-        total_records += 1
+        total_records += row["count"]
 
     visits = count_by_field(filtered_visits, "visit_year")
     visits = add_percent_field(visits)
@@ -676,63 +626,6 @@ def add_percent_field(list: List[dict]) -> list:
     return list
 
 
-def get_browser(user_agent):
-    """브라우저이름을 반환합니다.
-    """
-    user_agent = user_agent.lower()
-
-    browsers = {
-        'Chrome': r"chrome",
-        'FireFox': r"firefox",
-        'Safari': r"safari",
-        'Opera': r"opera",
-        'MSIE': r"msie ([1-9][0-9]\.[0-9]+)",
-        'Mozilla': r"mozilla",
-        'Robot': r"bot|Yeti|Baidu|Daumoa|Yandex|slurp|facebook",
-        'IE': r"internet explorer"
-    }
-
-    for browser_name, pattern in browsers.items():
-        if re.search(pattern, user_agent):
-            return browser_name
-
-    return "other"  # todo 다국어
-
-
-def get_os(user_agent):
-    user_agent = user_agent.lower()
-
-    os_patterns = {
-        "Android": r"android",
-        "IOS": r"IOS",
-        "iPad OS": r"iPad",
-        "Phone": r"phone",
-        "Windows10": r"windows nt 10\.0",
-        "Windows8.1": r"windows nt 6\.3",
-        "Windows8": r"windows nt 6\.2",
-        "Windows7": r"windows nt 6\.1",
-        "Vista": r"windows nt 6\.0",
-        "XP": r"windows nt 5\.1",
-        "2003": r"windows nt 5\.2",
-        "NT": r"windows nt 4\.[0-9]*",
-        "CE": r"windows ce",
-        "MAC": r"mac",
-        "Robot": r"bot|Yeti|Baidu|Daumoa|Yandex|slurp|facebook ",
-        "Linux": r"linux",
-        "Solrais": r"solrais",
-        "IE": r"internet explorer",
-        "Mozilla": r"mozilla",
-        "IRIX": r"irix"
-    }
-
-    # Iterate through the patterns and return the first matching OS
-    for os_name, pattern in os_patterns.items():
-        if re.search(pattern, user_agent):
-            return os_name
-
-    return "other"
-
-
 def validate_time(from_date, to_date):
     if from_date:
         from_date = re.sub(r'[^0-9 :\-]', '', from_date)
@@ -6,15 +6,14 @@ from sqlalchemy.exc import ProgrammingError
 from api.v1.auth import oauth2_optional
 from core.database import db_session
 from api.v1.dependencies.member import get_current_member_optional
-from api.v1.service.current_connect import CurrentConnectServiceAPI
 from api.v1.service.member import MemberServiceAPI
 from lib.common import get_client_ip
+from service.current_connect_service import presence_table
 
 
 async def set_current_connect(
         request: Request,
         db: db_session,
-        service: Annotated[CurrentConnectServiceAPI, Depends()],
         member_service: Annotated[MemberServiceAPI, Depends()],
         ):
     """현재 접속자 정보 설정"""
@@ -28,14 +27,8 @@ async def set_current_connect(
         cf_admin = getattr(request.state.config, "cf_admin", "admin")
 
         if cf_admin != mb_id:
-            current_login = service.fetch_current_connect(current_ip)
-            if current_login:
-                service.update_current_connect(current_login, path, mb_id)
-            else:
-                service.create_current_connect(current_ip, path, mb_id)
-
-        # 현재 로그인한 이력 삭제
-        service.delete_current_connect()
+            # 워커 메모리에 기록하고 백그라운드 작업이 일괄 저장
+            presence_table.touch(current_ip, mb_id, path)
 
         # 세션의 member 데이터를 데이터베이스와 동기화
         if member:
@@ -6,7 +6,9 @@ from typing_extensions import Annotated, List, Union
 from fastapi import Body, Path, Query
 from pydantic import BaseModel, ConfigDict, model_validator, Field
 
-from api.v1.models.pagination import PaginationResponse, PagenationRequest
+from api.v1.models.pagination import (
+    CursorPaginationResponse, CursorPagenationRequest, PaginationResponse
+)
 
 
 class WriteModel(BaseModel):
@@ -273,7 +275,7 @@ class ResponseBoardModel(BaseModel):
     # bo_10: str
 
 
-class BoardPaginationRequest(PagenationRequest):
+class BoardPaginationRequest(CursorPagenationRequest):
     per_page: int = Field(
         Query(default=0,
               ge=0,
@@ -288,7 +290,7 @@ class BoardPaginationRequest(PagenationRequest):
     )
 
 
-class ResponseBoardListModel(PaginationResponse):
+class ResponseBoardListModel(CursorPaginationResponse):
     """게시판 목록 모델"""
     categories: list
     board: ResponseBoardModel
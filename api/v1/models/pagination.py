@@ -1,4 +1,6 @@
 """페이징 모델 클래스를 정의한 파일입니다."""
+from typing_extensions import Union
+
 from fastapi import Query
 from pydantic import BaseModel, Field
 
@@ -29,3 +31,19 @@ class PaginationResponse(BaseModel):
     """페이징 정보 응답 모델"""
     total_records: int
     total_pages: int
+
+
+class CursorPagenationRequest(PagenationRequest):
+    """커서 페이징 요청 모델"""
+    cursor: Union[str, None] = Field(
+        Query(default=None,
+              title="커서",
+              description="이전 응답의 next_cursor 또는 prev_cursor 값<br>\
+                전달하면 page 대신 커서 기준으로 이어서 조회")
+    )
+
+
+class CursorPaginationResponse(PaginationResponse):
+    """커서 페이징 정보 응답 모델"""
+    prev_cursor: Union[str, None] = None
+    next_cursor: Union[str, None] = None
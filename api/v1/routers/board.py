@@ -48,17 +48,19 @@ async def api_list_post(
 ) -> ResponseBoardListModel:
     """
     게시판 정보, 글 목록을 반환합니다.
+    - 응답의 next_cursor/prev_cursor를 cursor로 전달하면 page 대신 커서 기준으로 조회합니다.
     """
     per_page = service.get_board_per_page(pagination.per_page)
 
     writes = service.get_writes(
         with_files=True,
         page=pagination.page,
-        per_page=pagination.per_page
+        per_page=pagination.per_page,
+        cursor=pagination.cursor
     )
     total_records = service.get_total_count()
     paging_info = get_paging_info(
-        pagination.page, per_page, total_records
+        service.search_params['current_page'], per_page, total_records
     )
     content = {
         "total_records": total_records,
@@ -67,10 +69,12 @@ async def api_list_post(
         "board": service.board,
         "notice_writes": service.get_notice_writes(),
         "writes": writes,
-        "total_count": service.get_total_count(),
+        "total_count": total_records,
         "current_page": service.search_params['current_page'],
         "prev_spt": service.prev_spt,
         "next_spt": service.next_spt,
+        "prev_cursor": service.prev_cursor,
+        "next_cursor": service.next_cursor,
     }
     return jsonable_encoder(content)
 
@@ -108,7 +112,7 @@ async def api_read_post(
     })
     content.update(additional_content)
     service.validate_secret()
-    service.validate_repeat_with_slowapi()
+    await service.validate_repeat_with_slowapi()
     service.block_read_comment()
     service.validate_read_level()
     service.check_scrap()
@@ -155,7 +159,7 @@ async def api_read_post(
         "nogood": ajax_good_data["nogood"],
     })
     content.update(additional_content)
-    service.validate_repeat_with_slowapi()
+    await service.validate_repeat_with_slowapi()
     service.block_read_comment()
     service.check_scrap()
     service.check_is_good()
@@ -469,6 +473,7 @@ async def api_update_comment(
     comment.wr_content = service.get_cleaned_data(comment_data.wr_content)
     comment.wr_option = comment_data.wr_option or "html1"
     comment.wr_last = service.g5_instance.get_wr_last_now(write_model.__tablename__)
+    service.update_search_index(comment)
     db.commit()
     return {"result": "updated"}
 
@@ -12,7 +12,7 @@ from sqlalchemy import delete
 from bbs.social import SocialAuthService
 from core.database import db_session
 from core.models import Member
-from lib.pbkdf2 import validate_password
+from lib.pbkdf2 import validate_password_async
 from lib.mail import send_password_reset_mail, send_register_admin_mail, send_register_mail
 
 from api.v1.dependencies.member import (
@@ -164,7 +164,7 @@ async def password_certification(
     """
     JWT토큰으로 decoding하여 얻은 member와 입력받은 비밀번호의 일치 여부를 확인합니다.
     """
-    if not validate_password(password, member.mb_password):
+    if not await validate_password_async(password, member.mb_password):
         service.raise_exception(status_code=403, detail="비밀번호가 일치하지 않습니다.")
 
     return {"message": "비밀번호가 확인되었습니다."}
@@ -22,8 +22,7 @@ async def read_total_visit(
     - 캐시를 사용하여 10분 동안 캐시된 데이터를 반환합니다.
     - 방문자 수는 기본설정 테이블의 cf_visit 값을 사용합니다.
     """
-    config_visit = getattr(request.state.config, "cf_visit", "")
-    return get_total_visit(config_visit)
+    return get_total_visit()
 
 
 @router.post("/visit",
@@ -174,6 +174,7 @@ class CreatePostServiceAPI(CreatePostService):
 
         write.wr_parent = write.wr_id  # 부모아이디 설정
         self.board.bo_count_write = self.board.bo_count_write + 1  # 게시판 글 갯수 1 증가
+        self.update_search_index(write)
         
         # Walrus 스토리지에 게시글 저장 (답글이 아닌 경우만)
         if not parent_write:
@@ -498,6 +498,7 @@ async def write_comment_update(
         comment.wr_content = service.get_cleaned_data(form.wr_content)
         comment.wr_option = form.wr_secret or "html1"
         comment.wr_last = service.g5_instance.get_wr_last_now(write_model.__tablename__)
+        service.update_search_index(comment)
     service.db.commit()
     redirect_url = service.get_redirect_url(write)
     return RedirectResponse(redirect_url, status_code=303)
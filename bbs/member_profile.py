@@ -15,7 +15,7 @@ from lib.dependency.dependencies import validate_captcha, validate_token
 from lib.dependency.auth import get_login_member
 from lib.dependency.member import validate_update_data
 from lib.member import get_next_open_date
-from lib.pbkdf2 import validate_password
+from lib.pbkdf2 import validate_password_async
 from service.member_service import (
     MemberService, MemberImageService, ValidateMember
 )
@@ -83,7 +83,7 @@ async def check_member(
     """
     회원프로필 수정 전 비밀번호 확인 처리
     """
-    if not validate_password(mb_password, member.mb_password):
+    if not await validate_password_async(mb_password, member.mb_password):
         raise AlertException("아이디 또는 패스워드가 일치하지 않습니다.", 404)
 
     request.session[SESSION_NAME] = True
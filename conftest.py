@@ -0,0 +1,54 @@
+"""
+테스트 공통 도구
+- query_counter: 엔진에서 실행되는 SQL 문장 수를 세는 QueryCounter를 생성합니다.
+- create_write_board(): SQLite 메모리 DB에 게시판(write_*) 테이블과 추가 테이블을 생성합니다.
+- write_values(): 게시글 행의 NOT NULL 일시 컬럼(wr_datetime)을 채웁니다.
+  (모델 기본값 ""는 SQLite DateTime 타입에 저장할 수 없음)
+"""
+
+import os
+import sys
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, event
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from lib.common import dynamic_create_write_table
+
+
+class QueryCounter:
+    """엔진에서 실행되는 SQL 문장 수를 센다."""
+
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._callback)
+
+    def _callback(self, *args, **kwargs):
+        self.count += 1
+
+
+@pytest.fixture
+def query_counter():
+    """QueryCounter(engine)를 생성하는 함수"""
+    return QueryCounter
+
+
+def create_write_board(bo_table: str, *tables):
+    """SQLite 메모리 DB에 게시판 테이블과 추가 테이블을 생성한다.
+
+    Returns:
+        tuple: (engine, write_model)
+    """
+    engine = create_engine("sqlite://")
+    write_model = dynamic_create_write_table(bo_table)
+    for table in (*tables, write_model.__table__):
+        table.create(bind=engine)
+    return engine, write_model
+
+
+def write_values(**values) -> dict:
+    """게시글 행의 값 (wr_datetime을 지정하지 않으면 현재 일시)"""
+    values.setdefault("wr_datetime", datetime.now())
+    return values
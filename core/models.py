@@ -776,6 +776,9 @@ class Visit(Base):
     vi_os = Column(String(255), nullable=False, default="")
     vi_device = Column(String(255), nullable=False, default="")
 
+    # 오늘 방문 여부 확인
+    date_ip_index = Index("idx_visit_date_ip", vi_date, vi_ip)
+
 
 class VisitSum(Base):
     """
@@ -788,6 +791,33 @@ class VisitSum(Base):
     vs_count = Column(Integer, nullable=False, default=0)
 
 
+class VisitRollup(Base):
+    """
+    방문자 일별 항목별 집계 테이블
+    - 접속자집계(도메인, 브라우저, OS, 접속기기) 화면에서 방문자 이력 대신 조회합니다.
+    - 스케줄러가 새로 기록된 방문자 이력만 읽어서 집계를 누적합니다.
+    """
+
+    __tablename__ = DB_TABLE_PREFIX + "visit_rollup"
+
+    vr_date = Column(Date, primary_key=True, nullable=False)
+    vr_dimension = Column(String(20), primary_key=True, nullable=False, comment="집계 항목 (referer, browser, os, device)")
+    vr_value = Column(String(255), primary_key=True, nullable=False, default="", comment="항목 값")
+    vr_count = Column(Integer, nullable=False, default=0)
+
+
+class VisitRollupState(Base):
+    """
+    방문자 집계 진행 상태 테이블
+    """
+
+    __tablename__ = DB_TABLE_PREFIX + "visit_rollup_state"
+
+    vrs_id = Column(Integer, primary_key=True)
+    vrs_last_vi_id = Column(Integer, nullable=False, default=0, comment="마지막으로 집계한 방문자 이력 ID")
+    vrs_datetime = Column(DateTime, nullable=True, comment="마지막 집계 일시")
+
+
 class QaConfig(Base):
     """
     Q&A 설정 테이블
@@ -910,10 +940,29 @@ class Point(Base):
     po_rel_id = Column(String(20), nullable=False, default="")
     po_rel_action = Column(String(100), nullable=False, default="")
 
+    # 적립 내용으로 중복 적립/삭제할 내역 조회
+    rel_index = Index("idx_point_rel", mb_id, po_rel_table, po_rel_id, po_rel_action)
+
     # 연관관계
     member: Mapped["Member"] = relationship("Member", back_populates="points")
 
 
+class PointExpire(Base):
+    """
+    회원별 만료 예정 포인트 테이블
+    - 회원, 만료일별로 아직 사용/소멸되지 않은 적립 포인트의 합계를 유지합니다.
+    - 스케줄러가 만료일이 지난 합계만 읽어서 포인트를 소멸시킵니다.
+    """
+
+    __tablename__ = DB_TABLE_PREFIX + "point_expire"
+
+    mb_id = Column(String(20), primary_key=True, nullable=False)
+    pe_expire_date = Column(Date, primary_key=True, nullable=False, comment="만료일")
+    pe_point = Column(Integer, nullable=False, default=0, comment="만료 예정 포인트")
+
+    expire_date_index = Index("idx_point_expire_date", pe_expire_date, mb_id)
+
+
 class Memo(Base):
     """
     쪽지 테이블
@@ -1104,6 +1153,33 @@ class Mail(Base):
     ma_last_option = Column(Text, nullable=False, default="")
 
 
+class MailQueue(Base):
+    """
+    메일 발송 대기열 테이블
+    - 요청 처리 중에는 메일을 등록만 하고, 스케줄러가 SMTP 연결을 재사용하여 모아서 발송합니다.
+    - 발송에 실패하면 mq_next_datetime 이후에 다시 발송합니다.
+    """
+
+    __tablename__ = DB_TABLE_PREFIX + "mail_queue"
+    __table_args__ = (
+        Index("idx_mail_queue_status", "mq_status", "mq_next_datetime", "mq_id"),
+    )
+
+    mq_id = Column(Integer, primary_key=True, autoincrement=True)
+    mq_from_email = Column(String(255), nullable=False, default="", comment="보내는 사람 이메일")
+    mq_from_name = Column(String(255), nullable=False, default="", comment="보내는 사람 이름")
+    mq_to_email = Column(String(255), nullable=False, default="", comment="받는 사람 이메일")
+    mq_to_name = Column(String(255), nullable=False, default="", comment="받는 사람 이름")
+    mq_subject = Column(String(255), nullable=False, default="")
+    mq_body = Column(Text, nullable=False, default="")
+    mq_status = Column(String(20), nullable=False, default="pending", comment="상태 (pending, processing, sent, failed)")
+    mq_attempts = Column(Integer, nullable=False, default=0, comment="시도 횟수")
+    mq_error_message = Column(Text, nullable=True, comment="오류 메시지")
+    mq_datetime = Column(DateTime, nullable=False, default=datetime.now, comment="등록 일시")
+    mq_next_datetime = Column(DateTime, nullable=False, default=datetime.now, comment="다음 발송 일시")
+    mq_sent_datetime = Column(DateTime, nullable=True, comment="발송 일시")
+
+
 class BoardNew(Base):
     """
     최신 게시물 테이블
@@ -1120,6 +1196,9 @@ class BoardNew(Base):
     bn_datetime = Column(DateTime, nullable=False, default=func.now())
     mb_id = Column(String(20), nullable=False, default="")
 
+    write_index = Index("idx_board_new_write", bo_table, wr_id)
+    mb_id_index = Index("idx_board_new_mb_id", mb_id)
+
     board: Mapped["Board"] = relationship("Board", back_populates="board_news")
 
 
@@ -1138,6 +1217,8 @@ class Scrap(Base):
     wr_id = Column(Integer, nullable=False, default=0)
     ms_datetime = Column(DateTime, nullable=False, default=func.now())
 
+    write_index = Index("idx_scrap_member_write", mb_id, bo_table, wr_id)
+
     board: Mapped["Board"] = relationship("Board", back_populates="scraps")
     member: Mapped["Member"] = relationship("Member", back_populates="scraps")
 
@@ -1182,6 +1263,24 @@ class BoardFile(Base):
     bf_datetime = Column(DateTime, nullable=False, default=func.now())
 
 
+class ThumbnailManifest(Base):
+    """
+    게시글 목록 섬네일 목록 테이블
+    - 게시글(bo_table, wr_id)의 대표 이미지로 생성한 크기별 섬네일 경로를 기록합니다.
+    - 목록 출력시 파일시스템을 확인하지 않고, 원본 경로가 대표 이미지와 같으면 기록된 섬네일을 사용합니다.
+    """
+
+    __tablename__ = DB_TABLE_PREFIX + "thumbnail_manifest"
+
+    bo_table = Column(String(20), primary_key=True, nullable=False, default="")
+    wr_id = Column(Integer, primary_key=True, nullable=False, default=0)
+    tm_width = Column(Integer, primary_key=True, nullable=False, default=0, comment="섬네일 너비")
+    tm_height = Column(Integer, primary_key=True, nullable=False, default=0, comment="섬네일 높이")
+    tm_source = Column(String(255), nullable=False, default="", comment="원본 이미지 경로")
+    tm_thumbnail = Column(String(255), nullable=False, default="", comment="섬네일 이미지 경로")
+    tm_datetime = Column(DateTime, nullable=False, default=datetime.now, comment="생성 일시")
+
+
 class MemberSocialProfiles(Base):
     """
     회원 소셜 프로필 테이블
@@ -1220,11 +1319,17 @@ class Login(Base):
     lo_location = Column(Text, nullable=False)
     lo_url = Column(Text, nullable=False)
 
+    # IP별로 1건만 저장 (워커별 저장 작업이 IP 기준으로 upsert)
+    ip_index = Index("idx_login_ip", lo_ip, unique=True)
+
 
 class SuiTransactionlog(Base):
     """SUI 트랜잭션 로그"""
     __tablename__ = DB_TABLE_PREFIX + "sui_transaction_log"
-    
+    __table_args__ = (
+        Index("idx_sui_transaction_log_tx_hash", "stl_tx_hash"),
+    )
+
     stl_id = Column(Integer, primary_key=True, autoincrement=True)
     mb_id = Column(String(20), nullable=False, index=True, comment="회원 ID")
     wr_id = Column(Integer, nullable=True, comment="게시글 ID")
@@ -1240,8 +1345,57 @@ class SuiTransactionlog(Base):
     # member = relationship("Member", back_populates="sui_transaction_logs", foreign_keys=[mb_id])
 
 
+class SuiAwardLedger(Base):
+    """SUIBOARD 토큰 지급 원장 (회원, 사유, 지급일별 1건)
+    - 1일 1회 지급(로그인 보상 등)은 원장에 먼저 INSERT 하고,
+      유니크키 중복이면 이미 지급한 것으로 처리합니다.
+    """
+    __tablename__ = DB_TABLE_PREFIX + "sui_award_ledger"
+    __table_args__ = (
+        UniqueConstraint("mb_id", "sal_reason", "sal_award_date", name="uq_sui_award_ledger"),
+    )
+
+    sal_id = Column(Integer, primary_key=True, autoincrement=True)
+    mb_id = Column(String(20), nullable=False, comment="회원 ID")
+    sal_reason = Column(String(50), nullable=False, comment="지급 사유")
+    sal_award_date = Column(Date, nullable=False, comment="지급일")
+    sal_amount = Column(BIGINT, nullable=False, default=0, comment="토큰 수량")
+    sal_datetime = Column(DateTime, nullable=False, default=datetime.now, comment="등록 일시")
+
+
+class SuiMintJob(Base):
+    """SUIBOARD 토큰 발행/회수 대기열
+    - 요청 처리 중에는 작업만 등록하고, 스케줄러가 대기중인 작업을 모아서 처리합니다.
+    - smj_action: mint(지급), reclaim(회수: 발행 후 즉시 소각)
+    """
+    __tablename__ = DB_TABLE_PREFIX + "sui_mint_job"
+    __table_args__ = (
+        Index("idx_sui_mint_job_status", "smj_action", "smj_status", "smj_id"),
+    )
+
+    smj_id = Column(Integer, primary_key=True, autoincrement=True)
+    mb_id = Column(String(20), nullable=False, index=True, comment="회원 ID")
+    wr_id = Column(Integer, nullable=True, comment="게시글 ID")
+    bo_table = Column(String(20), nullable=True, comment="게시판 테이블명")
+    smj_action = Column(String(20), nullable=False, default="mint", comment="작업 종류 (mint, reclaim)")
+    smj_recipient = Column(String(255), nullable=False, default="", comment="수신자 SUI 주소 (회수는 빈값)")
+    smj_amount = Column(BIGINT, nullable=False, comment="토큰 수량")
+    smj_reason = Column(String(50), nullable=False, comment="발생 사유")
+    smj_status = Column(String(20), nullable=False, default="pending",
+                        comment="상태 (pending, processing, success, failed, unknown: 발행 여부 확인 필요)")
+    smj_attempts = Column(Integer, nullable=False, default=0, comment="시도 횟수")
+    smj_tx_hash = Column(String(255), nullable=True, comment="트랜잭션 해시")
+    smj_reservation_id = Column(Integer, nullable=True, comment="발행량 예약 ID (TokenReservation)")
+    smj_error_message = Column(Text, nullable=True, comment="오류 메시지")
+    smj_datetime = Column(DateTime, nullable=False, default=datetime.now, comment="등록 일시")
+    smj_claimed_datetime = Column(DateTime, nullable=True, comment="처리 시작 일시")
+    smj_processed_datetime = Column(DateTime, nullable=True, comment="처리 일시")
+
+
 class TokenSupply(Base):
-    """SUIBOARD 토큰 총 발행량 관리"""
+    """SUIBOARD 토큰 총 발행량 관리
+    - total_minted는 발행 전에 예약(TokenReservation)한 수량을 포함합니다.
+    """
     __tablename__ = DB_TABLE_PREFIX + "token_supply"
     
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -1265,3 +1419,61 @@ class TokenSupply(Base):
         """추가 발행 가능 여부 확인"""
         return self.total_minted + amount <= self.max_supply
 
+
+class TokenBudget(Base):
+    """SUIBOARD 토큰 발행 한도별 사용량
+    - 일일 전체(daily:날짜), 회원별 일일(member:회원ID:날짜) 발행량을 키별로 누적합니다.
+    - 한도를 넘지 않는 경우에만 더하는 조건부 UPDATE로 예약하므로 동시에 예약해도 한도를 넘지 않습니다.
+    """
+    __tablename__ = DB_TABLE_PREFIX + "token_budget"
+
+    tb_key = Column(String(100), primary_key=True, comment="한도 키")
+    tb_used = Column(BIGINT, nullable=False, default=0, comment="예약/발행된 수량")
+    tb_datetime = Column(DateTime, nullable=False, default=datetime.now, comment="마지막 변경 일시")
+
+
+class TokenReservation(Base):
+    """SUIBOARD 토큰 발행량 예약
+    - 발행 전에 총 발행량(TokenSupply.total_minted)과 발행 한도(TokenBudget)를 예약하고,
+      발행 결과에 따라 확정(confirmed)하거나 취소(released)합니다.
+    """
+    __tablename__ = DB_TABLE_PREFIX + "token_reservation"
+
+    tr_id = Column(Integer, primary_key=True, autoincrement=True)
+    mb_id = Column(String(20), nullable=False, default="", comment="회원 ID")
+    tr_amount = Column(BIGINT, nullable=False, comment="예약 수량")
+    tr_budget_keys = Column(Text, nullable=False, default="", comment="예약한 발행 한도 키 (,로 구분)")
+    tr_status = Column(String(20), nullable=False, default="reserved", comment="상태 (reserved, confirmed, released)")
+    tr_tx_hash = Column(String(255), nullable=True, comment="트랜잭션 해시")
+    tr_datetime = Column(DateTime, nullable=False, default=datetime.now, comment="예약 일시")
+    tr_processed_datetime = Column(DateTime, nullable=True, comment="확정/취소 일시")
+
+
+
+class SearchIndexToken(Base):
+    """전체검색 색인 (n-gram 역색인)
+    - 게시글/댓글의 제목과 내용을 n-gram 토큰으로 분리하여 토큰별 출현 횟수를 저장합니다.
+    """
+    __tablename__ = DB_TABLE_PREFIX + "search_index_token"
+    __table_args__ = (
+        Index("idx_search_index_token", "sit_token", "bo_table", "wr_id"),
+        Index("idx_search_index_write", "bo_table", "wr_id"),
+        Index("idx_search_index_parent", "bo_table", "wr_parent"),
+    )
+
+    sit_id = Column(Integer, primary_key=True, autoincrement=True)
+    bo_table = Column(String(20), nullable=False, comment="게시판 테이블명")
+    wr_id = Column(Integer, nullable=False, comment="게시글 ID")
+    wr_parent = Column(Integer, nullable=False, default=0, comment="원글 ID")
+    wr_is_comment = Column(Integer, nullable=False, default=0, comment="댓글 여부")
+    sit_token = Column(String(20), nullable=False, comment="토큰")
+    sit_subject_count = Column(Integer, nullable=False, default=0, comment="제목 출현 횟수")
+    sit_content_count = Column(Integer, nullable=False, default=0, comment="내용 출현 횟수")
+
+
+class SearchIndexBoard(Base):
+    """전체검색 색인 생성이 완료된 게시판"""
+    __tablename__ = DB_TABLE_PREFIX + "search_index_board"
+
+    bo_table = Column(String(20), primary_key=True, comment="게시판 테이블명")
+    sib_datetime = Column(DateTime, nullable=False, default=datetime.now, comment="색인 생성 일시")
@@ -33,6 +33,7 @@ class Settings(BaseSettings):
     DB_CHARSET: str = "utf8mb4"
 
     IS_RESPONSIVE: bool = True  # 반응형 사용
+    TEMPLATE_BYTECODE_CACHE: bool = False  # 컴파일된 템플릿을 파일로 캐시 (data/cache/jinja)
 
     SESSION_COOKIE_NAME: str = "session"  # 세션 쿠키 이름
     SESSION_SECRET_KEY: str = ""  # 세션 비밀키
@@ -42,6 +43,7 @@ class Settings(BaseSettings):
     SMTP_PORT: int = 25
     SMTP_USERNAME: str = ""
     SMTP_PASSWORD: str = ""
+    SMTP_ALLOW_PLAIN_AUTH: bool = False  # STARTTLS를 지원하지 않는 서버에도 인증 정보를 평문으로 전송 (로컬 개발용)
 
     TIME_ZONE: str = "Asia/Seoul"  # 시간대
 
@@ -55,6 +57,16 @@ class Settings(BaseSettings):
     USE_API: bool = True  # API 사용
     USE_TEMPLATE: bool = True  # 템플릿 사용
 
+    # 전체검색 색인 백엔드 (db: DB n-gram 색인, none: 색인 미사용(LIKE 검색))
+    SEARCH_INDEX_BACKEND: str = "db"
+
+    # 게시글 목록 섬네일 생성 프로세스 수 (0: 프로세스를 사용하지 않고 바로 생성)
+    THUMBNAIL_WORKERS: int = 2
+
+    # SUIBOARD 토큰 일일 발행 한도 (0: 제한 없음)
+    TOKEN_DAILY_MINT_LIMIT: int = 0  # 전체 회원
+    TOKEN_MEMBER_DAILY_MINT_LIMIT: int = 0  # 회원별
+
     # CORS 설정
     CORS_ALLOW_ORIGINS: str = "*"
     CORS_ALLOW_CREDENTIALS: bool = False
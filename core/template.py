@@ -1,11 +1,12 @@
 import os
 import re
 import typing
+from contextvars import ContextVar
 
 from cachetools import LRUCache, cached
 from fastapi import FastAPI, Request
 from fastapi.templating import Jinja2Templates
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from sqlalchemy import select
 from starlette.background import BackgroundTask
 from starlette.staticfiles import StaticFiles
@@ -91,6 +92,39 @@ TEMPLATES = "templates"
 ADMIN_TEMPLATES = "admin/templates"
 ADMIN_TEMPLATES_DIR = get_admin_theme_path()  # 관리자 템플릿 경로
 
+TEMPLATE_BYTECODE_CACHE_DIR = "data/cache/jinja"
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """캐시 디렉토리가 삭제되어도(관리자 캐시파일 일괄삭제 등) 다시 생성하는 바이트코드 캐시"""
+
+    def dump_bytecode(self, bucket) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        super().dump_bytecode(bucket)
+
+
+_bytecode_cache: typing.Optional[TemplateBytecodeCache] = None
+
+# 현재 요청에서 모바일 템플릿 환경을 사용할지 여부
+_use_mobile_template: ContextVar[bool] = ContextVar("use_mobile_template", default=False)
+
+
+def get_bytecode_cache() -> typing.Optional[TemplateBytecodeCache]:
+    """템플릿 바이트코드 캐시를 반환
+    - .env 의 TEMPLATE_BYTECODE_CACHE 설정시 컴파일된 템플릿을 파일로 저장하여
+      워커 시작이나 테마 변경 후에도 템플릿을 다시 컴파일하지 않습니다.
+
+    Returns:
+        TemplateBytecodeCache: 바이트코드 캐시, 사용하지 않으면 None
+    """
+    global _bytecode_cache
+    if not settings.TEMPLATE_BYTECODE_CACHE:
+        return None
+    if _bytecode_cache is None:
+        os.makedirs(TEMPLATE_BYTECODE_CACHE_DIR, exist_ok=True)
+        _bytecode_cache = TemplateBytecodeCache(TEMPLATE_BYTECODE_CACHE_DIR)
+    return _bytecode_cache
+
 class TemplateService():
     """템플릿 서비스 클래스
     - TODO: 이외의 다른 부분도 클래스화 해야한다.
@@ -114,9 +148,11 @@ class UserTemplates(Jinja2Templates):
     사용자 Jinja2Template 설정 클래스
     - 사용자에서 반복적으로 사용되는 템플릿 설정을 관리
     - 싱글톤 패턴으로 구현
+    - PC/모바일 템플릿 환경을 각각 생성하여 요청마다 선택합니다.
+      (모바일 환경은 PC 환경의 필터/전역 설정을 공유하고, 컴파일된 템플릿 캐시는 따로 관리)
     """
     _instance = None
-    _is_mobile: bool = False
+    mobile_env: Environment = None
     default_directories = [
         TemplateService.get_templates_dir(),
         EDITOR_PATH,
@@ -138,6 +174,9 @@ class UserTemplates(Jinja2Templates):
             self._initialized = True
             super().__init__(directory=self.default_directories,
                              context_processors=context_processors)
+            self.env.bytecode_cache = get_bytecode_cache()
+            self.mobile_env = self.env.overlay(
+                loader=FileSystemLoader(self.get_mobile_directories()))
 
             # 템플릿 필터 설정
             self.env.filters["datetime_format"] = datetime_format
@@ -159,6 +198,24 @@ class UserTemplates(Jinja2Templates):
             if globals:
                 self.env.globals.update(**globals.__dict__)
 
+    def get_mobile_directories(self) -> list:
+        """모바일 템플릿 경로 (모바일 템플릿이 없으면 기본 템플릿 사용)"""
+        mobile_dir = f"{TemplateService.get_templates_dir()}/mobile"
+        return [mobile_dir] + [path for path in self.default_directories if path != mobile_dir]
+
+    def set_directories(self, directories: list) -> None:
+        """템플릿 경로를 변경하고 PC/모바일 템플릿 환경의 로더를 다시 생성합니다. (테마 변경시)"""
+        self.default_directories = directories
+        self.env.loader = FileSystemLoader(directories)
+        self.mobile_env.loader = FileSystemLoader(self.get_mobile_directories())
+        self.env.cache.clear()
+        self.mobile_env.cache.clear()
+
+    def get_template(self, name: str):
+        """요청의 디바이스에 맞는 템플릿 환경에서 템플릿을 조회합니다."""
+        env = self.mobile_env if _use_mobile_template.get() else self.env
+        return env.get_template(name)
+
     def _default_context(self, request: Request):
         # Lazy import
         from lib.board_lib import render_latest_posts
@@ -179,35 +236,25 @@ class UserTemplates(Jinja2Templates):
     ) -> _TemplateResponse:
         """Jinja2Templates TemplateResponse Override
         
-        적응형&모바일 접근일 경우 모바일 템플릿을 우선으로 검색하도록 경로를 재설정한다.
+        적응형&모바일 접근일 경우 모바일 템플릿 환경을 사용한다.
         - mobile 템플릿이 존재하지 않을 경우 기본 템플릿을 자동으로 사용한다.
-        - 클래스 변수(_is_mobile)를 통해 이전 요청과 비교하여 변경되었을 경우에만 경로를 재설정한다.
-        - 해당 로직은 생성자에서 처리하지 못한다.
+        - 공유 상태(로더)를 변경하지 않으므로 PC/모바일 요청이 번갈아 와도
+          컴파일된 템플릿 캐시가 유지된다.
         """
         request = context.get("request")
         is_mobile: bool = getattr(request.state, "is_mobile", False)
-        if (not settings.IS_RESPONSIVE
-                and self._is_mobile != is_mobile):
-            # 경로 우선순위 변경
-            mobile_dir = f"{TemplateService.get_templates_dir()}/mobile"
-            if is_mobile:
-                self.default_directories.insert(0, mobile_dir)
-            else:
-                if mobile_dir in self.default_directories:
-                    self.default_directories.remove(mobile_dir)
-
-            # 템플릿 로더 재설정
-            self.env.loader = FileSystemLoader(self.default_directories)
-            self._is_mobile = is_mobile
-
-        return super().TemplateResponse(
-            name=name,
-            context=context,
-            status_code=status_code,
-            headers=headers,
-            media_type=media_type,
-            background=background
-        )
+        token = _use_mobile_template.set(not settings.IS_RESPONSIVE and is_mobile)
+        try:
+            return super().TemplateResponse(
+                name=name,
+                context=context,
+                status_code=status_code,
+                headers=headers,
+                media_type=media_type,
+                background=background
+            )
+        finally:
+            _use_mobile_template.reset(token)
 
 
 class AdminTemplates(Jinja2Templates):
@@ -234,6 +281,7 @@ class AdminTemplates(Jinja2Templates):
             self._initialized = True
             super().__init__(directory=self.default_directories,
                              context_processors=context_processors)
+            self.env.bytecode_cache = get_bytecode_cache()
 
             # 템플릿 필터 설정
             self.env.filters["datetime_format"] = datetime_format
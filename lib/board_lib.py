@@ -1,11 +1,15 @@
 """게시판/게시글 함수 모음"""
 
+import base64
+import binascii
+import json
 import os
 import re
 from datetime import datetime, timedelta
 
 import bleach
-from typing import List
+from cachetools import TTLCache
+from typing import List, Optional, Tuple
 from fastapi import Request
 from fastapi.templating import Jinja2Templates
 from sqlalchemy import and_, asc, desc, func, insert, or_, select
@@ -17,18 +21,19 @@ from core.exception import AlertException
 from core.models import Board, BoardNew, Member, WriteBaseModel
 from core.template import TemplateService, UserTemplates
 from lib.common import (
-    FileCache,
     StringEncrypt,
     cut_name,
     dynamic_create_write_table,
     get_admin_email,
     get_admin_email_name,
-    get_editor_image,
-    thumbnail,
 )
-from lib.mail import mailer
+from lib.render_cache import latest_cache
 from lib.member import MemberDetails
 from service.board_file_service import BoardFileService as FileService
+from service.mail_queue_service import enqueue_mails
+from service.thumbnail_service import (
+    get_dummy_thumbnail, get_editor_image_paths, get_thumbnail_manifest_map, schedule_thumbnails
+)
 
 
 class BoardConfig:
@@ -519,57 +524,110 @@ def write_search_filter(
     Returns:
         Select: 필터가 적용된 쿼리.
     """
-    with DBConnect().sessionLocal() as db:
-        fields = []
-        is_comment = False
-
-        query = select()
-        # 분류
-        if category:
-            query = query.where(model.ca_name == category)
-
-        # 검색 필드 및 단어 설정
-        # 검색어를 단어로 분리하여 operator에 따라 필터를 생성
-        word_filters = []
-        words = keyword.split(" ")
-        if search_field:
-            # search_field는 {필드명},{코멘트여부} 형식으로 전달됨 (0:댓글, 1:게시글)
-            tmp = search_field.split(",")
-            fields = tmp[0].split("||")
-            is_comment = (tmp[1] == "0") if len(tmp) > 1 else False
-
-            # 패스워드 필드 제거
-            if "wr_password" in fields:
-                fields.remove("wr_password")
-
-            # 필드검색 필터 생성 (or 조건)
-            for word in words:
-                if not word.strip():
-                    continue
-                word_filters.append(
-                    or_(
-                        *[
-                            getattr(model, field).like(f"%{word}%")
-                            for field in fields
-                            if hasattr(model, field)
-                        ]
-                    )
+    fields = []
+    is_comment = False
+
+    query = select()
+    # 분류
+    if category:
+        query = query.where(model.ca_name == category)
+
+    # 검색 필드 및 단어 설정
+    # 검색어를 단어로 분리하여 operator에 따라 필터를 생성
+    word_filters = []
+    words = keyword.split(" ")
+    if search_field:
+        # search_field는 {필드명},{코멘트여부} 형식으로 전달됨 (0:댓글, 1:게시글)
+        tmp = search_field.split(",")
+        fields = tmp[0].split("||")
+        is_comment = (tmp[1] == "0") if len(tmp) > 1 else False
+
+        # 패스워드 필드 제거
+        if "wr_password" in fields:
+            fields.remove("wr_password")
+
+        # 필드검색 필터 생성 (or 조건)
+        for word in words:
+            if not word.strip():
+                continue
+            word_filters.append(
+                or_(
+                    *[
+                        getattr(model, field).like(f"%{word}%")
+                        for field in fields
+                        if hasattr(model, field)
+                    ]
                 )
+            )
 
-        # 분리된 단어 별 검색필터에 or 또는 and를 적용
-        if operator == "and":
-            query = query.where(and_(*word_filters))
-        else:
-            query = query.where(or_(*word_filters))
+    # 분리된 단어 별 검색필터에 or 또는 and를 적용
+    if operator == "and":
+        query = query.where(and_(*word_filters))
+    else:
+        query = query.where(or_(*word_filters))
 
-        # 댓글 검색
-        if is_comment:
-            query = query.where(model.wr_is_comment == 1)
-            # 원글만 조회해야하므로, wr_parent 목록을 가져와서 in조건으로 재필터링
-            parents = db.scalars(query.add_columns(model)).all()
-            query = select().where(model.wr_id.in_([row.wr_parent for row in parents]))
+    # 댓글 검색
+    if is_comment:
+        query = query.where(model.wr_is_comment == 1)
+        # 원글만 조회해야하므로, 댓글의 wr_parent를 서브쿼리(semi-join)로 재필터링
+        # (일치하는 댓글을 메모리로 가져오지 않고 DB에서 처리)
+        query = select().where(model.wr_id.in_(query.add_columns(model.wr_parent)))
 
-        return query
+    return query
+
+
+# 게시글 목록의 전체 게시글 수 캐시
+# 키: (게시판 테이블명, 목록 쿼리문, 쿼리 파라미터)
+# 글 작성/삭제시 현재 프로세스의 캐시는 delete_list_count_cache()로 삭제하고,
+# 다른 워커의 캐시는 TTL이 지나면 다시 조회된다.
+cache_list_count = TTLCache(maxsize=1024, ttl=60)
+
+
+def get_list_count_cache_key(bo_table: str, query: Select) -> tuple:
+    """게시글 목록 쿼리의 전체 게시글 수 캐시 키를 반환한다."""
+    compiled = query.compile()
+    return (bo_table, str(compiled), repr(sorted(compiled.params.items())))
+
+
+def delete_list_count_cache(bo_table: str) -> None:
+    """게시판의 전체 게시글 수 캐시를 삭제한다."""
+    for key in [key for key in list(cache_list_count.keys()) if key[0] == bo_table]:
+        cache_list_count.pop(key, None)
+
+
+def encode_list_cursor(wr_num: int, wr_reply: str, direction: str, offset: int = 0) -> str:
+    """게시글 목록 커서를 생성한다.
+
+    Args:
+        wr_num (int): 기준 게시글의 wr_num
+        wr_reply (str): 기준 게시글의 wr_reply
+        direction (str): next(다음 목록) 또는 prev(이전 목록)
+        offset (int): 커서로 이동할 목록의 첫 게시글 위치 (글 번호, 현재 페이지 계산용)
+
+    Returns:
+        str: URL에 사용할 수 있는 불투명(opaque) 커서 문자열
+    """
+    data = json.dumps({"n": wr_num, "r": wr_reply, "d": direction, "o": offset}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_list_cursor(cursor: str) -> Optional[Tuple[int, str, str, int]]:
+    """게시글 목록 커서를 해석한다.
+    - 위치(offset)가 없는 이전 형식의 커서는 위치를 0으로 본다.
+
+    Returns:
+        Optional[Tuple[int, str, str, int]]: (wr_num, wr_reply, direction, offset), 잘못된 커서이면 None
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        wr_num, wr_reply, direction = int(data["n"]), str(data["r"]), data["d"]
+        offset = max(int(data.get("o", 0)), 0)
+    except (binascii.Error, ValueError, TypeError, KeyError, UnicodeError, AttributeError):
+        return None
+    if direction not in ("next", "prev"):
+        return None
+    return wr_num, wr_reply, direction, offset
 
 
 def get_next_num(bo_table: str) -> int:
@@ -593,6 +651,7 @@ def get_list(
     write: WriteBaseModel,
     board_config: BoardConfig,
     subject_len: int = 0,
+    icon_file: Optional[bool] = None,
 ):
     """게시글 목록의 출력에 필요한 정보를 추가합니다.
     - 그누보드5의 get_list와 동일한 기능을 합니다.
@@ -602,11 +661,11 @@ def get_list(
         write (WriteBaseModel): 게시글 객체.
         board (Board): 게시판 객체.
         subject_len (int, optional): 게시글 제목 길이. Defaults to 0.
+        icon_file (bool, optional): 첨부파일 존재 여부. 미리 조회한 경우 전달하면 다시 조회하지 않음.
 
     Returns:
         WriteBaseModel: 게시글 목록.
     """
-    file_service = FileService(request, db)
     write.subject = board_config.cut_write_subject(write.wr_subject, subject_len)
     write.name = cut_name(request, write.wr_name)
     write.email = StringEncrypt().encrypt(write.wr_email)
@@ -616,7 +675,9 @@ def get_list(
     write.icon_secret = "secret" in write.wr_option
     write.icon_hot = board_config.is_icon_hot(write.wr_hit)
     write.icon_new = board_config.is_icon_new(write.wr_datetime)
-    write.icon_file = file_service.is_exist(board_config.board.bo_table, write.wr_id)
+    if icon_file is None:
+        icon_file = FileService(request, db).is_exist(board_config.board.bo_table, write.wr_id)
+    write.icon_file = icon_file
     write.icon_link = write.wr_link1 or write.wr_link2
     write.icon_reply = write.wr_reply
 
@@ -771,28 +832,37 @@ def send_write_mail(
             )
 
         # 중복 이메일 제거
-        send_email_list = list(set(send_email_list))
-        for email in send_email_list:
-            subject = f"[{config.cf_title}] {board.bo_subject} 게시판에 {act}이 등록되었습니다."
-            body = templates.TemplateResponse(
-                "bbs/mail_form/write_update_mail.html",
-                {
-                    "request": request,
-                    "act": act,
-                    "board": board,
-                    "wr_subject": write.wr_subject,
-                    "wr_name": write.wr_name,
-                    "wr_content": write.wr_content,
-                    "link_url": link_url,
-                },
-            ).body.decode("utf-8")
-            mailer(
-                get_admin_email(request),
-                email,
-                subject,
-                body,
-                get_admin_email_name(request),
-            )
+        send_email_list = [email for email in set(send_email_list) if email]
+        if not send_email_list:
+            return
+
+        # 받는 사람과 관계없이 같은 내용이므로 한번만 렌더링하고,
+        # 발송 대기열에 한번에 등록한다. (SMTP 발송은 스케줄러에서 처리)
+        subject = f"[{config.cf_title}] {board.bo_subject} 게시판에 {act}이 등록되었습니다."
+        body = templates.TemplateResponse(
+            "bbs/mail_form/write_update_mail.html",
+            {
+                "request": request,
+                "act": act,
+                "board": board,
+                "wr_subject": write.wr_subject,
+                "wr_name": write.wr_name,
+                "wr_content": write.wr_content,
+                "link_url": link_url,
+            },
+        ).body.decode("utf-8")
+        from_email = get_admin_email(request)
+        from_name = get_admin_email_name(request)
+        enqueue_mails(db, [
+            {
+                "from_email": from_email,
+                "to_email": email,
+                "subject": subject,
+                "body": body,
+                "from_name": from_name,
+            }
+            for email in send_email_list
+        ])
 
 
 def get_list_thumbnail(
@@ -804,6 +874,10 @@ def get_list_thumbnail(
     **kwargs,
 ):
     """게시글 목록의 섬네일 이미지를 생성한다.
+    - 게시글 목록에서 첨부파일을 미리 조회해 write.board_files에 담아둔 경우 DB를 다시 조회하지 않는다.
+    - 섬네일 목록(write.thumbnail_manifest)에 대표 이미지의 섬네일이 있으면 섬네일 파일만 확인한다.
+    - 섬네일이 없으면 생성을 예약하고, 생성될 때까지 이미지 없음 섬네일을 반환한다.
+      (request.state.thumbnail_pending 을 True로 설정)
 
     Args:
         request (Request): _description_
@@ -813,30 +887,41 @@ def get_list_thumbnail(
         thumb_height (int, optional): _description_. Defaults to 0.
     """
     config = request.state.config
-    with DBConnect().sessionLocal() as db:
-        service = FileService(request, db)
-        images, files = service.get_board_files_by_type(board.bo_table, write.wr_id)
+    board_files = getattr(write, "board_files", None)
+    manifest = getattr(write, "thumbnail_manifest", None)
+    if board_files is None or manifest is None:
+        with DBConnect().sessionLocal() as db:
+            if board_files is None:
+                board_files = FileService(request, db).get_board_files(board.bo_table, write.wr_id)
+            if manifest is None:
+                manifest = get_thumbnail_manifest_map(db, board.bo_table, [write.wr_id])[write.wr_id]
+    images, files = FileService(request, None).split_board_files_by_type(board_files)
+    size = (thumb_width, thumb_height)
+    entry = manifest.get(size)
     source_file = None
     result = {"src": "", "alt": "", "noimg": ""}
 
     if images:
-        # TODO : 게시글의 파일정보를 캐시된 데이터에서 조회한다.
         # 업로드 파일 목록
         source_file = images[0].bf_file
         result["alt"] = images[0].bf_content
+        # 섬네일 목록에 대표 이미지의 섬네일이 있으면 원본 파일을 확인하지 않음
+        if entry and entry.tm_source == source_file and os.path.exists(entry.tm_thumbnail):
+            result["src"] = entry.tm_thumbnail
+            return result
     else:
-        # TODO : 게시글의 본문정보를 캐시된 데이터에서 조회한다.
         # 게시글 본문
-        editor_images = get_editor_image(write.wr_content, view=False)
+        editor_images = get_editor_image_paths(write.wr_content)
+        if entry and entry.tm_source in editor_images and os.path.exists(entry.tm_thumbnail):
+            result["src"] = entry.tm_thumbnail
+            return result
+
         for image in editor_images:
             try:
                 ext = image.split(".")[-1].lower()
 
-                # 에디터로 삽입된 이미지의 주소는 웹 경로이기에 os.path로 체크할 수 있도록 경로를 변경한다.
-                # 외부 이미지도 썸네일로 보여지기를 희망하는 경우 썸네일 조건 및 생성 로직을 수정해야한다.
-                image = "./data/editor/" + image.split("/data/editor/")[1]
-
                 # image경로의 파일이 존재하고 이미지파일인지 확인
+                # 외부 이미지도 썸네일로 보여지기를 희망하는 경우 썸네일 조건 및 생성 로직을 수정해야한다.
                 if (
                     os.path.exists(image)
                     and os.path.isfile(image)
@@ -850,20 +935,18 @@ def get_list_thumbnail(
                 print(e)
                 continue
 
-    # 섬네일 생성
+    # 섬네일 생성 (요청 처리 중에는 생성하지 않고 예약한 뒤, 생성될 때까지 이미지 없음 섬네일을 출력)
+    # 원본 이미지를 그대로 출력하면 목록 한 페이지에 원본 크기의 이미지를 모두 내려받게 된다.
     if source_file:
-        result["src"] = thumbnail(
-            source_file, width=thumb_width, height=thumb_height, **kwargs
-        )
+        thumbnails = schedule_thumbnails(board.bo_table, write.wr_id, source_file, [size])
+        result["src"] = thumbnails.get(size)
+        if not result["src"]:
+            result["src"] = get_dummy_thumbnail(thumb_width, thumb_height)
+            # 이미지 없음 섬네일로 렌더링한 HTML은 캐시하지 않도록 표시 (render_latest_posts)
+            request.state.thumbnail_pending = True
     # 이미지가 없을 때
     else:
-        result["src"] = thumbnail(
-            "./static/img/dummy-donotremove.png",
-            target_path="./data/thumbnail_tmp",
-            width=thumb_width,
-            height=thumb_height,
-            **kwargs,
-        )
+        result["src"] = get_dummy_thumbnail(thumb_width, thumb_height)
         result["noimg"] = "img_not_found"
 
     return result
@@ -985,6 +1068,11 @@ def get_bo_table_list(added_bo_table_list: List[str] = None) -> list:
     return bo_table_list
 
 
+# 최신글 템플릿 전역 함수는 최초 1회만 등록
+latest_templates = UserTemplates()
+latest_templates.env.globals["get_list_thumbnail"] = get_list_thumbnail
+
+
 def render_latest_posts(
     request: Request,
     skin_name: str = "basic",
@@ -1004,17 +1092,13 @@ def render_latest_posts(
     Returns:
         str: 최신글 HTML
     """
-    templates = UserTemplates()
-    templates.env.globals["get_list_thumbnail"] = get_list_thumbnail
-
     device = request.state.device
-    file_cache = FileCache()
-    cache_filename = f"latest-{bo_table}-{device}-{skin_name}-{rows}-{subject_len}-{file_cache.get_cache_secret_key()}.html"
-    cache_file = os.path.join(file_cache.cache_dir, cache_filename)
+    cache_key = f"{device}-{skin_name}-{rows}-{subject_len}"
 
-    # 캐시된 파일이 있으면 파일을 읽어서 반환
-    if os.path.exists(cache_file):
-        return file_cache.get(cache_file)
+    # 캐시된 HTML이 있으면 반환
+    cached_html = latest_cache.get(bo_table, cache_key)
+    if cached_html is not None:
+        return cached_html
 
     with DBConnect().sessionLocal() as db:
         # 게시판 설정
@@ -1042,10 +1126,12 @@ def render_latest_posts(
         "writes": writes,
         "bo_table": bo_table,
     }
-    temp = templates.TemplateResponse(f"latest/{skin_name}.html", context)
+    request.state.thumbnail_pending = False
+    temp = latest_templates.TemplateResponse(f"latest/{skin_name}.html", context)
     temp_decode = temp.body.decode("utf-8")
 
-    # 캐시 파일 생성
-    file_cache.create(temp_decode, cache_file)
+    # 생성중인 섬네일이 있으면 캐시하지 않음 (섬네일이 기록되면 최신글 캐시도 무효화됨)
+    if not request.state.thumbnail_pending:
+        latest_cache.set(bo_table, cache_key, temp_decode)
 
     return temp_decode
@@ -27,6 +27,7 @@ from core.models import (
     BoardNew, Config, Member, Memo, UniqId, Visit, WriteBaseModel
 )
 from core.plugin import get_admin_menu_id_by_path
+from lib.ip_matcher import get_ip_matcher
 
 load_dotenv()
 
@@ -66,6 +67,8 @@ def dynamic_create_write_table(
             "__table_args__": (
                 Index(f'idx_wr_num_reply_{table_name}', 'wr_num', 'wr_reply'),
                 Index(f'idex_wr_is_comment_{table_name}', 'wr_is_comment'),
+                # 게시글별 댓글 조회
+                Index(f'idx_wr_parent_comment_{table_name}', 'wr_parent', 'wr_is_comment'),
                 {
                     "extend_existing": True,
                     **MySQLCharsetMixin().__table_args__
@@ -506,6 +509,29 @@ def calculator_image_resize(source_width, source_height, target_width=0, target_
 
 
 
+def reduce_image(image: Image.Image, width: int, height: int) -> Image.Image:
+    """섬네일 크기보다 작아지지 않는 범위에서 이미지를 빠르게 축소한다.
+    - JPEG: 디코딩할 때 1/2, 1/4, 1/8로 축소(draft)하여 원본 전체를 디코딩하지 않는다.
+    - 그 외: 정수배로 축소(reduce)한 뒤 ImageOps.fit으로 리샘플링한다.
+
+    Args:
+        image (Image.Image): 원본 이미지 객체
+        width (int): 섬네일 이미지 너비
+        height (int): 섬네일 이미지 높이
+
+    Returns:
+        Image.Image: 축소된 이미지 객체
+    """
+    if image.format == "JPEG":
+        image.draft(image.mode, (width, height))
+        return image
+
+    factor = min(image.width // width, image.height // height)
+    if factor >= 2 and image.mode in ("L", "LA", "RGB", "RGBA"):
+        return image.reduce(factor)
+    return image
+
+
 def thumbnail(source_file: str, target_path: str = None, width: int = 200, height: int = 150, **kwargs) -> str:
     """섬네일 이미지를 생성한다.
 
@@ -550,6 +576,7 @@ def thumbnail(source_file: str, target_path: str = None, width: int = 200, heigh
             expanded_img.save(thumbnail_file)
         else:
             # 이미지를 지정한 크기로 자르고 저장
+            source_image = reduce_image(source_image, width, height)
             ImageOps.fit(source_image, (width, height)).save(thumbnail_file)
             # source_image.thumbnail((width, height))
             # source_image.save(thumbnail_file)
@@ -727,21 +754,12 @@ def check_ip_list(request: Request, current_ip: str, ip_list: str, allow: bool)
     if request.state.is_super_admin:
         return allow
 
-    ip_list = ip_list.strip()
-    if not ip_list:
+    # 목록이 변경된 경우에만 새로 컴파일한다.
+    matcher = get_ip_matcher(ip_list)
+    if not matcher:
         return allow
 
-    ip_patterns = ip_list.split("\n")
-    for pattern in ip_patterns:
-        pattern = pattern.strip()
-        if not pattern:
-            continue
-        pattern = pattern.replace(".", r"\.")
-        pattern = pattern.replace("+", r"[0-9\.]+")
-        if re.match(f"^{pattern}$", current_ip):
-            return True
-
-    return False
+    return matcher.match(current_ip)
 
 
 def filter_words(request: Request, contents: str) -> str:
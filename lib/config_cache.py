@@ -0,0 +1,76 @@
+"""기본환경설정(Config) 프로세스 캐시
+
+요청마다 Config 테이블을 조회하지 않도록 프로세스 메모리에 캐시합니다.
+- 관리자에서 환경설정을 변경하면 invalidate_config_cache()를 호출합니다.
+- 여러 워커(--workers)간의 캐시 무효화는 버전 파일의 변경시간(mtime)으로 판단합니다.
+  (플러그인 상태파일의 get_plugin_state_change_time()과 같은 방식)
+"""
+import os
+import threading
+import time
+from typing import Optional
+
+import cachetools
+from sqlalchemy import select
+
+from core.database import DBConnect
+from core.models import Config
+
+CONFIG_VERSION_FILE_PATH = "data/cache/config_version.txt"
+
+# 전역 캐시
+# 키 값
+# config: 세션에서 분리(detach)된 Config 객체
+# version: 캐시 생성 당시의 설정 버전
+cache_config = cachetools.Cache(maxsize=2)
+_lock = threading.Lock()
+
+
+def get_config_version() -> int:
+    """환경설정 버전(버전 파일의 변경시간)을 반환한다.
+    Returns:
+        int: 버전 파일의 mtime(ns), 파일이 없으면 0
+    """
+    try:
+        return os.stat(CONFIG_VERSION_FILE_PATH).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def get_cached_config() -> Optional[Config]:
+    """캐시된 기본환경설정을 반환한다.
+    - 캐시가 없거나 버전이 변경되었으면 DB에서 다시 조회한다.
+    - 반환되는 객체는 세션에서 분리되어 있으므로 값을 변경해도 DB에 반영되지 않는다.
+    Returns:
+        Optional[Config]: 기본환경설정, 설치 전이면 None
+    """
+    version = get_config_version()
+    config = cache_config.get("config")
+    if config is not None and cache_config.get("version") == version:
+        return config
+
+    with _lock:
+        # 다른 스레드가 먼저 갱신했다면 그 값을 사용
+        config = cache_config.get("config")
+        if config is not None and cache_config.get("version") == version:
+            return config
+
+        # 세션을 닫으면 로드된 속성은 유지된 채 객체가 분리된다.
+        with DBConnect().sessionLocal() as db:
+            config = db.scalar(select(Config))
+
+        if config is not None:
+            cache_config["config"] = config
+            cache_config["version"] = version
+
+    return config
+
+
+def invalidate_config_cache() -> None:
+    """기본환경설정 캐시를 무효화한다.
+    - 현재 프로세스의 캐시를 비우고 버전 파일을 갱신하여 다른 워커에도 알린다.
+    """
+    cache_config.clear()
+    os.makedirs(os.path.dirname(CONFIG_VERSION_FILE_PATH), exist_ok=True)
+    with open(CONFIG_VERSION_FILE_PATH, "w", encoding="utf-8") as f:
+        f.write(str(time.time_ns()))
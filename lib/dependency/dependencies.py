@@ -5,7 +5,6 @@ from fastapi import (
     Depends, Form, HTTPException, Path, Query, Request, Response
 )
 from sqlalchemy import exists, inspect, select
-from sqlalchemy.exc import ProgrammingError
 
 from core.database import DBConnect
 from core.exception import AlertException, TemplateDisabledException
@@ -15,12 +14,10 @@ from core.template import get_theme_list
 from lib.captcha import get_current_captcha_cls
 from lib.common import get_client_ip, get_current_admin_menu_id
 from lib.dependency.auth import get_login_member_optional
+from lib.layout_cache import get_layout_data
 from lib.member import get_admin_type
 from lib.session_token import check_token
-from service.current_connect_service import CurrentConnectService
-from service.menu_service import MenuService
-from service.poll_service import PollService
-from service.popular_service import PopularService
+from service.current_connect_service import CurrentConnectService, presence_table
 
 
 async def get_variety_bo_table(
@@ -218,42 +215,27 @@ async def no_cache_response(response: Response):
 async def set_template_basic_data(
     request: Request,
     current_connect_service: Annotated[CurrentConnectService, Depends()],
-    menu_service: Annotated[MenuService, Depends()],
-    poll_service: Annotated[PollService, Depends()],
-    popular_service: Annotated[PopularService, Depends()]
 ):
-    """템플릿 기본 조회 데이터 설정"""
+    """템플릿 기본 조회 데이터 설정
+    - 메뉴, 최신 설문조사, 인기검색어는 레이아웃 데이터 캐시를 사용합니다.
+    """
     template_data = {
         "current_login_count": current_connect_service.fetch_total_records(),
-        "menus": menu_service.fetch_menus(),
-        "poll": poll_service.fetch_latest_poll(),
-        "populars": popular_service.fetch_populars(),
+        **get_layout_data(),
     }
     request.state.template_data = template_data
 
 
 async def set_current_connect(
         request: Request,
-        service: Annotated[CurrentConnectService, Depends()],
         member: Annotated[Member, Depends(get_login_member_optional)]):
-    """현재 접속자 정보 설정"""
-    try:
+    """현재 접속자 정보 설정
+    - 워커 메모리에 기록하고 백그라운드 작업이 일괄 저장합니다.
+    """
+    if not request.state.is_super_admin:
         current_ip = get_client_ip(request)
-        path = request.url.path
         mb_id = getattr(member, "mb_id", "")
-
-        if not request.state.is_super_admin:
-            current_login = service.fetch_current_connect(current_ip)
-            if current_login:
-                service.update_current_connect(current_login, path, mb_id)
-            else:
-                service.create_current_connect(current_ip, path, mb_id)
-
-        # 현재 로그인한 이력 삭제
-        service.delete_current_connect()
-
-    except ProgrammingError as e:
-        print(e)
+        presence_table.touch(current_ip, mb_id, request.url.path)
 
 
 def validate_login_url(request: Request, url: str = Form(default="/")):
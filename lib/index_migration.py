@@ -0,0 +1,182 @@
+"""테이블/인덱스 마이그레이션
+
+모델(core/models.py, 게시판 write_* 테이블)에 선언된 테이블과 인덱스 중
+기존 설치본의 데이터베이스에 없는 테이블과 인덱스를 생성합니다. (migrate_indexes.py)
+- 요청 처리 중에는 테이블/인덱스를 생성하지 않으므로 업데이트 후 서비스 전에 실행해야 합니다.
+- 없는 테이블은 인덱스를 포함해 생성하고, 기존 데이터로 채워야 하는 테이블은 TABLE_CREATORS의 함수로 생성합니다.
+- 게시판 테이블은 Board 테이블의 게시판 목록으로 dynamic_create_write_table() 모델을 만들어 확인합니다.
+- 같은 컬럼 순서로 시작하는 인덱스/유니크키/기본키가 이미 있으면 생성하지 않습니다.
+  유니크 인덱스는 같은 컬럼의 유니크키/기본키가 있어야 생성하지 않습니다.
+- 유니크 인덱스는 생성 전에 중복 데이터를 정리하고(UNIQUE_INDEX_PREPARERS), 같은 이름의 인덱스를 삭제합니다.
+- 서비스 중에도 실행할 수 있도록 테이블 잠금 없이 생성합니다.
+  (MySQL/MariaDB: ALGORITHM=INPLACE, LOCK=NONE, PostgreSQL: CREATE INDEX CONCURRENTLY)
+- 테이블/인덱스 생성에 실패하면 기록하고 나머지를 계속 생성합니다.
+"""
+import logging
+from typing import Iterator, List, Tuple
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import Index, Table, inspect, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateIndex
+
+from core.database import DBConnect
+from core.models import Base, Board, Login, PointExpire, SuiAwardLedger
+from lib.common import dynamic_create_write_table
+from service.current_connect_service import delete_duplicate_login_ips
+from service.point_service import create_point_expire_table
+from service.sui_award_ledger_service import create_award_ledger_table
+
+logger = logging.getLogger(__name__)
+
+# 생성 후 기존 데이터로 채워야 하는 테이블 (테이블명: 함수(db), 함수에서 테이블을 생성하고 채움)
+TABLE_CREATORS = {
+    PointExpire.__tablename__: create_point_expire_table,
+    SuiAwardLedger.__tablename__: create_award_ledger_table,
+}
+
+# 유니크 인덱스 생성 전에 중복 데이터를 정리하는 함수 (테이블명: 함수(connection))
+UNIQUE_INDEX_PREPARERS = {
+    Login.__tablename__: delete_duplicate_login_ips,
+}
+
+
+def get_model_tables(engine: Engine) -> List[Table]:
+    """인덱스를 확인할 테이블 목록 (모델 테이블 + 게시판 테이블)"""
+    with engine.connect() as connection:
+        bo_tables = connection.scalars(select(Board.bo_table)).all()
+    for bo_table in bo_tables:
+        dynamic_create_write_table(bo_table)
+    return list(Base.metadata.sorted_tables)
+
+
+def find_missing_tables(engine: Engine) -> List[Table]:
+    """데이터베이스에 없는 모델 테이블을 반환합니다."""
+    inspector = inspect(engine)
+    return [table for table in get_model_tables(engine) if not inspector.has_table(table.name)]
+
+
+def migrate_tables(engine: Engine = None, dry_run: bool = False) -> List[str]:
+    """데이터베이스에 없는 모델 테이블을 생성합니다.
+
+    Args:
+        engine (Engine, optional): 기본값은 DBConnect().engine
+        dry_run (bool, optional): True이면 생성할 테이블만 반환
+
+    Returns:
+        List[str]: 생성한(dry_run이면 생성할) 테이블 목록, 생성에 실패한 테이블은 제외
+    """
+    engine = engine or DBConnect().engine
+    missing = find_missing_tables(engine)
+    names = [table.name for table in missing]
+    if dry_run or not missing:
+        return names
+
+    created = []
+    for table in missing:
+        logger.info(f"테이블 생성: {table.name}")
+        try:
+            creator = TABLE_CREATORS.get(table.name)
+            if creator:
+                with Session(engine) as db:
+                    creator(db)
+            else:
+                table.create(bind=engine)
+        except Exception as e:
+            logger.exception(f"테이블 생성 실패: {table.name}: {e}")
+            continue
+        created.append(table.name)
+    return created
+
+
+def _existing_column_lists(inspector, table_name: str) -> List[Tuple[Tuple[str, ...], bool]]:
+    """테이블에 이미 있는 인덱스/유니크키/기본키의 (컬럼 목록, 유니크 여부)"""
+    column_lists = [(index["column_names"], bool(index["unique"])) for index in inspector.get_indexes(table_name)]
+    column_lists += [(unique["column_names"], True) for unique in inspector.get_unique_constraints(table_name)]
+    primary_key = inspector.get_pk_constraint(table_name).get("constrained_columns")
+    if primary_key:
+        column_lists.append((primary_key, True))
+    return [(tuple(column.lower() for column in columns if column), unique) for columns, unique in column_lists]
+
+
+def find_missing_indexes(engine: Engine) -> Iterator[Index]:
+    """데이터베이스에 없는 모델 인덱스를 반환합니다."""
+    inspector = inspect(engine)
+    for table in get_model_tables(engine):
+        if not inspector.has_table(table.name):
+            continue
+        existing = _existing_column_lists(inspector, table.name)
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            columns = tuple(column.name.lower() for column in index.columns)
+            if index.unique:
+                if (columns, True) in existing:
+                    continue
+            elif any(existing_columns[:len(columns)] == columns for existing_columns, _ in existing):
+                continue
+            yield index
+
+
+def prepare_unique_index(operations: Operations, index: Index) -> None:
+    """유니크 인덱스 생성 전에 중복 데이터를 정리하고 같은 이름의 (유니크가 아닌) 인덱스를 삭제합니다."""
+    connection = operations.get_bind()
+    table_name = index.table.name
+    preparer = UNIQUE_INDEX_PREPARERS.get(table_name)
+    if preparer:
+        deleted = preparer(connection)
+        logger.info(f"중복 데이터 삭제: {table_name} {deleted}건")
+    if any(existing["name"] == index.name for existing in inspect(connection).get_indexes(table_name)):
+        operations.drop_index(index.name, table_name=table_name)
+    connection.commit()
+
+
+def create_index_online(operations: Operations, index: Index) -> None:
+    """테이블 잠금 없이 인덱스를 생성합니다."""
+    connection = operations.get_bind()
+    dialect = connection.dialect.name
+    if dialect in ("mysql", "mariadb"):
+        ddl = str(CreateIndex(index).compile(dialect=connection.dialect))
+        operations.execute(text(f"{ddl} ALGORITHM=INPLACE LOCK=NONE"))
+    elif dialect == "postgresql":
+        # CONCURRENTLY는 트랜잭션 밖에서 실행해야 한다.
+        with operations.get_context().autocommit_block():
+            operations.create_index(index.name, index.table.name, [column.name for column in index.columns],
+                                    unique=index.unique, postgresql_concurrently=True)
+    else:
+        operations.create_index(index.name, index.table.name, [column.name for column in index.columns],
+                                unique=index.unique)
+
+
+def migrate_indexes(engine: Engine = None, dry_run: bool = False) -> List[str]:
+    """데이터베이스에 없는 모델 인덱스를 생성합니다.
+
+    Args:
+        engine (Engine, optional): 기본값은 DBConnect().engine
+        dry_run (bool, optional): True이면 생성할 인덱스만 반환
+
+    Returns:
+        List[str]: 생성한(dry_run이면 생성할) 인덱스 목록 ("테이블.인덱스"), 생성에 실패한 인덱스는 제외
+    """
+    engine = engine or DBConnect().engine
+    missing = list(find_missing_indexes(engine))
+    names = [f"{index.table.name}.{index.name}" for index in missing]
+    if dry_run or not missing:
+        return names
+
+    created = []
+    with engine.connect() as connection:
+        operations = Operations(MigrationContext.configure(connection))
+        for index, name in zip(missing, names):
+            logger.info(f"인덱스 생성: {name}")
+            try:
+                if index.unique:
+                    prepare_unique_index(operations, index)
+                create_index_online(operations, index)
+                connection.commit()
+            except Exception as e:
+                connection.rollback()
+                logger.exception(f"인덱스 생성 실패: {name}: {e}")
+                continue
+            created.append(name)
+    return created
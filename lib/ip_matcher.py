@@ -0,0 +1,134 @@
+"""접근허용/차단 IP 목록 검사
+
+기본환경설정의 접근가능 IP(cf_possible_ip), 접근차단 IP(cf_intercept_ip) 목록을
+요청마다 정규식으로 변환하지 않도록 미리 컴파일한 IPMatcher 객체로 검사합니다.
+- 123.123.123.123 : 일치하는 IP
+- 123.123.+ : + 는 숫자 또는 . 1자 이상 (기존 문법)
+- 123.123.0.0/16 : CIDR 범위 (IPv4, IPv6)
+목록 문자열이 같으면 같은 객체를 사용하므로 환경설정이 변경될 때만 다시 생성합니다.
+"""
+import ipaddress
+import re
+from typing import Dict, List, Optional, Set
+
+from cachetools import LRUCache, cached
+
+# 기존 문법(. 과 + 이외의 문자는 정규식으로 처리)에서 정규식으로 해석되는 문자
+REGEX_SPECIAL_CHARS = set("\\^$*?{}[]()|")
+PLUS_TAIL_CHARS = set("0123456789.")
+
+
+class _PrefixNode:
+    """+ 로 끝나는 패턴의 접두사 트리 노드"""
+    __slots__ = ("children", "terminal")
+
+    def __init__(self):
+        self.children: Dict[str, "_PrefixNode"] = {}
+        self.terminal = False
+
+
+class IPMatcher:
+    """IP 목록 검사 객체
+
+    Args:
+        ip_list (str): 줄바꿈으로 구분된 IP 목록
+    """
+
+    def __init__(self, ip_list: str):
+        self.exact: Set[str] = set()
+        self.prefix_root = _PrefixNode()
+        # 키 값: 프리픽스 길이, 값: 네트워크 주소(정수) 집합
+        self.networks: Dict[int, Dict[int, Set[int]]] = {4: {}, 6: {}}
+        self.regex: Optional[re.Pattern] = None
+        self.count = 0
+
+        regex_patterns: List[str] = []
+        for pattern in ip_list.split("\n"):
+            pattern = pattern.strip()
+            if not pattern:
+                continue
+            self.count += 1
+
+            if "/" in pattern and self._add_network(pattern):
+                continue
+            if any(char in REGEX_SPECIAL_CHARS for char in pattern):
+                regex_patterns.append(self._to_regex(pattern))
+            elif "+" not in pattern:
+                self.exact.add(pattern)
+            elif pattern.endswith("+") and "+" not in pattern[:-1]:
+                self._add_prefix(pattern[:-1])
+            else:
+                regex_patterns.append(self._to_regex(pattern))
+
+        if regex_patterns:
+            self.regex = re.compile("|".join(f"(?:{pattern})" for pattern in regex_patterns))
+
+    @staticmethod
+    def _to_regex(pattern: str) -> str:
+        """기존 문법의 패턴을 정규식으로 변환"""
+        pattern = pattern.replace(".", r"\.")
+        pattern = pattern.replace("+", r"[0-9\.]+")
+        return f"^{pattern}$"
+
+    def _add_network(self, pattern: str) -> bool:
+        try:
+            network = ipaddress.ip_network(pattern, strict=False)
+        except ValueError:
+            return False
+        prefixes = self.networks[network.version]
+        prefixes.setdefault(network.prefixlen, set()).add(int(network.network_address))
+        return True
+
+    def _add_prefix(self, prefix: str) -> None:
+        node = self.prefix_root
+        for char in prefix:
+            node = node.children.setdefault(char, _PrefixNode())
+        node.terminal = True
+
+    def _match_prefix(self, ip: str) -> bool:
+        """접두사 뒤에 숫자 또는 . 이 1자 이상 이어지는지 확인"""
+        node = self.prefix_root
+        for index, char in enumerate(ip):
+            if node.terminal and all(tail in PLUS_TAIL_CHARS for tail in ip[index:]):
+                return True
+            node = node.children.get(char)
+            if node is None:
+                return False
+        return False
+
+    def _match_network(self, ip: str) -> bool:
+        try:
+            address = ipaddress.ip_address(ip)
+        except ValueError:
+            return False
+        prefixes = self.networks[address.version]
+        if not prefixes:
+            return False
+        value = int(address)
+        bits = address.max_prefixlen
+        for prefixlen, network_addresses in prefixes.items():
+            mask = ((1 << prefixlen) - 1) << (bits - prefixlen)
+            if value & mask in network_addresses:
+                return True
+        return False
+
+    def match(self, ip: str) -> bool:
+        """IP가 목록에 속하는지 확인"""
+        if ip in self.exact:
+            return True
+        if self.prefix_root.children and self._match_prefix(ip):
+            return True
+        if self._match_network(ip):
+            return True
+        if self.regex and self.regex.match(ip):
+            return True
+        return False
+
+    def __bool__(self) -> bool:
+        return self.count > 0
+
+
+@cached(LRUCache(maxsize=8))
+def get_ip_matcher(ip_list: str) -> IPMatcher:
+    """IP 목록 문자열에 해당하는 IPMatcher를 반환 (목록이 변경된 경우에만 새로 생성)"""
+    return IPMatcher(ip_list or "")
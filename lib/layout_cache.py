@@ -0,0 +1,174 @@
+"""레이아웃(공통 화면) 데이터 프로세스 캐시
+
+템플릿 페이지마다 조회하는 메뉴, 최신 설문조사, 인기검색어를 프로세스 메모리에 캐시합니다.
+- 메뉴는 전체 메뉴를 1회 쿼리로 조회하여 트리(부모 메뉴의 sub 속성)로 구성합니다.
+- 관리자에서 메뉴/설문조사/인기검색어를 변경하면 invalidate_layout_cache()를 호출합니다.
+- 여러 워커(--workers)간의 캐시 무효화는 버전 파일의 변경시간(mtime)으로 판단합니다.
+  (lib/config_cache.py 와 같은 방식)
+- 인기검색어는 검색할 때마다 쌓이므로 TTL(60초) 동안만 캐시합니다.
+"""
+import os
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+import cachetools
+from sqlalchemy import desc, func, select
+from sqlalchemy.orm import Session
+
+from core.database import DBConnect
+from core.models import Menu, Poll, Popular
+
+LAYOUT_VERSION_FILE_PATH = "data/cache/layout_version.txt"
+POPULAR_CACHE_TTL = 60
+
+# 전역 캐시
+# 키 값
+# menus: 메뉴 트리, poll: 최신 설문조사 (세션에서 분리된 객체)
+# version: 캐시 생성 당시의 레이아웃 데이터 버전
+cache_layout = cachetools.Cache(maxsize=8)
+cache_populars = cachetools.TTLCache(maxsize=128, ttl=POPULAR_CACHE_TTL)
+_stats = {"hits": Counter(), "misses": Counter(), "invalidations": 0}
+_lock = threading.Lock()
+
+
+def get_layout_version() -> int:
+    """레이아웃 데이터 버전(버전 파일의 변경시간)을 반환한다.
+    Returns:
+        int: 버전 파일의 mtime(ns), 파일이 없으면 0
+    """
+    try:
+        return os.stat(LAYOUT_VERSION_FILE_PATH).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def fetch_menu_tree(db: Session) -> List[Menu]:
+    """1, 2단계 메뉴를 한번에 조회하여 부모 메뉴의 sub 속성에 자식 메뉴를 설정한다."""
+    menus = db.scalars(select(Menu).order_by(Menu.me_order, Menu.me_id)).all()
+
+    parents = []
+    children = {}
+    for menu in menus:
+        if len(menu.me_code) == 2:
+            parents.append(menu)
+        elif len(menu.me_code) == 4:
+            children.setdefault(menu.me_code[:2], []).append(menu)
+
+    for menu in parents:
+        menu.sub = children.get(menu.me_code, [])
+    return parents
+
+
+def fetch_latest_poll(db: Session) -> Optional[Poll]:
+    """사용 설정된 최신 설문조사 1건을 조회한다."""
+    return db.scalar(
+        select(Poll)
+        .where(Poll.po_use == 1)
+        .order_by(Poll.po_id.desc())
+    )
+
+
+def fetch_populars(db: Session, limit: int = 10, day: int = 3) -> list:
+    """현재 날짜와 day일 전 날짜 사이의 인기검색어를 조회한다."""
+    today = datetime.now()
+    before_day = today - timedelta(days=day)
+    return db.execute(
+        select(Popular.pp_word, func.count(Popular.pp_word).label('count'))
+        .where(
+            Popular.pp_word != '',
+            Popular.pp_date >= before_day,
+            Popular.pp_date <= today
+        )
+        .group_by(Popular.pp_word)
+        .order_by(desc('count'), Popular.pp_word)
+        .limit(limit)
+    ).all()
+
+
+def _check_version() -> None:
+    """다른 워커에서 무효화되었으면 캐시를 비운다."""
+    version = get_layout_version()
+    if cache_layout.get("version") != version:
+        with _lock:
+            if cache_layout.get("version") != version:
+                cache_layout.clear()
+                cache_populars.clear()
+                cache_layout["version"] = version
+
+
+def _get_cached(cache: cachetools.Cache, key, name: str, loader):
+    """캐시된 값을 반환하고, 없으면 별도 세션으로 조회하여 캐시한다."""
+    _check_version()
+    if key in cache:
+        _stats["hits"][name] += 1
+        return cache[key]
+
+    with _lock:
+        if key in cache:
+            _stats["hits"][name] += 1
+            return cache[key]
+
+        _stats["misses"][name] += 1
+        # 세션을 닫으면 로드된 속성은 유지된 채 객체가 분리된다.
+        with DBConnect().sessionLocal() as db:
+            value = loader(db)
+        cache[key] = value
+    return value
+
+
+def get_cached_menus() -> List[Menu]:
+    """캐시된 메뉴 트리를 반환한다."""
+    return _get_cached(cache_layout, "menus", "menus", fetch_menu_tree)
+
+
+def get_cached_latest_poll() -> Optional[Poll]:
+    """캐시된 최신 설문조사를 반환한다."""
+    return _get_cached(cache_layout, "poll", "poll", fetch_latest_poll)
+
+
+def get_cached_populars(limit: int = 10, day: int = 3) -> list:
+    """캐시된 인기검색어를 반환한다."""
+    return _get_cached(cache_populars, (limit, day), "populars",
+                       lambda db: fetch_populars(db, limit, day))
+
+
+def get_layout_data() -> dict:
+    """템플릿 공통 화면에 사용하는 데이터를 반환한다."""
+    return {
+        "menus": get_cached_menus(),
+        "poll": get_cached_latest_poll(),
+        "populars": get_cached_populars(),
+    }
+
+
+def invalidate_layout_cache() -> None:
+    """레이아웃 데이터 캐시를 무효화한다.
+    - 현재 프로세스의 캐시를 비우고 버전 파일을 갱신하여 다른 워커에도 알린다.
+    """
+    with _lock:
+        cache_layout.clear()
+        cache_populars.clear()
+        _stats["invalidations"] += 1
+    os.makedirs(os.path.dirname(LAYOUT_VERSION_FILE_PATH), exist_ok=True)
+    with open(LAYOUT_VERSION_FILE_PATH, "w", encoding="utf-8") as f:
+        f.write(str(time.time_ns()))
+
+
+def get_layout_cache_stats() -> List[dict]:
+    """현재 프로세스의 레이아웃 데이터 캐시 적중/실패 통계를 반환한다."""
+    stats = []
+    for name in ("menus", "poll", "populars"):
+        hits = _stats["hits"][name]
+        misses = _stats["misses"][name]
+        requests = hits + misses
+        stats.append({
+            "name": name,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / requests * 100, 1) if requests else 0.0,
+            "invalidations": _stats["invalidations"],
+        })
+    return stats
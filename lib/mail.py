@@ -2,31 +2,24 @@
 메일 발송 라이브러리
 - background에서 Session 공유 문제로 인해 DBConnect().sessionLocal()을 사용함
 """
-import smtplib
 from datetime import datetime
-from email.header import Header
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.utils import formataddr
 
 from fastapi import Request
 from fastapi.templating import Jinja2Templates
 
 from core.database import DBConnect
 from core.models import Config, Member, PollEtc, QaConfig, QaContent
-from core.settings import settings
 from core.template import TemplateService
 from lib.common import cut_name, get_admin_email, get_admin_email_name
-
-_SMTP_SERVER = settings.SMTP_SERVER
-_SMTP_PORT = settings.SMTP_PORT
-_SMTP_USERNAME = settings.SMTP_USERNAME
-_SMTP_PASSWORD = settings.SMTP_PASSWORD
+from service.mail_queue_service import enqueue_mail
 
 
 def mailer(from_email: str, to_email: str, subject: str, body: str,
            from_name: str = None, to_name: str = None) -> None:
     """메일 발송 함수
+    - 요청 처리 중에 SMTP 서버에 연결하지 않도록 메일 발송 대기열에 등록하고,
+      스케줄러가 SMTP 연결을 재사용하여 모아서 발송합니다.
+      (service/mail_queue_service.py)
 
     Args:
         from_email (str): 보내는 사람 이메일
@@ -35,46 +28,12 @@ def mailer(from_email: str, to_email: str, subject: str, body: str,
         body (str): 내용
         from_name (str, optional): 보내는 사람 이름. Defaults to None.
         to_name (str, optional): 받는 사람 이름. Defaults to None.
-
-    Raises:
-        SMTPAuthenticationError: SMTP 인증정보가 잘못되었을 때
-        SMTPServerDisconnected: SMTP 서버에 연결하지 못했거나 연결이 끊어졌을 때
-        SMTPException: 메일을 보내는 중에 오류가 발생했을 때
-        Exception: 기타 오류
     """
     try:
-        # Daum, Naver 메일은 SMTP_SSL을 사용합니다.
-        if _SMTP_PORT == 465:
-            server = smtplib.SMTP_SSL(_SMTP_SERVER, _SMTP_PORT, timeout=10)
-        else: # port: 587
-            server = smtplib.SMTP(_SMTP_SERVER, _SMTP_PORT, timeout=10)
-            server.starttls()
-
-        if _SMTP_USERNAME and _SMTP_PASSWORD:
-            server.login(_SMTP_USERNAME, _SMTP_PASSWORD)
-
-        msg = MIMEMultipart()
-        msg['From'] = formataddr((str(Header(from_name, 'utf-8')), from_email))
-        msg['To'] = formataddr((str(Header(to_name, 'utf-8')), to_email))
-        msg['Subject'] = subject
-        # Assuming body is HTML, if not change 'html' to 'plain'
-        msg.attach(MIMEText(body, 'html'))
-
-        server.sendmail(from_email, to_email, msg.as_string())
-
-    except smtplib.SMTPAuthenticationError as e:
-        print(f"SMTP 인증정보가 잘못되었습니다. {e}")
-    except smtplib.SMTPServerDisconnected as e:
-        print(f"SMTP 서버에 연결하지 못했거나 연결이 끊어졌습니다. {e}")
-    except smtplib.SMTPException as e:
-        print(f"메일을 보내는 중에 오류가 발생했습니다. {e}")
+        with DBConnect().sessionLocal() as db:
+            enqueue_mail(db, from_email, to_email, subject, body, from_name, to_name)
     except Exception as e:
-        print(e)
-    finally:
-        try:
-            server.quit()
-        except Exception as e:
-            pass
+        print(f"메일 발송 대기열에 등록하지 못했습니다. {e}")
 
 
 async def send_password_reset_mail(request: Request, member: Member) -> None:
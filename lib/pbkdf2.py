@@ -1,7 +1,9 @@
+import asyncio
 import hashlib
 import os
 import base64
 import hmac
+from concurrent.futures import ThreadPoolExecutor
 from math import ceil
 
 # Constants
@@ -10,6 +12,13 @@ PBKDF2_COMPAT_ITERATIONS = 12000
 PBKDF2_COMPAT_SALT_BYTES = 24
 PBKDF2_COMPAT_HASH_BYTES = 24
 
+# 비밀번호 검증/생성 전용 스레드 풀
+# hashlib.pbkdf2_hmac 은 계산중에 GIL을 해제하므로 이벤트 루프를 막지 않고 병렬로 처리된다.
+# 동시에 많은 로그인 요청이 와도 CPU를 모두 사용하지 않도록 스레드 수를 제한한다.
+PASSWORD_HASH_MAX_WORKERS = min(4, os.cpu_count() or 1)
+_password_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_MAX_WORKERS,
+                                        thread_name_prefix="pbkdf2")
+
 
 def create_hash(password, force_compat=False):
     salt = base64.b64encode(os.urandom(PBKDF2_COMPAT_SALT_BYTES)).decode('utf-8')
@@ -26,7 +35,17 @@ def validate_password(password, hash):
     
     pbkdf2 = base64.b64decode(params[3])
     pbkdf2_check = pbkdf2_default(params[0], password, params[2], int(params[1]), len(pbkdf2))
-    return slow_equals(pbkdf2, pbkdf2_check)
+    return hmac.compare_digest(pbkdf2, pbkdf2_check)
+
+async def validate_password_async(password, hash):
+    """비밀번호 검증을 스레드 풀에서 실행한다. (async 함수에서 사용)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, validate_password, password, hash)
+
+async def create_hash_async(password):
+    """비밀번호 해시 생성을 스레드 풀에서 실행한다. (async 함수에서 사용)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, create_hash, password)
 
 def slow_equals(a, b):
     diff = len(a) ^ len(b)
@@ -39,12 +58,22 @@ def slow_equals(a, b):
     return diff == 0
 
 def needs_upgrade(hash):
+    """현재 설정(알고리즘, 반복 횟수, 길이)과 다르게 생성된 해시인지 확인한다.
+    - 비밀번호 검증에 성공한 후 True 이면 create_hash()로 다시 생성하여 저장한다.
+    """
     params = hash.split(':')
     if len(params) < 4:
         return True
-    
-    # You can add more conditions to check if the hash needs an upgrade
-    return False
+
+    try:
+        iterations = int(params[1])
+        hash_bytes = len(base64.b64decode(params[3]))
+    except ValueError:
+        return True
+
+    return (params[0].lower() != PBKDF2_COMPAT_HASH_ALGORITHM.lower()
+            or iterations < PBKDF2_COMPAT_ITERATIONS
+            or hash_bytes < PBKDF2_COMPAT_HASH_BYTES)
 
 def pbkdf2_default(algo, password, salt, count, key_length):
     if count <= 0 or key_length <= 0:
@@ -63,6 +92,18 @@ def pbkdf2_default(algo, password, salt, count, key_length):
         else:
             raise ValueError('PBKDF2 ERROR: Hash algorithm not supported.')
     
+    try:
+        # OpenSSL 구현을 사용 (아래 pbkdf2_python과 같은 결과)
+        return hashlib.pbkdf2_hmac(algo, password.encode(), salt, count, key_length)
+    except ValueError:
+        # OpenSSL에서 HMAC을 지원하지 않는 알고리즘
+        return pbkdf2_python(algo, password, salt, count, key_length)
+
+def pbkdf2_python(algo, password, salt, count, key_length):
+    """PBKDF2 순수 파이썬 구현 (hashlib.pbkdf2_hmac을 사용할 수 없는 경우)"""
+    if isinstance(salt, str):
+        salt = salt.encode()
+
     hash_length = len(hashlib.new(algo).digest())
     block_count = ceil(key_length / hash_length)
     
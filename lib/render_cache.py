@@ -0,0 +1,166 @@
+"""렌더링 결과(HTML) 캐시
+
+최신글 등 렌더링된 HTML을 프로세스 메모리(LRU)와 파일에 캐시합니다.
+- 캐시는 태그(게시판 코드 등)로 묶어서 관리하며, 태그 단위로 무효화합니다.
+- 무효화는 태그의 버전 파일만 갱신하므로 캐시 파일 수와 관계없이 O(1)입니다.
+  캐시(메모리/파일)에 생성 당시의 버전을 함께 저장하고, 버전이 다르면 만료된 것으로 판단합니다.
+- 여러 워커(--workers)간의 무효화는 버전 파일의 변경시간(mtime)으로 판단합니다.
+  (lib/config_cache.py 와 같은 방식)
+"""
+import hashlib
+import os
+import re
+import threading
+import time
+from typing import Optional
+
+import cachetools
+
+RENDER_CACHE_DIR = os.path.join("data", "cache")
+RENDER_CACHE_MAXSIZE = 512  # 메모리에 보관할 최대 캐시 수
+RENDER_CACHE_TTL = 3600  # 캐시 유지 시간 (초)
+VERSION_FILE_NAME = ".version"
+
+
+def _safe_name(value: str) -> str:
+    """파일/디렉토리 이름으로 사용할 수 없는 문자를 제거한다."""
+    return re.sub(r"[^0-9a-zA-Z_\-]", "_", str(value)) or "_"
+
+
+class RenderCache:
+    """태그 단위로 무효화할 수 있는 렌더링 캐시
+
+    Args:
+        name (str): 캐시 이름 (캐시 파일 디렉토리: data/cache/{name})
+        maxsize (int, optional): 메모리에 보관할 최대 캐시 수
+        ttl (int, optional): 캐시 유지 시간 (초)
+    """
+
+    def __init__(self, name: str, maxsize: int = RENDER_CACHE_MAXSIZE, ttl: int = RENDER_CACHE_TTL):
+        self.name = name
+        self.ttl = ttl
+        self.cache_dir = os.path.join(RENDER_CACHE_DIR, name)
+        # 키 값: (태그, 키), 값: (HTML, 캐시 생성 당시의 태그 버전)
+        self._memory = cachetools.TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self._secret_key = None
+        self._stats = {"memory_hits": 0, "file_hits": 0, "misses": 0, "invalidations": 0}
+
+    def _get_secret_key(self) -> str:
+        """캐시 파일 이름을 추측할 수 없도록 사용하는 6자리 문자열"""
+        if self._secret_key is None:
+            combined_data = os.environ.get("SERVER_SOFTWARE", "") + os.environ.get("DOCUMENT_ROOT", "")
+            self._secret_key = hashlib.md5(combined_data.encode()).hexdigest()[:6]
+        return self._secret_key
+
+    def _tag_dir(self, tag: str) -> str:
+        return os.path.join(self.cache_dir, _safe_name(tag))
+
+    def _file_path(self, tag: str, key: str) -> str:
+        return os.path.join(self._tag_dir(tag), f"{_safe_name(key)}-{self._get_secret_key()}.html")
+
+    @staticmethod
+    def _mtime(path: str) -> int:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return 0
+
+    def get_version(self, tag: str) -> int:
+        """태그의 캐시 버전을 반환한다. (전체/태그 버전 파일 중 최근 변경시간)"""
+        return max(
+            self._mtime(os.path.join(self.cache_dir, VERSION_FILE_NAME)),
+            self._mtime(os.path.join(self._tag_dir(tag), VERSION_FILE_NAME)),
+        )
+
+    def get(self, tag: str, key: str) -> Optional[str]:
+        """캐시된 HTML을 반환한다. 없거나 만료되었으면 None"""
+        version = self.get_version(tag)
+        cached = self._memory.get((tag, key))
+        if cached is not None and cached[1] == version:
+            self._stats["memory_hits"] += 1
+            return cached[0]
+
+        file_path = self._file_path(tag, key)
+        file_mtime = self._mtime(file_path)
+        if file_mtime and time.time_ns() - file_mtime < self.ttl * 1_000_000_000:
+            try:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    # 첫 줄: 캐시 생성 당시의 태그 버전
+                    file_version, _, html = f.read().partition("\n")
+            except OSError:
+                file_version, html = None, None
+            if file_version == str(version):
+                with self._lock:
+                    self._memory[(tag, key)] = (html, version)
+                self._stats["file_hits"] += 1
+                return html
+
+        self._stats["misses"] += 1
+        return None
+
+    def set(self, tag: str, key: str, html: str) -> None:
+        """렌더링된 HTML을 캐시한다."""
+        version = self.get_version(tag)
+        with self._lock:
+            self._memory[(tag, key)] = (html, version)
+
+        file_path = self._file_path(tag, key)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        # 다른 워커가 쓰는 중인 파일을 읽지 않도록 임시 파일에 쓴 후 교체
+        temp_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(f"{version}\n{html}")
+        os.replace(temp_path, file_path)
+
+    def _touch_version(self, directory: str) -> None:
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, VERSION_FILE_NAME), "w", encoding="utf-8") as f:
+            f.write(str(time.time_ns()))
+
+    def invalidate(self, tag: str) -> None:
+        """태그의 캐시를 모두 무효화한다."""
+        self._touch_version(self._tag_dir(tag))
+        self._stats["invalidations"] += 1
+
+    def clear(self) -> None:
+        """모든 캐시를 무효화한다. (테마 변경, 캐시 일괄삭제 등)"""
+        with self._lock:
+            self._memory.clear()
+        self._touch_version(self.cache_dir)
+        self._stats["invalidations"] += 1
+
+    def stats(self) -> dict:
+        """현재 프로세스의 캐시 적중/실패 통계를 반환한다."""
+        hits = self._stats["memory_hits"] + self._stats["file_hits"]
+        requests = hits + self._stats["misses"]
+        return {
+            "name": self.name,
+            **self._stats,
+            "hits": hits,
+            "hit_rate": round(hits / requests * 100, 1) if requests else 0.0,
+            "size": len(self._memory),
+            "maxsize": self._memory.maxsize,
+        }
+
+
+# 최신글 캐시 (태그: 게시판 코드)
+latest_cache = RenderCache("latest")
+
+
+def invalidate_latest_cache(bo_table: str) -> None:
+    """게시판의 최신글 캐시를 무효화한다."""
+    latest_cache.invalidate(bo_table)
+
+
+def get_board_version(bo_table: str) -> int:
+    """게시판 데이터 버전을 반환한다.
+    - 게시글이 작성/수정/삭제될 때(invalidate_latest_cache) 변경되므로
+      게시판 데이터로 만든 다른 캐시의 키로도 사용한다. (예: 이전글/다음글)
+    """
+    return latest_cache.get_version(bo_table)
+
+
+def get_render_cache_stats() -> list:
+    """렌더링 캐시 통계 목록을 반환한다."""
+    return [latest_cache.stats()]
@@ -4,6 +4,13 @@
 
 #from datetime import datetime
 
+from lib.search_index import build_search_index
+from service.current_connect_service import process_expired_connects
+from service.mail_queue_service import process_mail_queue
+from service.point_service import process_point_expire
+from service.sui_mint_queue_service import process_mint_jobs, process_reclaim_jobs
+from service.visit_rollup_service import process_visit_rollup
+
 
 # def interval_print_date_time():
 #     print(f"interval print: {datetime.now()}")
@@ -14,4 +21,39 @@ interval_jobs = [
     #     'job_func': interval_print_date_time,
     #     'expression': {'seconds': 2}
     # },
-]
\ No newline at end of file
+    {
+        'job_id': 'interval_sui_mint',
+        'job_func': process_mint_jobs,
+        'expression': {'seconds': 5, 'max_instances': 1, 'coalesce': True}
+    },
+    {
+        'job_id': 'interval_sui_reclaim',
+        'job_func': process_reclaim_jobs,
+        'expression': {'seconds': 30, 'max_instances': 1, 'coalesce': True}
+    },
+    {
+        'job_id': 'interval_search_index',
+        'job_func': build_search_index,
+        'expression': {'minutes': 1, 'max_instances': 1, 'coalesce': True}
+    },
+    {
+        'job_id': 'interval_visit_rollup',
+        'job_func': process_visit_rollup,
+        'expression': {'minutes': 1, 'max_instances': 1, 'coalesce': True}
+    },
+    {
+        'job_id': 'interval_current_connect',
+        'job_func': process_expired_connects,
+        'expression': {'minutes': 1, 'max_instances': 1, 'coalesce': True}
+    },
+    {
+        'job_id': 'interval_mail_queue',
+        'job_func': process_mail_queue,
+        'expression': {'seconds': 5, 'max_instances': 1, 'coalesce': True}
+    },
+    {
+        'job_id': 'interval_point_expire',
+        'job_func': process_point_expire,
+        'expression': {'minutes': 10, 'max_instances': 1, 'coalesce': True}
+    },
+]
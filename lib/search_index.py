@@ -0,0 +1,334 @@
+"""전체검색 색인
+
+게시판마다 LIKE '%단어%' 검색을 하지 않도록 게시글/댓글의 n-gram 역색인을 관리합니다.
+- 색인 백엔드는 .env의 SEARCH_INDEX_BACKEND 로 선택합니다. (db: 기본, none: 색인 미사용)
+- 다른 백엔드는 register_search_index_backend()로 등록할 수 있습니다.
+- 게시글 작성/수정/삭제/이동시 색인을 갱신하고,
+  기존 게시글은 스케줄러(build_search_index)가 게시판 단위로 색인합니다.
+- 색인이 완료되지 않은 게시판이나 색인으로 처리할 수 없는 검색은 LIKE 검색을 사용합니다.
+- 색인으로 찾은 후보 게시글은 LIKE 조건으로 다시 확인하므로 검색 결과는 LIKE 검색과 같습니다.
+"""
+import html
+import logging
+import re
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Type
+
+from sqlalchemy import and_, case, delete, distinct, func, insert, literal, or_, select, true, union_all
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from core.database import DBConnect
+from core.models import Board, SearchIndexBoard, SearchIndexToken, WriteBaseModel
+from core.settings import settings
+from lib.common import dynamic_create_write_table
+
+logger = logging.getLogger(__name__)
+
+NGRAM_SIZE = 2  # 한글은 형태소 분석 없이 2-gram으로 분리
+SUBJECT_WEIGHT = 3  # 제목에 포함된 토큰의 가중치
+INDEX_FIELDS = {"wr_subject", "wr_content"}  # 색인 검색이 가능한 필드
+REBUILD_CHUNK_SIZE = 500  # 게시판 색인 생성시 한번에 처리할 게시글 수
+
+_TAG_PATTERN = re.compile(r"<[^>]*>")
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def _split_words(text: str) -> List[str]:
+    """HTML 태그를 제거하고 소문자 단어 목록으로 분리한다."""
+    if not text:
+        return []
+    text = html.unescape(_TAG_PATTERN.sub(" ", text)).lower()
+    return _WORD_PATTERN.findall(text)
+
+
+def tokenize(text: str) -> Counter:
+    """문자열을 n-gram 토큰으로 분리하여 토큰별 출현 횟수를 반환한다.
+    - NGRAM_SIZE 이하의 단어는 단어 자체를 토큰으로 사용한다.
+    """
+    tokens = Counter()
+    for word in _split_words(text):
+        if len(word) <= NGRAM_SIZE:
+            tokens[word] += 1
+            continue
+        for i in range(len(word) - NGRAM_SIZE + 1):
+            tokens[word[i:i + NGRAM_SIZE]] += 1
+    return tokens
+
+
+def tokenize_query(keyword: str) -> Optional[Set[str]]:
+    """검색어 단어를 토큰 집합으로 분리한다.
+
+    Returns:
+        Optional[Set[str]]: 토큰 집합, NGRAM_SIZE보다 짧은 단어가 있어 색인으로 찾을 수 없으면 None
+    """
+    words = _split_words(keyword)
+    if not words or any(len(word) < NGRAM_SIZE for word in words):
+        return None
+    return set(tokenize(" ".join(words)))
+
+
+def _like_filter(model: WriteBaseModel, words: List[str], fields: Set[str], operator: str):
+    """LIKE 검색(write_search_filter)과 같은 검색 조건을 반환한다."""
+    word_filters = [
+        or_(*[getattr(model, field).like(f"%{word}%") for field in sorted(fields)])
+        for word in words if word.strip()
+    ]
+    return and_(*word_filters) if operator == "and" else or_(*word_filters)
+
+
+class SearchIndexBackend:
+    """검색 색인 백엔드 기본 클래스 (색인 미사용)
+    - 색인 생성이 완료된 게시판이 없으므로 항상 LIKE 검색을 사용합니다.
+    """
+    enabled = False
+
+    def is_ready(self, db: Session, bo_tables: List[str]) -> Set[str]:
+        """색인 생성이 완료된 게시판 목록을 반환한다."""
+        return set()
+
+    def index_write(self, db: Session, bo_table: str, write: WriteBaseModel) -> None:
+        """게시글(댓글)의 색인을 갱신한다."""
+
+    def delete_write(self, db: Session, bo_table: str, wr_id: int) -> None:
+        """게시글의 색인을 삭제한다. 게시글의 댓글 색인도 함께 삭제한다."""
+
+    def rebuild_board(self, db: Session, bo_table: str) -> int:
+        """게시판 전체 색인을 다시 생성한다."""
+        return 0
+
+    def search(
+        self,
+        db: Session,
+        bo_tables: List[str],
+        words: List[str],
+        fields: Set[str],
+        operator: str,
+        offset: int,
+        limit: int,
+    ) -> Optional[dict]:
+        """여러 게시판을 한번에 검색한다.
+
+        Returns:
+            Optional[dict]: 색인으로 검색할 수 없으면 None
+                - counts: 게시판별 검색 결과 수
+                - hits: 게시판별 offset ~ offset + limit 범위의 (bo_table, wr_id, score) 목록 (점수순)
+        """
+        return None
+
+
+class DBSearchIndex(SearchIndexBackend):
+    """DB 테이블에 저장하는 n-gram 역색인"""
+    enabled = True
+
+    def is_ready(self, db: Session, bo_tables: List[str]) -> Set[str]:
+        if not bo_tables:
+            return set()
+        return set(db.scalars(
+            select(SearchIndexBoard.bo_table).where(SearchIndexBoard.bo_table.in_(bo_tables))
+        ).all())
+
+    def _make_rows(self, bo_table: str, write: WriteBaseModel) -> List[dict]:
+        subject_tokens = tokenize(write.wr_subject)
+        content_tokens = tokenize(write.wr_content)
+        return [
+            {
+                "bo_table": bo_table,
+                "wr_id": write.wr_id,
+                "wr_parent": write.wr_parent or write.wr_id,
+                "wr_is_comment": write.wr_is_comment or 0,
+                "sit_token": token,
+                "sit_subject_count": subject_tokens.get(token, 0),
+                "sit_content_count": content_tokens.get(token, 0),
+            }
+            for token in subject_tokens.keys() | content_tokens.keys()
+        ]
+
+    def _insert_rows(self, db: Session, rows: List[dict]) -> None:
+        if rows:
+            db.execute(insert(SearchIndexToken), rows)
+
+    def index_write(self, db: Session, bo_table: str, write: WriteBaseModel) -> None:
+        db.execute(
+            delete(SearchIndexToken)
+            .where(SearchIndexToken.bo_table == bo_table, SearchIndexToken.wr_id == write.wr_id)
+        )
+        self._insert_rows(db, self._make_rows(bo_table, write))
+
+    def delete_write(self, db: Session, bo_table: str, wr_id: int) -> None:
+        db.execute(
+            delete(SearchIndexToken)
+            .where(
+                SearchIndexToken.bo_table == bo_table,
+                or_(SearchIndexToken.wr_id == wr_id, SearchIndexToken.wr_parent == wr_id)
+            )
+        )
+
+    def rebuild_board(self, db: Session, bo_table: str) -> int:
+        write_model = dynamic_create_write_table(bo_table)
+        db.execute(delete(SearchIndexToken).where(SearchIndexToken.bo_table == bo_table))
+        db.execute(delete(SearchIndexBoard).where(SearchIndexBoard.bo_table == bo_table))
+        db.commit()
+
+        # wr_id 기준으로 나누어 색인 (작업 중에 작성된 글과 중복되지 않도록 범위별로 삭제 후 추가)
+        total = 0
+        last_wr_id = 0
+        while True:
+            writes = db.scalars(
+                select(write_model)
+                .where(write_model.wr_id > last_wr_id)
+                .order_by(write_model.wr_id)
+                .limit(REBUILD_CHUNK_SIZE)
+            ).all()
+            if not writes:
+                break
+            wr_ids = [write.wr_id for write in writes]
+            db.execute(
+                delete(SearchIndexToken)
+                .where(SearchIndexToken.bo_table == bo_table, SearchIndexToken.wr_id.in_(wr_ids))
+            )
+            rows = []
+            for write in writes:
+                rows.extend(self._make_rows(bo_table, write))
+            self._insert_rows(db, rows)
+            db.commit()
+            db.expunge_all()
+            total += len(writes)
+            last_wr_id = wr_ids[-1]
+
+        db.add(SearchIndexBoard(bo_table=bo_table, sib_datetime=datetime.now()))
+        db.commit()
+        return total
+
+    def search(
+        self,
+        db: Session,
+        bo_tables: List[str],
+        words: List[str],
+        fields: Set[str],
+        operator: str,
+        offset: int,
+        limit: int,
+    ) -> Optional[dict]:
+        if not bo_tables or not fields or not fields <= INDEX_FIELDS:
+            return None
+        word_tokens = [tokenize_query(word) for word in words if word.strip()]
+        if not word_tokens or any(tokens is None for tokens in word_tokens):
+            return None
+
+        token = SearchIndexToken
+        if fields == {"wr_subject"}:
+            score = token.sit_subject_count
+            field_filter = token.sit_subject_count > 0
+        elif fields == {"wr_content"}:
+            score = token.sit_content_count
+            field_filter = token.sit_content_count > 0
+        else:
+            score = token.sit_subject_count * SUBJECT_WEIGHT + token.sit_content_count
+            field_filter = true()
+
+        # 검색어 단어별로 모든 토큰이 포함된 게시글만 일치하는 것으로 판단
+        word_matches = [
+            func.count(distinct(case((token.sit_token.in_(tokens), token.sit_token)))) == len(tokens)
+            for tokens in word_tokens
+        ]
+        all_tokens = set().union(*word_tokens)
+        # 토큰이 다른 단어/필드에 흩어져 있어도 후보가 되므로 게시판별로 LIKE 조건을 다시 확인
+        # (후보 게시글만 기본키로 조회하므로 게시판 전체를 LIKE 검색하지 않음)
+        board_matches = []
+        for bo_table in bo_tables:
+            candidates = (
+                select(token.wr_id, func.sum(score).label("score"))
+                .where(token.bo_table == bo_table, token.sit_token.in_(all_tokens), field_filter)
+                .group_by(token.wr_id)
+                .having(and_(*word_matches) if operator == "and" else or_(*word_matches))
+                .subquery()
+            )
+            model = dynamic_create_write_table(bo_table)
+            board_matches.append(
+                select(literal(bo_table).label("bo_table"), candidates.c.wr_id, candidates.c.score)
+                .join(model, model.wr_id == candidates.c.wr_id)
+                .where(_like_filter(model, words, fields, operator))
+            )
+        matched = union_all(*board_matches).subquery()
+        ranked = select(
+            matched.c.bo_table,
+            matched.c.wr_id,
+            matched.c.score,
+            func.row_number().over(
+                partition_by=matched.c.bo_table,
+                order_by=(matched.c.score.desc(), matched.c.wr_id.desc())
+            ).label("search_rank"),
+            func.count().over(partition_by=matched.c.bo_table).label("board_count"),
+        ).subquery()
+        # 게시판별 결과 수를 함께 얻기 위해 1순위 결과는 항상 포함
+        query = (
+            select(ranked)
+            .where(or_(ranked.c.search_rank == 1, ranked.c.search_rank.between(offset + 1, offset + limit)))
+            .order_by(ranked.c.score.desc(), ranked.c.bo_table, ranked.c.wr_id.desc())
+        )
+        try:
+            rows = db.execute(query).all()
+        except DBAPIError as e:
+            # 윈도우 함수를 지원하지 않는 DB 등
+            logger.warning(f"검색 색인 조회 실패, LIKE 검색을 사용합니다: {e}")
+            db.rollback()
+            return None
+
+        counts = {}
+        hits = []
+        for row in rows:
+            counts[row.bo_table] = row.board_count
+            if offset < row.search_rank <= offset + limit:
+                hits.append((row.bo_table, row.wr_id, row.score))
+        return {"counts": counts, "hits": hits}
+
+
+SEARCH_INDEX_BACKENDS: Dict[str, Type[SearchIndexBackend]] = {
+    "none": SearchIndexBackend,
+    "db": DBSearchIndex,
+}
+_backend_instance: Optional[SearchIndexBackend] = None
+
+
+def register_search_index_backend(name: str, backend_class: Type[SearchIndexBackend]) -> None:
+    """검색 색인 백엔드를 등록한다. (플러그인 등에서 사용)"""
+    global _backend_instance
+    SEARCH_INDEX_BACKENDS[name] = backend_class
+    _backend_instance = None
+
+
+def get_search_index() -> SearchIndexBackend:
+    """설정된 검색 색인 백엔드를 반환한다."""
+    global _backend_instance
+    if _backend_instance is None:
+        backend_class = SEARCH_INDEX_BACKENDS.get(settings.SEARCH_INDEX_BACKEND)
+        if backend_class is None:
+            logger.warning(f"알 수 없는 검색 색인 백엔드: {settings.SEARCH_INDEX_BACKEND}")
+            backend_class = SearchIndexBackend
+        _backend_instance = backend_class()
+    return _backend_instance
+
+
+def build_search_index() -> Optional[str]:
+    """색인이 생성되지 않은 게시판 하나의 색인을 생성한다. (스케줄러 작업)
+
+    Returns:
+        Optional[str]: 색인을 생성한 게시판 테이블명, 없으면 None
+    """
+    search_index = get_search_index()
+    if not search_index.enabled:
+        return None
+
+    with DBConnect().sessionLocal() as db:
+        bo_tables = db.scalars(select(Board.bo_table).order_by(Board.bo_table)).all()
+        ready = search_index.is_ready(db, bo_tables)
+        pending = [bo_table for bo_table in bo_tables if bo_table not in ready]
+        if not pending:
+            return None
+
+        bo_table = pending[0]
+        count = search_index.rebuild_board(db, bo_table)
+        logger.info(f"검색 색인 생성: {bo_table}, {count}건")
+        return bo_table
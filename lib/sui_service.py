@@ -72,6 +72,7 @@ def get_default_mint_address():
 
 DEFAULT_SUI_BIN_PATH = get_default_sui_bin_path()
 DEFAULT_GAS_BUDGET = 100000000 
+SUI_CLI_TIMEOUT = 120  # SUI CLI 응답 대기 시간 (초), sui_config["cli_timeout"]으로 변경 가능
 
 # Default SUI configuration
 DEFAULT_SUI_CONFIG = {
@@ -86,10 +87,16 @@ class SuiInteractionError(Exception):
     """Custom exception for SUI interaction failures."""
     pass
 
+class SuiOutcomeUnknown(SuiInteractionError):
+    """트랜잭션을 제출했지만 실행 여부를 알 수 없음 (응답 시간 초과 등)
+    - 체인에서 실행되었을 수 있으므로 재시도하거나 예약을 취소하지 말고, 다이제스트/체인 상태를 확인해야 합니다.
+    """
+
 def _get_active_sui_address(sui_bin_path: str) -> str:
     """Helper function to get the active SUI address from the CLI."""
     try:
-        result = subprocess.run([sui_bin_path, "client", "active-address"], capture_output=True, text=True, check=True)
+        result = subprocess.run([sui_bin_path, "client", "active-address"], capture_output=True, text=True, check=True,
+                                timeout=SUI_CLI_TIMEOUT)
         active_address = result.stdout.strip()
         if not active_address.startswith("0x") or len(active_address) < 5:
             raise SuiInteractionError(f"Invalid active address format: {active_address}")
@@ -142,12 +149,15 @@ def extract_transaction_hash(sui_output: str) -> str:
     logger.error(f"출력에서 트랜잭션 해시를 추출할 수 없습니다: {sui_output[:300]}...")
     return None
 
-def award_suiboard_token(recipient_address: str, amount: int, sui_config: dict) -> str:
-    """SUIBOARD 토큰을 지급하고 발행량을 추적합니다."""
-    from core.database import DBConnect
-    from core.models import TokenSupply
-    from datetime import datetime
-    
+def award_suiboard_token(recipient_address: str, amount: int, sui_config: dict, mb_id: str = "") -> str:
+    """SUIBOARD 토큰을 지급하고 발행량을 추적합니다.
+    - 발행 전에 발행량을 예약하고, 발행에 성공하면 확정, 실패하면 취소합니다.
+    - 응답 시간 초과로 발행 여부를 알 수 없으면 예약을 유지하고 SuiOutcomeUnknown을 발생시킵니다.
+    """
+    from service.token_supply_service import (
+        confirm_reservations, release_reservations, reserve_tokens
+    )
+
     # 입력 검증
     if not recipient_address or not recipient_address.startswith("0x"):
         raise ValueError(f"Invalid recipient address format: {recipient_address}")
@@ -160,32 +170,9 @@ def award_suiboard_token(recipient_address: str, amount: int, sui_config: dict)
         if key not in sui_config:
             raise ValueError(f"Missing required SUI configuration key: {key}")
     
-    # 발행량 제한 체크
-    db_connect = DBConnect()
-    db = db_connect.sessionLocal()
+    # 발행량 예약 (최대 발행량, 발행 한도 초과시 TokenBudgetExceeded)
+    reservation_id = reserve_tokens(amount, mb_id)
     try:
-        supply_record = db.query(TokenSupply).first()
-        
-        if not supply_record:
-            # 최초 실행 시 토큰 공급량 기록 생성
-            supply_record = TokenSupply(
-                total_minted=0,
-                total_burned=0,
-                max_supply=100000000,  # 1억개 제한
-                last_updated=datetime.now(),
-                notes="Initial token supply record created"
-            )
-            db.add(supply_record)
-            db.commit()
-            logger.info("토큰 공급량 추적 테이블 초기화 완료")
-        
-        # 발행 가능 여부 확인
-        if not supply_record.can_mint(amount):
-            remaining = supply_record.remaining_supply
-            error_msg = f"토큰 발행 한도 초과: 요청량 {amount}, 남은 발행가능량 {remaining}, 최대공급량 {supply_record.max_supply}"
-            logger.error(error_msg)
-            raise SuiInteractionError(error_msg)
-        
         # 실제 토큰 민팅 실행
         logger.info(f"Attempting to award {amount} SUIBOARD tokens to {recipient_address}")
         
@@ -209,7 +196,8 @@ def award_suiboard_token(recipient_address: str, amount: int, sui_config: dict)
 
         # Windows에서는 shell=True 옵션을 사용해야 PATH에서 sui.exe를 찾을 수 있음
         use_shell = platform.system() == "Windows"
-        result = subprocess.run(command, capture_output=True, text=True, check=True, shell=use_shell)
+        result = subprocess.run(command, capture_output=True, text=True, check=True, shell=use_shell,
+                                timeout=sui_config.get("cli_timeout", SUI_CLI_TIMEOUT))
 
         logger.info(f"SUI CLI 명령 결과 - stdout: {result.stdout}")
         if result.stderr:
@@ -228,41 +216,120 @@ def award_suiboard_token(recipient_address: str, amount: int, sui_config: dict)
         # 트랜잭션 해시 추출
         tx_hash = extract_transaction_hash(result.stdout)
         
-        if tx_hash:
-            # 발행량 업데이트
-            supply_record.total_minted += amount
-            supply_record.last_updated = datetime.now()
-            supply_record.notes = f"Minted {amount} tokens to {recipient_address}, TX: {tx_hash}"
-            db.commit()
-            
-            logger.info(f"SUIBOARD 토큰 {amount}개 발행 완료: {recipient_address}, TX: {tx_hash}")
-            logger.info(f"총 발행량: {supply_record.total_minted}/{supply_record.max_supply}, 남은 발행가능량: {supply_record.remaining_supply}")
-            return tx_hash
-        else:
+        if not tx_hash:
             error_msg = f"트랜잭션 해시를 찾을 수 없음: {result.stdout}"
             logger.error(error_msg)
             raise SuiInteractionError(error_msg)
             
+    except subprocess.TimeoutExpired as e:
+        # 트랜잭션이 실행되었을 수 있으므로 예약을 취소하지 않음 (reserved 상태로 남아 한도에 포함됨)
+        logger.error(f"SUI CLI 응답 시간 초과, 발행 여부 확인 필요: 예약 {reservation_id}, {recipient_address}")
+        raise SuiOutcomeUnknown(f"SUI CLI 응답 시간 초과 ({e.timeout}초), 발행 여부 확인 필요 (예약 {reservation_id})")
     except subprocess.CalledProcessError as e:
+        release_reservations([reservation_id])
         error_msg = f"SUI CLI 명령 실패 (RC: {e.returncode}): {e.stderr if e.stderr else e.stdout}"
         logger.error(error_msg)
         raise SuiInteractionError(error_msg)
     except SuiInteractionError:
+        release_reservations([reservation_id])
         raise
     except Exception as e:
+        release_reservations([reservation_id])
         logger.error(f"토큰 지급 중 예상치 못한 오류: {str(e)}")
         raise SuiInteractionError(f"토큰 지급 실패: {str(e)}")
-    finally:
-        db.close()
+
+    # 발행량 확정 (트랜잭션이 실행된 뒤이므로 실패해도 예약을 취소하지 않음)
+    try:
+        confirm_reservations([reservation_id], tx_hash,
+                             f"Minted {amount} tokens to {recipient_address}, TX: {tx_hash}")
+    except Exception as e:
+        logger.exception(f"발행량 확정 실패: 예약 {reservation_id}, TX: {tx_hash}: {e}")
+    logger.info(f"SUIBOARD 토큰 {amount}개 발행 완료: {recipient_address}, TX: {tx_hash}")
+    return tx_hash
+
+def mint_suiboard_token_batch(awards: dict, sui_config: dict) -> str:
+    """여러 수신자에 대한 SUIBOARD 토큰 발행을 하나의 Programmable Transaction Block으로 실행합니다.
+
+    Args:
+        awards (dict): {수신자 주소: 발행량} (수신자별로 합산된 값)
+        sui_config (dict): SUI 설정
+
+    Returns:
+        str: 트랜잭션 해시
+
+    - 발행량(TokenSupply) 갱신과 트랜잭션 로그 기록은 호출하는 쪽에서 처리합니다.
+    """
+    if not awards:
+        raise ValueError("No awards to mint")
+
+    for recipient_address, amount in awards.items():
+        if not recipient_address or not recipient_address.startswith("0x"):
+            raise ValueError(f"Invalid recipient address format: {recipient_address}")
+        if amount <= 0:
+            raise ValueError(f"Amount must be positive: {amount}")
+
+    required_keys = ["package_id", "treasury_cap_id"]
+    for key in required_keys:
+        if key not in sui_config:
+            raise ValueError(f"Missing required SUI configuration key: {key}")
+
+    mint_target = f"{sui_config['package_id']}::suiboard_token::mint"
+    command = [sui_config.get("sui_bin_path", DEFAULT_SUI_BIN_PATH), "client", "ptb"]
+    for recipient_address, amount in awards.items():
+        command += [
+            "--move-call", mint_target,
+            f"@{sui_config['treasury_cap_id']}",
+            f"{amount}u64",
+            f"@{recipient_address}",
+        ]
+    command += ["--gas-budget", str(sui_config.get("gas_budget", DEFAULT_GAS_BUDGET)), "--json"]
+
+    logger.info(f"SUI CLI PTB 발행 실행: 수신자 {len(awards)}명, 총 {sum(awards.values())}개")
+
+    try:
+        use_shell = platform.system() == "Windows"
+        result = subprocess.run(command, capture_output=True, text=True, check=True, shell=use_shell,
+                                timeout=sui_config.get("cli_timeout", SUI_CLI_TIMEOUT))
+    except subprocess.TimeoutExpired as e:
+        # 응답을 받지 못했을 뿐 트랜잭션이 실행되었을 수 있음
+        raise SuiOutcomeUnknown(f"SUI CLI PTB 응답 시간 초과 ({e.timeout}초), 발행 여부 확인 필요")
+    except subprocess.CalledProcessError as e:
+        error_msg = f"SUI CLI PTB 명령 실패 (RC: {e.returncode}): {e.stderr if e.stderr else e.stdout}"
+        logger.error(error_msg)
+        raise SuiInteractionError(error_msg)
+    except OSError as e:
+        raise SuiInteractionError(f"SUI CLI 실행 실패: {e}")
+
+    if result.stderr:
+        logger.warning(f"SUI CLI PTB stderr: {result.stderr}")
+
+    try:
+        response_json = json.loads(result.stdout)
+        if "error" in response_json:
+            raise SuiInteractionError(f"SUI CLI PTB call failed: {response_json.get('error')}")
+    except json.JSONDecodeError:
+        logger.warning("Failed to parse JSON response, attempting text parsing")
+
+    tx_hash = extract_transaction_hash(result.stdout)
+    if not tx_hash:
+        raise SuiInteractionError(f"트랜잭션 해시를 찾을 수 없음: {result.stdout}")
+
+    logger.info(f"SUIBOARD 토큰 일괄 발행 완료: {awards}, TX: {tx_hash}")
+    return tx_hash
 
 def reclaim_suiboard_token(amount_to_reclaim: int, sui_config: dict) -> str:
-    """토큰을 회수합니다 (민트 후 즉시 소각)."""
+    """토큰을 회수합니다 (민트 후 즉시 소각).
+
+    하나의 Programmable Transaction Block 안에서 `coin::mint`로 만든 코인을 바로 `burn`에 전달하므로
+    CLI 호출은 1회이며, 임시 코인을 받을 활성 주소(active-address)를 조회할 필요가 없습니다.
+    여러 게시글의 회수량은 합산하여 한 번에 호출합니다.
+    """
     logger.info(f"Attempting to reclaim (mint and burn) {amount_to_reclaim} Suiboard tokens.")
-    
+
     # 입력 검증
     if amount_to_reclaim <= 0:
         raise ValueError(f"Amount to reclaim must be positive: {amount_to_reclaim}")
-    
+
     required_keys = ["package_id", "treasury_cap_id"]
     for key in required_keys:
         if key not in sui_config:
@@ -271,122 +338,52 @@ def reclaim_suiboard_token(amount_to_reclaim: int, sui_config: dict) -> str:
     sui_bin_path = sui_config.get("sui_bin_path", DEFAULT_SUI_BIN_PATH)
     package_id = sui_config["package_id"]
     treasury_cap_id = sui_config["treasury_cap_id"]
-    gas_budget_mint = sui_config.get("gas_budget_mint", sui_config.get("gas_budget", DEFAULT_GAS_BUDGET))
-    gas_budget_burn = sui_config.get("gas_budget_burn", sui_config.get("gas_budget", DEFAULT_GAS_BUDGET))
-    
-    # Determine the address to mint the temporary coin to (for burning)
-    # This should ideally be an address controlled by the system/TreasuryCap holder.
-    # For simplicity, using the CLI's active address.
-    try:
-        mint_to_address = _get_active_sui_address(sui_bin_path)
-        logger.info(f"Temporary coin for burning will be minted to active CLI address: {mint_to_address}")
-    except SuiInteractionError as e:
-        logger.error(f"Cannot proceed with reclaim: Failed to get active SUI address for minting temporary coin. Error: {e}")
-        raise
+    gas_budget = sui_config.get("gas_budget_burn", sui_config.get("gas_budget", DEFAULT_GAS_BUDGET))
 
-    # Step 1: Mint a new coin object with the amount_to_reclaim to the mint_to_address
-    mint_command = [
-        sui_bin_path, "client", "call",
-        "--package", package_id,
-        "--module", "suiboard_token",
-        "--function", "mint",
-        "--args", treasury_cap_id, str(amount_to_reclaim), mint_to_address,
-        "--gas-budget", str(gas_budget_mint),
+    command = [
+        sui_bin_path, "client", "ptb",
+        "--move-call", "0x2::coin::mint",
+        f"<{package_id}::suiboard_token::SUIBOARD_TOKEN>",
+        f"@{treasury_cap_id}", f"{amount_to_reclaim}u64",
+        "--assign", "reclaim_coin",
+        "--move-call", f"{package_id}::suiboard_token::burn",
+        f"@{treasury_cap_id}", "reclaim_coin",
+        "--gas-budget", str(gas_budget),
         "--json"
     ]
-    mint_command_str = " ".join(mint_command)
-    logger.info(f"Executing SUI CLI mint command for reclaim: {mint_command_str}")
-    newly_minted_coin_id = None
-    try:
-        mint_result = subprocess.run(mint_command, capture_output=True, text=True, check=True)
-        logger.info(f"SUI CLI mint (for reclaim) command output: {mint_result.stdout}")
-        mint_response_json = json.loads(mint_result.stdout)
-
-        if "error" in mint_response_json:
-            error_message = mint_response_json.get("error", "Unknown SUI error from mint (for reclaim) JSON response")
-            logger.error(f"SUI CLI mint (for reclaim) call failed with error: {error_message}")
-            raise SuiInteractionError(f"SUI CLI mint (for reclaim) call failed: {error_message}")
-
-        # Extract the newly created Coin object ID
-        # This part is critical and depends heavily on the SUI CLI version and output format.
-        # Looking for created objects of type Coin<SUIBOARD_TOKEN>
-        created_objects = mint_response_json.get("effects", {}).get("created", [])
-        if not created_objects:
-             # Fallback for older SUI CLI versions or different output structures
-            object_changes = mint_response_json.get("objectChanges", [])
-            for change in object_changes:
-                if change.get("type") == "created" and "Coin<" in change.get("objectType", ""):
-                    created_objects.append(change)
-        
-        for obj in created_objects:
-            object_type = obj.get("objectType", "")
-            # We need to be more specific if possible, e.g., by checking the full type string
-            # Example: f"{package_id}::suiboard_token::SUIBOARD_TOKEN"
-            # For now, a simpler check for Coin and ensuring it's not the gas coin.
-            if "Coin<" in object_type and package_id in object_type: # Check if it's our token
-                newly_minted_coin_id = obj.get("objectId")
-                if newly_minted_coin_id:
-                    logger.info(f"Successfully minted temporary coin for burning. Object ID: {newly_minted_coin_id}")
-                    break
-        
-        if not newly_minted_coin_id:
-            logger.error(f"Could not find newly minted Coin<SUIBOARD_TOKEN> object ID in mint (for reclaim) response: {mint_response_json}")
-            raise SuiInteractionError("Failed to extract newly minted coin ID for burning.")
+    logger.info(f"Executing SUI CLI reclaim PTB: {' '.join(command)}")
 
+    try:
+        use_shell = platform.system() == "Windows"
+        result = subprocess.run(command, capture_output=True, text=True, check=True, shell=use_shell,
+                                timeout=sui_config.get("cli_timeout", SUI_CLI_TIMEOUT))
+    except subprocess.TimeoutExpired as e:
+        # 응답을 받지 못했을 뿐 트랜잭션이 실행되었을 수 있음
+        raise SuiOutcomeUnknown(f"SUI CLI reclaim 응답 시간 초과 ({e.timeout}초), 회수 여부 확인 필요")
     except subprocess.CalledProcessError as e:
-        logger.error(f"SUI CLI mint (for reclaim) command failed. RC: {e.returncode}, Stdout: {e.stdout}, Stderr: {e.stderr}")
-        raise SuiInteractionError(f"SUI CLI mint (for reclaim) execution failed: {e.stderr if e.stderr else e.stdout}")
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to decode JSON from SUI CLI mint (for reclaim): {e}, Raw: {mint_result.stdout}")
-        raise SuiInteractionError(f"Failed to decode SUI CLI mint (for reclaim) JSON: {mint_result.stdout}")
-    except Exception as e:
-        logger.error(f"Unexpected error during mint (for reclaim): {e}")
-        raise SuiInteractionError(f"Unexpected error during mint (for reclaim): {e}")
-
-    # Step 2: Burn the newly minted coin
-    burn_command = [
-        sui_bin_path, "client", "call",
-        "--package", package_id,
-        "--module", "suiboard_token",
-        "--function", "burn",
-        "--args", treasury_cap_id, newly_minted_coin_id,
-        "--gas-budget", str(gas_budget_burn),
-        "--json"
-    ]
-    burn_command_str = " ".join(burn_command)
-    logger.info(f"Executing SUI CLI burn command: {burn_command_str}")
+        logger.error(f"SUI CLI reclaim PTB failed. RC: {e.returncode}, Stdout: {e.stdout}, Stderr: {e.stderr}")
+        raise SuiInteractionError(f"SUI CLI reclaim execution failed: {e.stderr if e.stderr else e.stdout}")
+    except OSError as e:
+        raise SuiInteractionError(f"SUI CLI 실행 실패: {e}")
+
     try:
-        burn_result = subprocess.run(burn_command, capture_output=True, text=True, check=True)
-        logger.info(f"SUI CLI burn command output: {burn_result.stdout}")
-        burn_response_json = json.loads(burn_result.stdout)
-
-        if "error" in burn_response_json:
-            error_message = burn_response_json.get("error", "Unknown SUI error from burn JSON response")
-            logger.error(f"SUI CLI burn call failed with error: {error_message}")
-            raise SuiInteractionError(f"SUI CLI burn call failed: {error_message}")
-
-        tx_digest_burn = None
-        if "digest" in burn_response_json:
-            tx_digest_burn = burn_response_json["digest"]
-        elif burn_response_json.get("effects", {}).get("status", {}).get("status") == "success":
-            tx_digest_burn = burn_response_json.get("effects", {}).get("transactionDigest")
-        
-        if not tx_digest_burn:
-            logger.error(f"Could not extract transaction digest from SUI CLI burn response: {burn_response_json}")
-            raise SuiInteractionError(f"Could not extract transaction digest from SUI CLI burn response. Response: {burn_result.stdout}")
+        response_json = json.loads(result.stdout)
+    except json.JSONDecodeError:
+        logger.error(f"Failed to decode JSON response from SUI CLI reclaim: {result.stdout}")
+        raise SuiInteractionError(f"Failed to decode SUI CLI reclaim JSON response: {result.stdout}")
 
-        logger.info(f"Suiboard token reclaim (burn) successful. Transaction Digest: {tx_digest_burn}")
-        return tx_digest_burn
+    if "error" in response_json:
+        error_message = response_json.get("error", "Unknown SUI error from reclaim JSON response")
+        logger.error(f"SUI CLI reclaim call failed with error: {error_message}")
+        raise SuiInteractionError(f"SUI CLI reclaim call failed: {error_message}")
 
-    except subprocess.CalledProcessError as e:
-        logger.error(f"SUI CLI burn command failed. RC: {e.returncode}, Stdout: {e.stdout}, Stderr: {e.stderr}")
-        raise SuiInteractionError(f"SUI CLI burn command execution failed: {e.stderr if e.stderr else e.stdout}")
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to decode JSON response from SUI CLI burn: {e}, Raw: {burn_result.stdout}")
-        raise SuiInteractionError(f"Failed to decode SUI CLI burn JSON response: {burn_result.stdout}")
-    except Exception as e:
-        logger.error(f"An unexpected error occurred during SUI token burn: {e}")
-        raise SuiInteractionError(f"An unexpected error occurred during token burn: {e}")
+    tx_digest = response_json.get("digest") or response_json.get("effects", {}).get("transactionDigest")
+    if not tx_digest:
+        logger.error(f"Could not extract transaction digest from SUI CLI reclaim response: {response_json}")
+        raise SuiInteractionError(f"Could not extract transaction digest from SUI CLI reclaim response. Response: {result.stdout}")
+
+    logger.info(f"Suiboard token reclaim successful. Transaction Digest: {tx_digest}")
+    return tx_digest
 
 if __name__ == '__main__':
     print("SUI Service Module - Direct Testing")
@@ -417,7 +414,7 @@ if __name__ == '__main__':
     # Example for testing reclaim_suiboard_token (requires setup):
     # try:
     #     test_config = DEFAULT_SUI_CONFIG.copy()
-    #     test_config["gas_budget"] = 30000000  # Higher budget for two transactions
+    #     test_config["gas_budget"] = 30000000
     #     amount_to_reclaim_test = 50
     #     reclaim_digest = reclaim_suiboard_token(amount_to_reclaim_test, test_config)
     #     print(f"Test reclaim transaction digest: {reclaim_digest}")
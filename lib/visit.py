@@ -1,13 +1,20 @@
 """방문자 관련 기능을 제공하는 모듈입니다."""
 from cachetools import TTLCache, cached
+from sqlalchemy import select
 
+from core.database import DBConnect
+from core.models import Config
 from service.visit_service import VisitService
 
 
 @cached(TTLCache(maxsize=1, ttl=600))
-def get_total_visit(config_visit: str) -> dict:
+def get_total_visit() -> dict:
     """
     방문자 수 집계 조회
+    - 기본설정의 방문자 수(cf_visit)는 방문자 이력을 저장할 때 누적 갱신됩니다.
+    - 방문자 이력 저장시 기본환경설정 캐시를 무효화하지 않으므로 캐시된 기본환경설정 대신 DB에서 조회합니다.
     - 10분 동안 캐시된 데이터를 반환합니다.
     """
+    with DBConnect().sessionLocal() as db:
+        config_visit = db.scalar(select(Config.cf_visit))
     return VisitService.parse_visit_data(config_visit)
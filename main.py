@@ -38,14 +38,19 @@ from lib.common import (
     is_possible_ip,
     session_member_key,
 )
+from lib.config_cache import get_cached_config
 from lib.dependency.dependencies import check_use_template
 from lib.member import is_super_admin
 from lib.scheduler import scheduler
 from lib.session_token import create_session_token
-from service.member_service import MemberService
+from service.current_connect_service import presence_table
+from service.hit_counter_service import hit_counter
+from service.mail_queue_service import mail_sender
+from service.member_service import MemberService, build_member_image_indexes
 from service.point_service import PointService
-from service.visit_service import VisitService
+from service.visit_service import VisitService, visit_buffer
 from service.sui_token_service import SuiTokenService
+from service.thumbnail_service import shutdown_thumbnail_executor
 from lib.sui_service import award_suiboard_token, DEFAULT_SUI_CONFIG
 
 from admin.admin import router as admin_router
@@ -66,7 +71,16 @@ async def lifespan(app: FastAPI):
     - yield 이전의 코드: 서버가 시작될 때 실행
     - yield 이후의 코드: 서버가 종료될 때 실행
     """
+    build_member_image_indexes()
+    visit_buffer.start()
+    presence_table.start()
+    hit_counter.start()
     yield
+    await visit_buffer.stop()
+    await presence_table.stop()
+    await hit_counter.stop()
+    shutdown_thumbnail_executor()
+    mail_sender.close()
     scheduler.remove_flag()
 
 
@@ -130,6 +144,7 @@ async def main_middleware(request: Request, call_next):
         #     return RedirectResponse(url=str(https_url), status_code=301)
 
     # 데이터베이스 설치여부 체크
+    # - 세션은 첫 쿼리 실행 시점에 커넥션을 가져오므로, 비회원 요청은 DB에 접근하지 않는다.
     with DBConnect().sessionLocal() as db:
         url_path = request.url.path
         config = None
@@ -140,8 +155,8 @@ async def main_middleware(request: Request, call_next):
                     raise AlertException(
                         ".env 파일이 없습니다. 설치를 진행해 주세요.", 400, "/install"
                     )
-                # 기본환경설정 테이블 조회
-                config = db.scalar(select(models.Config))
+                # 기본환경설정 조회 (프로세스 캐시)
+                config = get_cached_config()
             else:
                 return await call_next(request)
 
@@ -254,35 +269,35 @@ async def main_middleware(request: Request, call_next):
     # 응답 객체 설정
     response: Response = await call_next(request)
 
-    with DBConnect().sessionLocal() as db:
-        age_1day = 60 * 60 * 24
-
-        # 자동로그인 쿠키 재설정
-        # is_autologin과 세션을 확인해서 로그아웃 처리 이후 쿠키가 재설정되는 것을 방지
-        if is_autologin and request.session.get("ss_mb_id"):
-            response.set_cookie(
-                key="ck_mb_id",
-                value=cookie_mb_id,
-                max_age=age_1day * 30,
-                domain=cookie_domain,
-            )
-            response.set_cookie(
-                key="ck_auto",
-                value=ss_mb_key,
-                max_age=age_1day * 30,
-                domain=cookie_domain,
-            )
-        # 방문자 이력 기록
-        ck_visit_ip = request.cookies.get("ck_visit_ip", None)
-        if ck_visit_ip != current_ip:
-            response.set_cookie(
-                key="ck_visit_ip",
-                value=current_ip,
-                max_age=age_1day,
-                domain=cookie_domain,
-            )
-            visit_service = VisitService(request, db)
-            visit_service.create_visit_record()
+    age_1day = 60 * 60 * 24
+
+    # 자동로그인 쿠키 재설정
+    # is_autologin과 세션을 확인해서 로그아웃 처리 이후 쿠키가 재설정되는 것을 방지
+    if is_autologin and request.session.get("ss_mb_id"):
+        response.set_cookie(
+            key="ck_mb_id",
+            value=cookie_mb_id,
+            max_age=age_1day * 30,
+            domain=cookie_domain,
+        )
+        response.set_cookie(
+            key="ck_auto",
+            value=ss_mb_key,
+            max_age=age_1day * 30,
+            domain=cookie_domain,
+        )
+    # 방문자 이력 기록
+    # - 방문 기록이 필요한 경우에만 세션을 생성한다.
+    ck_visit_ip = request.cookies.get("ck_visit_ip", None)
+    if ck_visit_ip != current_ip:
+        response.set_cookie(
+            key="ck_visit_ip",
+            value=current_ip,
+            max_age=age_1day,
+            domain=cookie_domain,
+        )
+        # 방문자 이력은 버퍼에 추가하고 백그라운드에서 일괄 저장
+        visit_buffer.push(VisitService(request, None).get_visit_data())
 
     return response
 
@@ -0,0 +1,40 @@
+"""
+테이블/인덱스 마이그레이션 스크립트
+- 기존 설치본의 데이터베이스에 모델에 선언된 테이블과 인덱스(게시판 write_* 테이블 포함)를 생성합니다.
+- 요청 처리 중에는 테이블을 생성하지 않으므로 업데이트 후 서비스 전에 한번 실행해야 합니다.
+  (인덱스는 테이블 잠금 없이 생성합니다.)
+
+사용법:
+    python migrate_indexes.py            # 테이블/인덱스 생성
+    python migrate_indexes.py --dry-run  # 생성할 테이블/인덱스만 출력
+"""
+import argparse
+import logging
+
+from lib.index_migration import migrate_indexes, migrate_tables
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모델에 선언된 테이블/인덱스 중 데이터베이스에 없는 것을 생성합니다.")
+    parser.add_argument("--dry-run", action="store_true", help="생성할 테이블/인덱스만 출력합니다.")
+    args = parser.parse_args()
+
+    tables = migrate_tables(dry_run=args.dry_run)
+    if not tables:
+        logger.info("생성할 테이블이 없습니다.")
+    for name in tables:
+        logger.info(f"{'생성할 테이블' if args.dry_run else '생성한 테이블'}: {name}")
+
+    names = migrate_indexes(dry_run=args.dry_run)
+    if not names:
+        logger.info("생성할 인덱스가 없습니다.")
+        return
+    for name in names:
+        logger.info(f"{'생성할 인덱스' if args.dry_run else '생성한 인덱스'}: {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,17 +3,19 @@ import datetime
 import logging # Added for logging SUI interactions
 from datetime import timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 import platform
 
 from core.models import Member, Board, Config, Point # Assuming Config might hold SUI settings
 from lib.board_lib import insert_board_new, get_next_num, generate_reply_character
 from lib.common import dynamic_create_write_table
+from lib.search_index import get_search_index
 
 from lib.common import get_client_ip # For wr_ip, might need a mock or fixed IP for agent
-from lib.sui_service import award_suiboard_token, SuiInteractionError # Import SUI service
+from lib.sui_service import award_suiboard_token, SuiInteractionError, SuiOutcomeUnknown # Import SUI service
 # Import the SUI transaction logging service
 from service.sui_transaction_log_service import log_sui_transaction
+from service.sui_mint_queue_service import enqueue_token_award
+from service.point_service import add_member_point
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
@@ -110,6 +112,7 @@ def create_post_by_agent(
     db.flush() 
 
     write.wr_parent = write.wr_id 
+    get_search_index().index_write(db, board.bo_table, write)
     db.commit()
     logger.info(f"Agent {mb_id} created post {write.wr_id} in board {bo_table}.")
 
@@ -120,9 +123,8 @@ def create_post_by_agent(
         point_content = f"{board.bo_subject} {write.wr_id} 글쓰기 (에이전트)"
         # 직접 포인트 데이터베이스에 저장 (agent 전용)
         
-        # 회원의 현재 포인트 계산
-        current_points = db.query(func.sum(Point.po_point)).filter(Point.mb_id == member.mb_id).scalar() or 0
-        new_total_points = current_points + board.bo_write_point
+        # 회원 포인트 갱신
+        new_total_points = add_member_point(db, member.mb_id, board.bo_write_point)
         
         # 포인트 내역 추가
         new_point = Point(
@@ -138,9 +140,6 @@ def create_post_by_agent(
             po_rel_action="쓰기"
         )
         db.add(new_point)
-        
-        # 회원 포인트 업데이트
-        member.mb_point = new_total_points
         db.commit()
         logger.info(f"Points ({board.bo_write_point}) awarded to {member.mb_id} for post {write.wr_id}.")
 
@@ -154,6 +153,24 @@ def create_post_by_agent(
                current_sui_config["treasury_cap_id"] == "0xYOUR_TREASURY_CAP_ID":
                 logger.warning("SUI Package ID or Treasury CAP ID is still a placeholder. Token award will likely fail.")
 
+            if not sui_config_override:
+                # 기본 설정이면 발행 대기열에 등록 (발행 및 트랜잭션 로그 기록은 스케줄러가 처리)
+                try:
+                    enqueue_token_award(
+                        db,
+                        mb_id=member.mb_id,
+                        recipient_address=member.mb_sui_address,
+                        amount=TOKEN_AWARD_AMOUNT_POST_CREATION,
+                        reason="게시글 작성 보상 (에이전트)",
+                        wr_id=write.wr_id,
+                        bo_table=board.bo_table,
+                    )
+                    logger.info(f"SUI token award queued for post {write.wr_id}. User: {member.mb_id}")
+                except ValueError as e:
+                    logger.error(f"SUI token award could not be queued for post {write.wr_id}. User: {member.mb_id}, Error: {e}")
+                return write
+
+            # 설정을 덮어쓴 경우 대기열 작업자는 기본 설정을 사용하므로 직접 발행
             tx_digest_val = None
             tx_status = "failed"
             error_msg = None
@@ -161,10 +178,16 @@ def create_post_by_agent(
                 tx_digest_val = award_suiboard_token(
                     recipient_address=member.mb_sui_address,
                     amount=TOKEN_AWARD_AMOUNT_POST_CREATION, 
-                    sui_config=current_sui_config
+                    sui_config=current_sui_config,
+                    mb_id=member.mb_id
                 )
                 tx_status = "success"
                 logger.info(f"SUI token award successful for post {write.wr_id}. User: {member.mb_id}, TX Digest: {tx_digest_val}")
+            except SuiOutcomeUnknown as e:
+                # 발행되었을 수 있으므로 실패로 기록하지 않음 (발행량 예약 유지)
+                tx_status = "unknown"
+                error_msg = str(e)
+                logger.error(f"SUI token award outcome unknown for post {write.wr_id}. User: {member.mb_id}, Error: {error_msg}")
             except SuiInteractionError as e:
                 error_msg = str(e)
                 logger.error(f"SUI token award failed for post {write.wr_id}. User: {member.mb_id}, Error: {error_msg}")
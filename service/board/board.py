@@ -9,7 +9,8 @@ from core.models import Board, WriteBaseModel, Group, AutoSave
 from core.exception import AlertException
 from core.formclass import WriteForm
 from lib.board_lib import (
-    BoardConfig, FileCache, is_owner, is_write_delay, send_write_mail
+    BoardConfig, delete_list_count_cache, is_owner, is_write_delay,
+    send_write_mail
 )
 from lib.member import MemberDetails
 from lib.common import (
@@ -17,6 +18,8 @@ from lib.common import (
     remove_query_params, set_url_query_params
 )
 from lib.html_sanitizer import content_sanitizer
+from lib.render_cache import invalidate_latest_cache
+from lib.search_index import get_search_index
 from lib.slowapi.create_post_limit.limiter import validate_slowapi_create_post
 from lib.pbkdf2 import create_hash, validate_password
 from service import BaseService
@@ -260,9 +263,18 @@ class BoardService(BaseService, BoardConfig):
             self.request.session[f"ss_secret_{self.bo_table}_{wr_id}"] = True
 
     def delete_cache(self):
-        """최신글 캐시 삭제"""
-        FileCache().delete_prefix(f"latest-{self.bo_table}")
+        """최신글, 게시글 수 캐시 삭제"""
+        invalidate_latest_cache(self.bo_table)
+        delete_list_count_cache(self.bo_table)
     
+    def update_search_index(self, write: WriteBaseModel):
+        """전체검색 색인 갱신 (commit은 호출하는 쪽에서 처리)"""
+        get_search_index().index_write(self.db, self.bo_table, write)
+
+    def delete_search_index(self, wr_id: int):
+        """전체검색 색인 삭제 (댓글 색인 포함, commit은 호출하는 쪽에서 처리)"""
+        get_search_index().delete_write(self.db, self.bo_table, wr_id)
+
     def delete_auto_save(self, uid: str):
         """자동저장 글 삭제"""
         if uid:
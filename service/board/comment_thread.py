@@ -0,0 +1,159 @@
+"""게시글 댓글 목록(댓글 스레드) 구성
+
+게시글 읽기(HTML, API)와 게시글 목록에서 같은 방식으로 댓글 목록을 구성합니다.
+- 댓글은 필요한 컬럼만 1회 쿼리로 조회하고, 부모글은 댓글마다 조회하지 않고 전달받은 게시글을 사용합니다.
+- 이름/IP 표시, 회원 이미지/아이콘은 같은 값에 대해 한번만 계산합니다.
+- 템플릿/API 응답에 필요한 속성만 가진 CommentView 객체 목록을 반환합니다.
+"""
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List
+
+from sqlalchemy import Row, select
+from sqlalchemy.orm import Session
+
+from core.models import WriteBaseModel
+from lib.board_lib import is_owner
+from lib.common import cut_name
+
+SECRET_COMMENT_CONTENT = "비밀글 입니다."
+COMMENT_REPLY_MAX_DEPTH = 5  # 대댓글 최대 깊이 (wr_comment_reply 길이)
+
+
+@dataclass(slots=True)
+class CommentView:
+    """댓글 목록 항목"""
+    wr_id: int
+    wr_parent: int
+    wr_comment: int
+    wr_comment_reply: str
+    mb_id: str
+    wr_name: str
+    wr_email: str
+    wr_homepage: str
+    wr_datetime: datetime
+    wr_last: str
+    wr_option: str
+    wr_content: str
+    name: str
+    ip: str
+    mb_image_path: str
+    mb_icon_path: str
+    save_content: str
+    is_reply: bool
+    is_edit: bool
+    is_del: bool
+    is_secret: bool
+    is_secret_content: bool
+
+
+def _comment_columns(write_model: WriteBaseModel) -> tuple:
+    return (
+        write_model.wr_id, write_model.wr_parent, write_model.wr_comment,
+        write_model.wr_comment_reply, write_model.mb_id, write_model.wr_name,
+        write_model.wr_email, write_model.wr_homepage, write_model.wr_datetime,
+        write_model.wr_last, write_model.wr_option, write_model.wr_content,
+        write_model.wr_ip,
+    )
+
+
+def fetch_comments_map(db: Session, write_model: WriteBaseModel, wr_ids: List[int]) -> Dict[int, List[Row]]:
+    """여러 게시글의 댓글을 한번에 조회하여 게시글 번호별로 반환합니다."""
+    comments_map = defaultdict(list)
+    if not wr_ids:
+        return comments_map
+
+    rows = db.execute(
+        select(*_comment_columns(write_model))
+        .where(
+            write_model.wr_parent.in_(wr_ids),
+            write_model.wr_is_comment == 1
+        )
+        .order_by(write_model.wr_parent, write_model.wr_comment, write_model.wr_comment_reply)
+    ).all()
+    for row in rows:
+        comments_map[row.wr_parent].append(row)
+    return comments_map
+
+
+class CommentThreadBuilder:
+    """
+    댓글 목록 구성 클래스
+
+    Args:
+        service (BoardService): 게시판 서비스 (request, board, member, db, write_model 사용)
+    """
+
+    def __init__(self, service):
+        self.service = service
+        self.request = service.request
+        self.bo_table = service.bo_table
+        member = service.member
+        self.mb_id = member.mb_id
+        self.is_admin = bool(member.admin_type)
+        self.can_reply = service.board.bo_comment_level <= member.level
+        self._names = {}
+        self._ips = {}
+        self._images = {}
+        self._icons = {}
+
+    def _cached(self, cache: dict, key, func):
+        if key not in cache:
+            cache[key] = func(key)
+        return cache[key]
+
+    def build(self, parent: WriteBaseModel, rows: Iterable[Row]) -> List[CommentView]:
+        """게시글(parent)의 댓글 목록을 구성합니다."""
+        session = self.request.session
+        is_parent_owner = is_owner(parent, self.mb_id)
+        comments = []
+        for row in rows:
+            is_comment_owner = bool(self.mb_id and row.mb_id == self.mb_id)
+            is_secret = "secret" in row.wr_option
+            # 비밀댓글 처리
+            is_secret_content = (
+                is_secret
+                and not self.is_admin
+                and not is_owner(row, self.mb_id)
+                and not is_parent_owner
+                and not session.get(f"ss_secret_comment_{self.bo_table}_{row.wr_id}")
+            )
+            comments.append(CommentView(
+                wr_id=row.wr_id,
+                wr_parent=row.wr_parent,
+                wr_comment=row.wr_comment,
+                wr_comment_reply=row.wr_comment_reply,
+                mb_id=row.mb_id,
+                wr_name=row.wr_name,
+                wr_email=row.wr_email,
+                wr_homepage=row.wr_homepage,
+                wr_datetime=row.wr_datetime,
+                wr_last=row.wr_last,
+                wr_option=row.wr_option,
+                wr_content=row.wr_content,
+                name=self._cached(self._names, row.wr_name, lambda name: cut_name(self.request, name)),
+                ip=self._cached(self._ips, row.wr_ip, self.service.get_display_ip),
+                mb_image_path=self._cached(self._images, row.mb_id, self.service.get_member_image_path),
+                mb_icon_path=self._cached(self._icons, row.mb_id, self.service.get_member_icon_path),
+                save_content=SECRET_COMMENT_CONTENT if is_secret_content else row.wr_content,
+                is_reply=len(row.wr_comment_reply) < COMMENT_REPLY_MAX_DEPTH and self.can_reply,
+                is_edit=self.is_admin or is_comment_owner,
+                is_del=self.is_admin or is_comment_owner or not row.mb_id,
+                is_secret=is_secret,
+                is_secret_content=is_secret_content,
+            ))
+        return comments
+
+    def build_thread(self, parent: WriteBaseModel) -> List[CommentView]:
+        """게시글 1건의 댓글 목록을 조회하여 구성합니다."""
+        rows = fetch_comments_map(self.service.db, self.service.write_model, [parent.wr_id])
+        return self.build(parent, rows.get(parent.wr_id, []))
+
+    def build_threads(self, parents: List[WriteBaseModel],
+                      comments_map: Dict[int, List[Row]] = None) -> Dict[int, List[CommentView]]:
+        """여러 게시글의 댓글 목록을 한번에 조회하여 게시글 번호별로 구성합니다."""
+        if comments_map is None:
+            comments_map = fetch_comments_map(self.service.db, self.service.write_model,
+                                              [parent.wr_id for parent in parents])
+        return {parent.wr_id: self.build(parent, comments_map.get(parent.wr_id, [])) for parent in parents}
@@ -6,8 +6,10 @@ from sqlalchemy import select, update
 from core.database import db_session
 from core.models import WriteBaseModel, BoardNew, BoardGood, Scrap
 from core.formclass import WriteForm
-from lib.board_lib import FileCache, get_next_num, generate_reply_character
+from lib.board_lib import delete_list_count_cache, get_next_num, generate_reply_character
 from lib.common import cut_name, dynamic_create_write_table
+from lib.render_cache import invalidate_latest_cache
+from lib.search_index import get_search_index
 from lib.dependency.dependencies import (
     validate_captcha as lib_validate_captcha, get_variety_bo_table
 )
@@ -16,8 +18,7 @@ from api.v1.models.board import WriteModel, WriteTransportation
 from service.point_service import PointService
 from . import BoardService
 from service.board_file_service import BoardFileService
-from service.sui_token_service import SuiTokenService
-from lib.sui_service import award_suiboard_token, DEFAULT_SUI_CONFIG
+from service.sui_mint_queue_service import enqueue_token_award
 from lib.walrus_service import store_post_on_walrus, WalrusError, DEFAULT_WALRUS_CONFIG
 import asyncio
 import logging
@@ -73,61 +74,23 @@ class CreatePostService(BoardService):
             logger.info(f"  - SUI 주소: {self.member.mb_sui_address}")
             
             # SUIBOARD 토큰 지급 (답글이 아니고 SUI 주소가 있는 경우)
+            # - 발행 대기열에 등록만 하고, 실제 발행과 트랜잭션 로그 기록은 스케줄러가 처리
             if is_not_reply and has_sui_address:
+                token_amount = 1  # 게시글 작성 보상
                 try:
-                    logger.info(f"SUIBOARD 토큰 지급 시작: {self.member.mb_id}")
-                    sui_token_service = SuiTokenService(self.request, self.db)
-                    token_amount = 1  # 게시글 작성 보상
-                    
-                    # 실제 SUIBOARD 토큰 지급
-                    tx_hash = award_suiboard_token(
+                    enqueue_token_award(
+                        self.db,
+                        mb_id=self.member.mb_id,
                         recipient_address=self.member.mb_sui_address,
                         amount=token_amount,
-                        sui_config=DEFAULT_SUI_CONFIG
-                    )
-                    
-                    # 트랜잭션 로그 저장 (중복 체크)
-                    from core.models import SuiTransactionlog
-                    from sqlalchemy import select
-                    
-                    # 동일한 트랜잭션 해시가 이미 존재하는지 확인
-                    existing_log = self.db.scalar(
-                        select(SuiTransactionlog).where(SuiTransactionlog.stl_tx_hash == tx_hash)
-                    )
-                    
-                    if not existing_log:
-                        sui_log = SuiTransactionlog(
-                            mb_id=self.member.mb_id,
-                            wr_id=write.wr_id,
-                            bo_table=self.bo_table,
-                            stl_amount=token_amount,
-                            stl_reason="post_creation",
-                            stl_tx_hash=tx_hash,
-                            stl_status="success",
-                            stl_datetime=datetime.now(),
-                            stl_error_message=None
-                        )
-                        self.db.add(sui_log)
-                        logger.info(f"SUIBOARD 토큰 {token_amount} 지급 완료: {self.member.mb_id}, 게시글 {write.wr_id}, TX: {tx_hash}")
-                    else:
-                        logger.warning(f"중복 트랜잭션 해시 발견, 로그 저장 건너뜀: {tx_hash}")
-                    
-                except Exception as e:
-                    logger.error(f"SUIBOARD 토큰 지급 실패: {self.member.mb_id}, 게시글 {write.wr_id}, 오류: {str(e)}")
-                    # 실패 로그 저장
-                    from core.models import SuiTransactionlog
-                    sui_log = SuiTransactionlog(
-                        mb_id=self.member.mb_id,
+                        reason="post_creation",
                         wr_id=write.wr_id,
                         bo_table=self.bo_table,
-                        stl_amount=1,
-                        stl_reason="post_creation",
-                        stl_tx_hash=None,
-                        stl_status="failed",
-                        stl_datetime=datetime.now(),
-                        stl_error_message=str(e)
+                        commit=False,
                     )
-                    self.db.add(sui_log)
+                    logger.info(f"SUIBOARD 토큰 {token_amount} 지급 대기열 등록: {self.member.mb_id}, 게시글 {write.wr_id}")
+                except Exception as e:
+                    logger.error(f"SUIBOARD 토큰 지급 등록 실패: {self.member.mb_id}, 게시글 {write.wr_id}, 오류: {str(e)}")
             else:
                 logger.info(f"SUIBOARD 토큰 지급 조건 불만족으로 건너뜀: {self.member.mb_id}")
         else:
@@ -149,6 +112,7 @@ class CreatePostService(BoardService):
 
         write.wr_parent = write.wr_id  # 부모아이디 설정
         self.board.bo_count_write = self.board.bo_count_write + 1  # 게시판 글 갯수 1 증가
+        self.update_search_index(write)
         
         # Walrus 스토리지에 게시글 저장 (답글이 아닌 경우만)
         if not parent_write:
@@ -232,7 +196,6 @@ class MoveUpdateService(BoardService):
         origin_bo_table = self.bo_table
 
         # 게시글 복사/이동 작업 반복
-        file_cache = FileCache()
         for target_bo_table in target_bo_tables:
             for origin_write in origin_writes:
                 target_write_model = dynamic_create_write_table(target_bo_table)
@@ -271,6 +234,7 @@ class MoveUpdateService(BoardService):
                 self.db.commit()
                 # 부모아이디 설정
                 target_write.wr_parent = target_write.wr_id
+                get_search_index().index_write(self.db, target_bo_table, target_write)
                 self.db.commit()
 
                 if self.sw == WriteTransportation.MOVE.value:
@@ -296,6 +260,7 @@ class MoveUpdateService(BoardService):
                         )
                     # 기존 데이터 삭제
                     self.db.delete(origin_write)
+                    self.delete_search_index(origin_write.wr_id)
                     self.db.commit()
 
                 # 파일이 존재할 경우
@@ -308,8 +273,10 @@ class MoveUpdateService(BoardService):
                         self.file_service.copy_board_files(CreatePostService.FILE_DIRECTORY,
                                                            origin_bo_table, origin_write.wr_id,
                                                            target_bo_table, target_write.wr_id)
-            # 최신글 캐시 삭제
-            file_cache.delete_prefix(f'latest-{target_bo_table}')
+            # 최신글, 게시글 수 캐시 삭제
+            invalidate_latest_cache(target_bo_table)
+            delete_list_count_cache(target_bo_table)
 
-        # 원본 게시판 최신글 캐시 삭제
-        file_cache.delete_prefix(f'latest-{origin_bo_table}')
+        # 원본 게시판 최신글, 게시글 수 캐시 삭제
+        invalidate_latest_cache(origin_bo_table)
+        delete_list_count_cache(origin_bo_table)
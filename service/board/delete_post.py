@@ -6,14 +6,15 @@ from sqlalchemy import select, exists, delete, update, and_
 from sqlalchemy.orm import Session # Ensure Session is imported for type hinting
 
 from core.database import db_session
-from core.models import Member, BoardNew, Scrap, WriteBaseModel, SuiTransactionlog, TokenSupply # Import SuiTransactionlog and TokenSupply
-from lib.board_lib import is_owner, FileCache
+from core.models import Member, BoardNew, Scrap, WriteBaseModel, SuiTransactionlog
+from lib.board_lib import is_owner, delete_list_count_cache
 from lib.common import remove_query_params, set_url_query_params
+from lib.render_cache import invalidate_latest_cache
 from service.board_file_service import BoardFileService
 from service.point_service import PointService
+from service.thumbnail_service import delete_thumbnail_manifest
 from .board import BoardService
-from lib.sui_service import reclaim_suiboard_token, SuiInteractionError, DEFAULT_SUI_CONFIG # Import SUI service
-from service.sui_transaction_log_service import log_sui_transaction # Import SUI transaction logging service
+from service.sui_mint_queue_service import enqueue_token_reclaim
 from lib.walrus_service import retrieve_post_from_walrus, WalrusError, DEFAULT_WALRUS_CONFIG # Import Walrus service
 
 logger = logging.getLogger(__name__) # Setup logger
@@ -97,77 +98,22 @@ class DeletePostService(BoardService):
         write = self.get_write(write_id)
         
         # SUIBOARD 토큰 회수 (에이전트가 아닌 경우만)
+        # - 회수 대기열에 등록만 하고, 실제 회수(발행+소각)와 트랜잭션 로그 기록은 스케줄러가 처리
         if not write.mb_id.startswith('gg_'):
+            token_amount = 1  # 게시글 작성 시 지급된 토큰 양
             try:
-                # 게시글 작성 보상으로 지급된 토큰 회수
-                token_amount = 1  # 게시글 작성 시 지급된 토큰 양
-                
-                # 실제 SUIBOARD 토큰 회수 (소각)
-                tx_hash = reclaim_suiboard_token(
-                    amount_to_reclaim=token_amount,
-                    sui_config=DEFAULT_SUI_CONFIG
-                )
-                
-                # 소각량 추적 업데이트
-                from core.database import get_db
-                from datetime import datetime
-                
-                db = next(get_db())
-                try:
-                    supply_record = db.query(TokenSupply).first()
-                    if supply_record:
-                        supply_record.total_burned += token_amount
-                        supply_record.last_updated = datetime.now()
-                        supply_record.notes = f"Burned {token_amount} tokens from deleted post {write_id}"
-                        db.commit()
-                        logger.info(f"토큰 소각량 추적 업데이트: +{token_amount}, 총 소각량: {supply_record.total_burned}")
-                    else:
-                        logger.warning("TokenSupply 레코드가 없어 소각량 추적 불가")
-                finally:
-                    db.close()
-                
-                # 트랜잭션 로그 저장 (중복 체크)
-                from core.models import SuiTransactionlog
-                from sqlalchemy import select
-                
-                # 동일한 트랜잭션 해시가 이미 존재하는지 확인
-                existing_log = self.db.scalar(
-                    select(SuiTransactionlog).where(SuiTransactionlog.stl_tx_hash == tx_hash)
-                )
-                
-                if not existing_log:
-                    sui_log = SuiTransactionlog(
-                        mb_id=write.mb_id,
-                        wr_id=write.wr_id,
-                        bo_table=self.bo_table,
-                        stl_amount=-token_amount,  # 음수로 회수 표시
-                        stl_reason="post_deletion", 
-                        stl_tx_hash=tx_hash,
-                        stl_status="success",
-                        stl_datetime=datetime.now(),
-                        stl_error_message=None
-                    )
-                    self.db.add(sui_log)
-                    logger.info(f"SUIBOARD 토큰 {token_amount} 회수 완료: {write.mb_id}, 게시글 {write.wr_id}, TX: {tx_hash}")
-                else:
-                    logger.warning(f"중복 트랜잭션 해시 발견, 로그 저장 건너뜀: {tx_hash}")
-                
-            except Exception as e:
-                logger.error(f"SUIBOARD 토큰 회수 실패: {write.mb_id}, 게시글 {write.wr_id}, 오류: {str(e)}")
-                # 실패 로그 저장
-                from core.models import SuiTransactionlog
-                sui_log = SuiTransactionlog(
+                enqueue_token_reclaim(
+                    self.db,
                     mb_id=write.mb_id,
+                    amount=token_amount,
+                    reason="post_deletion",
                     wr_id=write.wr_id,
                     bo_table=self.bo_table,
-                    stl_amount=-1,
-                    stl_reason="post_deletion",
-                    stl_tx_hash=None,
-                    stl_status="failed",
-                    stl_datetime=datetime.now(),
-                    stl_error_message=str(e)
+                    commit=False,
                 )
-                self.db.add(sui_log)
+                logger.info(f"SUIBOARD 토큰 {token_amount} 회수 대기열 등록: {write.mb_id}, 게시글 {write.wr_id}")
+            except Exception as e:
+                logger.error(f"SUIBOARD 토큰 회수 등록 실패: {write.mb_id}, 게시글 {write.wr_id}, 오류: {str(e)}")
 
         # Walrus에서 게시글 처리 (삭제는 불가능하므로 로그만 기록)
         self._handle_walrus_deletion(write)
@@ -188,7 +134,10 @@ class DeletePostService(BoardService):
         # 게시글 삭제
         self.db.delete(write)
         self.board.bo_count_write = self.board.bo_count_write - 1
+        self.delete_search_index(write.wr_id)
+        delete_thumbnail_manifest(self.db, self.bo_table, write.wr_id)
         self.db.commit()
+        delete_list_count_cache(self.bo_table)
 
     def _handle_walrus_deletion(self, write_item):
         """Walrus에서 게시글 처리 (삭제 기록)"""
@@ -293,6 +242,7 @@ class DeleteCommentService(DeletePostService):
             update(write_model).values(wr_comment=write_model.wr_comment - 1)
             .where(write_model.wr_id == self.comment.wr_parent)
         )
+        self.delete_search_index(self.comment.wr_id)
         db.commit()
 
 class ListDeleteService(BoardService):
@@ -323,7 +273,7 @@ class ListDeleteService(BoardService):
         instance = cls(request, db, file_service, point_service, bo_table)
         return instance
 
-    def delete_writes(self, wr_ids: list, sui_config_override: dict = None):
+    def delete_writes(self, wr_ids: list):
         """게시글 목록 삭제 및 SUI 토큰 회수"""
         write_model = self.write_model
         db: Session = self.db
@@ -357,6 +307,7 @@ class ListDeleteService(BoardService):
 
             # Delete the post itself
             db.delete(write_to_delete)
+            self.delete_search_index(wr_id_to_delete)
             if not self.point_service.delete_point(original_writer_mb_id, self.bo_table, wr_id_to_delete, "쓰기"):
                 self.point_service.save_point(original_writer_mb_id, self.board.bo_write_point * (-1),
                                               f"{self.board.bo_subject} {wr_id_to_delete} 글 삭제")
@@ -367,36 +318,17 @@ class ListDeleteService(BoardService):
             # Comment count update would be more complex here, assuming comments are deleted above
 
             # Reclaim SUI tokens
+            # 회수 대기열에 등록하면 스케줄러가 여러 게시글의 회수를 하나의 트랜잭션으로 처리
             if amount_to_reclaim_list_delete > 0 and original_writer_mb_id:
-                logger.info(f"Attempting to reclaim {amount_to_reclaim_list_delete} SUI tokens for list-deleted post {wr_id_to_delete}.")
-                current_sui_config_list = DEFAULT_SUI_CONFIG.copy()
-                if sui_config_override:
-                    current_sui_config_list.update(sui_config_override)
-                
-                reclaim_tx_digest_list = None
-                reclaim_status_list = "failed"
-                reclaim_error_msg_list = None
-                try:
-                    reclaim_tx_digest_list = reclaim_suiboard_token(
-                        amount_to_reclaim=amount_to_reclaim_list_delete,
-                        sui_config=current_sui_config_list
-                    )
-                    reclaim_status_list = "success"
-                except SuiInteractionError as e:
-                    reclaim_error_msg_list = str(e)
-                except Exception as e:
-                    reclaim_error_msg_list = f"Unexpected SUI error: {str(e)}"
-                
-                log_sui_transaction(
-                    db=db,
+                logger.info(f"Queueing reclaim of {amount_to_reclaim_list_delete} SUI tokens for list-deleted post {wr_id_to_delete}.")
+                enqueue_token_reclaim(
+                    db,
                     mb_id=original_writer_mb_id,
+                    amount=amount_to_reclaim_list_delete,
+                    reason="목록 삭제로 인한 토큰 회수",
                     wr_id=wr_id_to_delete,
                     bo_table=self.bo_table,
-                    stl_amount=-amount_to_reclaim_list_delete,
-                    stl_tx_hash=reclaim_tx_digest_list,
-                    stl_status=reclaim_status_list,
-                    stl_reason="목록 삭제로 인한 토큰 회수",
-                    stl_error_message=reclaim_error_msg_list
+                    commit=False,
                 )
 
             # Remove from BoardNew and Scrap
@@ -404,5 +336,6 @@ class ListDeleteService(BoardService):
             db.execute(delete(Scrap).where(Scrap.bo_table == self.bo_table, Scrap.wr_id == wr_id_to_delete))
 
         db.commit()
-        FileCache().delete_prefix(f"latest-{self.bo_table}")
+        invalidate_latest_cache(self.bo_table)
+        delete_list_count_cache(self.bo_table)
 
@@ -1,14 +1,19 @@
-from typing_extensions import Annotated, List
+from typing_extensions import Annotated, Dict, List, Tuple
 from fastapi import Request, Path, Depends
-from sqlalchemy import asc, desc, func, select
+from sqlalchemy import Row, and_, asc, desc, func, or_, select
 
 from core.database import db_session
 from core.models import WriteBaseModel
 from lib.dependency.dependencies import common_search_query_params
-from lib.board_lib import get_list_thumbnail, write_search_filter, get_list, cut_name, is_owner
+from lib.board_lib import (
+    cache_list_count, decode_list_cursor, encode_list_cursor, get_list,
+    get_list_count_cache_key, get_list_thumbnail, write_search_filter
+)
 from service.board_file_service import BoardFileService
 from service.ajax import AJAXService
+from service.thumbnail_service import get_thumbnail_manifest_map
 from . import BoardService
+from .comment_thread import CommentThreadBuilder, fetch_comments_map
 
 
 class ListPostService(BoardService):
@@ -33,6 +38,8 @@ class ListPostService(BoardService):
         self.search_params = search_params
         self.prev_spt = None
         self.next_spt = None
+        self.prev_cursor = None
+        self.next_cursor = None
 
     @classmethod
     async def async_init(
@@ -57,6 +64,10 @@ class ListPostService(BoardService):
         # 게시글 목록 조회
         self.query = write_search_filter(self.write_model, sca, sfl, stx)
 
+        # 커서 페이지네이션은 기본 정렬(wr_num, wr_reply)의 일반 목록에서만 사용합니다.
+        self.is_default_sort = not (sst and hasattr(self.write_model, sst)) and not self.board.bo_sort_field
+        self.is_search = bool(sca or (sfl and stx))
+
         # 정렬
         if sst and hasattr(self.write_model, sst):
             if sod == "desc":
@@ -104,64 +115,60 @@ class ListPostService(BoardService):
         게시글 목록에 부가 정보를 추가합니다.
         (댓글, 좋아요, 회원 이미지, 회원 아이콘, 썸네일, 첨부파일)
         """
-        ajax_service = AJAXService(self.request, self.db)
-        for write in writes:
-            write.num = total_count - offset - writes.index(write)
-            write = get_list(self.request, self.db, write, self)
-
-            # 댓글 정보를 불러와서 write에 추가합니다.
-            comments: List[WriteBaseModel] = self.db.scalars(
-            select(self.write_model).filter_by(
-                    wr_parent=write.wr_id,
-                    wr_is_comment=1
-                ).order_by(self.write_model.wr_comment, self.write_model.wr_comment_reply)
-            ).all()
-
-            for comment in comments:
-                comment.name = cut_name(self.request, comment.wr_name)
-                comment.ip = self.get_display_ip(comment.wr_ip)
-                comment.is_reply = len(comment.wr_comment_reply) < 5 and self.board.bo_comment_level <= self.member.level
-                comment.is_edit = bool(self.member.admin_type or (self.member and comment.mb_id == self.member.mb_id))
-                comment.is_del = bool(self.member.admin_type or (self.member and comment.mb_id == self.member.mb_id) or not comment.mb_id)
-                comment.is_secret = "secret" in comment.wr_option
-
-                # 회원 이미지, 아이콘 경로 설정
-                comment.mb_image_path = self.get_member_image_path(comment.mb_id)
-                comment.mb_icon_path = self.get_member_icon_path(comment.mb_id)
-
-                # 비밀댓글 처리
-                session_secret_comment_name = f"ss_secret_comment_{self.bo_table}_{comment.wr_id}"
-                parent_write = self.db.get(self.write_model, comment.wr_parent)
-                if (comment.is_secret
-                        and not self.member.admin_type
-                        and not is_owner(comment, self.member.mb_id)
-                        and not is_owner(parent_write, self.member.mb_id)
-                        and not self.request.session.get(session_secret_comment_name)):
-                    comment.is_secret_content = True
-                    comment.save_content = "비밀글 입니다."
-                else:
-                    comment.is_secret_content = False
-                    comment.save_content = comment.wr_content
+        if not writes:
+            return writes
+
+        # 페이지 전체의 댓글, 추천/비추천 수, 첨부파일, 섬네일 목록을 IN (...) 쿼리로 한번에 조회합니다.
+        wr_ids = [write.wr_id for write in writes]
+        comments_map = self.get_comments_map(wr_ids)
+        comment_builder = CommentThreadBuilder(self)
+        good_map = AJAXService(self.request, self.db).get_ajax_good_data_map(self.bo_table, wr_ids)
+        files_map = self.file_service.get_board_files_map(self.bo_table, wr_ids)
+        manifest_map = get_thumbnail_manifest_map(self.db, self.bo_table, wr_ids)
+
+        for index, write in enumerate(writes):
+            board_files = files_map.get(write.wr_id, [])
+            write.num = total_count - offset - index
+            write = get_list(self.request, self.db, write, self, icon_file=bool(board_files))
+
+            # 댓글 정보를 write에 추가합니다.
+            comments = comment_builder.build(write, comments_map.get(write.wr_id, []))
             write.comments = comments
 
+            # 첨부파일, 섬네일 목록 (썸네일 생성시 재사용)
+            write.board_files = board_files
+            write.thumbnail_manifest = manifest_map[write.wr_id]
+
             # 게시글 목록 조회시 첨부된 파일을 함께 가져올 경우, default는 False
             if with_files:
-                write.images, write.normal_files = self.file_service.get_board_files_by_type(self.bo_table, write.wr_id)
+                write.images, write.normal_files = self.file_service.split_board_files_by_type(board_files)
 
             # 회원 이미지, 아이콘 경로 설정
             write.mb_image_path = self.get_member_image_path(write.mb_id)
             write.mb_icon_path = self.get_member_icon_path(write.mb_id)
 
             # 게시글 좋아요/싫어요 정보 설정
-            ajax_good_data = ajax_service.get_ajax_good_data(self.bo_table, write)
-            write.good = ajax_good_data["good"]
-            write.nogood = ajax_good_data["nogood"]
+            write.good = good_map[write.wr_id]["good"]
+            write.nogood = good_map[write.wr_id]["nogood"]
 
             # 게시글 썸네일 설정
             write.thumbnail = get_list_thumbnail(self.request, self.board, write, self.gallery_width, self.gallery_height)
 
-    def get_writes(self, with_files=False, page=1, per_page=None, with_notice=False) -> List[WriteBaseModel]:
-        """게시글 목록을 가져옵니다."""
+        return writes
+
+    def get_comments_map(self, wr_ids: List[int]) -> Dict[int, List[Row]]:
+        """여러 게시글의 댓글을 한번에 조회하여 게시글 번호별로 반환합니다."""
+        return fetch_comments_map(self.db, self.write_model, wr_ids)
+
+    def is_cursor_pagination(self) -> bool:
+        """커서 페이지네이션 사용 가능 여부"""
+        return self.is_default_sort and not self.is_search
+
+    def get_writes(self, with_files=False, page=1, per_page=None, with_notice=False, cursor=None) -> List[WriteBaseModel]:
+        """게시글 목록을 가져옵니다.
+        - cursor가 전달되면 OFFSET 대신 (wr_num, wr_reply) 기준으로 이어서 조회합니다.
+          (기본 정렬의 일반 목록이 아니면 page 기준으로 조회합니다.)
+        """
         current_page = page
         if per_page:
             page_rows = per_page        # 페이지당 게시글 수를 별도 설정
@@ -173,13 +180,21 @@ class ListPostService(BoardService):
             notice_ids = self.get_notice_list()
             self.query = self.query.where(self.write_model.wr_id.notin_(notice_ids))
 
-        # 페이지 번호에 따른 offset 계산
-        offset = (current_page - 1) * page_rows
-        # 최종 쿼리 결과를 가져옵니다.
-        writes = self.db.scalars(
-            self.query.add_columns(self.write_model)
-            .offset(offset).limit(page_rows)
-        ).all()
+        if cursor and self.is_cursor_pagination():
+            # 글 번호(num)와 현재 페이지는 커서에 담긴 목록의 위치로 계산
+            writes, offset = self.get_writes_by_cursor(cursor, page_rows)
+            self.search_params['current_page'] = offset // page_rows + 1
+        else:
+            # 페이지 번호에 따른 offset 계산
+            offset = (current_page - 1) * page_rows
+            # 최종 쿼리 결과를 가져옵니다. (다음 목록 여부 확인을 위해 1개 더 조회)
+            writes = self.db.scalars(
+                self.query.add_columns(self.write_model)
+                .offset(offset).limit(page_rows + 1)
+            ).all()
+            has_next = len(writes) > page_rows
+            writes = writes[:page_rows]
+            self.set_cursors(writes, has_prev=offset > 0, has_next=has_next, offset=offset, page_rows=page_rows)
 
         total_count = self.get_total_count()
 
@@ -188,6 +203,59 @@ class ListPostService(BoardService):
 
         return writes
 
+    def get_writes_by_cursor(self, cursor: str, page_rows: int) -> Tuple[List[WriteBaseModel], int]:
+        """커서 기준으로 게시글 목록과 목록의 위치(offset)를 가져옵니다.
+        - idx_wr_num_reply 인덱스를 이용하므로 목록의 깊이와 관계없이 조회 비용이 일정합니다.
+        - 목록의 위치는 커서에 담아 전달하므로 앞쪽 게시글 수를 세지 않습니다.
+          (이동 중 새 글이 등록되면 글 번호가 조금 어긋날 수 있습니다.)
+        """
+        decoded = decode_list_cursor(cursor)
+        if decoded is None:
+            self.raise_exception(detail="잘못된 커서입니다.", status_code=400)
+        wr_num, wr_reply, direction, offset = decoded
+
+        model = self.write_model
+        query = self.query.order_by(None)
+        if direction == "next":
+            query = query.where(or_(
+                model.wr_num > wr_num,
+                and_(model.wr_num == wr_num, model.wr_reply > wr_reply)
+            )).order_by(model.wr_num, model.wr_reply)
+        else:
+            query = query.where(or_(
+                model.wr_num < wr_num,
+                and_(model.wr_num == wr_num, model.wr_reply < wr_reply)
+            )).order_by(desc(model.wr_num), desc(model.wr_reply))
+
+        # 이전/다음 목록 여부 확인을 위해 1개 더 조회
+        writes = list(self.db.scalars(query.add_columns(model).limit(page_rows + 1)).all())
+        has_more = len(writes) > page_rows
+        writes = writes[:page_rows]
+
+        if direction == "next":
+            self.set_cursors(writes, has_prev=True, has_next=has_more, offset=offset, page_rows=page_rows)
+        else:
+            writes.reverse()
+            # 더 이전 목록이 없으면 첫 목록
+            if not has_more:
+                offset = 0
+            self.set_cursors(writes, has_prev=has_more, has_next=True, offset=offset, page_rows=page_rows)
+
+        return writes, offset
+
+    def set_cursors(self, writes: List[WriteBaseModel], has_prev: bool, has_next: bool,
+                    offset: int, page_rows: int) -> None:
+        """조회된 목록의 처음/마지막 게시글로 이전/다음 커서를 설정합니다.
+        - 커서에는 이동할 목록의 위치(offset)를 함께 담습니다.
+        """
+        if not writes or not self.is_cursor_pagination():
+            return
+        first, last = writes[0], writes[-1]
+        self.prev_cursor = (encode_list_cursor(first.wr_num, first.wr_reply, "prev", max(offset - page_rows, 0))
+                            if has_prev else None)
+        self.next_cursor = (encode_list_cursor(last.wr_num, last.wr_reply, "next", offset + len(writes))
+                            if has_next else None)
+
     def get_notice_writes(self, with_files=False) -> List[WriteBaseModel]:
         """게시글 중 공지사항 목록을 가져옵니다."""
         current_page = self.search_params.get('current_page')
@@ -206,6 +274,13 @@ class ListPostService(BoardService):
         return notice_writes
 
     def get_total_count(self) -> int:
-        """쿼리문을 통해 불러오는 게시글의 수"""
-        total_count = self.db.scalar(self.query.add_columns(func.count()).order_by(None))
+        """쿼리문을 통해 불러오는 게시글의 수
+        - 페이지마다 COUNT(*)를 실행하지 않도록 쿼리별로 캐시합니다.
+        """
+        query = self.query.add_columns(func.count()).order_by(None)
+        cache_key = get_list_count_cache_key(self.bo_table, query)
+        total_count = cache_list_count.get(cache_key)
+        if total_count is None:
+            total_count = self.db.scalar(query)
+            cache_list_count[cache_key] = total_count
         return total_count
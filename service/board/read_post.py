@@ -1,18 +1,28 @@
-from typing_extensions import Annotated, List, Tuple
+from typing_extensions import Annotated, List, Optional, Tuple
 
+from cachetools import TTLCache
 from fastapi import Depends, Request, Path
-from sqlalchemy import asc, desc, select, exists
+from sqlalchemy import Row, and_, asc, desc, exists, literal, or_, select, union_all
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from starlette.concurrency import run_in_threadpool
 
 from core.database import db_session
 from core.models import BoardGood, Scrap, WriteBaseModel, BoardFile, Member
 from core.exception import RedirectException
-from lib.common import set_url_query_params
+from lib.common import get_client_ip, set_url_query_params
 from lib.board_lib import is_owner, cut_name
+from lib.render_cache import get_board_version
 from lib.template_filters import number_format
-from lib.slowapi.read_count_limit.limiter import limit_read_count
 from service.board_file_service import BoardFileService
+from service.hit_counter_service import hit_counter, read_dedupe
 from service.point_service import PointService
 from . import BoardService
+from .comment_thread import CommentThreadBuilder, CommentView
+
+# 이전글 다음글 캐시
+# 키 값: (게시판 코드, 게시글 ID, wr_num, wr_reply, 분류, 검색필드, 검색어, 게시판 버전)
+prev_next_cache = TTLCache(maxsize=4096, ttl=600)
 
 
 class ReadPostService(BoardService):
@@ -137,6 +147,9 @@ class ReadPostService(BoardService):
             return
 
         # 포인트 검사
+        # 읽기 포인트는 조회수처럼 모아서 반영하지 않음
+        # (포인트가 부족하면 글을 보여주지 않아야 하고, 글별 1회 차감을 포인트 내역으로 확인하므로)
+        # 회원 포인트는 save_point에서 `mb_point = mb_point + n` 쿼리로 갱신되어 동시 요청에도 누락되지 않음
         if self.config.cf_use_point:
             read_point = self.board.bo_read_point
             if not self.is_read_point(self.write):
@@ -149,9 +162,10 @@ class ReadPostService(BoardService):
                 self.point_service.save_point(
                     self.member.mb_id, read_point, f"{self.board.bo_subject} {self.write.wr_id} 글읽기",
                     self.board.bo_table, self.write.wr_id, "읽기")
-        # 조회수 증가
-        self.write.wr_hit += 1
-        self.db.commit()
+        # 조회수 증가 (DB에는 주기적으로 한번에 반영)
+        hit_counter.increment(self.bo_table, self.write.wr_id)
+        # 화면에 표시할 조회수만 변경 (변경 상태로 표시하지 않아 commit 시 반영되지 않음)
+        set_committed_value(self.write, "wr_hit", (self.write.wr_hit or 0) + 1)
 
     def validate_repeat_with_session(self):
         """
@@ -165,15 +179,17 @@ class ReadPostService(BoardService):
         self._validate_repeat()
         self.request.session[session_name] = True
 
-    def validate_repeat_with_slowapi(self):
+    async def validate_repeat_with_slowapi(self):
         """
         게시글 작성자 확인(_validate_repeat())과
-        slowapi를 통한 ip 확인을 통해
+        IP별 중복 조회 확인(모든 워커 공유, 하루 1회)을 통해
         한번 읽은 게시글은 조회수, 포인트 처리를 하지 않는다.
+        - 중복 조회 기록(SQLite 파일)은 이벤트 루프를 막지 않도록 스레드 풀에서 기록한다.
         """
         try:
-            limit_read_count(self.request)
-            self._validate_repeat()
+            key = f"{get_client_ip(self.request)}:{self.bo_table}:{self.wr_id}"
+            if await run_in_threadpool(read_dedupe.first_hit, key):
+                self._validate_repeat()
         except:
             pass
 
@@ -216,81 +232,65 @@ class ReadPostService(BoardService):
                 links.append({"no": i, "url": url, "hit": hit})
         return links
 
-    def get_comments(self) -> List[WriteBaseModel]:
+    def get_comments(self) -> List[CommentView]:
         """댓글 목록 조회"""
-        comments: List[WriteBaseModel] = self.db.scalars(
-            select(self.write_model).filter_by(
-                wr_parent=self.wr_id,
-                wr_is_comment=1
-            ).order_by(self.write_model.wr_comment, self.write_model.wr_comment_reply)
-        ).all()
-
-        for comment in comments:
-            comment.name = cut_name(self.request, comment.wr_name)
-            comment.ip = self.get_display_ip(comment.wr_ip)
-            comment.is_reply = len(comment.wr_comment_reply) < 5 and self.board.bo_comment_level <= self.member.level
-            comment.is_edit = bool(self.member.admin_type or (self.member and comment.mb_id == self.member.mb_id))
-            comment.is_del = bool(self.member.admin_type or (self.member and comment.mb_id == self.member.mb_id) or not comment.mb_id)
-            comment.is_secret = "secret" in comment.wr_option
-
-            # 회원 이미지, 아이콘 경로 설정
-            comment.mb_image_path = self.get_member_image_path(comment.mb_id)
-            comment.mb_icon_path = self.get_member_icon_path(comment.mb_id)
-
-            # 비밀댓글 처리
-            session_secret_comment_name = f"ss_secret_comment_{self.bo_table}_{comment.wr_id}"
-            parent_write = self.db.get(self.write_model, comment.wr_parent)
-            if (comment.is_secret
-                    and not self.member.admin_type
-                    and not is_owner(comment, self.member.mb_id)
-                    and not is_owner(parent_write, self.member.mb_id)
-                    and not self.request.session.get(session_secret_comment_name)):
-                comment.is_secret_content = True
-                comment.save_content = "비밀글 입니다."
-            else:
-                comment.is_secret_content = False
-                comment.save_content = comment.wr_content
+        return CommentThreadBuilder(self).build_thread(self.write)
 
-        return comments
+    def get_prev_next(self) -> Tuple[Optional[Row], Optional[Row]]:
+        """이전글 다음글 조회
+        - 게시판 글 목록 순서(wr_num, wr_reply)에서 앞/뒤 게시글을 1회 쿼리로 조회한다.
+        - 결과는 게시글/검색조건별로 캐시하고, 게시판에 글이 작성/수정/삭제되면 무효화된다.
+        """
+        if self.board.bo_use_list_view:
+            return None, None
 
-    def get_prev_next(self) -> Tuple[WriteBaseModel, WriteBaseModel]:
-        """이전글 다음글 조회"""
-        prev = None
-        next = None
         sca = self.request.query_params.get("sca")
         sfl = self.request.query_params.get("sfl")
         stx = self.request.query_params.get("stx")
-        if not self.board.bo_use_list_view:
-            query = select(self.write_model).where(self.write_model.wr_is_comment == 0)
-            if sca:
-                query = query.where(self.write_model.ca_name == sca)
-            if sfl and stx and hasattr(self.write_model, sfl):
-                query = query.where(getattr(self.write_model, sfl).like(f"%{stx}%"))
-            # 같은 wr_num 내에서 이전글 조회
-            prev = self.db.scalar(
-                query.where(
-                    self.write_model.wr_num == self.write.wr_num,
-                    self.write_model.wr_reply < self.write.wr_reply,
-                ).order_by(desc(self.write_model.wr_reply))
-            )
-            if not prev:
-                prev = self.db.scalar(
-                    query.where(self.write_model.wr_num < self.write.wr_num)
-                    .order_by(desc(self.write_model.wr_num))
-                )
-            # 같은 wr_num 내에서 다음글 조회
-            next = self.db.scalar(
-                query.where(
-                    self.write_model.wr_num == self.write.wr_num,
-                    self.write_model.wr_reply > self.write.wr_reply,
-                ).order_by(asc(self.write_model.wr_reply))
-            )
-            if not next:
-                next = self.db.scalar(
-                    query.where(self.write_model.wr_num > self.write.wr_num)
-                    .order_by(asc(self.write_model.wr_num))
-                )
-        return prev, next
+        key = (self.bo_table, self.write.wr_id, self.write.wr_num, self.write.wr_reply,
+               sca, sfl, stx, get_board_version(self.bo_table))
+        if key not in prev_next_cache:
+            prev_next_cache[key] = fetch_prev_next(
+                self.db, self.write_model, self.write.wr_num, self.write.wr_reply, sca, sfl, stx)
+        return prev_next_cache[key]
+
+
+def fetch_prev_next(db: Session, write_model: WriteBaseModel, wr_num: int, wr_reply: str,
+                    sca: str = None, sfl: str = None, stx: str = None) -> Tuple[Optional[Row], Optional[Row]]:
+    """이전글 다음글을 1회 쿼리로 조회한다.
+    - 이전글/다음글을 각각 (wr_num, wr_reply) 순서로 정렬하여 첫 행만 조회하는 쿼리를
+      UNION ALL 로 합친다. 인덱스(wr_num, wr_reply) 순서대로 읽다가 조건에 맞는 첫 행에서 멈춘다.
+
+    Returns:
+        Tuple[Row, Row]: 이전글, 다음글 (wr_id, wr_subject, wr_datetime). 없으면 None
+    """
+    conditions = [write_model.wr_is_comment == 0]
+    if sca:
+        conditions.append(write_model.ca_name == sca)
+    if sfl and stx and hasattr(write_model, sfl):
+        conditions.append(getattr(write_model, sfl).like(f"%{stx}%"))
+
+    def _nearest(direction: str, before: bool):
+        if before:
+            position = or_(write_model.wr_num < wr_num,
+                           and_(write_model.wr_num == wr_num, write_model.wr_reply < wr_reply))
+            order = (desc(write_model.wr_num), desc(write_model.wr_reply))
+        else:
+            position = or_(write_model.wr_num > wr_num,
+                           and_(write_model.wr_num == wr_num, write_model.wr_reply > wr_reply))
+            order = (asc(write_model.wr_num), asc(write_model.wr_reply))
+        return select(
+            select(literal(direction).label("direction"), write_model.wr_id,
+                   write_model.wr_subject, write_model.wr_datetime)
+            .where(*conditions, position)
+            .order_by(*order)
+            .limit(1)
+            .subquery()
+        )
+
+    rows = db.execute(union_all(_nearest("prev", True), _nearest("next", False))).all()
+    result = {row.direction: row for row in rows}
+    return result.get("prev"), result.get("next")
 
 
 class DownloadFileService(BoardService):
@@ -59,6 +59,7 @@ class UpdatePostService(BoardService):
         for field, value in data.__dict__.items():
             if value:
                 setattr(write, field, value)
+        self.update_search_index(write)
         self.db.commit()
 
 
@@ -168,6 +169,9 @@ class CommentService(UpdatePostService):
         # 게시글에 댓글 수 증가
         write.wr_comment +=  1
 
+        # 댓글과 색인을 함께 커밋 (flush로 wr_id만 할당)
+        self.db.flush()
+        self.update_search_index(comment)
         self.db.commit()
         return comment
 
@@ -1,12 +1,15 @@
 """게시판 파일 관련 기능을 제공하는 서비스 모듈입니다."""
 import os
 import shutil
-from typing import List
+from typing import Dict, List
 from fastapi import Request, UploadFile
 from sqlalchemy import exists, func, insert, select
 
 from core.database import db_session
 from core.models import Board, BoardFile
+from service.thumbnail_service import (
+    delete_thumbnail_manifest, get_thumbnail_manifest_map, get_thumbnail_sizes, schedule_thumbnails
+)
 
 
 class BoardFileService():
@@ -97,6 +100,27 @@ class BoardFileService():
 
         return files
 
+    def get_board_files_map(self, bo_table: str, wr_ids: List[int]) -> Dict[int, List[BoardFile]]:
+        """여러 게시글의 업로드된 파일 목록을 한번에 가져온다.
+
+        Returns:
+            dict[int, list[BoardFile]]: 게시글 번호별 파일 목록 (파일이 없는 게시글은 빈 목록)
+        """
+        files_map = {wr_id: [] for wr_id in wr_ids}
+        if not wr_ids:
+            return files_map
+
+        board_files = self.db.scalars(
+            select(BoardFile).where(
+                BoardFile.bo_table == bo_table,
+                BoardFile.wr_id.in_(wr_ids)
+            ).order_by(BoardFile.wr_id, BoardFile.bf_no)
+        ).all()
+        for file in board_files:
+            files_map[file.wr_id].append(file)
+
+        return files_map
+
     def get_board_files_by_type(self, bo_table: str, wr_id: int):
         """업로드된 파일 목록을 파일과 이미지로 분리한다.
 
@@ -108,6 +132,15 @@ class BoardFileService():
             list[BoardFile]: 이미지 목록
         """
         board_files = self.get_board_files(bo_table, wr_id)
+        return self.split_board_files_by_type(board_files)
+
+    def split_board_files_by_type(self, board_files: List[BoardFile]):
+        """파일 목록을 이미지와 일반 파일로 분리한다.
+
+        Returns:
+            list[BoardFile]: 이미지 목록
+            list[BoardFile]: 파일 목록
+        """
         images = []
         files = []
         for file in board_files:
@@ -166,6 +199,7 @@ class BoardFileService():
             )
         )
         self.db.commit()
+        self.schedule_list_thumbnails(bo_table, wr_id)
 
     def update_board_file(self, board_file: BoardFile,
                           directory: str, filename: str, file: UploadFile,
@@ -188,6 +222,24 @@ class BoardFileService():
         board_file.bf_content = content
         board_file.bf_filesize = file.size
         self.db.commit()
+        self.schedule_list_thumbnails(board_file.bo_table, board_file.wr_id)
+
+    def schedule_list_thumbnails(self, bo_table: str, wr_id: int):
+        """게시글 대표 이미지(첫번째 이미지)의 목록 섬네일 생성을 예약한다.
+        - 섬네일은 프로세스 풀에서 게시판 설정의 크기(PC, 모바일)로 생성하고 섬네일 목록에 기록한다.
+        - 이미 섬네일 목록에 있으면 예약하지 않는다.
+        """
+        images, _ = self.get_board_files_by_type(bo_table, wr_id)
+        board = self.db.get(Board, bo_table)
+        if not images or not board:
+            return
+
+        source_file = images[0].bf_file
+        manifest = get_thumbnail_manifest_map(self.db, bo_table, [wr_id])[wr_id]
+        sizes = [size for size in get_thumbnail_sizes(board)
+                 if not (size in manifest and manifest[size].tm_source == source_file)]
+        if sizes:
+            schedule_thumbnails(bo_table, wr_id, source_file, sizes)
 
     def update_download_count(self, board_file: BoardFile):
         """다운로드 횟수를 증가시킨다.
@@ -223,6 +275,7 @@ class BoardFileService():
                                    board_file.bf_content, target_bo_table, target_wr_id)
             board_file.bo_table = target_bo_table
             board_file.wr_id = target_wr_id
+        delete_thumbnail_manifest(self.db, origin_bo_table, origin_wr_id)
 
         self.db.commit()
 
@@ -254,6 +307,8 @@ class BoardFileService():
             return
         self.remove_file(board_file.bf_file)
         self.db.delete(board_file)
+        # 대표 이미지가 바뀔 수 있으므로 섬네일 목록 삭제
+        delete_thumbnail_manifest(self.db, bo_table, wr_id)
         self.db.commit()
 
     def delete_board_files(self, bo_table: str, wr_id: int):
@@ -270,6 +325,7 @@ class BoardFileService():
                     self.remove_file(os.path.join(directory, file))
             # 파일 정보 삭제
             self.db.delete(board_file)
+        delete_thumbnail_manifest(self.db, bo_table, wr_id)
         self.db.commit()
 
     def upload_file(self, directory: str, filename: str, file: UploadFile):
@@ -6,8 +6,9 @@ from sqlalchemy import func, select, Select
 from core.models import Board, BoardNew
 from core.database import db_session
 from core.exception import AlertException
-from lib.common import dynamic_create_write_table, cut_name, FileCache
+from lib.common import dynamic_create_write_table, cut_name
 from lib.board_lib import BoardConfig, get_list, get_list_thumbnail
+from lib.render_cache import invalidate_latest_cache
 from service import BaseService
 from service.ajax.ajax import AJAXService
 from service.board_file_service import BoardFileService
@@ -193,7 +194,7 @@ class BoardNewService(BaseService):
             self.db.delete(new)
 
             # 최신글 캐시 삭제
-            FileCache().delete_prefix(f'latest-{new.bo_table}')
+            invalidate_latest_cache(new.bo_table)
 
         self.db.commit()
 
@@ -1,17 +1,41 @@
-"""현재 접속자 관련 기능을 제공하는 서비스 모듈입니다."""
+"""현재 접속자 관련 기능을 제공하는 서비스 모듈입니다.
+
+요청마다 현재 접속자 테이블(Login)을 조회/갱신하지 않도록
+워커별 메모리(presence_table)에 IP별 접속 정보를 기록하고, 주기적으로 한번에 저장합니다.
+- 오래된 접속 정보는 조회시 접속 유지시간(cf_login_minutes)으로 제외하고,
+  스케줄러가 주기적으로 삭제합니다.
+- 여러 워커가 같은 IP를 동시에 저장해도 1건만 남도록 IP 유니크 인덱스로 upsert 합니다.
+  (기존 설치본의 유니크 인덱스는 migrate_indexes.py 에서 중복 IP를 정리한 뒤 생성합니다.)
+"""
+import asyncio
+import logging
+import threading
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, Dict, Tuple, Union
 
-from cachetools import LRUCache, cached
+from cachetools import TTLCache, cached
 from cachetools.keys import hashkey
 from fastapi import Request
-from sqlalchemy import Row, Select, Sequence, delete, func, insert, select
-
-from core.database import db_session
+from sqlalchemy import Row, Select, Sequence, case, delete, func, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from core.database import DBConnect, db_session
 from core.exception import AlertException
 from core.models import Login, Member
+from lib.config_cache import get_cached_config
 from service import BaseService
 
+logger = logging.getLogger(__name__)
+
+PRESENCE_FLUSH_INTERVAL = 5  # 현재 접속자 정보 저장 주기 (초)
+PRESENCE_FLUSH_CHUNK_SIZE = 500  # 한번에 저장할 IP 수
+PRESENCE_UPSERT_COLUMNS = ("mb_id", "lo_location", "lo_url", "lo_datetime")  # 접속 시간은 마지막에 갱신
+
 
 class CurrentConnectService(BaseService):
     """
@@ -28,7 +52,8 @@ class CurrentConnectService(BaseService):
     def raise_exception(self, status_code: int, detail: str = None, url: str = None):
         return AlertException(status_code=status_code, detail=detail, url=url)
 
-    @cached(LRUCache(maxsize=1),
+    # 다른 워커의 접속 정보도 저장 주기마다 반영되므로 같은 주기로 캐시
+    @cached(TTLCache(maxsize=2, ttl=PRESENCE_FLUSH_INTERVAL),
             key=lambda self, only_member=False: hashkey("connects_count", only_member))
     def fetch_total_records(self, only_member: bool = False) -> int:
         """현재 접속중인 회원의 총 수를 반환합니다."""
@@ -48,47 +73,6 @@ class CurrentConnectService(BaseService):
             .offset(offset).limit(per_page)
         ).all()
 
-    def fetch_current_connect(self, ip: str) -> Login:
-        """특정 IP의 현재 접속자 정보를 반환합니다."""
-        return self.db.scalar(select(Login).where(Login.lo_ip == ip))
-
-    def create_current_connect(self, ip: str,
-                               path: str, mb_id: str = "") -> None:
-        """현재 접속자 정보를 생성합니다."""
-        self.db.execute(
-            insert(Login).values(
-                lo_ip=ip,
-                mb_id=mb_id,
-                lo_location=path,
-                lo_url=path
-            )
-        )
-        self.db.commit()
-
-        # 캐시 초기화
-        self.fetch_total_records.cache_clear()
-
-    def update_current_connect(self, login: Login,
-                               path: str, mb_id: str = "") -> None:
-        """현재 접속자 정보를 갱신합니다."""
-        login.mb_id = mb_id
-        login.lo_datetime = datetime.now()
-        login.lo_location = path
-        login.lo_url = path
-
-        self.db.commit()
-
-    def delete_current_connect(self) -> None:
-        """설정 시간 이전의 현재 접속자 정보를 삭제합니다."""
-        result = self.db.execute(
-            delete(Login).where(Login.lo_datetime < self.base_date)
-        )
-        self.db.commit()
-
-        # 캐시 초기화
-        if result.rowcount:
-            self.fetch_total_records.cache_clear()
-
     def _base_query(self, only_member: bool = False) -> Select:
         """기본 쿼리를 반환합니다."""
         query = select().where(
@@ -101,3 +85,153 @@ class CurrentConnectService(BaseService):
             query = query.where(Login.mb_id != "")
 
         return query
+
+
+def delete_duplicate_login_ips(connection: Union[Connection, Session]) -> int:
+    """같은 IP의 현재 접속자 정보 중 가장 최근 정보만 남기고 삭제한다. (IP 유니크 인덱스 생성 전)
+
+    Returns:
+        int: 삭제한 접속자 정보 수
+    """
+    rows = connection.execute(
+        select(Login.lo_id, Login.lo_ip).order_by(Login.lo_datetime.desc(), Login.lo_id.desc())
+    ).all()
+    latest_ips = set()
+    duplicate_ids = []
+    for lo_id, lo_ip in rows:
+        if lo_ip in latest_ips:
+            duplicate_ids.append(lo_id)
+        latest_ips.add(lo_ip)
+    for start in range(0, len(duplicate_ids), PRESENCE_FLUSH_CHUNK_SIZE):
+        chunk = duplicate_ids[start:start + PRESENCE_FLUSH_CHUNK_SIZE]
+        connection.execute(delete(Login).where(Login.lo_id.in_(chunk)))
+    return len(duplicate_ids)
+
+
+def _upsert_presences(db: Session, rows: list):
+    """IP 기준 upsert 문장 (다른 워커가 더 최근에 저장한 정보는 유지)"""
+    if db.bind.dialect.name in ("mysql", "mariadb"):
+        statement = mysql_insert(Login).values(rows)
+        is_newer = statement.inserted.lo_datetime >= Login.lo_datetime
+        # MySQL은 앞에서 갱신한 값으로 다음 컬럼을 계산하므로 접속 시간을 마지막에 갱신
+        return statement.on_duplicate_key_update([
+            (column, case((is_newer, statement.inserted[column]), else_=Login.__table__.c[column]))
+            for column in PRESENCE_UPSERT_COLUMNS
+        ])
+
+    insert_ = postgresql_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+    statement = insert_(Login).values(rows)
+    return statement.on_conflict_do_update(
+        index_elements=[Login.lo_ip],
+        set_={column: statement.excluded[column] for column in PRESENCE_UPSERT_COLUMNS},
+        where=Login.lo_datetime <= statement.excluded.lo_datetime,
+    )
+
+
+def save_presences(db: Session, presences: Dict[str, Tuple[str, str, datetime]]) -> int:
+    """현재 접속자 정보를 한번에 저장합니다.
+    - 이미 등록된 IP는 갱신하고, 없는 IP는 추가합니다. (IP 기준 upsert)
+
+    Args:
+        presences (dict): {IP: (회원아이디, 접속 경로, 접속 시간)}
+
+    Returns:
+        int: 저장한 접속자 수
+    """
+    ips = list(presences)
+    for start in range(0, len(ips), PRESENCE_FLUSH_CHUNK_SIZE):
+        rows = []
+        for ip in ips[start:start + PRESENCE_FLUSH_CHUNK_SIZE]:
+            mb_id, path, connected_at = presences[ip]
+            rows.append({
+                "lo_ip": ip,
+                "mb_id": mb_id,
+                "lo_datetime": connected_at,
+                "lo_location": path,
+                "lo_url": path,
+            })
+        db.execute(_upsert_presences(db, rows))
+    db.commit()
+    return len(ips)
+
+
+def delete_expired_connects(db: Session, login_minutes: int) -> int:
+    """접속 유지시간이 지난 현재 접속자 정보를 삭제합니다.
+
+    Returns:
+        int: 삭제한 접속자 수
+    """
+    base_date = datetime.now() - timedelta(minutes=login_minutes)
+    result = db.execute(delete(Login).where(Login.lo_datetime < base_date))
+    db.commit()
+    return result.rowcount
+
+
+def process_expired_connects() -> int:
+    """접속 유지시간이 지난 현재 접속자 정보 삭제 (스케줄러 작업)"""
+    config = get_cached_config()
+    login_minutes = getattr(config, "cf_login_minutes", 10) or 10
+    with DBConnect().sessionLocal() as db:
+        return delete_expired_connects(db, login_minutes)
+
+
+class PresenceTable:
+    """
+    워커별 현재 접속자 정보
+    - 요청마다 IP별 접속 정보를 메모리에 기록하고(같은 IP는 덮어씀),
+      워커마다 실행되는 백그라운드 작업이 주기적으로 현재 접속자 테이블에 저장합니다.
+    """
+
+    def __init__(self, flush_interval: int = PRESENCE_FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        # 키 값: IP, 값: (회원아이디, 접속 경로, 접속 시간)
+        self._presences = {}
+        self._lock = threading.Lock()
+        self._task = None
+
+    def touch(self, ip: str, mb_id: str, path: str) -> None:
+        """접속 정보를 기록합니다."""
+        with self._lock:
+            self._presences[ip] = (mb_id or "", path, datetime.now())
+
+    def flush(self) -> int:
+        """기록된 접속 정보를 DB에 저장합니다.
+
+        Returns:
+            int: 저장한 접속자 수
+        """
+        with self._lock:
+            presences, self._presences = self._presences, {}
+        if not presences:
+            return 0
+
+        try:
+            with DBConnect().sessionLocal() as db:
+                return save_presences(db, presences)
+        except Exception as e:
+            logger.error(f"현재 접속자 저장 실패: {e}")
+            # 다음 주기에 다시 저장 (그 사이에 기록된 정보가 우선)
+            with self._lock:
+                for ip, presence in presences.items():
+                    self._presences.setdefault(ip, presence)
+            return 0
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await run_in_threadpool(self.flush)
+
+    def start(self) -> None:
+        """백그라운드 저장 작업을 시작합니다. (앱 시작시)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """백그라운드 저장 작업을 중지하고 남은 정보를 저장합니다. (앱 종료시)"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await run_in_threadpool(self.flush)
+
+
+presence_table = PresenceTable()
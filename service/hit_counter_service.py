@@ -0,0 +1,209 @@
+"""게시글 조회수 서비스를 제공하는 모듈입니다.
+
+게시글을 읽을 때마다 게시글 행을 갱신(wr_hit += 1 후 commit)하지 않도록
+워커별 메모리(hit_counter)에 게시글별 조회수 증가량을 모아두고,
+주기적으로 `UPDATE ... SET wr_hit = wr_hit + n` 쿼리로 한번에 반영합니다.
+- 증가량을 더하는 쿼리이므로 여러 워커에서 동시에 반영해도 조회수가 누락되지 않습니다.
+- 같은 IP의 중복 조회 확인(read_dedupe)은 모든 워커가 공유하는 로컬 SQLite 파일에 기록합니다.
+  캐시 일괄삭제(data/cache) 대상이 아니고 공개 경로(/data)로 제공되지 않도록 var 디렉토리에 저장하며,
+  파일이 삭제/교체되면 모든 워커가 새 파일을 다시 열어 함께 사용합니다.
+"""
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Dict, Tuple
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from core.database import DBConnect
+from lib.common import dynamic_create_write_table
+
+logger = logging.getLogger(__name__)
+
+HIT_FLUSH_INTERVAL = 5  # 조회수 반영 주기 (초)
+READ_DEDUPE_WINDOW = 86400  # 같은 IP의 조회수 중복 확인 기간 (초)
+READ_DEDUPE_PATH = os.path.join("var", "read_dedupe.sqlite3")
+READ_DEDUPE_CLEANUP_INTERVAL = 3600  # 만료된 중복 확인 기록 삭제 주기 (초)
+
+
+def save_hits(db: Session, hits: Dict[Tuple[str, int], int]) -> int:
+    """게시글별 조회수 증가량을 한번에 반영합니다.
+
+    Args:
+        hits (dict): {(게시판 코드, 게시글 ID): 증가량}
+
+    Returns:
+        int: 반영한 게시글 수
+    """
+    tables = defaultdict(list)
+    for (bo_table, wr_id), count in hits.items():
+        if count:
+            tables[bo_table].append({"b_wr_id": wr_id, "b_count": count})
+
+    for bo_table, rows in tables.items():
+        table = dynamic_create_write_table(bo_table).__table__
+        db.execute(
+            update(table)
+            .where(table.c.wr_id == bindparam("b_wr_id"))
+            .values(wr_hit=table.c.wr_hit + bindparam("b_count")),
+            rows
+        )
+    db.commit()
+    return sum(len(rows) for rows in tables.values())
+
+
+class HitCounter:
+    """
+    워커별 게시글 조회수 증가량
+    - 요청마다 메모리의 증가량만 더하고,
+      워커마다 실행되는 백그라운드 작업이 주기적으로 DB에 반영합니다.
+    """
+
+    def __init__(self, flush_interval: int = HIT_FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        # 키 값: (게시판 코드, 게시글 ID), 값: 조회수 증가량
+        self._hits = Counter()
+        self._lock = threading.Lock()
+        self._task = None
+
+    def increment(self, bo_table: str, wr_id: int, count: int = 1) -> None:
+        """게시글 조회수 증가량을 더합니다."""
+        with self._lock:
+            self._hits[(bo_table, wr_id)] += count
+
+    def pending(self, bo_table: str, wr_id: int) -> int:
+        """아직 DB에 반영하지 않은 조회수 증가량을 반환합니다."""
+        with self._lock:
+            return self._hits.get((bo_table, wr_id), 0)
+
+    def flush(self) -> int:
+        """조회수 증가량을 DB에 반영합니다.
+
+        Returns:
+            int: 반영한 게시글 수
+        """
+        with self._lock:
+            hits, self._hits = self._hits, Counter()
+        if not hits:
+            return 0
+
+        try:
+            with DBConnect().sessionLocal() as db:
+                return save_hits(db, hits)
+        except Exception as e:
+            logger.error(f"조회수 반영 실패: {e}")
+            # 다음 주기에 다시 반영
+            with self._lock:
+                self._hits.update(hits)
+            return 0
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await run_in_threadpool(self.flush)
+            await run_in_threadpool(read_dedupe.cleanup)
+
+    def start(self) -> None:
+        """백그라운드 반영 작업을 시작합니다. (앱 시작시)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """백그라운드 반영 작업을 중지하고 남은 증가량을 반영합니다. (앱 종료시)"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await run_in_threadpool(self.flush)
+
+
+class ReadDedupeStore:
+    """
+    조회수 중복 확인 기록
+    - 여러 워커(--workers)가 같은 SQLite 파일을 사용하므로 워커와 관계없이 중복을 확인합니다.
+    - 키별로 만료 시간을 저장하고, 만료 전에 다시 조회하면 중복으로 판단합니다.
+
+    Args:
+        path (str): SQLite 파일 경로
+        window (int, optional): 중복 확인 기간 (초)
+    """
+
+    def __init__(self, path: str = READ_DEDUPE_PATH, window: int = READ_DEDUPE_WINDOW):
+        self.path = path
+        self.window = window
+        self._connection = None
+        self._inode = None
+        self._lock = threading.Lock()
+        self._cleaned_at = 0.0
+
+    def _file_inode(self):
+        try:
+            return os.stat(self.path).st_ino
+        except OSError:
+            return None
+
+    def _connect(self) -> sqlite3.Connection:
+        # 다른 워커와 같은 파일을 사용하도록 파일이 삭제/교체되었으면 다시 연다.
+        if self._connection is not None and self._file_inode() != self._inode:
+            logger.info(f"조회수 중복 확인 파일이 변경되어 다시 엽니다: {self.path}")
+            self._connection.close()
+            self._connection = None
+        if self._connection is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None,
+                                         check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS read_dedupe ("
+                "rd_key TEXT PRIMARY KEY, rd_expires REAL NOT NULL)"
+            )
+            self._connection = connection
+            self._inode = self._file_inode()
+        return self._connection
+
+    def first_hit(self, key: str) -> bool:
+        """중복 확인 기간 내 첫 조회이면 기록하고 True, 중복이면 False를 반환합니다."""
+        now = time.time()
+        with self._lock:
+            # 새 키이거나 만료된 키인 경우에만 행이 추가/갱신된다.
+            cursor = self._connect().execute(
+                "INSERT INTO read_dedupe (rd_key, rd_expires) VALUES (?, ?) "
+                "ON CONFLICT(rd_key) DO UPDATE SET rd_expires = excluded.rd_expires "
+                "WHERE read_dedupe.rd_expires <= ?",
+                (key, now + self.window, now)
+            )
+            return cursor.rowcount == 1
+
+    def cleanup(self, force: bool = False) -> int:
+        """만료된 기록을 삭제합니다. (READ_DEDUPE_CLEANUP_INTERVAL 마다)
+
+        Returns:
+            int: 삭제한 기록 수
+        """
+        now = time.time()
+        if not force and now - self._cleaned_at < READ_DEDUPE_CLEANUP_INTERVAL:
+            return 0
+        self._cleaned_at = now
+        try:
+            with self._lock:
+                cursor = self._connect().execute(
+                    "DELETE FROM read_dedupe WHERE rd_expires <= ?", (now,))
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.error(f"조회수 중복 확인 기록 삭제 실패: {e}")
+            return 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+hit_counter = HitCounter()
+read_dedupe = ReadDedupeStore()
@@ -0,0 +1,272 @@
+"""메일 발송 대기열 서비스
+
+요청 처리 중에 SMTP 서버에 직접 연결하지 않도록 메일을 대기열(MailQueue)에 등록하고,
+스케줄러가 대기중인 메일을 모아서 발송합니다.
+- 발송시 SMTP 연결을 유지하여 여러 메일을 하나의 연결로 발송합니다.
+- 발송에 실패한 메일은 MAIL_MAX_ATTEMPTS 까지 점점 긴 간격(backoff)으로 재시도합니다.
+"""
+import logging
+import smtplib
+from datetime import datetime, timedelta
+from email.header import Header
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from email.utils import formataddr
+from typing import List, Optional
+
+from sqlalchemy import insert, or_, select
+from sqlalchemy.orm import Session
+
+from core.database import DBConnect
+from core.models import MailQueue
+from core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+MAIL_BATCH_SIZE = 100  # 한 번에 발송할 최대 메일 수
+MAIL_MAX_ATTEMPTS = 8  # 실패시 최대 시도 횟수 (재시도 간격 합계 약 2시간)
+MAIL_RETRY_DELAY = 60  # 첫 재시도 대기시간 (초), 시도할 때마다 2배
+MAIL_PROCESSING_TIMEOUT = 600  # 발송중 상태로 남은 메일을 다시 발송하기까지의 시간 (초)
+SMTP_TIMEOUT = 10
+SMTP_IDLE_TIMEOUT = 60  # 사용하지 않은 SMTP 연결을 다시 연결하기까지의 시간 (초)
+
+
+def enqueue_mails(db: Session, mails: List[dict], commit: bool = True) -> int:
+    """메일을 발송 대기열에 한번에 등록한다.
+
+    Args:
+        db (Session): SQLAlchemy Session
+        mails (List[dict]): [{"from_email", "to_email", "subject", "body", "from_name", "to_name"}, ...]
+        commit (bool, optional): 등록 후 commit 여부. 호출하는 쪽의 트랜잭션에 포함하려면 False.
+
+    Returns:
+        int: 등록한 메일 수
+    """
+    now = datetime.now()
+    rows = []
+    for mail in mails:
+        # 받는 사람 이메일은 ,로 구분하여 여러명에게 보낼 수 있음
+        for to_email in str(mail.get("to_email") or "").split(","):
+            to_email = to_email.strip()
+            if not to_email:
+                continue
+            rows.append({
+                "mq_from_email": mail.get("from_email") or "",
+                "mq_from_name": mail.get("from_name") or "",
+                "mq_to_email": to_email,
+                "mq_to_name": mail.get("to_name") or "",
+                "mq_subject": mail.get("subject") or "",
+                "mq_body": mail.get("body") or "",
+                "mq_status": "pending",
+                "mq_attempts": 0,
+                "mq_datetime": now,
+                "mq_next_datetime": now,
+            })
+    if not rows:
+        return 0
+
+    db.execute(insert(MailQueue), rows)
+    if commit:
+        db.commit()
+    return len(rows)
+
+
+def enqueue_mail(db: Session, from_email: str, to_email: str, subject: str, body: str,
+                 from_name: str = None, to_name: str = None, commit: bool = True) -> int:
+    """메일 1건을 발송 대기열에 등록한다."""
+    return enqueue_mails(db, [{
+        "from_email": from_email,
+        "to_email": to_email,
+        "subject": subject,
+        "body": body,
+        "from_name": from_name,
+        "to_name": to_name,
+    }], commit=commit)
+
+
+def build_mail_message(from_email: str, to_email: str, subject: str, body: str,
+                       from_name: str = None, to_name: str = None) -> MIMEMultipart:
+    """HTML 메일 메시지를 생성한다."""
+    msg = MIMEMultipart()
+    msg['From'] = formataddr((str(Header(from_name or "", 'utf-8')), from_email))
+    msg['To'] = formataddr((str(Header(to_name or "", 'utf-8')), to_email))
+    msg['Subject'] = subject
+    msg.attach(MIMEText(body, 'html'))
+    return msg
+
+
+class SMTPMailSender:
+    """
+    SMTP 연결을 유지하면서 메일을 발송하는 클래스
+    - 연결이 끊어졌으면 다시 연결하여 한번 더 발송합니다.
+    - SMTP_IDLE_TIMEOUT 동안 사용하지 않은 연결은 서버에서 끊었을 수 있으므로 다시 연결합니다.
+    - 인증 정보가 있으면 STARTTLS로 암호화한 뒤에만 로그인합니다.
+      (STARTTLS를 지원하지 않는 서버는 SMTP_ALLOW_PLAIN_AUTH 설정시에만 평문으로 로그인)
+    """
+
+    def __init__(self, host: str = None, port: int = None,
+                 username: str = None, password: str = None,
+                 timeout: int = SMTP_TIMEOUT, idle_timeout: int = SMTP_IDLE_TIMEOUT,
+                 allow_plain_auth: bool = None):
+        self.host = host if host is not None else settings.SMTP_SERVER
+        self.port = port if port is not None else settings.SMTP_PORT
+        self.username = username if username is not None else settings.SMTP_USERNAME
+        self.password = password if password is not None else settings.SMTP_PASSWORD
+        self.allow_plain_auth = (allow_plain_auth if allow_plain_auth is not None
+                                 else settings.SMTP_ALLOW_PLAIN_AUTH)
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self._server: Optional[smtplib.SMTP] = None
+        self._last_used: Optional[datetime] = None
+        self.connect_count = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        # Daum, Naver 메일은 SMTP_SSL을 사용합니다.
+        if self.port == 465:
+            server = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout)
+        else:
+            server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            server.ehlo()
+            if server.has_extn("starttls"):
+                server.starttls()
+            elif self.username and self.password and not self.allow_plain_auth:
+                server.close()
+                raise smtplib.SMTPNotSupportedError(
+                    "SMTP 서버가 STARTTLS를 지원하지 않아 인증 정보를 전송하지 않았습니다.")
+
+        if self.username and self.password:
+            server.login(self.username, self.password)
+        self.connect_count += 1
+        return server
+
+    def _get_server(self) -> smtplib.SMTP:
+        if (self._server is not None and self._last_used
+                and datetime.now() - self._last_used > timedelta(seconds=self.idle_timeout)):
+            self.close()
+        if self._server is None:
+            self._server = self._connect()
+        return self._server
+
+    def send(self, from_email: str, to_email: str, subject: str, body: str,
+             from_name: str = None, to_name: str = None) -> None:
+        """메일을 발송한다.
+
+        Raises:
+            SMTPRecipientsRefused: 받는 사람 이메일이 거부되었을 때
+            SMTPException: 메일을 보내는 중에 오류가 발생했을 때
+            OSError: SMTP 서버에 연결하지 못했을 때
+        """
+        msg = build_mail_message(from_email, to_email, subject, body, from_name, to_name)
+        try:
+            self._get_server().sendmail(from_email, to_email, msg.as_string())
+        except smtplib.SMTPServerDisconnected:
+            # 유지하던 연결이 끊어진 경우 다시 연결하여 발송
+            self._server = None
+            self._get_server().sendmail(from_email, to_email, msg.as_string())
+        self._last_used = datetime.now()
+
+    def close(self) -> None:
+        """SMTP 연결을 종료한다."""
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except Exception:
+                pass
+            self._server = None
+
+
+# 스케줄러에서 사용하는 SMTP 연결 (발송 주기 사이에도 연결을 유지)
+mail_sender = SMTPMailSender()
+
+
+def _claim_pending_mails(db: Session, limit: int) -> List[MailQueue]:
+    """발송할 메일을 발송중 상태로 변경하고 반환한다.
+    - 발송중 상태로 MAIL_PROCESSING_TIMEOUT 이 지난 메일(처리 중 종료 등)도 다시 발송한다.
+    """
+    now = datetime.now()
+    query = (
+        select(MailQueue)
+        .where(
+            or_(MailQueue.mq_status == "pending", MailQueue.mq_status == "processing"),
+            MailQueue.mq_next_datetime <= now,
+        )
+        .order_by(MailQueue.mq_id)
+        .limit(limit)
+    )
+    if db.bind.dialect.name != "sqlite":
+        query = query.with_for_update(skip_locked=True)
+
+    mails = db.scalars(query).all()
+    for mail in mails:
+        mail.mq_status = "processing"
+        mail.mq_attempts += 1
+        mail.mq_next_datetime = now + timedelta(seconds=MAIL_PROCESSING_TIMEOUT)
+    db.commit()
+    return mails
+
+
+def _is_connection_error(error: Exception) -> bool:
+    """메일이 아니라 SMTP 연결(인증 포함)에 문제가 있는지 확인한다."""
+    if isinstance(error, (smtplib.SMTPAuthenticationError, smtplib.SMTPConnectError,
+                          smtplib.SMTPServerDisconnected, smtplib.SMTPNotSupportedError)):
+        return True
+    return not isinstance(error, smtplib.SMTPException)
+
+
+def _fail_mail(mail: MailQueue, error: Exception, permanent: bool = False) -> None:
+    """재시도 대기 상태로 되돌리거나, 최대 시도 횟수를 넘으면 실패 처리한다."""
+    mail.mq_error_message = str(error)
+    if permanent or mail.mq_attempts >= MAIL_MAX_ATTEMPTS:
+        mail.mq_status = "failed"
+        logger.error(f"메일 발송 실패: {mail.mq_to_email}, {error}")
+    else:
+        mail.mq_status = "pending"
+        delay = MAIL_RETRY_DELAY * 2 ** (mail.mq_attempts - 1)
+        mail.mq_next_datetime = datetime.now() + timedelta(seconds=delay)
+
+
+def process_mail_queue(batch_size: int = MAIL_BATCH_SIZE,
+                       sender: SMTPMailSender = None) -> int:
+    """대기중인 메일을 발송한다. (스케줄러 작업)
+    - 하나의 SMTP 연결로 대기중인 메일을 모아서 발송한다.
+    - SMTP 서버에 연결할 수 없으면 남은 메일도 다음 재시도 시간으로 미룬다.
+
+    Returns:
+        int: 발송한 메일 수
+    """
+    sender = sender or mail_sender
+
+    sent = 0
+    with DBConnect().sessionLocal() as db:
+        mails = _claim_pending_mails(db, batch_size)
+        if not mails:
+            return 0
+
+        for index, mail in enumerate(mails):
+            try:
+                sender.send(mail.mq_from_email, mail.mq_to_email, mail.mq_subject,
+                            mail.mq_body, mail.mq_from_name, mail.mq_to_name)
+            except smtplib.SMTPRecipientsRefused as e:
+                _fail_mail(mail, e, permanent=True)
+            except OSError as e:  # SMTPException 포함
+                if not _is_connection_error(e):
+                    _fail_mail(mail, e)
+                    continue
+                # 서버에 연결할 수 없으면 남은 메일도 다음에 재시도
+                sender.close()
+                for pending in mails[index:]:
+                    _fail_mail(pending, e)
+                logger.error(f"SMTP 서버에 연결하지 못했습니다. {e}")
+                break
+            except Exception as e:
+                _fail_mail(mail, e)
+            else:
+                mail.mq_status = "sent"
+                mail.mq_error_message = None
+                mail.mq_sent_datetime = datetime.now()
+                sent += 1
+        db.commit()
+
+    if sent:
+        logger.info(f"메일 발송: {sent}건")
+    return sent
@@ -3,6 +3,8 @@ import hashlib
 import os
 import re
 import secrets
+import threading
+import time
 from datetime import date, datetime, timedelta
 from glob import glob
 from typing import Optional, Tuple
@@ -17,7 +19,9 @@ from core.exception import AlertException, JSONException
 from core.models import Member
 from lib.common import filter_words, get_client_ip, is_none_datetime, check_prohibit_words
 from lib.member import get_next_open_date, hide_member_id
-from lib.pbkdf2 import validate_password
+from lib.pbkdf2 import (
+    create_hash, create_hash_async, needs_upgrade, validate_password, validate_password_async
+)
 from service import BaseService
 
 
@@ -83,6 +87,35 @@ class MemberService(BaseService):
             self.raise_exception(
                 status_code=403, detail="아이디 또는 비밀번호가 올바르지 않습니다.")
 
+        self._check_authenticated_member(member)
+        # 이전 설정으로 생성된 비밀번호 해시는 현재 설정으로 다시 생성
+        if needs_upgrade(member.mb_password):
+            member.mb_password = create_hash(password)
+            self.db.commit()
+        return member
+
+    async def authenticate_member_async(self, mb_id: str, password: str) -> Member:
+        """
+        authenticate_member()와 같지만 비밀번호 검증을 별도 스레드 풀에서 실행합니다.
+        - async 라우터에서 이벤트 루프를 막지 않도록 사용합니다.
+        """
+        member = self.fetch_member_by_id(mb_id)
+        if not member or not await validate_password_async(password, member.mb_password):
+            self.raise_exception(
+                status_code=403, detail="아이디 또는 비밀번호가 올바르지 않습니다.")
+
+        self._check_authenticated_member(member)
+        # 이전 설정으로 생성된 비밀번호 해시는 현재 설정으로 다시 생성
+        if needs_upgrade(member.mb_password):
+            member.mb_password = await create_hash_async(password)
+            self.db.commit()
+        return member
+
+    def _check_authenticated_member(self, member: Member) -> None:
+        """비밀번호 검증 이후의 회원 상태(탈퇴/차단, 메일 인증)를 확인합니다.
+        - 로그인할 수 없는 회원은 비밀번호 해시를 갱신하지 않도록 해시 갱신 전에 호출합니다.
+        """
+        mb_id = member.mb_id
         is_active, message = self.is_activated(member)
         if not is_active:
             self.raise_exception(status_code=403, detail=message)
@@ -93,8 +126,6 @@ class MemberService(BaseService):
             url = self.request.url_for("certify_email_update_form", mb_id=mb_id, key=key)
             self.raise_exception(status_code=403, detail=message, url=url)
 
-        return member
-
     def get_member(self, mb_id: str) -> Member:
         """
         현재 회원 정보를 조회합니다.
@@ -305,6 +336,85 @@ class MemberService(BaseService):
         return self.db.scalar(query)
 
 
+MEMBER_IMAGE_INDEX_CHECK_INTERVAL = 5  # 다른 워커의 변경사항 확인 주기 (초)
+
+
+class MemberImageIndex:
+    """
+    회원 아이콘/이미지 경로 색인
+    - 조회할 때마다 glob()으로 디렉토리를 검색하지 않도록 회원아이디별 이미지 경로를 메모리에 보관합니다.
+    - 하위 디렉토리(아이디 앞 2자리)의 변경시간(mtime)을 주기적으로 비교하여
+      다른 워커에서 변경된 디렉토리만 다시 읽습니다.
+    """
+
+    def __init__(self, directory: str, check_interval: int = MEMBER_IMAGE_INDEX_CHECK_INTERVAL):
+        self.directory = directory
+        self.check_interval = check_interval
+        # 키 값: 하위 디렉토리, 값: {회원아이디: 이미지 경로}
+        self._paths = {}
+        self._mtimes = {}
+        self._checked_at = None
+        self._lock = threading.Lock()
+
+    def get(self, mb_id: str) -> Optional[str]:
+        """회원 이미지 경로를 반환합니다. 없으면 None"""
+        if self._checked_at is None or time.monotonic() - self._checked_at >= self.check_interval:
+            self.refresh()
+        return self._paths.get(mb_id[:2], {}).get(mb_id)
+
+    def refresh(self) -> None:
+        """변경된 하위 디렉토리의 색인을 다시 생성합니다."""
+        with self._lock:
+            mtimes = {}
+            try:
+                with os.scandir(self.directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            mtimes[entry.name] = entry.stat().st_mtime_ns
+            except OSError:
+                pass
+
+            for sub in list(self._paths):
+                if sub not in mtimes:
+                    self._paths.pop(sub, None)
+                    self._mtimes.pop(sub, None)
+            now = time.time_ns()
+            for sub, mtime in mtimes.items():
+                # 변경시간 정밀도 때문에 같은 시각에 연속으로 변경된 경우를 놓치지 않도록
+                # 최근에 변경된 디렉토리는 다시 읽음
+                if self._mtimes.get(sub) != mtime or now - mtime < 2_000_000_000:
+                    self._scan(sub, mtime)
+            self._checked_at = time.monotonic()
+
+    def update(self, mb_id: str) -> None:
+        """회원 이미지가 변경된 하위 디렉토리의 색인을 다시 생성합니다."""
+        sub = mb_id[:2]
+        with self._lock:
+            try:
+                mtime = os.stat(os.path.join(self.directory, sub)).st_mtime_ns
+            except OSError:
+                self._paths.pop(sub, None)
+                self._mtimes.pop(sub, None)
+                return
+            self._scan(sub, mtime)
+
+    def _scan(self, sub: str, mtime: int) -> None:
+        paths = {}
+        sub_directory = os.path.join(self.directory, sub)
+        try:
+            with os.scandir(sub_directory) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    mb_id, ext = os.path.splitext(entry.name)
+                    if not ext or mb_id in paths or not entry.is_file():
+                        continue
+                    # 캐시를 위해 파일 수정시간을 추가
+                    paths[mb_id] = f"/{os.path.join(sub_directory, entry.name)}?{int(entry.stat().st_mtime)}"
+        except OSError:
+            pass
+        self._paths[sub] = paths
+        self._mtimes[sub] = mtime
+
+
 class MemberImageService(BaseService):
     """
     회원 이미지 관련 서비스를 제공하는 종속성 주입 클래스입니다.
@@ -360,6 +470,10 @@ class MemberImageService(BaseService):
         if not mb_id:
             return MemberImageService.NO_IMAGE_PATH
 
+        index = MEMBER_IMAGE_INDEXES.get(directory)
+        if index:
+            return index.get(mb_id) or MemberImageService.NO_IMAGE_PATH
+
         member_directory = os.path.join(directory, mb_id[:2])
         image_files = glob(os.path.join(member_directory, f"{mb_id}.*"))
         if image_files:
@@ -401,6 +515,9 @@ class MemberImageService(BaseService):
             image_obj.save(save_path)
             image_obj.close()
 
+        if (is_delete or image_obj) and directory in MEMBER_IMAGE_INDEXES:
+            MEMBER_IMAGE_INDEXES[directory].update(mb_id)
+
     def _delete_existing_images(self, directory: str, mb_id: str):
         """기존 이미지 파일 삭제 처리"""
         existing_images = glob(os.path.join(directory, f"{mb_id}.*"))
@@ -488,6 +605,19 @@ class MemberImageService(BaseService):
         return img_type_dict[image_type]
 
 
+# 회원 아이콘/이미지 경로 색인 (키 값: 이미지 디렉토리)
+MEMBER_IMAGE_INDEXES = {
+    MemberImageService.ICON_DIR: MemberImageIndex(MemberImageService.ICON_DIR),
+    MemberImageService.IMAGE_DIR: MemberImageIndex(MemberImageService.IMAGE_DIR),
+}
+
+
+def build_member_image_indexes() -> None:
+    """회원 아이콘/이미지 경로 색인을 생성합니다. (서버 시작시)"""
+    for index in MEMBER_IMAGE_INDEXES.values():
+        index.refresh()
+
+
 class ValidateMember(BaseService):
     """
     회원 정보 유효성 검사 서비스를 제공하는 클래스입니다.
@@ -1,14 +1,12 @@
 """메뉴 서비스를 제공하는 모듈입니다."""
 from typing import List
-from cachetools import LRUCache, cached
-from cachetools.keys import hashkey
 
 from fastapi import Request
-from sqlalchemy import func, select
 
 from core.database import db_session
 from core.exception import AlertException
 from core.models import Menu
+from lib.layout_cache import get_cached_menus
 from service import BaseService
 
 
@@ -24,27 +22,6 @@ class MenuService(BaseService):
     def raise_exception(self, status_code: int = 400, detail: str = None, url: str = None) -> None:
         raise AlertException(detail, status_code, url)
 
-    @cached(LRUCache(maxsize=128), key=lambda _: hashkey("menus"))
     def fetch_menus(self) -> List[Menu]:
-        """사용자페이지 메뉴 조회 함수"""
-        menus = []
-        # 부모메뉴 조회
-        parent_menus = self.db.scalars(
-            select(Menu)
-            .where(func.char_length(Menu.me_code) == 2)
-            .order_by(Menu.me_order)
-        ).all()
-
-        for menu in parent_menus:
-            parent_code = menu.me_code
-            # 자식 메뉴 조회
-            child_menus = self.db.scalars(
-                select(Menu).where(
-                    func.char_length(Menu.me_code) == 4,
-                    func.substr(Menu.me_code, 1, 2) == parent_code
-                ).order_by(Menu.me_order)
-            ).all()
-
-            menu.sub = child_menus
-            menus.append(menu)
-        return menus
+        """사용자페이지 메뉴 조회 함수 (레이아웃 데이터 캐시 사용)"""
+        return get_cached_menus()
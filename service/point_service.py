@@ -1,22 +1,192 @@
-"""포인트 관련 기능을 제공하는 서비스 모듈입니다."""
+"""포인트 관련 기능을 제공하는 서비스 모듈입니다.
+
+회원 포인트(Member.mb_point)를 잔액으로 유지하고, 포인트 내역을 추가할 때마다 잔액에 더합니다.
+- 포인트를 적립할 때마다 회원의 전체 포인트 내역을 합산(SUM)하지 않습니다.
+- 유효기간이 있는 포인트는 회원, 만료일별 만료 예정 포인트(PointExpire)에 합산하고,
+  스케줄러(process_point_expire)가 만료일이 지난 포인트를 소멸시킵니다.
+"""
+import logging
 import uuid
-from datetime import datetime, timedelta
-from typing import List
+from datetime import date, datetime, timedelta
+from typing import List, Union
 from typing_extensions import Annotated
 
 from fastapi import Depends, Request
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.orm import Session
 
-from core.database import db_session
+from core.database import DBConnect, db_session
 from core.exception import AlertException
-from core.models import Member, Point
+from core.models import Member, Point, PointExpire
+from lib.config_cache import get_cached_config
 from service import BaseService
 from service.member_service import MemberService
 
+logger = logging.getLogger(__name__)
+
+MAX_EXPIRE_DATE = date(9999, 12, 31)  # 만료되지 않는 포인트의 만료일
+POINT_EXPIRE_CHUNK_SIZE = 500  # 한번에 소멸 처리할 회원 수
+POINT_EXPIRE_MAX_CHUNKS = 20  # 스케줄러 1회 실행시 최대 처리 횟수
+
+
+def create_point_expire_table(db: Session) -> None:
+    """만료 예정 포인트 테이블을 생성하고 기존 포인트 내역으로 채운다. (마이그레이션: migrate_indexes.py)"""
+    # 생성 이후에 적립되는 포인트는 적립시 합산되므로 기존 내역만 채운다.
+    last_po_id = db.scalar(select(func.max(Point.po_id))) or 0
+    db.commit()
+    PointExpire.__table__.create(bind=db.get_bind())
+    _fill_point_expire(db, last_po_id)
+
+
+def _fill_point_expire(db: Session, last_po_id: int) -> None:
+    """po_id가 last_po_id 이하인 포인트 내역으로 만료 예정 포인트를 채운다."""
+    rows = db.execute(
+        select(Point.mb_id, Point.po_expire_date,
+               func.sum(Point.po_point - Point.po_use_point).label("point"))
+        .where(
+            Point.po_id <= last_po_id,
+            Point.po_point > 0,
+            Point.po_expired != 1,
+            Point.po_expire_date != MAX_EXPIRE_DATE
+        )
+        .group_by(Point.mb_id, Point.po_expire_date)
+    ).all()
+    for row in rows:
+        add_expire_point(db, row.mb_id, row.po_expire_date, int(row.point or 0))
+    db.commit()
+
+
+def _to_date(value: Union[date, datetime, str]) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value)[:10], "%Y-%m-%d").date()
+
+
+def add_member_point(db: Session, mb_id: str, point: int) -> int:
+    """회원 포인트(잔액)에 point를 더하고 변경된 잔액을 반환합니다. (commit은 호출하는 쪽에서 처리)
+    - 회원 행을 UPDATE 하므로 같은 회원의 포인트 변경은 트랜잭션이 끝날 때까지 순서대로 처리됩니다.
+    """
+    db.execute(
+        update(Member).values(mb_point=Member.mb_point + point)
+        .where(Member.mb_id == mb_id)
+    )
+    mb_point = db.scalar(select(Member.mb_point).where(Member.mb_id == mb_id))
+    return int(mb_point) if mb_point else 0
+
+
+def add_expire_point(db: Session, mb_id: str, expire_date: Union[date, datetime, str], point: int) -> None:
+    """회원의 만료일별 만료 예정 포인트에 point를 더합니다. (commit은 호출하는 쪽에서 처리)
+    - 만료되지 않는 포인트(MAX_EXPIRE_DATE)는 기록하지 않습니다.
+    """
+    if not point or not expire_date:
+        return None
+    expire_date = _to_date(expire_date)
+    if expire_date >= MAX_EXPIRE_DATE:
+        return None
+
+    result = db.execute(
+        update(PointExpire).values(pe_point=PointExpire.pe_point + point)
+        .where(PointExpire.mb_id == mb_id, PointExpire.pe_expire_date == expire_date)
+    )
+    if not result.rowcount:
+        db.execute(insert(PointExpire).values(mb_id=mb_id, pe_expire_date=expire_date, pe_point=point))
+
+
+def delete_member_points(db: Session, mb_id: str) -> None:
+    """회원의 포인트 내역과 만료 예정 포인트를 모두 삭제합니다. (회원 삭제시, commit은 호출하는 쪽에서 처리)
+    - 만료 예정 포인트를 남겨두면 스케줄러가 삭제된 회원의 포인트를 소멸시킵니다.
+    """
+    db.execute(delete(Point).where(Point.mb_id == mb_id))
+    db.execute(delete(PointExpire).where(PointExpire.mb_id == mb_id))
+
+
+def expire_member_points(db: Session, mb_id: str, today: date = None) -> int:
+    """회원의 만료일이 지난 포인트를 소멸시킵니다. (만료일 당일까지 사용 가능)
+    - 포인트 내역이 없는 회원(삭제된 회원 등)은 소멸 내역을 추가하지 않고 만료 예정 포인트만 삭제합니다.
+
+    Returns:
+        int: 소멸시킨 포인트
+    """
+    today = today or date.today()
+    # 포인트 적립/사용과 동시에 처리되지 않도록 회원 행을 먼저 잠근다.
+    query = select(Member.mb_point).where(Member.mb_id == mb_id)
+    if db.bind.dialect.name != "sqlite":
+        query = query.with_for_update()
+    mb_point = db.scalar(query)
+
+    due = (PointExpire.mb_id == mb_id, PointExpire.pe_expire_date < today)
+    has_history = db.scalar(select(Point.po_id).where(Point.mb_id == mb_id).limit(1)) is not None
+    if not has_history:
+        db.execute(delete(PointExpire).where(*due))
+        db.commit()
+        return 0
+
+    expire_point = int(db.scalar(select(func.sum(PointExpire.pe_point)).where(*due)) or 0)
+    if expire_point > 0 and mb_point is not None:
+        po_mb_point = add_member_point(db, mb_id, -expire_point)
+        db.add(Point(
+            mb_id=mb_id,
+            po_content='포인트 소멸',
+            po_point=-expire_point,
+            po_use_point=0,
+            po_mb_point=po_mb_point,
+            po_expired=1,
+            po_rel_table='@expire',
+            po_rel_id=str(mb_id),
+            po_rel_action='expire-' + str(uuid.uuid4()),
+        ))
+
+    # 만료된 포인트 내역 업데이트 (남은 포인트는 소멸로 사용한 것으로 처리)
+    db.execute(
+        update(Point).values(po_expired=1, po_use_point=Point.po_point)
+        .where(Point.mb_id == mb_id,
+               Point.po_expired != 1,
+               Point.po_expire_date != MAX_EXPIRE_DATE,
+               Point.po_expire_date < today)
+    )
+    db.execute(delete(PointExpire).where(*due))
+    db.commit()
+    return max(expire_point, 0)
+
+
+def expire_points(db: Session, today: date = None, max_chunks: int = POINT_EXPIRE_MAX_CHUNKS) -> int:
+    """만료일이 지난 포인트가 있는 회원의 포인트를 소멸시킵니다.
+
+    Returns:
+        int: 처리한 회원 수
+    """
+    today = today or date.today()
+    total = 0
+    for _ in range(max_chunks):
+        mb_ids = db.scalars(
+            select(PointExpire.mb_id).distinct()
+            .where(PointExpire.pe_expire_date < today)
+            .limit(POINT_EXPIRE_CHUNK_SIZE)
+        ).all()
+        if not mb_ids:
+            break
+        for mb_id in mb_ids:
+            expire_member_points(db, mb_id, today)
+        total += len(mb_ids)
+    return total
+
+
+def process_point_expire() -> int:
+    """포인트 소멸 (스케줄러 작업)"""
+    config = get_cached_config()
+    if getattr(config, "cf_point_term", 0) <= 0:
+        return 0
+    with DBConnect().sessionLocal() as db:
+        count = expire_points(db)
+    if count:
+        logger.info(f"포인트 소멸: {count}명")
+    return count
+
 
 class PointService(BaseService):
     """포인트 서비스 클래스"""
-    MAX_DATE = "9999-12-31"
 
     def __init__(
             self,
@@ -88,17 +258,15 @@ class PointService(BaseService):
         # 포인트 내역 추가
         if point > 0:
             po_expired = 0
-            po_expire_date = datetime.strptime(self.MAX_DATE, '%Y-%m-%d')
-            if self.point_term > 0:
-                expire_days = expire if expire > 0 else self.point_term
-                after_datetime = timedelta(days=expire_days - 1)
-                po_expire_date = (datetime.now() + after_datetime).strftime('%Y-%m-%d')
+            po_expire_date = self._get_expire_date(expire)
         else:
             po_expired = 1
             po_expire_date = datetime.now()
+            # 사용한 포인트는 만료일이 빠른 적립 내역부터 차감
+            self.insert_use_point(mb_id, point)
 
-        mb_point = self.get_total_point(mb_id)
-        po_mb_point = mb_point + point
+        # 회원 포인트 갱신
+        po_mb_point = add_member_point(self.db, mb_id, point)
 
         new_point = Point(
             mb_id=mb_id,
@@ -113,9 +281,9 @@ class PointService(BaseService):
             po_rel_action=rel_action
         )
         self.db.add(new_point)
-
-        # 회원 포인트 갱신
-        self.member_service.update_member_point(mb_id, po_mb_point)
+        if point > 0:
+            add_expire_point(self.db, mb_id, po_expire_date, point)
+        self.db.commit()
 
     def get_config_point(self, cf_name: str) -> int:
         """
@@ -125,27 +293,14 @@ class PointService(BaseService):
 
     def get_total_point(self, mb_id: str) -> int:
         """
-        회원의 포인트 총합
+        회원의 포인트 총합 (회원 포인트 잔액)
         """
-        # 만료된 포인트들을 소진 처리
-        expire_point = self._fetch_expire_points(mb_id)
-        if expire_point > 0:
-            self._insert_expire_point(mb_id, expire_point)
-
-        # 만료된 포인트 내역 업데이트
-        self._update_expired_points(mb_id)
-
-        # 포인트 총합
-        point_sum = self.db.scalar(
-            select(func.sum(Point.po_point))
-            .where(Point.mb_id == mb_id)
-        )
-
-        return int(point_sum) if point_sum else 0
+        mb_point = self.db.scalar(select(Member.mb_point).where(Member.mb_id == mb_id))
+        return int(mb_point) if mb_point else 0
 
     def insert_use_point(self, mb_id: str, point: int, po_id: int = None) -> None:
         """
-        사용한 포인트 내역 입력&업데이트
+        사용한 포인트 내역 입력&업데이트 (commit은 호출하는 쪽에서 처리)
         """
         using_point = abs(point)
         # 사용할 수 있는 포인트 내역 조회
@@ -157,7 +312,7 @@ class PointService(BaseService):
             )
         )
         if po_id:
-            query.where(Point.po_id != po_id)
+            query = query.where(Point.po_id != po_id)
 
         order_list = [Point.po_id.asc()]
         if self.point_term:
@@ -167,74 +322,65 @@ class PointService(BaseService):
 
         # 포인트 사용처리
         for row in points:
-            row_point = row.po_point
-            used_point = row.po_use_point
-
-            if (row_point - used_point) > using_point:
-                self.db.execute(
-                    update(Point).values(po_mb_point=Point.po_mb_point + using_point)
-                    .where(Point.po_id == row.po_id)
-                )
-                self.db.commit()
-            else:
-                deduction_point = row_point - used_point
-                self.db.execute(
-                    update(Point).values(
-                        po_use_point=(Point.po_use_point + deduction_point),
-                        po_expired=100
-                    ).where(Point.po_id == row.po_id)
-                )
-                self.db.commit()
-                using_point -= deduction_point
-
-    def delete_point(self, mb_id: str, rel_table: str, rel_id: str, rel_action: str) -> None:
+            remaining_point = row.po_point - row.po_use_point
+
+            if remaining_point > using_point:
+                row.po_use_point += using_point
+                add_expire_point(self.db, mb_id, row.po_expire_date, -using_point)
+                break
+
+            row.po_use_point += remaining_point
+            row.po_expired = 100
+            add_expire_point(self.db, mb_id, row.po_expire_date, -remaining_point)
+            using_point -= remaining_point
+
+    def delete_point(self, mb_id: str, rel_table: str, rel_id: str, rel_action: str) -> bool:
         """
         포인트 내역 삭제
         """
-        result = False
-
         # 포인트 내역정보
-        row = self._fetch_point_by_relation(mb_id, rel_table, rel_id, rel_action)
-        if row:
-            if row.po_point and row.po_point > 0:
-                abs_po_point = abs(row.po_point)
-                self.delete_use_point(row.mb_id, abs_po_point)
-            else:
-                if row.po_use_point and row.po_use_point > 0:
-                    self.insert_use_point(row.mb_id, row.po_use_point, row.po_id)
+        row = self._fetch_point_by_relation(mb_id, rel_table, str(rel_id), rel_action)
+        if not row:
+            return False
 
-            delete_result = self.db.execute(
-                delete(Point).where(
-                    Point.mb_id == mb_id,
-                    Point.po_rel_table == rel_table,
-                    Point.po_rel_id == str(rel_id),
-                    Point.po_rel_action == rel_action
-                )
-            )
-            self.db.commit()
+        self.delete_point_row(row)
+        return True
 
-            if delete_result.rowcount > 0:
-                result = True
+    def delete_point_row(self, point: Point) -> None:
+        """
+        포인트 내역 1건을 삭제하고 이후 내역과 회원 포인트에 반영합니다.
+        """
+        if point.po_point < 0:
+            abs_po_point = abs(point.po_point)
+
+            if point.po_rel_table == "@expire":
+                self.delete_expire_point(point.mb_id, abs_po_point)
+            else:
+                self.delete_use_point(point.mb_id, abs_po_point)
+        elif point.po_use_point > 0:
+            self.insert_use_point(point.mb_id, point.po_use_point, point.po_id)
+
+        # 삭제하는 적립 포인트 중 남은 포인트는 만료 예정 포인트에서 제외
+        if point.po_point > 0 and point.po_expired != 1:
+            add_expire_point(self.db, point.mb_id, point.po_expire_date,
+                             point.po_use_point - point.po_point)
 
-                # po_mb_point에 반영
-                if row.po_point:
-                    self.db.execute(
-                        update(Point).values(
-                            po_mb_point=Point.po_mb_point - row.po_point
-                        )
-                        .where(Point.mb_id == mb_id, Point.po_id > row.po_id)
-                    )
-                    self.db.commit()
+        self.db.delete(point)
 
-                # 회원 포인트 총합 갱신
-                sum_point = self.get_total_point(mb_id)
-                self.member_service.update_member_point(mb_id, sum_point)
+        # po_mb_point에 반영
+        self.db.execute(
+            update(Point)
+            .values(po_mb_point=Point.po_mb_point - point.po_point)
+            .where(Point.mb_id == point.mb_id, Point.po_id > point.po_id)
+        )
 
-        return result
+        # 회원 포인트 갱신
+        add_member_point(self.db, point.mb_id, -point.po_point)
+        self.db.commit()
 
     def delete_use_point(self, mb_id: str, point: int) -> None:
         """
-        사용포인트 삭제
+        사용포인트 삭제 (commit은 호출하는 쪽에서 처리)
         """
         point1 = abs(point)
         query = select(Point).where(
@@ -249,38 +395,21 @@ class PointService(BaseService):
         points = self.db.scalars(query.order_by(*order_list)).all()
 
         for row in points:
-            point2 = row.po_use_point
             if (row.po_expired == 100
-                and (row.po_expire_date == self.MAX_DATE
-                     or row.po_expire_date >= datetime.now())):
-                po_expired = 0
-            else:
-                po_expired = row.po_expired
-
-            if point2 > point1:
-                self.db.execute(
-                    update(Point).values(
-                        po_use_point=Point.po_use_point - point1,
-                        po_expired=po_expired
-                    )
-                    .where(Point.po_id == row.po_id)
-                )
-                self.db.commit()
-                break
+                    and _to_date(row.po_expire_date) >= date.today()):
+                row.po_expired = 0
 
-            self.db.execute(
-                update(Point).values(
-                    po_use_point=0,
-                    po_expired=po_expired
-                )
-                .where(Point.po_id == row.po_id)
-            )
-            self.db.commit()
-            point1 = point1 - point2
+            restore_point = min(row.po_use_point, point1)
+            row.po_use_point -= restore_point
+            add_expire_point(self.db, mb_id, row.po_expire_date, restore_point)
+
+            point1 -= restore_point
+            if point1 <= 0:
+                break
 
-    def delete_expire_point(self, mb_id: str, point: int):
+    def delete_expire_point(self, mb_id: str, point: int) -> None:
         """
-        소멸 포인트 삭제
+        소멸 포인트 삭제 (commit은 호출하는 쪽에서 처리)
         """
         point1 = abs(point)
         points = self.db.scalars(
@@ -292,36 +421,26 @@ class PointService(BaseService):
             ).order_by(Point.po_expire_date.desc(), Point.po_id.desc())
         ).all()
 
+        po_expire_date = self._get_expire_date()
         for row in points:
-            point2 = row.po_use_point
-            po_expired = 0
-            po_expire_date = self.MAX_DATE
-            if self.point_term > 0:
-                expired = timedelta(days=self.point_term - 1)
-                po_expire_date = (datetime.now() + expired).strftime('%Y-%m-%d')
-        
-            if point2 > point1:
-                self.db.execute(
-                    update(Point).values(
-                        po_use_point=Point.po_use_point - point1,
-                        po_expired=po_expired,
-                        po_expire_date=po_expire_date
-                    )
-                    .where(Point.po_id == row.po_id)
-                )
-                self.db.commit()
+            restore_point = min(row.po_use_point, point1)
+            row.po_use_point -= restore_point
+            row.po_expired = 0
+            row.po_expire_date = po_expire_date
+            add_expire_point(self.db, mb_id, po_expire_date, restore_point)
+
+            point1 -= restore_point
+            if point1 <= 0:
                 break
 
-            self.db.execute(
-                update(Point).values(
-                    po_use_point=0,
-                    po_expired=po_expired,
-                    po_expire_date=po_expire_date
-                )
-                .where(Point.po_id == row.po_id)
-            )
-            self.db.commit()
-            point1 = point1 - point2
+    def _get_expire_date(self, expire: int = 0) -> date:
+        """
+        적립 포인트의 만료일 (유효기간을 사용하지 않으면 MAX_EXPIRE_DATE)
+        """
+        if self.point_term <= 0:
+            return MAX_EXPIRE_DATE
+        expire_days = expire if expire > 0 else self.point_term
+        return (datetime.now() + timedelta(days=expire_days - 1)).date()
 
     def _fetch_point_by_relation(self, mb_id: str,
                                  rel_table: str, rel_id: str, rel_action: str):
@@ -335,62 +454,3 @@ class PointService(BaseService):
                     Point.po_rel_id == rel_id,
                     Point.po_rel_action == rel_action)
         )
-
-    def _fetch_expire_points(self, mb_id: str) -> int:
-        """
-        회원의 만료 예정 포인트 얻기
-        """
-        if self.point_term <= 0:
-            return 0
-
-        point_sum = self.db.scalar(
-            select(func.sum(Point.po_point - Point.po_use_point))
-            .where(Point.mb_id == mb_id,
-                   Point.po_expired == 0,
-                   Point.po_expire_date < datetime.now())
-        )
-
-        return int(point_sum) if point_sum else 0
-
-    def _insert_expire_point(self, mb_id: str, point: int) -> None:
-        """
-        만료된 포인트만큼 포인트를 소멸시킵니다.
-        """
-        member = self.member_service.fetch_member_by_id(mb_id)
-        mb_point = member.mb_point if member else 0
-        expired_point = point * (-1)
-        new_point = Point(
-            mb_id=mb_id,
-            po_content='포인트 소멸',
-            po_point=expired_point,
-            po_use_point=0,
-            po_mb_point=mb_point + expired_point,
-            po_expired=1,
-            po_rel_table='@expire',
-            po_rel_id=str(mb_id),
-            po_rel_action='expire-' + str(uuid.uuid4()),
-        )
-        self.db.add(new_point)
-        self.db.commit()
-
-        # 포인트를 사용한 경우 포인트 내역에 사용금액 기록
-        # TODO: 주석처리된 이유를 확인해야 함
-        if expired_point < 0:
-            # insert_use_point(mb_id, point)
-            pass
-
-    def _update_expired_points(self, mb_id: str) -> None:
-        if self.point_term <= 0:
-            return None
-
-        self.db.execute(
-            update(Point).values(po_expired=1)
-            .where(Point.mb_id == mb_id,
-                   Point.po_expired != 1,
-                   Point.po_expire_date != self.MAX_DATE,
-                   Point.po_expire_date < datetime.now()
-            )
-        )
-        self.db.commit()
-
-        return None
\ No newline at end of file
@@ -1,8 +1,6 @@
 """설문조사 관련 기능을 제공하는 서비스 모듈입니다."""
 from typing import List, Tuple
 
-from cachetools import LRUCache, cached
-from cachetools.keys import hashkey
 from fastapi import Request
 from sqlalchemy import select
 
@@ -10,6 +8,7 @@ from core.database import db_session
 from core.exception import AlertException, AlertCloseException
 from core.models import Member, Poll, PollEtc
 from lib.common import get_client_ip
+from lib.layout_cache import get_cached_latest_poll
 from service import BaseService
 
 
@@ -131,17 +130,11 @@ class PollService(BaseService):
         self.db.delete(poll_etc)
         self.db.commit()
 
-    @cached(LRUCache(maxsize=1), key=lambda _: hashkey("latest_poll"))
     def fetch_latest_poll(self):
         """
-        사용 설정된 최신 설문조사 1건을 조회합니다.
+        사용 설정된 최신 설문조사 1건을 조회합니다. (레이아웃 데이터 캐시 사용)
         """
-        latest_poll = self.db.scalar(
-            select(Poll)
-            .where(Poll.po_use == 1)
-            .order_by(Poll.po_id.desc())
-        )
-        return latest_poll
+        return get_cached_latest_poll()
 
 
 class ValidatePollService(BaseService):
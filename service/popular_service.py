@@ -1,15 +1,14 @@
 """인기 검색어 관련 기능을 제공하는 서비스 모듈입니다."""
-from datetime import date, datetime, timedelta
+from datetime import date, datetime
 from typing import List
 
-from cachetools import TTLCache, cached
-from cachetools.keys import hashkey
 from fastapi import Request
-from sqlalchemy import delete, desc, exists, func, select
+from sqlalchemy import delete, exists
 from sqlalchemy.exc import SQLAlchemyError
 from core.database import db_session
 from core.models import Popular
 from lib.common import get_client_ip
+from lib.layout_cache import get_cached_populars
 from service import BaseService
 
 
@@ -27,12 +26,10 @@ class PopularService(BaseService):
     def raise_exception(self, status_code: int, detail: str = None):
         pass
 
-    @cached(TTLCache(maxsize=128, ttl=60),
-            key=lambda self, limit=10, day=3: hashkey("populars", limit, day))
     def fetch_populars(self, limit: int = 10, day: int = 3) -> List[Popular]:
         """
         현재 날짜와 day일 전 날짜 사이의 인기검색어를 조회한다.
-        - TTL(Time To Live)캐시를 사용하여 조회한다.
+        - 레이아웃 데이터 캐시(TTL)를 사용하여 조회한다.
 
         Args:
             limit (int, optional): 조회 갯수. Defaults to 7.
@@ -42,21 +39,7 @@ class PopularService(BaseService):
             List[Popular]: 인기검색어 리스트
 
         """
-        today = datetime.now()
-        before_day = today - timedelta(days=day)
-        populars = self.db.execute(
-            select(Popular.pp_word, func.count(Popular.pp_word).label('count'))
-            .where(
-                Popular.pp_word != '',
-                Popular.pp_date >= before_day,
-                Popular.pp_date <= today
-            )
-            .group_by(Popular.pp_word)
-            .order_by(desc('count'), Popular.pp_word)
-            .limit(limit)
-        ).all()
-
-        return populars
+        return get_cached_populars(limit, day)
 
     def create_popular(self, request: Request, fields: str, word: str) -> None:
         """인기검색어를 생성합니다."""
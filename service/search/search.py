@@ -10,6 +10,7 @@ from core.exception import AlertException
 from lib.board_lib import BoardConfig, write_search_filter, get_list
 from lib.common import dynamic_create_write_table
 from lib.member import MemberDetails
+from lib.search_index import get_search_index
 from service import BaseService
 
 
@@ -87,6 +88,7 @@ class SearchService(BaseService):
             self.raise_exception(status_code=400, detail="검색어는 2글자 이상 입력해 주세요.")
 
         remove_boards = []
+        searchable_boards = []
         total_search_count = 0
         offset = (page - 1) * per_page
         for board in boards:
@@ -105,17 +107,29 @@ class SearchService(BaseService):
                 if not (is_group_admin or group_member):
                     remove_boards.append(board)
                     continue
+            searchable_boards.append((board, board_config))
 
-            # 게시판 별 검색 Query 설정
+        # 색인 생성이 완료된 게시판은 전체검색 색인으로 한번에 검색
+        indexed_result = self.search_by_index(
+            [board.bo_table for board, _ in searchable_boards], sfl, stx, sop, offset, per_page)
+
+        for board, board_config in searchable_boards:
             write_model = dynamic_create_write_table(board.bo_table)
-            query = write_search_filter(write_model, search_field=sfl,
-                                        keyword=stx, operator=sop)
-            query = board_config.get_list_sort_query(write_model, query)
-            board.search_count = self.db.scalar(query.add_columns(func.count()).order_by(None))
+            if board.bo_table in indexed_result["bo_tables"]:
+                board.search_count = indexed_result["counts"].get(board.bo_table, 0)
+                board.writes = self.get_writes_by_ids(
+                    write_model, indexed_result["wr_ids"].get(board.bo_table, []))
+            else:
+                # 게시판 별 검색 Query 설정 (LIKE 검색)
+                query = write_search_filter(write_model, search_field=sfl,
+                                            keyword=stx, operator=sop)
+                query = board_config.get_list_sort_query(write_model, query)
+                board.search_count = self.db.scalar(query.add_columns(func.count()).order_by(None))
+                if board.search_count > 0:
+                    board.writes = self.db.scalars(query.add_columns(write_model).\
+                                    offset(offset).limit(per_page)).all()
 
             if board.search_count > 0:
-                board.writes = self.db.scalars(query.add_columns(write_model).\
-                                offset(offset).limit(per_page)).all()
                 total_search_count += board.search_count
                 for write in board.writes:
                     write = get_list(self.request, self.db, write, board_config)
@@ -142,6 +156,51 @@ class SearchService(BaseService):
 
         return {"total_search_count": total_search_count, "boards": boards}
 
+    def search_by_index(
+        self,
+        bo_tables: List[str],
+        sfl: str,
+        stx: str,
+        sop: str,
+        offset: int,
+        per_page: int
+    ) -> dict:
+        """전체검색 색인으로 여러 게시판을 한번에 검색
+        - 색인 생성이 완료되지 않은 게시판이나 색인으로 처리할 수 없는 검색(댓글 검색, 한 글자 단어 등)은
+          bo_tables에서 제외되며 LIKE 검색을 사용합니다.
+        """
+        result = {"bo_tables": set(), "counts": {}, "wr_ids": {}}
+
+        # sfl은 {필드명},{코멘트여부} 형식 (write_search_filter 참고)
+        tmp = (sfl or "").split(",")
+        if len(tmp) > 1 and tmp[1] == "0":
+            return result
+        fields = set(tmp[0].split("||")) - {"wr_password"}
+
+        search_index = get_search_index()
+        indexed_bo_tables = search_index.is_ready(self.db, bo_tables)
+        if not indexed_bo_tables:
+            return result
+
+        searched = search_index.search(self.db, sorted(indexed_bo_tables), stx.split(" "),
+                                       fields, sop, offset, per_page)
+        if searched is None:
+            return result
+
+        result["bo_tables"] = indexed_bo_tables
+        result["counts"] = searched["counts"]
+        for bo_table, wr_id, _ in searched["hits"]:
+            result["wr_ids"].setdefault(bo_table, []).append(wr_id)
+        return result
+
+    def get_writes_by_ids(self, write_model, wr_ids: List[int]) -> list:
+        """검색 색인 순서대로 게시글 목록 조회"""
+        if not wr_ids:
+            return []
+        writes = self.db.scalars(select(write_model).where(write_model.wr_id.in_(wr_ids))).all()
+        writes_map = {write.wr_id: write for write in writes}
+        return [writes_map[wr_id] for wr_id in wr_ids if wr_id in writes_map]
+
 
 class SearchServiceAPI(SearchService):
     """
@@ -0,0 +1,121 @@
+"""SUIBOARD 토큰 지급 원장 서비스
+
+1일 1회 지급하는 토큰(로그인 보상 등)을 회원, 사유, 지급일별 원장(SuiAwardLedger)에 기록합니다.
+- 원장의 유니크키(mb_id, sal_reason, sal_award_date)로 중복 지급을 막으므로
+  지급 전에 트랜잭션 로그를 날짜 함수로 조회하지 않습니다.
+- 원장 테이블을 새로 생성한 경우 기존 트랜잭션 로그와 대기중인 발행 작업으로 원장을 채웁니다.
+"""
+import datetime
+import logging
+from typing import Iterable, List, Set, Tuple, Union
+
+from sqlalchemy import func, insert, inspect, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from core.models import SuiAwardLedger, SuiMintJob, SuiTransactionlog
+
+logger = logging.getLogger(__name__)
+
+DAILY_AWARD_REASONS = ("daily_login",)  # 1일 1회 지급하는 사유
+LEDGER_BACKFILL_CHUNK_SIZE = 1000
+
+def create_award_ledger_table(db: Session) -> None:
+    """지급 원장 테이블을 생성하고 기존 트랜잭션 로그로 채운다. (마이그레이션: migrate_indexes.py)"""
+    SuiAwardLedger.__table__.create(bind=db.get_bind())
+    backfill_award_ledger(db)
+
+
+def _to_date(value: Union[datetime.date, datetime.datetime, str]) -> datetime.date:
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.datetime.strptime(str(value)[:10], "%Y-%m-%d").date()
+
+
+def _fetch_awarded(db: Session) -> Iterable[Tuple[str, str, datetime.date, int]]:
+    """기존 트랜잭션 로그와 대기/처리중/확인 필요 발행 작업의 (회원, 사유, 지급일, 수량)"""
+    award_date = func.date(SuiTransactionlog.stl_datetime)
+    yield from db.execute(
+        select(SuiTransactionlog.mb_id, SuiTransactionlog.stl_reason, award_date,
+               func.sum(SuiTransactionlog.stl_amount))
+        .where(SuiTransactionlog.stl_reason.in_(DAILY_AWARD_REASONS))
+        .group_by(SuiTransactionlog.mb_id, SuiTransactionlog.stl_reason, award_date)
+    ).all()
+
+    if inspect(db.get_bind()).has_table(SuiMintJob.__tablename__):
+        award_date = func.date(SuiMintJob.smj_datetime)
+        yield from db.execute(
+            select(SuiMintJob.mb_id, SuiMintJob.smj_reason, award_date, func.sum(SuiMintJob.smj_amount))
+            .where(SuiMintJob.smj_reason.in_(DAILY_AWARD_REASONS),
+                   SuiMintJob.smj_status.in_(["pending", "processing", "unknown"]))
+            .group_by(SuiMintJob.mb_id, SuiMintJob.smj_reason, award_date)
+        ).all()
+
+
+def backfill_award_ledger(db: Session) -> int:
+    """기존 트랜잭션 로그로 지급 원장을 채운다. (이미 있는 원장은 건너뜀)
+
+    Returns:
+        int: 추가한 원장 수
+    """
+    existing: Set[Tuple[str, str, datetime.date]] = {
+        (row.mb_id, row.sal_reason, row.sal_award_date)
+        for row in db.execute(select(SuiAwardLedger.mb_id, SuiAwardLedger.sal_reason,
+                                     SuiAwardLedger.sal_award_date)).all()
+    }
+    now = datetime.datetime.now()
+    rows: List[dict] = []
+    for mb_id, reason, award_date, amount in _fetch_awarded(db):
+        key = (mb_id, reason, _to_date(award_date))
+        if key in existing:
+            continue
+        existing.add(key)
+        rows.append({"mb_id": mb_id, "sal_reason": reason, "sal_award_date": key[2],
+                     "sal_amount": int(amount or 0), "sal_datetime": now})
+
+    added = 0
+    for start in range(0, len(rows), LEDGER_BACKFILL_CHUNK_SIZE):
+        chunk = rows[start:start + LEDGER_BACKFILL_CHUNK_SIZE]
+        try:
+            db.execute(insert(SuiAwardLedger), chunk)
+            db.commit()
+            added += len(chunk)
+        except IntegrityError:
+            # 채우는 중에 지급된 원장과 겹치면 한 건씩 추가
+            db.rollback()
+            for row in chunk:
+                try:
+                    db.execute(insert(SuiAwardLedger).values(**row))
+                    db.commit()
+                    added += 1
+                except IntegrityError:
+                    db.rollback()
+    logger.info(f"SUIBOARD 토큰 지급 원장 채우기 완료: {added}건")
+    return added
+
+
+def record_daily_award(db: Session, mb_id: str, reason: str, amount: int,
+                       award_date: datetime.date = None) -> bool:
+    """지급 원장에 오늘 지급을 기록한다. (commit은 호출하는 쪽에서 처리)
+    - 같은 회원, 사유, 지급일의 원장이 이미 있으면 False를 반환한다.
+      (SAVEPOINT만 rollback 하므로 호출하는 쪽 트랜잭션의 다른 변경은 유지된다.)
+
+    Returns:
+        bool: 기록 여부 (False: 이미 지급함)
+    """
+    try:
+        with db.begin_nested():
+            db.execute(
+                insert(SuiAwardLedger).values(
+                    mb_id=mb_id,
+                    sal_reason=reason,
+                    sal_award_date=award_date or datetime.date.today(),
+                    sal_amount=amount,
+                    sal_datetime=datetime.datetime.now(),
+                )
+            )
+    except IntegrityError:
+        return False
+    return True
@@ -0,0 +1,379 @@
+"""SUIBOARD 토큰 발행/회수 대기열 서비스
+
+요청 처리 중에 SUI CLI를 직접 실행하지 않도록 작업을 대기열(SuiMintJob)에 등록하고,
+스케줄러가 대기중인 작업을 모아서 처리합니다.
+- 지급(mint): 작업별로 발행량을 예약(reserve_tokens)한 뒤 수신자별로 합산하여 하나의 트랜잭션 블록으로 발행
+- 회수(reclaim): 여러 게시글의 회수량을 합산하여 한 번의 발행+소각 트랜잭션으로 처리
+- 체인에 제출되었을 수 있는 작업(응답 시간 초과, 제출 후 기록 실패, 처리 중 종료)은 다시 발행하지 않도록
+  확인 필요(unknown) 상태로 두고, 확인 후 resolve_unknown_jobs()로 반영합니다.
+"""
+import datetime
+import logging
+from collections import defaultdict
+from typing import List, Optional
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.orm import Session
+
+from core.database import DBConnect
+from core.models import SuiMintJob, SuiTransactionlog
+from lib.sui_service import (
+    DEFAULT_SUI_CONFIG, SuiOutcomeUnknown, mint_suiboard_token_batch, reclaim_suiboard_token
+)
+from service.token_supply_service import (
+    TokenBudgetExceeded, add_burned_tokens, confirm_reservations,
+    release_reservations, reserve_tokens
+)
+
+logger = logging.getLogger(__name__)
+
+MINT_BATCH_SIZE = 100  # 한 번에 처리할 최대 작업 수
+MINT_MAX_ATTEMPTS = 3  # 실패시 최대 재시도 횟수
+MINT_PROCESSING_TIMEOUT = 900  # 처리중 상태로 남은 작업(처리 중 종료 등)을 확인 필요 상태로 변경하기까지의 시간 (초)
+
+
+def enqueue_token_award(
+    db: Session,
+    mb_id: str,
+    recipient_address: str,
+    amount: int,
+    reason: str,
+    wr_id: int = None,
+    bo_table: str = None,
+    commit: bool = True,
+) -> SuiMintJob:
+    """토큰 발행 작업을 대기열에 등록한다.
+
+    Args:
+        db (Session): SQLAlchemy Session
+        mb_id (str): 회원 ID
+        recipient_address (str): 수신자 SUI 주소
+        amount (int): 발행량
+        reason (str): 발행 사유 (SuiTransactionlog.stl_reason)
+        wr_id (int, optional): 관련 게시글 ID
+        bo_table (str, optional): 관련 게시판 테이블명
+        commit (bool, optional): 등록 후 commit 여부. 호출하는 쪽의 트랜잭션에 포함하려면 False.
+
+    Returns:
+        SuiMintJob: 등록된 작업
+    """
+    if not recipient_address or not recipient_address.startswith("0x"):
+        raise ValueError(f"Invalid recipient address format: {recipient_address}")
+    if amount <= 0:
+        raise ValueError(f"Amount must be positive: {amount}")
+
+    job = SuiMintJob(
+        mb_id=mb_id,
+        wr_id=wr_id,
+        bo_table=bo_table,
+        smj_action="mint",
+        smj_recipient=recipient_address,
+        smj_amount=amount,
+        smj_reason=reason,
+        smj_status="pending",
+        smj_attempts=0,
+        smj_datetime=datetime.datetime.now(),
+    )
+    db.add(job)
+    if commit:
+        db.commit()
+    logger.info(f"토큰 발행 작업 등록: {mb_id}, {amount}개, 사유: {reason}")
+    return job
+
+
+def enqueue_token_reclaim(
+    db: Session,
+    mb_id: str,
+    amount: int,
+    reason: str,
+    wr_id: int = None,
+    bo_table: str = None,
+    commit: bool = True,
+) -> SuiMintJob:
+    """토큰 회수 작업을 대기열에 등록한다.
+
+    Args:
+        db (Session): SQLAlchemy Session
+        mb_id (str): 회수 대상 회원 ID
+        amount (int): 회수량
+        reason (str): 회수 사유 (SuiTransactionlog.stl_reason)
+        wr_id (int, optional): 관련 게시글 ID
+        bo_table (str, optional): 관련 게시판 테이블명
+        commit (bool, optional): 등록 후 commit 여부. 호출하는 쪽의 트랜잭션에 포함하려면 False.
+
+    Returns:
+        SuiMintJob: 등록된 작업
+    """
+    if amount <= 0:
+        raise ValueError(f"Amount to reclaim must be positive: {amount}")
+
+    job = SuiMintJob(
+        mb_id=mb_id,
+        wr_id=wr_id,
+        bo_table=bo_table,
+        smj_action="reclaim",
+        smj_recipient="",
+        smj_amount=amount,
+        smj_reason=reason,
+        smj_status="pending",
+        smj_attempts=0,
+        smj_datetime=datetime.datetime.now(),
+    )
+    db.add(job)
+    if commit:
+        db.commit()
+    logger.info(f"토큰 회수 작업 등록: {mb_id}, {amount}개, 사유: {reason}")
+    return job
+
+
+def _claim_pending_jobs(db: Session, action: str, limit: int) -> List[SuiMintJob]:
+    """대기중인 작업을 처리중 상태로 변경하고 반환한다.
+    - 처리중 상태로 MINT_PROCESSING_TIMEOUT 이 지난 작업(처리 중 종료 등)은 체인에 제출되었을 수 있으므로
+      다시 처리하지 않고 확인 필요(unknown) 상태로 변경한다. (발행량 예약도 유지)
+    """
+    now = datetime.datetime.now()
+    stale_datetime = now - datetime.timedelta(seconds=MINT_PROCESSING_TIMEOUT)
+    query = (
+        select(SuiMintJob)
+        .where(
+            SuiMintJob.smj_action == action,
+            or_(
+                SuiMintJob.smj_status == "pending",
+                and_(SuiMintJob.smj_status == "processing",
+                     SuiMintJob.smj_claimed_datetime < stale_datetime)
+            )
+        )
+        .order_by(SuiMintJob.smj_id)
+        .limit(limit)
+    )
+    if db.bind.dialect.name != "sqlite":
+        query = query.with_for_update(skip_locked=True)
+
+    jobs = []
+    for job in db.scalars(query).all():
+        if job.smj_status == "processing":
+            _hold_job(job, "처리 시간 초과, 발행 여부 확인 필요")
+            logger.error(f"처리 시간 초과 작업 확인 필요: {job.smj_id} ({job.smj_action}, {job.mb_id})")
+            continue
+        job.smj_status = "processing"
+        job.smj_attempts += 1
+        job.smj_claimed_datetime = now
+        jobs.append(job)
+    db.commit()
+    return jobs
+
+
+def _finish_job(db: Session, job: SuiMintJob, status: str,
+                tx_hash: str = None, error_message: str = None) -> None:
+    """작업 상태를 기록하고 트랜잭션 로그를 남긴다."""
+    job.smj_status = status
+    job.smj_tx_hash = tx_hash
+    job.smj_error_message = error_message
+    job.smj_processed_datetime = datetime.datetime.now()
+    db.add(SuiTransactionlog(
+        mb_id=job.mb_id,
+        wr_id=job.wr_id,
+        bo_table=job.bo_table,
+        # 회수는 음수로 표시
+        stl_amount=-job.smj_amount if job.smj_action == "reclaim" else job.smj_amount,
+        stl_reason=job.smj_reason,
+        stl_tx_hash=tx_hash,
+        stl_status=status,
+        stl_datetime=job.smj_processed_datetime,
+        stl_error_message=error_message,
+    ))
+
+
+def _hold_job(job: SuiMintJob, error_message: str, tx_hash: str = None) -> None:
+    """발행 여부를 알 수 없는 작업을 확인 필요(unknown) 상태로 변경한다.
+    - 재시도하지 않고 발행량 예약도 유지하며, resolve_unknown_jobs()로 확인 결과를 반영한다.
+    """
+    job.smj_status = "unknown"
+    job.smj_error_message = error_message
+    if tx_hash:
+        job.smj_tx_hash = tx_hash
+    job.smj_processed_datetime = datetime.datetime.now()
+
+
+def _hold_unknown_jobs(db: Session, job_ids: List[int], error_message: str, tx_hash: str = None) -> None:
+    """제출 후 오류가 발생한 작업을 확인 필요 상태로 변경한다. (세션은 rollback 후 다시 조회)"""
+    db.rollback()
+    for job in db.scalars(select(SuiMintJob).where(SuiMintJob.smj_id.in_(job_ids))).all():
+        _hold_job(job, error_message, tx_hash)
+    db.commit()
+
+
+def _release_failed_jobs(db: Session, jobs: List[SuiMintJob], error: Exception) -> None:
+    """체인에 제출하기 전에 실패한 작업을 재시도 대기 상태로 되돌리거나,
+    최대 시도 횟수를 넘으면 실패 처리한다.
+    """
+    db.rollback()
+    for job in jobs:
+        if job.smj_status != "processing":
+            continue
+        job.smj_reservation_id = None
+        if job.smj_attempts >= MINT_MAX_ATTEMPTS:
+            _finish_job(db, job, "failed", error_message=str(error))
+        else:
+            job.smj_status = "pending"
+            job.smj_error_message = str(error)
+    db.commit()
+
+
+def _record_submitted(db: Session, job_ids: List[int], tx_hash: str, record) -> None:
+    """체인에 제출된 작업의 결과를 기록한다.
+    - 다이제스트가 있으므로 실패해도 재시도(재발행)하지 않는다.
+      기록을 1회 다시 시도하고, 그래도 실패하면 확인 필요 상태로 변경한다.
+    """
+    for attempt in range(2):
+        try:
+            record()
+            db.commit()
+            return
+        except Exception as e:
+            logger.exception(f"제출된 트랜잭션 기록 실패 ({attempt + 1}회): TX {tx_hash}: {e}")
+            db.rollback()
+            error = e
+    try:
+        _hold_unknown_jobs(db, job_ids, f"트랜잭션 기록 실패, 확인 필요: {error}", tx_hash)
+    except Exception as e:
+        # 처리중 상태로 남은 작업은 MINT_PROCESSING_TIMEOUT 후 확인 필요 상태가 된다.
+        logger.exception(f"확인 필요 상태 기록 실패: TX {tx_hash}: {e}")
+
+
+def process_mint_jobs(batch_size: int = MINT_BATCH_SIZE, sui_config: Optional[dict] = None) -> int:
+    """대기중인 발행 작업을 처리한다. (스케줄러 작업)
+    - 작업별로 발행량을 예약하고, 최대 발행량/발행 한도를 초과하는 작업은 실패 처리한다.
+    - 수신자별로 발행량을 합산하여 하나의 Programmable Transaction Block으로 발행한다.
+    - 발행에 성공하면 예약을 확정한다.
+    - 제출 전에 실패하면(예상하지 못한 오류 포함) 예약을 취소한 뒤 MINT_MAX_ATTEMPTS 까지 다음 주기에 재시도한다.
+    - 응답 시간 초과로 발행 여부를 알 수 없거나, 발행 후 기록에 실패하면 재시도하지 않고
+      예약을 유지한 채 확인 필요(unknown) 상태로 변경한다.
+
+    Returns:
+        int: 처리한 작업 수
+    """
+    sui_config = sui_config or DEFAULT_SUI_CONFIG
+
+    with DBConnect().sessionLocal() as db:
+        jobs = _claim_pending_jobs(db, "mint", batch_size)
+        if not jobs:
+            return 0
+
+        reservation_ids = []
+        mint_jobs = []
+        awards = defaultdict(int)
+        try:
+            # 예약은 다른 세션에서 처리하므로 그동안 이 세션의 변경사항을 flush 하지 않음 (SQLite 잠금 방지)
+            with db.no_autoflush:
+                for job in jobs:
+                    try:
+                        job.smj_reservation_id = reserve_tokens(job.smj_amount, job.mb_id)
+                    except TokenBudgetExceeded as e:
+                        logger.error(str(e))
+                        _finish_job(db, job, "failed", error_message=str(e))
+                        continue
+                    reservation_ids.append(job.smj_reservation_id)
+                    awards[job.smj_recipient] += job.smj_amount
+                    mint_jobs.append(job)
+            # 발행 한도 초과로 실패한 작업과 예약 ID는 발행 실패시 rollback 되지 않도록 먼저 저장
+            db.commit()
+            if not mint_jobs:
+                return len(jobs)
+            mint_job_ids = [job.smj_id for job in mint_jobs]
+
+            tx_hash = mint_suiboard_token_batch(dict(awards), sui_config)
+
+        except SuiOutcomeUnknown as e:
+            logger.error(f"토큰 일괄 발행 결과 확인 필요: {e}")
+            _hold_unknown_jobs(db, mint_job_ids, str(e))
+            return len(jobs)
+        except Exception as e:  # SuiInteractionError, ValueError 외의 오류도 예약 취소 후 재시도
+            logger.exception(f"토큰 일괄 발행 실패: {e}")
+            release_reservations(reservation_ids)
+            _release_failed_jobs(db, jobs, e)
+            return len(jobs)
+
+        minted = sum(awards.values())
+
+        def record():
+            confirm_reservations(reservation_ids, tx_hash,
+                                 f"Minted {minted} tokens to {len(awards)} recipients, TX: {tx_hash}")
+            for job in db.scalars(select(SuiMintJob).where(SuiMintJob.smj_id.in_(mint_job_ids))).all():
+                _finish_job(db, job, "success", tx_hash=tx_hash)
+
+        _record_submitted(db, mint_job_ids, tx_hash, record)
+        return len(jobs)
+
+
+def process_reclaim_jobs(batch_size: int = MINT_BATCH_SIZE, sui_config: Optional[dict] = None) -> int:
+    """대기중인 회수 작업을 처리한다. (스케줄러 작업)
+    - 회수량을 합산하여 한 번의 발행+소각 트랜잭션으로 처리하고 소각량을 갱신한다.
+    - 제출 전에 실패하면 MINT_MAX_ATTEMPTS 까지 다음 주기에 재시도한다.
+    - 응답 시간 초과로 회수 여부를 알 수 없거나, 회수 후 기록에 실패하면 확인 필요(unknown) 상태로 변경한다.
+
+    Returns:
+        int: 처리한 작업 수
+    """
+    sui_config = sui_config or DEFAULT_SUI_CONFIG
+
+    with DBConnect().sessionLocal() as db:
+        jobs = _claim_pending_jobs(db, "reclaim", batch_size)
+        if not jobs:
+            return 0
+
+        job_ids = [job.smj_id for job in jobs]
+        total_amount = sum(job.smj_amount for job in jobs)
+        try:
+            tx_hash = reclaim_suiboard_token(total_amount, sui_config)
+        except SuiOutcomeUnknown as e:
+            logger.error(f"토큰 일괄 회수 결과 확인 필요: {e}")
+            _hold_unknown_jobs(db, job_ids, str(e))
+            return len(jobs)
+        except Exception as e:  # SuiInteractionError, ValueError 외의 오류도 재시도
+            logger.exception(f"토큰 일괄 회수 실패: {e}")
+            _release_failed_jobs(db, jobs, e)
+            return len(jobs)
+
+        def record():
+            add_burned_tokens(db, total_amount,
+                              f"Burned {total_amount} tokens from {len(jobs)} deleted posts, TX: {tx_hash}")
+            for job in db.scalars(select(SuiMintJob).where(SuiMintJob.smj_id.in_(job_ids))).all():
+                _finish_job(db, job, "success", tx_hash=tx_hash)
+
+        _record_submitted(db, job_ids, tx_hash, record)
+        return len(jobs)
+
+
+def resolve_unknown_jobs(smj_ids: List[int], tx_hash: str = None) -> int:
+    """확인 필요(unknown) 작업에 체인 확인 결과를 반영한다. (관리자 확인 후 실행)
+
+    Args:
+        smj_ids (List[int]): 작업 ID 목록 (같은 트랜잭션으로 처리된 작업)
+        tx_hash (str, optional): 체인에서 확인한 트랜잭션 다이제스트.
+            있으면 발행량 예약을 확정(회수는 소각량 반영)하고 성공 처리한다.
+            없으면 제출되지 않은 것으로 보고 예약을 취소한 뒤 대기 상태로 되돌린다.
+
+    Returns:
+        int: 반영한 작업 수
+    """
+    with DBConnect().sessionLocal() as db:
+        jobs = db.scalars(
+            select(SuiMintJob).where(SuiMintJob.smj_id.in_(smj_ids), SuiMintJob.smj_status == "unknown")
+        ).all()
+        reservation_ids = [job.smj_reservation_id for job in jobs if job.smj_reservation_id]
+        if tx_hash:
+            confirm_reservations(reservation_ids, tx_hash)
+            burned = sum(job.smj_amount for job in jobs if job.smj_action == "reclaim")
+            if burned:
+                add_burned_tokens(db, burned, f"Burned {burned} tokens (resolved), TX: {tx_hash}")
+            for job in jobs:
+                _finish_job(db, job, "success", tx_hash=tx_hash)
+        else:
+            release_reservations(reservation_ids)
+            for job in jobs:
+                job.smj_status = "pending"
+                job.smj_reservation_id = None
+                job.smj_error_message = None
+        db.commit()
+        return len(jobs)
@@ -2,12 +2,12 @@
 import datetime
 from typing import Optional
 
-from sqlalchemy import select, func
-from sqlalchemy.orm import Session
 from fastapi import Request
 
 from core.database import db_session
-from core.models import Member, SuiTransactionlog # Using SuiTransactionlog model
+from core.models import Member
+from service.sui_award_ledger_service import record_daily_award
+from service.sui_mint_queue_service import enqueue_token_award
 # from lib.sui_integration import transfer_suiboard_tokens # Placeholder for actual SUI transfer function
 
 class SuiTokenService:
@@ -22,7 +22,7 @@ class SuiTokenService:
     async def award_login_tokens(self, member: Member, amount: int = 2) -> bool:
         """
         Awards SUIBOARD tokens to a member upon login, once per day.
-        Logs the transaction.
+        The award is queued; the mint worker submits it and logs the transaction.
         """
         if not member or not member.mb_id:
             print("SuiTokenService: Invalid member object.")
@@ -33,87 +33,28 @@ class SuiTokenService:
             # Optionally, log this attempt or notify the user to set their SUI address.
             return False
 
-        # Check if tokens were already awarded today for login
+        # 지급 원장에 먼저 기록하고, 유니크키 중복이면 오늘 이미 지급(대기열 등록)한 것으로 처리
+        # 토큰 발행은 원장과 같은 트랜잭션으로 대기열에 등록하고 즉시 반환 (발행 및 트랜잭션 로그 기록은 스케줄러가 처리)
         today = datetime.date.today()
-        existing_log = self.db.scalar(
-            select(SuiTransactionlog).where(
-                SuiTransactionlog.mb_id == member.mb_id,
-                SuiTransactionlog.stl_reason == "daily_login",
-                func.date(SuiTransactionlog.stl_datetime) == today
-            ).limit(1)
-        )
-
-        if existing_log:
-            print(f"SuiTokenService: Login tokens already awarded to {member.mb_id} today ({today}).")
-            return True # Or False if we want to indicate no new tokens were awarded
-
-        # 실제 SUI 토큰 지급 로직
-        print(f"SuiTokenService: Attempting to transfer {amount} SUIBOARD tokens to {member.mb_sui_address} for member {member.mb_id}.")
-        
         try:
-            from lib.sui_service import award_suiboard_token, DEFAULT_SUI_CONFIG
-            tx_hash = award_suiboard_token(
+            if not record_daily_award(self.db, member.mb_id, "daily_login", amount, today):
+                print(f"SuiTokenService: Login tokens already awarded to {member.mb_id} today ({today}).")
+                return True # Or False if we want to indicate no new tokens were awarded
+
+            enqueue_token_award(
+                self.db,
+                mb_id=member.mb_id,
                 recipient_address=member.mb_sui_address,
                 amount=amount,
-                sui_config=DEFAULT_SUI_CONFIG
+                reason="daily_login",
+                commit=False,
             )
-            sui_transfer_successful = True
+            self.db.commit()
+            print(f"SuiTokenService: Queued {amount} SUIBOARD tokens for {member.mb_id} ({member.mb_sui_address}).")
+            return True
         except Exception as e:
-            print(f"SuiTokenService: SUI token transfer failed for {member.mb_id}: {e}")
-            tx_hash = None
-            sui_transfer_successful = False
-        
-        if sui_transfer_successful:
-            print(f"SuiTokenService: SUI token transfer successful. TxHash: {tx_hash}")
-            try:
-                # 중복 트랜잭션 해시 체크
-                existing_log = self.db.scalar(
-                    select(SuiTransactionlog).where(SuiTransactionlog.stl_tx_hash == tx_hash)
-                )
-                
-                if not existing_log:
-                    new_token_log = SuiTransactionlog(
-                        mb_id=member.mb_id,
-                        wr_id=None,  # No post associated with login bonus
-                        bo_table=None,  # No board associated with login bonus
-                        stl_amount=amount,
-                        stl_reason="daily_login",
-                        stl_tx_hash=tx_hash,
-                        stl_status="success",
-                        stl_datetime=datetime.datetime.now(),
-                        stl_error_message=None
-                    )
-                    self.db.add(new_token_log)
-                    self.db.commit()
-                    print(f"SuiTokenService: Logged token award for {member.mb_id}.")
-                else:
-                    print(f"SuiTokenService: Duplicate transaction hash found, skipping log: {tx_hash}")
-                return True
-            except Exception as e:
-                self.db.rollback()
-                print(f"SuiTokenService: Error logging token award for {member.mb_id}: {e}")
-                # Potentially handle SUI transaction rollback/compensation if logging fails critically
-                return False
-        else:
-            print(f"SuiTokenService: SUI token transfer failed for {member.mb_id}.")
-            # 실패 로그 저장
-            try:
-                failed_token_log = SuiTransactionlog(
-                    mb_id=member.mb_id,
-                    wr_id=None,
-                    bo_table=None,
-                    stl_amount=amount,
-                    stl_reason="daily_login",
-                    stl_tx_hash=None,
-                    stl_status="failed",
-                    stl_datetime=datetime.datetime.now(),
-                    stl_error_message=str(e) if 'e' in locals() else "Unknown error"
-                )
-                self.db.add(failed_token_log)
-                self.db.commit()
-            except Exception as log_error:
-                print(f"SuiTokenService: Error logging failed token transfer for {member.mb_id}: {log_error}")
-                self.db.rollback()
+            self.db.rollback()
+            print(f"SuiTokenService: Failed to queue login tokens for {member.mb_id}: {e}")
             return False
 
 # Note: The SuiTokenLog model needs to be defined in core/models.py
@@ -0,0 +1,300 @@
+"""게시글 목록 섬네일 서비스
+
+게시글 목록(갤러리, 최신글)의 섬네일을 요청 처리 중에 생성하지 않도록
+첨부파일을 등록할 때 프로세스 풀에서 미리 생성하고 섬네일 목록(ThumbnailManifest)에 기록합니다.
+- 목록 출력시에는 섬네일 목록과 섬네일 파일의 존재 여부만 확인하고 원본 파일(os.path.exists, getmtime)은 확인하지 않습니다.
+- 섬네일 목록에 없으면 생성을 예약하고, 생성될 때까지는 이미지 없음 섬네일을 출력합니다.
+- 게시글, 첨부파일을 삭제하거나 이동하면 섬네일 목록도 삭제합니다.
+- 전체 게시판의 섬네일은 warm_thumbnails.py로 미리 생성할 수 있습니다.
+"""
+import datetime
+import logging
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from core.database import DBConnect
+from core.models import Board, BoardFile, ThumbnailManifest
+from core.settings import settings
+from lib.common import dynamic_create_write_table, get_editor_image, thumbnail
+from lib.render_cache import invalidate_latest_cache
+
+logger = logging.getLogger(__name__)
+
+Size = Tuple[int, int]
+
+DUMMY_IMAGE = "./static/img/dummy-donotremove.png"
+DUMMY_THUMBNAIL_PATH = "./data/thumbnail_tmp"
+
+_executor: Optional[ProcessPoolExecutor] = None
+_lock = threading.Lock()
+_pending = set()  # 생성중인 섬네일 (bo_table, wr_id, 원본 경로, 크기 목록)
+_dummy_thumbnails: Dict[Size, str] = {}
+
+WARM_CHUNK_SIZE = 500  # 미리 생성시 한번에 예약할 게시글 수
+# 최신글 스킨(templates/*/latest)에서 사용하는 섬네일 크기
+LATEST_THUMBNAIL_SIZES: List[Size] = [(210, 150), (297, 212), (300, 220), (500, 350), (120, 120), (1200, 350)]
+
+
+def get_thumbnail_sizes(board: Board) -> List[Size]:
+    """게시판 설정의 목록 섬네일 크기 목록 (PC, 모바일)"""
+    sizes = [
+        (board.bo_gallery_width or 200, board.bo_gallery_height or 150),
+        (board.bo_mobile_gallery_width or 200, board.bo_mobile_gallery_height or 150),
+    ]
+    return list(dict.fromkeys(sizes))
+
+
+def get_warm_thumbnail_sizes(board: Board) -> List[Size]:
+    """미리 생성할 섬네일 크기 목록 (게시판 목록 + 최신글 스킨)"""
+    return list(dict.fromkeys(get_thumbnail_sizes(board) + LATEST_THUMBNAIL_SIZES))
+
+
+def get_editor_image_paths(wr_content: str) -> List[str]:
+    """본문에 에디터로 삽입된 이미지의 파일 경로 목록 (파일 존재 여부는 확인하지 않음)
+    - 에디터로 삽입된 이미지의 주소는 웹 경로이기에 os.path로 체크할 수 있도록 경로를 변경한다.
+    """
+    paths = []
+    for image in get_editor_image(wr_content, view=False):
+        if "/data/editor/" in image:
+            paths.append("./data/editor/" + image.split("/data/editor/")[1])
+    return paths
+
+
+def get_thumbnail_manifest_map(db: Session, bo_table: str,
+                               wr_ids: List[int]) -> Dict[int, Dict[Size, ThumbnailManifest]]:
+    """여러 게시글의 섬네일 목록을 한번에 조회한다.
+
+    Returns:
+        dict[int, dict[tuple, ThumbnailManifest]]: 게시글 번호별 {(너비, 높이): 섬네일}
+    """
+    manifest_map = {wr_id: {} for wr_id in wr_ids}
+    if not wr_ids:
+        return manifest_map
+
+    rows = db.scalars(
+        select(ThumbnailManifest).where(
+            ThumbnailManifest.bo_table == bo_table,
+            ThumbnailManifest.wr_id.in_(wr_ids)
+        )
+    ).all()
+    for row in rows:
+        manifest_map[row.wr_id][(row.tm_width, row.tm_height)] = row
+    return manifest_map
+
+
+def save_thumbnail_manifest(db: Session, bo_table: str, wr_id: int,
+                            source_file: str, thumbnails: Dict[Size, str]) -> None:
+    """섬네일 목록을 기록하고 commit 한다."""
+    now = datetime.datetime.now()
+    for (width, height), thumbnail_file in thumbnails.items():
+        values = {"tm_source": source_file, "tm_thumbnail": thumbnail_file, "tm_datetime": now}
+        result = db.execute(
+            update(ThumbnailManifest).values(**values)
+            .where(
+                ThumbnailManifest.bo_table == bo_table,
+                ThumbnailManifest.wr_id == wr_id,
+                ThumbnailManifest.tm_width == width,
+                ThumbnailManifest.tm_height == height
+            )
+        )
+        if not result.rowcount:
+            db.execute(insert(ThumbnailManifest).values(
+                bo_table=bo_table, wr_id=wr_id, tm_width=width, tm_height=height, **values))
+        try:
+            db.commit()
+        except IntegrityError:
+            # 다른 워커가 먼저 기록한 경우
+            db.rollback()
+
+
+def delete_thumbnail_manifest(db: Session, bo_table: str, wr_id: int = None) -> None:
+    """게시글의 섬네일 목록을 삭제한다. (commit은 호출하는 쪽에서 처리)
+    - wr_id가 없으면 게시판의 섬네일 목록 전체를 삭제한다.
+    """
+    query = delete(ThumbnailManifest).where(ThumbnailManifest.bo_table == bo_table)
+    if wr_id is not None:
+        query = query.where(ThumbnailManifest.wr_id == wr_id)
+    db.execute(query)
+
+
+def generate_thumbnails(source_file: str, sizes: Iterable[Size]) -> Dict[Size, str]:
+    """원본 이미지로 크기별 섬네일을 생성한다. (프로세스 풀에서 실행)
+
+    Returns:
+        dict[tuple, str]: {(너비, 높이): 섬네일 경로} (생성에 실패한 크기는 제외)
+    """
+    thumbnails = {}
+    for width, height in sizes:
+        thumbnail_file = thumbnail(source_file, width=width, height=height)
+        if thumbnail_file:
+            thumbnails[(width, height)] = thumbnail_file
+    return thumbnails
+
+
+def _get_executor() -> Optional[ProcessPoolExecutor]:
+    """섬네일 생성 프로세스 풀 (THUMBNAIL_WORKERS가 0이면 None)"""
+    global _executor
+    if settings.THUMBNAIL_WORKERS <= 0:
+        return None
+    with _lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=settings.THUMBNAIL_WORKERS)
+        return _executor
+
+
+def shutdown_thumbnail_executor() -> None:
+    """섬네일 생성 프로세스 풀을 종료한다. (서버 종료시 호출)
+    - 생성중인 섬네일은 기다리지 않고, 아직 시작하지 않은 예약은 취소한다.
+    """
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+        _pending.clear()
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _record_thumbnails(bo_table: str, wr_id: int, source_file: str, thumbnails: Dict[Size, str]) -> None:
+    if not thumbnails:
+        return
+    with DBConnect().sessionLocal() as db:
+        save_thumbnail_manifest(db, bo_table, wr_id, source_file, thumbnails)
+    invalidate_latest_cache(bo_table)
+
+
+def schedule_thumbnails(bo_table: str, wr_id: int, source_file: str, sizes: Iterable[Size]) -> Dict[Size, str]:
+    """섬네일 생성을 예약한다. 생성이 끝나면 섬네일 목록에 기록한다.
+    - 같은 섬네일을 생성하는 중이면 다시 예약하지 않는다.
+
+    Returns:
+        dict[tuple, str]: 프로세스 풀을 사용하지 않아 바로 생성한 경우 {(너비, 높이): 섬네일 경로}, 예약한 경우 {}
+    """
+    sizes = tuple(sizes)
+    key = (bo_table, wr_id, source_file, sizes)
+    with _lock:
+        if key in _pending:
+            return {}
+        _pending.add(key)
+
+    def _finish(thumbnails: Dict[Size, str]) -> None:
+        try:
+            _record_thumbnails(bo_table, wr_id, source_file, thumbnails)
+        except Exception as e:
+            logger.error(f"섬네일 목록 기록 실패: {bo_table}/{wr_id} {source_file}: {e}")
+        finally:
+            with _lock:
+                _pending.discard(key)
+
+    try:
+        executor = _get_executor()
+        if executor is None:
+            thumbnails = generate_thumbnails(source_file, sizes)
+            _finish(thumbnails)
+            return thumbnails
+
+        future: Future = executor.submit(generate_thumbnails, source_file, sizes)
+        future.add_done_callback(lambda done: _finish(done.result() if not done.exception() else {}))
+    except Exception as e:
+        logger.error(f"섬네일 생성 예약 실패: {bo_table}/{wr_id} {source_file}: {e}")
+        with _lock:
+            _pending.discard(key)
+    return {}
+
+
+def get_dummy_thumbnail(width: int, height: int) -> str:
+    """이미지가 없는 게시글의 섬네일 경로 (크기별로 1회만 생성)"""
+    thumbnail_file = _dummy_thumbnails.get((width, height))
+    if not thumbnail_file:
+        thumbnail_file = thumbnail(DUMMY_IMAGE, target_path=DUMMY_THUMBNAIL_PATH, width=width, height=height)
+        if thumbnail_file:
+            _dummy_thumbnails[(width, height)] = thumbnail_file
+    return thumbnail_file
+
+
+def find_thumbnail_sources(db: Session, bo_table: str, image_extension: str) -> Iterator[Tuple[int, str]]:
+    """게시판 게시글별 대표 이미지 (첨부 이미지가 없으면 본문에 에디터로 삽입된 이미지)
+
+    Returns:
+        Iterator[tuple[int, str]]: (게시글 번호, 원본 이미지 경로)
+    """
+    first_images = {}
+    board_files = db.execute(
+        select(BoardFile.wr_id, BoardFile.bf_source, BoardFile.bf_file)
+        .where(BoardFile.bo_table == bo_table)
+        .order_by(BoardFile.wr_id, BoardFile.bf_no)
+    ).all()
+    for board_file in board_files:
+        ext = board_file.bf_source.split(".")[-1]
+        if ext in image_extension and board_file.wr_id not in first_images:
+            first_images[board_file.wr_id] = board_file.bf_file
+
+    write_model = dynamic_create_write_table(bo_table)
+    writes = db.execute(
+        select(write_model.wr_id, write_model.wr_content)
+        .where(write_model.wr_is_comment == 0)
+        .execution_options(yield_per=WARM_CHUNK_SIZE)
+    )
+    for wr_id, wr_content in writes:
+        if wr_id in first_images:
+            yield wr_id, first_images[wr_id]
+            continue
+        for image in get_editor_image_paths(wr_content):
+            ext = image.split(".")[-1].lower()
+            if os.path.isfile(image) and os.path.getsize(image) > 0 and ext in image_extension:
+                yield wr_id, image
+                break
+
+
+def warm_thumbnails(image_extension: str, bo_tables: List[str] = None, workers: int = None) -> int:
+    """게시판 게시글의 목록/최신글 섬네일을 프로세스 풀에서 미리 생성하고 섬네일 목록에 기록한다.
+    - 섬네일 목록에 이미 있는 섬네일은 생성하지 않는다.
+    - 섬네일을 생성한 게시판은 최신글 캐시를 무효화한다.
+
+    Args:
+        image_extension (str): 이미지 확장자 (Config.cf_image_extension)
+        bo_tables (List[str], optional): 게시판 목록. 기본값은 전체 게시판
+        workers (int, optional): 프로세스 수. 기본값은 THUMBNAIL_WORKERS (0이면 CPU 수)
+
+    Returns:
+        int: 섬네일을 생성한 게시글 수
+    """
+    warmed = 0
+    with DBConnect().sessionLocal() as db:
+        query = select(Board).order_by(Board.bo_table)
+        if bo_tables:
+            query = query.where(Board.bo_table.in_(bo_tables))
+        boards = db.scalars(query).all()
+
+        max_workers = workers or settings.THUMBNAIL_WORKERS or None
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for board in boards:
+                sizes = get_warm_thumbnail_sizes(board)
+                board_warmed = warmed
+                sources = list(find_thumbnail_sources(db, board.bo_table, image_extension))
+                for start in range(0, len(sources), WARM_CHUNK_SIZE):
+                    chunk = sources[start:start + WARM_CHUNK_SIZE]
+                    manifest_map = get_thumbnail_manifest_map(db, board.bo_table, [wr_id for wr_id, _ in chunk])
+                    futures = {}
+                    for wr_id, source_file in chunk:
+                        manifest = manifest_map[wr_id]
+                        missing = [size for size in sizes
+                                   if not (size in manifest and manifest[size].tm_source == source_file)]
+                        if missing:
+                            futures[executor.submit(generate_thumbnails, source_file, missing)] = (wr_id, source_file)
+
+                    for future in as_completed(futures):
+                        wr_id, source_file = futures[future]
+                        thumbnails = future.result()
+                        if thumbnails:
+                            save_thumbnail_manifest(db, board.bo_table, wr_id, source_file, thumbnails)
+                            warmed += 1
+                if warmed > board_warmed:
+                    invalidate_latest_cache(board.bo_table)
+                logger.info(f"섬네일 미리 생성: {board.bo_table} ({len(sources)}개 게시글 확인)")
+    return warmed
@@ -0,0 +1,218 @@
+"""SUIBOARD 토큰 발행량 예약 서비스
+
+SUI CLI로 발행하기 전에 발행량을 예약하고, 발행 결과에 따라 확정하거나 취소합니다.
+- 예약은 한도를 넘지 않는 경우에만 더하는 조건부 UPDATE로 처리하므로
+  여러 워커가 동시에 예약해도 최대 발행량(TokenSupply.max_supply)과 발행 한도를 넘지 않고,
+  증가량이 누락되지 않습니다.
+- 총 발행량은 예약시 TokenSupply.total_minted에 더하고, 발행에 실패하면 취소하여 되돌립니다.
+- 일일 전체/회원별 발행 한도(TokenBudget)도 같은 방식으로 예약합니다.
+- 발행 결과를 기록하기 전에 프로세스가 종료된 예약은 발행 여부를 알 수 없으므로
+  자동으로 취소하지 않습니다. (reserved 상태로 남아 한도에 포함됨)
+"""
+import datetime
+import logging
+from typing import List, Optional, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from core.database import DBConnect
+from core.models import TokenBudget, TokenReservation, TokenSupply
+from core.settings import settings
+from lib.sui_service import SuiInteractionError
+
+logger = logging.getLogger(__name__)
+
+TOKEN_MAX_SUPPLY = 100000000  # 최대 발행량 기본값 (1억개)
+
+
+class TokenBudgetExceeded(SuiInteractionError):
+    """토큰 최대 발행량 또는 발행 한도 초과"""
+
+
+def get_mint_budgets(mb_id: str = "", today: datetime.date = None) -> List[Tuple[str, int]]:
+    """발행시 예약할 발행 한도 목록
+
+    Returns:
+        List[Tuple[str, int]]: [(한도 키, 한도), ...] (한도가 0이면 제외)
+    """
+    today = today or datetime.date.today()
+    budgets = []
+    if settings.TOKEN_DAILY_MINT_LIMIT > 0:
+        budgets.append((f"daily:{today}", settings.TOKEN_DAILY_MINT_LIMIT))
+    if mb_id and settings.TOKEN_MEMBER_DAILY_MINT_LIMIT > 0:
+        budgets.append((f"member:{mb_id}:{today}", settings.TOKEN_MEMBER_DAILY_MINT_LIMIT))
+    return budgets
+
+
+def get_supply_record(db: Session) -> TokenSupply:
+    """토큰 공급량 기록을 반환한다. 없으면 생성한다."""
+    query = select(TokenSupply).order_by(TokenSupply.id).limit(1)
+    supply_record = db.scalar(query)
+    if not supply_record:
+        try:
+            db.add(TokenSupply(
+                id=1,
+                total_minted=0,
+                total_burned=0,
+                max_supply=TOKEN_MAX_SUPPLY,
+                last_updated=datetime.datetime.now(),
+                notes="Initial token supply record created"
+            ))
+            db.commit()
+            logger.info("토큰 공급량 추적 테이블 초기화 완료")
+        except IntegrityError:
+            # 다른 워커가 먼저 생성한 경우
+            db.rollback()
+        supply_record = db.scalar(query)
+    return supply_record
+
+
+def _ensure_budget_rows(db: Session, keys: List[str]) -> None:
+    """발행 한도 행이 없으면 생성한다. (조건부 UPDATE 대상)"""
+    existing = set(db.scalars(select(TokenBudget.tb_key).where(TokenBudget.tb_key.in_(keys))).all())
+    for key in keys:
+        if key in existing:
+            continue
+        try:
+            db.add(TokenBudget(tb_key=key, tb_used=0, tb_datetime=datetime.datetime.now()))
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+
+
+def reserve_tokens(amount: int, mb_id: str = "",
+                   budgets: Optional[List[Tuple[str, int]]] = None) -> int:
+    """발행량을 예약한다.
+
+    Args:
+        amount (int): 발행량
+        mb_id (str, optional): 회원 ID (회원별 발행 한도)
+        budgets (List[Tuple[str, int]], optional): 예약할 발행 한도. 기본값은 get_mint_budgets(mb_id)
+
+    Returns:
+        int: 예약 ID (confirm_reservations/release_reservations에 사용)
+
+    Raises:
+        TokenBudgetExceeded: 최대 발행량 또는 발행 한도 초과
+    """
+    if amount <= 0:
+        raise ValueError(f"Amount must be positive: {amount}")
+
+    budgets = get_mint_budgets(mb_id) if budgets is None else budgets
+    # 여러 워커가 같은 순서로 행을 잠그도록 키 순서로 정렬
+    budgets = sorted((key, limit) for key, limit in budgets if limit > 0)
+    now = datetime.datetime.now()
+
+    with DBConnect().sessionLocal() as db:
+        supply_id = get_supply_record(db).id
+        _ensure_budget_rows(db, [key for key, _ in budgets])
+
+        result = db.execute(
+            update(TokenSupply)
+            .where(TokenSupply.id == supply_id,
+                   TokenSupply.total_minted + amount <= TokenSupply.max_supply)
+            .values(total_minted=TokenSupply.total_minted + amount, last_updated=now)
+        )
+        if not result.rowcount:
+            db.rollback()
+            supply_record = db.get(TokenSupply, supply_id)
+            raise TokenBudgetExceeded(
+                f"토큰 발행 한도 초과: 요청량 {amount}, "
+                f"남은 발행가능량 {supply_record.remaining_supply}, 최대공급량 {supply_record.max_supply}")
+
+        for key, limit in budgets:
+            result = db.execute(
+                update(TokenBudget)
+                .where(TokenBudget.tb_key == key, TokenBudget.tb_used + amount <= limit)
+                .values(tb_used=TokenBudget.tb_used + amount, tb_datetime=now)
+            )
+            if not result.rowcount:
+                db.rollback()
+                raise TokenBudgetExceeded(f"토큰 발행 한도 초과: {key}, 요청량 {amount}, 한도 {limit}")
+
+        reservation = TokenReservation(
+            mb_id=mb_id or "",
+            tr_amount=amount,
+            tr_budget_keys=",".join(key for key, _ in budgets),
+            tr_status="reserved",
+            tr_datetime=now,
+        )
+        db.add(reservation)
+        db.commit()
+        return reservation.tr_id
+
+
+def confirm_reservations(tr_ids: List[int], tx_hash: str = None, notes: str = None) -> int:
+    """발행에 성공한 예약을 확정한다.
+
+    Returns:
+        int: 확정한 예약 수
+    """
+    if not tr_ids:
+        return 0
+    now = datetime.datetime.now()
+    with DBConnect().sessionLocal() as db:
+        result = db.execute(
+            update(TokenReservation)
+            .where(TokenReservation.tr_id.in_(tr_ids), TokenReservation.tr_status == "reserved")
+            .values(tr_status="confirmed", tr_tx_hash=tx_hash, tr_processed_datetime=now)
+        )
+        if notes:
+            supply_id = get_supply_record(db).id
+            db.execute(
+                update(TokenSupply).where(TokenSupply.id == supply_id)
+                .values(notes=notes, last_updated=now)
+            )
+        db.commit()
+        return result.rowcount
+
+
+def release_reservations(tr_ids: List[int]) -> int:
+    """발행에 실패한 예약을 취소하고 예약한 수량을 되돌린다.
+    - 이미 확정/취소된 예약은 무시하므로 여러 번 호출해도 한번만 되돌린다.
+
+    Returns:
+        int: 취소한 예약 수
+    """
+    if not tr_ids:
+        return 0
+    now = datetime.datetime.now()
+    released = 0
+    with DBConnect().sessionLocal() as db:
+        supply_id = get_supply_record(db).id
+        reservations = db.execute(
+            select(TokenReservation.tr_id, TokenReservation.tr_amount, TokenReservation.tr_budget_keys)
+            .where(TokenReservation.tr_id.in_(tr_ids), TokenReservation.tr_status == "reserved")
+        ).all()
+        for reservation in reservations:
+            # 상태가 바뀐 예약만 되돌린다. (동시에 취소해도 한번만 반영)
+            result = db.execute(
+                update(TokenReservation)
+                .where(TokenReservation.tr_id == reservation.tr_id, TokenReservation.tr_status == "reserved")
+                .values(tr_status="released", tr_processed_datetime=now)
+            )
+            if not result.rowcount:
+                continue
+            db.execute(
+                update(TokenSupply).where(TokenSupply.id == supply_id)
+                .values(total_minted=TokenSupply.total_minted - reservation.tr_amount, last_updated=now)
+            )
+            for key in filter(None, reservation.tr_budget_keys.split(",")):
+                db.execute(
+                    update(TokenBudget).where(TokenBudget.tb_key == key)
+                    .values(tb_used=TokenBudget.tb_used - reservation.tr_amount, tb_datetime=now)
+                )
+            released += 1
+        db.commit()
+    return released
+
+
+def add_burned_tokens(db: Session, amount: int, notes: str = None) -> None:
+    """소각량을 더한다. (commit은 호출하는 쪽에서 처리)"""
+    supply_id = get_supply_record(db).id
+    values = {"total_burned": TokenSupply.total_burned + amount, "last_updated": datetime.datetime.now()}
+    if notes:
+        values["notes"] = notes
+    db.execute(update(TokenSupply).where(TokenSupply.id == supply_id).values(**values))
@@ -0,0 +1,233 @@
+"""방문자 집계(rollup) 서비스를 제공하는 모듈입니다.
+
+관리자 접속자집계 화면에서 기간 내 방문자 이력(Visit)을 모두 읽지 않도록
+일별, 항목별 방문자 수를 VisitRollup 테이블에 누적합니다.
+- 스케줄러가 마지막으로 집계한 이후의 방문자 이력만 읽어서 집계합니다.
+- 먼저 번호(vi_id)를 받고 늦게 커밋된 이력을 건너뛰지 않도록
+  ROLLUP_SAFETY_LAG보다 최근의 방문자 이력은 다음 집계로 미룹니다.
+- 일별/월별/연도별 방문자 수는 방문자 합계 테이블(VisitSum)을 사용합니다.
+"""
+import logging
+import re
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import List
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from core.database import DBConnect
+from core.models import Visit, VisitRollup, VisitRollupState, VisitSum
+
+logger = logging.getLogger(__name__)
+
+VISIT_ROLLUP_DIMENSIONS = ("referer", "browser", "os", "device")
+ROLLUP_CHUNK_SIZE = 5000  # 한번에 읽어올 방문자 이력 수
+ROLLUP_MAX_CHUNKS = 20  # 스케줄러 1회 실행시 최대 처리 횟수
+ROLLUP_SAFETY_LAG = 60  # 커밋이 늦어질 수 있는 최근 방문자 이력을 집계하지 않는 시간 (초)
+
+
+def get_browser(user_agent):
+    """브라우저이름을 반환합니다.
+    """
+    user_agent = user_agent.lower()
+
+    browsers = {
+        'Chrome': r"chrome",
+        'FireFox': r"firefox",
+        'Safari': r"safari",
+        'Opera': r"opera",
+        'MSIE': r"msie ([1-9][0-9]\.[0-9]+)",
+        'Mozilla': r"mozilla",
+        'Robot': r"bot|Yeti|Baidu|Daumoa|Yandex|slurp|facebook",
+        'IE': r"internet explorer"
+    }
+
+    for browser_name, pattern in browsers.items():
+        if re.search(pattern, user_agent):
+            return browser_name
+
+    return "other"  # todo 다국어
+
+
+def get_os(user_agent):
+    user_agent = user_agent.lower()
+
+    os_patterns = {
+        "Android": r"android",
+        "IOS": r"IOS",
+        "iPad OS": r"iPad",
+        "Phone": r"phone",
+        "Windows10": r"windows nt 10\.0",
+        "Windows8.1": r"windows nt 6\.3",
+        "Windows8": r"windows nt 6\.2",
+        "Windows7": r"windows nt 6\.1",
+        "Vista": r"windows nt 6\.0",
+        "XP": r"windows nt 5\.1",
+        "2003": r"windows nt 5\.2",
+        "NT": r"windows nt 4\.[0-9]*",
+        "CE": r"windows ce",
+        "MAC": r"mac",
+        "Robot": r"bot|Yeti|Baidu|Daumoa|Yandex|slurp|facebook ",
+        "Linux": r"linux",
+        "Solrais": r"solrais",
+        "IE": r"internet explorer",
+        "Mozilla": r"mozilla",
+        "IRIX": r"irix"
+    }
+
+    # Iterate through the patterns and return the first matching OS
+    for os_name, pattern in os_patterns.items():
+        if re.search(pattern, user_agent):
+            return os_name
+
+    return "other"
+
+
+def get_referer_domain(referer: str) -> str:
+    """집계에 사용할 referer 값을 반환합니다. (직접 접속이면 빈 문자열)"""
+    match = re.search(r'^http[s]*\S+', referer or "")
+    if not match:
+        return ""
+    return re.sub(r"^(www\.|search\.|dirsearch\.|dir\.search\.|dir\.|kr\.search\.|myhome\.)(.*)",
+                  "\\2", match.group())
+
+
+def get_visit_dimensions(visit) -> dict:
+    """방문자 이력의 항목별 집계 값을 반환합니다."""
+    return {
+        # DB 기본키 비교시 대소문자를 구분하지 않는 경우가 있으므로 소문자로 저장
+        "referer": get_referer_domain(visit.vi_referer).lower()[:255],
+        "browser": (visit.vi_browser or get_browser(visit.vi_agent or ""))[:255],
+        "os": (visit.vi_os or get_os(visit.vi_agent or ""))[:255],
+        "device": (visit.vi_device or "")[:255],
+    }
+
+
+def _get_rollup_state(db: Session) -> VisitRollupState:
+    """집계 진행 상태를 반환한다. 없으면 생성한다."""
+    query = select(VisitRollupState).where(VisitRollupState.vrs_id == 1)
+    if db.bind.dialect.name != "sqlite":
+        # 여러 워커에서 동시에 집계하지 않도록 잠금
+        query = query.with_for_update()
+    state = db.scalar(query)
+    if not state:
+        state = VisitRollupState(vrs_id=1, vrs_last_vi_id=0)
+        db.add(state)
+        db.flush()
+    return state
+
+
+def _add_rollup_counts(db: Session, counts: Counter) -> None:
+    """(날짜, 항목, 값)별 방문자 수를 집계 테이블에 누적한다."""
+    dates = {key[0] for key in counts}
+    existing = {
+        (row.vr_date, row.vr_dimension, row.vr_value): row
+        for row in db.scalars(select(VisitRollup).where(VisitRollup.vr_date.in_(dates))).all()
+    }
+    for (vr_date, dimension, value), count in counts.items():
+        row = existing.get((vr_date, dimension, value))
+        if row:
+            row.vr_count += count
+        else:
+            db.add(VisitRollup(vr_date=vr_date, vr_dimension=dimension, vr_value=value, vr_count=count))
+
+
+def rollup_visits(db: Session, max_chunks: int = ROLLUP_MAX_CHUNKS,
+                  safety_lag: int = ROLLUP_SAFETY_LAG) -> int:
+    """마지막 집계 이후의 방문자 이력을 집계 테이블에 누적합니다.
+    - 집계 위치(vrs_last_vi_id)는 safety_lag초 이전에 방문한 이력까지만 옮깁니다.
+      (더 작은 번호의 이력이 아직 커밋되지 않았을 수 있으므로)
+
+    Returns:
+        int: 집계한 방문자 이력 수
+    """
+    cutoff = datetime.now() - timedelta(seconds=safety_lag)
+    total = 0
+    for _ in range(max_chunks):
+        state = _get_rollup_state(db)
+        visits = db.execute(
+            select(Visit.vi_id, Visit.vi_date, Visit.vi_time, Visit.vi_referer, Visit.vi_agent,
+                   Visit.vi_browser, Visit.vi_os, Visit.vi_device)
+            .where(Visit.vi_id > state.vrs_last_vi_id)
+            .order_by(Visit.vi_id)
+            .limit(ROLLUP_CHUNK_SIZE)
+        ).all()
+        for index, visit in enumerate(visits):
+            if datetime.combine(visit.vi_date, visit.vi_time) > cutoff:
+                visits = visits[:index]
+                break
+        if not visits:
+            db.commit()
+            break
+
+        counts = Counter()
+        for visit in visits:
+            for dimension, value in get_visit_dimensions(visit).items():
+                counts[(visit.vi_date, dimension, value)] += 1
+        _add_rollup_counts(db, counts)
+
+        state.vrs_last_vi_id = visits[-1].vi_id
+        state.vrs_datetime = datetime.now()
+        db.commit()
+        total += len(visits)
+
+    return total
+
+
+def process_visit_rollup() -> int:
+    """방문자 집계 (스케줄러 작업)"""
+    with DBConnect().sessionLocal() as db:
+        count = rollup_visits(db)
+    if count:
+        logger.info(f"방문자 집계: {count}건")
+    return count
+
+
+def get_rollup_counts(db: Session, dimension: str, from_date: str, to_date: str) -> List[dict]:
+    """기간 내 항목별 방문자 수를 방문자 수가 많은 순서로 반환합니다.
+
+    Returns:
+        List[dict]: [{"value": 항목 값, "count": 방문자 수}, ...]
+    """
+    rows = db.execute(
+        select(VisitRollup.vr_value, func.sum(VisitRollup.vr_count).label("count"))
+        .where(
+            VisitRollup.vr_dimension == dimension,
+            VisitRollup.vr_date.between(from_date, to_date)
+        )
+        .group_by(VisitRollup.vr_value)
+        .order_by(func.sum(VisitRollup.vr_count).desc())
+    ).all()
+    return [{"value": row.vr_value, "count": int(row.count)} for row in rows]
+
+
+def get_visit_sum_counts(db: Session, from_date: str, to_date: str, date_format: str) -> List[dict]:
+    """기간 내 방문자 수를 date_format(예: %Y-%m) 단위로 합산하여 날짜순으로 반환합니다.
+
+    Returns:
+        List[dict]: [{"value": 날짜 문자열, "count": 방문자 수}, ...]
+    """
+    rows = db.execute(
+        select(VisitSum.vs_date, VisitSum.vs_count)
+        .where(VisitSum.vs_date.between(from_date, to_date))
+        .order_by(VisitSum.vs_date)
+    ).all()
+    counts = Counter()
+    for row in rows:
+        counts[row.vs_date.strftime(date_format)] += row.vs_count
+    return [{"value": key, "count": value} for key, value in counts.items()]
+
+
+def delete_visit_rollups(db: Session, before: date = None, year: int = None, month: int = None) -> None:
+    """방문자 이력 삭제시 같은 기간의 집계를 삭제합니다. (commit은 호출하는 쪽에서 처리)"""
+    query = delete(VisitRollup)
+    if before:
+        query = query.where(VisitRollup.vr_date < before)
+    elif year and month:
+        start = date(year, month, 1)
+        end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+        query = query.where(VisitRollup.vr_date >= start, VisitRollup.vr_date < end)
+    else:
+        return
+    db.execute(query)
@@ -1,16 +1,27 @@
 """방문자 서비스를 제공하는 모듈입니다."""
+import asyncio
+import logging
+import threading
+from collections import deque
 from datetime import date, datetime, timedelta
 import re
-from typing import Union
+from typing import List, Union
 
 from fastapi import Request
-from sqlalchemy import exists, func, select
+from sqlalchemy import exists, insert, select, update
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from user_agents import parse
 
-from core.database import db_session
+from core.database import DBConnect, db_session
 from core.models import Config, Visit, VisitSum
 from lib.common import get_client_ip
 
+logger = logging.getLogger(__name__)
+
+VISIT_FLUSH_INTERVAL = 5  # 방문자 이력 버퍼 저장 주기 (초)
+VISIT_BUFFER_MAX_SIZE = 10000  # 버퍼 최대 크기 (초과시 새 이력을 버리고 개수를 기록)
+
 
 class VisitService:
     """
@@ -37,36 +48,34 @@ class VisitService:
 
         return visit
 
+    def get_visit_data(self) -> dict:
+        """요청 정보로 방문자 이력 데이터를 생성합니다. (User-Agent 파싱은 저장시 처리)"""
+        now = datetime.now()
+        return {
+            "vi_ip": get_client_ip(self.request),
+            "vi_date": now.date(),
+            "vi_time": now.time(),
+            "vi_referer": self.request.headers.get("referer", ""),
+            "vi_agent": self.request.headers.get("User-Agent", ""),
+        }
+
     def create_visit_record(self) -> Union[Visit, None]:
         """
         방문자 접속 이력 생성 함수
         - 새로운 접속 이력 생성
-        - 방문자 합계 테이블 갱신
-        - 기본설정 테이블에 방문자 수 기록
+        - 방문자 합계 테이블, 기본설정 테이블의 방문자 수를 증가
         """
-        vi_ip = get_client_ip(self.request)
-        if self.is_exists_visit(vi_ip, self.today):
+        visit_data = self.get_visit_data()
+        if self.is_exists_visit(visit_data["vi_ip"], visit_data["vi_date"]):
             return None
 
-        referer = self.request.headers.get("referer", "")
-        user_agent = self.request.headers.get("User-Agent", "")
-        browser, os, device = self._parse_user_agent(user_agent)
-        visit = Visit(
-            vi_ip=vi_ip,
-            vi_date=self.today,
-            vi_time=datetime.now().time(),
-            vi_referer=referer,
-            vi_agent=user_agent,
-            vi_browser=browser,
-            vi_os=os,
-            vi_device=device,
-        )
+        browser, os, device = parse_user_agent(visit_data["vi_agent"])
+        visit = Visit(**visit_data, vi_browser=browser, vi_os=os, vi_device=device)
         self.db.add(visit)
-        self.db.commit()
-        self.db.refresh(visit)
+        self.db.flush()
 
-        self._update_visit_sum()
-        self._update_config()
+        increase_visit_count(self.db, {visit.vi_date: 1})
+        self.db.commit()
 
         return visit
 
@@ -79,35 +88,187 @@ class VisitService:
             ).select()
         )
 
-    def _parse_user_agent(self, user_agent: str):
-        """User-Agent 문자열을 파싱하여 브라우저, OS, 디바이스 정보를 반환합니다."""
-        ua = parse(user_agent)
-        browser = getattr(ua.browser, 'family', 'unknown')
-        os = getattr(ua.os, 'family', 'unknown')
-        device = 'pc' if ua.is_pc else 'mobile' if ua.is_mobile else 'tablet' if ua.is_tablet else 'unknown'
-        return browser, os, device
-
-    def _update_config(self) -> None:
-        """기본설정 테이블 > 방문자 수 갱신 함수"""
-        today = self.db.scalar(
-            select(VisitSum.vs_count).where(VisitSum.vs_date == self.today)
-        ) or 0
-        yesterday = self.db.scalar(
-            select(VisitSum.vs_count)
-            .where(VisitSum.vs_date == self.today - timedelta(days=1))
-        ) or 0
-        visit_max = self.db.scalar(func.max(VisitSum.vs_count)) or 0
-        visit_total = self.db.scalar(func.sum(VisitSum.vs_count)) or 0
-
-        config = self.db.scalars(select(Config)).first()
-        config.cf_visit = f"오늘:{today},어제:{yesterday},최대:{visit_max},전체:{visit_total}"
-        self.db.commit()
 
-    def _update_visit_sum(self) -> None:
-        """방문자 합계 테이블 갱신 함수"""
-        visit_count_today = self.db.scalar(
-            select(func.count(Visit.vi_id))
-            .where(Visit.vi_date == self.today)
+def parse_user_agent(user_agent: str):
+    """User-Agent 문자열을 파싱하여 브라우저, OS, 디바이스 정보를 반환합니다."""
+    ua = parse(user_agent)
+    browser = getattr(ua.browser, 'family', 'unknown')
+    os = getattr(ua.os, 'family', 'unknown')
+    device = 'pc' if ua.is_pc else 'mobile' if ua.is_mobile else 'tablet' if ua.is_tablet else 'unknown'
+    return browser, os, device
+
+
+def increase_visit_count(db: Session, date_counts: dict) -> None:
+    """방문자 합계 테이블과 기본설정 테이블의 방문자 수를 증가시킵니다. (commit은 호출하는 쪽에서 처리)
+    - 방문자 합계는 날짜별로 증가시키고, 전체/최대 방문자 수는 기존 값에서 누적합니다.
+
+    Args:
+        date_counts (dict): {날짜: 새로 기록된 방문자 수}
+    """
+    for visit_date, count in date_counts.items():
+        result = db.execute(
+            update(VisitSum)
+            .where(VisitSum.vs_date == visit_date)
+            .values(vs_count=VisitSum.vs_count + count)
         )
-        self.db.merge(VisitSum(vs_date=self.today, vs_count=visit_count_today))
-        self.db.commit()
+        if not result.rowcount:
+            db.add(VisitSum(vs_date=visit_date, vs_count=count))
+    db.flush()
+
+    config_query = select(Config)
+    if db.bind.dialect.name != "sqlite":
+        config_query = config_query.with_for_update()
+    config = db.scalars(config_query).first()
+    if not config:
+        return
+
+    today = date.today()
+    today_count = db.scalar(select(VisitSum.vs_count).where(VisitSum.vs_date == today)) or 0
+    yesterday_count = db.scalar(
+        select(VisitSum.vs_count).where(VisitSum.vs_date == today - timedelta(days=1))
+    ) or 0
+    visit = VisitService.parse_visit_data(config.cf_visit)
+    visit_max = max(visit["max"], today_count, yesterday_count)
+    visit_total = visit["total"] + sum(date_counts.values())
+    config.cf_visit = f"오늘:{today_count},어제:{yesterday_count},최대:{visit_max},전체:{visit_total}"
+
+
+def save_visits(db: Session, visits: List[dict]) -> int:
+    """버퍼에 쌓인 방문자 이력을 한번에 저장합니다.
+    - 같은 날 이미 기록된 IP는 제외합니다.
+
+    Returns:
+        int: 새로 저장한 방문자 이력 수
+    """
+    # 버퍼 내 중복 제거
+    unique_visits = {}
+    for visit in visits:
+        unique_visits.setdefault((visit["vi_date"], visit["vi_ip"]), visit)
+
+    # 이미 기록된 IP 제외 (날짜별로 IN 조회)
+    date_ips = {}
+    for visit_date, ip in unique_visits:
+        date_ips.setdefault(visit_date, set()).add(ip)
+    for visit_date, ips in date_ips.items():
+        exists_ips = db.scalars(
+            select(Visit.vi_ip).where(Visit.vi_date == visit_date, Visit.vi_ip.in_(ips))
+        ).all()
+        for ip in exists_ips:
+            unique_visits.pop((visit_date, ip), None)
+
+    if not unique_visits:
+        return 0
+
+    rows = []
+    date_counts = {}
+    for visit in unique_visits.values():
+        browser, os, device = parse_user_agent(visit["vi_agent"])
+        rows.append({**visit, "vi_browser": browser, "vi_os": os, "vi_device": device})
+        date_counts[visit["vi_date"]] = date_counts.get(visit["vi_date"], 0) + 1
+
+    db.execute(insert(Visit), rows)
+    increase_visit_count(db, date_counts)
+    db.commit()
+    return len(rows)
+
+
+class VisitBuffer:
+    """
+    방문자 이력 버퍼
+    - 응답 후 미들웨어에서는 방문자 이력을 메모리에 추가만 하고,
+      워커마다 실행되는 백그라운드 작업이 주기적으로 한번에 저장합니다.
+    """
+
+    def __init__(self, flush_interval: int = VISIT_FLUSH_INTERVAL, max_size: int = VISIT_BUFFER_MAX_SIZE):
+        self.flush_interval = flush_interval
+        self.max_size = max_size
+        self.dropped = 0  # 버퍼가 가득 차 버린 방문자 이력 수 (누적)
+        self._dropped_unlogged = 0  # 아직 로그로 남기지 않은 버린 이력 수
+        self._visits = deque()
+        self._seen = set()  # 현재 프로세스에서 오늘 이미 버퍼에 추가한 (날짜, IP)
+        self._seen_date = None
+        self._lock = threading.Lock()
+        self._task = None
+
+    def push(self, visit_data: dict) -> None:
+        """방문자 이력을 버퍼에 추가합니다.
+        - 버퍼가 가득 차면 이력을 버리고 개수를 기록합니다. (다음 저장 주기에 로그로 남김)
+        """
+        key = (visit_data["vi_date"], visit_data["vi_ip"])
+        with self._lock:
+            if self._seen_date != visit_data["vi_date"]:
+                self._seen.clear()
+                self._seen_date = visit_data["vi_date"]
+            if key in self._seen:
+                return
+            if len(self._visits) >= self.max_size:
+                # 같은 IP의 다음 방문은 다시 기록할 수 있도록 _seen에는 추가하지 않음
+                self._drop(1)
+                return
+            self._seen.add(key)
+            self._visits.append(visit_data)
+
+    def _drop(self, count: int) -> None:
+        """버린 방문자 이력 수를 기록합니다. (_lock 안에서 호출)"""
+        if not self._dropped_unlogged:
+            logger.warning(f"방문자 이력 버퍼가 가득 찼습니다. (최대 {self.max_size}건)")
+        self.dropped += count
+        self._dropped_unlogged += count
+
+    def _requeue(self, visits: List[dict]) -> None:
+        """저장에 실패한 방문자 이력을 버퍼 앞쪽에 다시 넣습니다.
+        - 버퍼의 남은 공간만큼만 넣고, 넣지 못한 이력은 버립니다.
+        """
+        with self._lock:
+            space = max(self.max_size - len(self._visits), 0)
+            requeued, dropped = visits[:space], visits[space:]
+            self._visits.extendleft(reversed(requeued))
+            for visit in dropped:
+                self._seen.discard((visit["vi_date"], visit["vi_ip"]))
+            if dropped:
+                self._drop(len(dropped))
+
+    def flush(self) -> int:
+        """버퍼의 방문자 이력을 DB에 저장합니다.
+
+        Returns:
+            int: 새로 저장한 방문자 이력 수
+        """
+        with self._lock:
+            visits = list(self._visits)
+            self._visits.clear()
+            dropped, self._dropped_unlogged = self._dropped_unlogged, 0
+        if dropped:
+            logger.warning(f"방문자 이력 버퍼가 가득 차 {dropped}건을 저장하지 못했습니다. (누적 {self.dropped}건)")
+        if not visits:
+            return 0
+
+        try:
+            with DBConnect().sessionLocal() as db:
+                count = save_visits(db, visits)
+        except Exception as e:
+            logger.error(f"방문자 이력 저장 실패: {e}")
+            # 다음 주기에 다시 저장
+            self._requeue(visits)
+            return 0
+        return count
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await run_in_threadpool(self.flush)
+
+    def start(self) -> None:
+        """백그라운드 저장 작업을 시작합니다. (앱 시작시)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """백그라운드 저장 작업을 중지하고 남은 이력을 저장합니다. (앱 종료시)"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await run_in_threadpool(self.flush)
+
+
+visit_buffer = VisitBuffer()
@@ -0,0 +1,109 @@
+"""
+댓글 목록 구성 테스트
+- 댓글 목록을 1회의 쿼리로 조회하고, 댓글마다 부모글을 조회하지 않는지 확인합니다.
+- 비밀댓글 내용 표시 여부와 수정/삭제/답변 권한을 확인합니다.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from conftest import create_write_board, write_values
+from service.board.comment_thread import SECRET_COMMENT_CONTENT, CommentThreadBuilder
+
+BO_TABLE = "commentthread"
+
+
+@pytest.fixture
+def db():
+    engine, write_model = create_write_board(BO_TABLE)
+
+    session = sessionmaker(bind=engine)()
+    session.add(write_model(**write_values(wr_id=1, wr_num=-1, wr_parent=1, wr_is_comment=0, mb_id="writer")))
+    comments = [
+        # (wr_id, mb_id, wr_comment_reply, wr_option)
+        (2, "user", "", ""),
+        (3, "user", "AAAAA", "secret"),
+        (4, "other", "A", "secret"),
+        (5, "", "", "secret"),
+    ]
+    for wr_id, mb_id, reply, option in comments:
+        session.add(write_model(**write_values(
+            wr_id=wr_id, wr_num=-1, wr_parent=1, wr_is_comment=1, wr_comment=wr_id,
+            wr_comment_reply=reply, wr_option=option, mb_id=mb_id,
+            wr_name=f"이름{wr_id}", wr_content=f"내용{wr_id}", wr_ip="127.0.0.1")))
+    session.commit()
+
+    yield session, engine, write_model
+    session.close()
+
+
+def make_service(db, write_model, mb_id=None, admin_type=None, session=None):
+    config = SimpleNamespace(cf_cut_name=2)
+    request = SimpleNamespace(state=SimpleNamespace(config=config), session=session or {})
+    return SimpleNamespace(
+        request=request,
+        db=db,
+        write_model=write_model,
+        bo_table=BO_TABLE,
+        board=SimpleNamespace(bo_comment_level=2),
+        member=SimpleNamespace(mb_id=mb_id, admin_type=admin_type, level=2 if mb_id else 1),
+        get_display_ip=lambda ip: ip,
+        get_member_image_path=lambda mb_id: f"/image/{mb_id}",
+        get_member_icon_path=lambda mb_id: f"/icon/{mb_id}",
+    )
+
+
+def test_build_thread_single_query(db, query_counter):
+    """댓글 목록을 1회 쿼리로 조회 (부모글 조회 없음)"""
+    session, engine, write_model = db
+    parent = session.get(write_model, 1)
+    counter = query_counter(engine)
+
+    comments = CommentThreadBuilder(make_service(session, write_model, "user")).build_thread(parent)
+
+    assert counter.count == 1
+    assert [comment.wr_id for comment in comments] == [2, 3, 4, 5]
+    assert comments[0].name == "이름"
+    assert comments[0].mb_image_path == "/image/user"
+
+
+def test_secret_comment_content(db):
+    """비밀댓글은 관리자, 댓글 작성자, 원글 작성자, 세션 확인시에만 내용 표시"""
+    session, _, write_model = db
+    parent = session.get(write_model, 1)
+
+    def secret_ids(**kwargs):
+        builder = CommentThreadBuilder(make_service(session, write_model, **kwargs))
+        return [comment.wr_id for comment in builder.build_thread(parent) if comment.is_secret_content]
+
+    assert secret_ids() == [3, 4, 5]
+    assert secret_ids(mb_id="user") == [4, 5]
+    assert secret_ids(mb_id="writer") == []
+    assert secret_ids(mb_id="admin", admin_type="super") == []
+    assert secret_ids(session={f"ss_secret_comment_{BO_TABLE}_5": True}) == [3, 4]
+
+    comment = CommentThreadBuilder(make_service(session, write_model)).build_thread(parent)[2]
+    assert comment.save_content == SECRET_COMMENT_CONTENT
+    assert comment.wr_content == "내용4"
+
+
+def test_comment_permissions(db):
+    """수정/삭제/답변 권한"""
+    session, _, write_model = db
+    parent = session.get(write_model, 1)
+
+    comments = CommentThreadBuilder(make_service(session, write_model, "user")).build_thread(parent)
+    assert [comment.is_edit for comment in comments] == [True, True, False, False]
+    # 비회원 댓글은 비밀번호 확인 후 삭제
+    assert [comment.is_del for comment in comments] == [True, True, False, True]
+    # 대댓글 최대 깊이
+    assert [comment.is_reply for comment in comments] == [True, False, True, True]
+
+    guest_comments = CommentThreadBuilder(make_service(session, write_model)).build_thread(parent)
+    assert not any(comment.is_reply for comment in guest_comments)
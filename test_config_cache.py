@@ -0,0 +1,105 @@
+"""
+기본환경설정 프로세스 캐시 테스트
+- 캐시된 설정은 다시 조회하지 않고, 무효화하면 DB에서 다시 조회하는지 확인합니다.
+- 다른 워커가 버전 파일을 갱신하거나 캐시 디렉토리가 삭제되면 다시 조회하는지 확인합니다.
+- 설치 전(설정 없음)에는 캐시하지 않는지 확인합니다.
+"""
+
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.models import Config
+from lib import config_cache
+from lib.config_cache import get_cached_config, invalidate_config_cache
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    engine = create_engine("sqlite://")
+    Config.__table__.create(bind=engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as db:
+        db.add(Config(cf_id=1, cf_title="first"))
+        db.commit()
+
+    monkeypatch.setattr(config_cache, "DBConnect", lambda: SimpleNamespace(sessionLocal=factory))
+    config_cache.cache_config.clear()
+    yield engine
+    config_cache.cache_config.clear()
+
+
+def set_title(engine, title):
+    with engine.begin() as connection:
+        connection.execute(update(Config).values(cf_title=title))
+
+
+def test_cached_config_without_query(engine, query_counter):
+    """캐시된 설정은 DB를 다시 조회하지 않음"""
+    counter = query_counter(engine)
+
+    config = get_cached_config()
+    assert config.cf_title == "first"
+    assert counter.count == 1
+
+    assert get_cached_config() is config
+    assert counter.count == 1
+
+
+def test_invalidate_reloads(engine):
+    """무효화하면 변경된 설정을 다시 조회"""
+    assert get_cached_config().cf_title == "first"
+    set_title(engine, "second")
+    assert get_cached_config().cf_title == "first"
+
+    invalidate_config_cache()
+
+    assert os.path.exists(config_cache.CONFIG_VERSION_FILE_PATH)
+    assert get_cached_config().cf_title == "second"
+
+
+def test_other_worker_version_change(engine):
+    """다른 워커가 버전 파일을 갱신하면 다시 조회"""
+    invalidate_config_cache()
+    assert get_cached_config().cf_title == "first"
+    set_title(engine, "second")
+
+    # 다른 워커의 invalidate_config_cache() (현재 프로세스의 캐시는 그대로)
+    version = config_cache.get_config_version()
+    os.utime(config_cache.CONFIG_VERSION_FILE_PATH, ns=(time.time_ns(), version + 1_000_000))
+    assert get_cached_config().cf_title == "second"
+
+    # 캐시 디렉토리 삭제(관리자 캐시파일 일괄삭제)도 버전 변경으로 처리
+    set_title(engine, "third")
+    os.remove(config_cache.CONFIG_VERSION_FILE_PATH)
+    assert config_cache.get_config_version() == 0
+    assert get_cached_config().cf_title == "third"
+
+
+def test_detached_config(engine):
+    """반환된 설정을 변경해도 DB에 반영되지 않음"""
+    config = get_cached_config()
+    config.cf_title = "changed"
+
+    with sessionmaker(bind=engine)() as db:
+        assert db.scalar(select(Config.cf_title)) == "first"
+
+
+def test_not_installed_not_cached(engine, query_counter):
+    """설정이 없으면(설치 전) None을 반환하고 캐시하지 않음"""
+    with engine.begin() as connection:
+        connection.execute(Config.__table__.delete())
+    counter = query_counter(engine)
+
+    assert get_cached_config() is None
+    assert get_cached_config() is None
+    assert counter.count == 2
+    assert "config" not in config_cache.cache_config
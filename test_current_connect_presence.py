@@ -0,0 +1,111 @@
+"""
+현재 접속자 일괄 저장 테스트
+- 워커 메모리에 기록된 접속 정보가 IP별로 한번에 저장(갱신/추가)되는지 확인합니다.
+- 여러 워커가 같은 IP를 저장해도 1건만 남는지 확인합니다.
+- 접속 유지시간이 지난 정보가 삭제되는지 확인합니다.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.models import Login
+from service.current_connect_service import (
+    PresenceTable, _upsert_presences, delete_expired_connects, save_presences
+)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Login.__table__.create(bind=engine)
+
+    session = sessionmaker(bind=engine)()
+    session.add(Login(lo_ip="10.0.0.1", mb_id="", lo_datetime=datetime.now() - timedelta(minutes=3),
+                      lo_location="/", lo_url="/"))
+    session.add(Login(lo_ip="10.0.0.9", mb_id="old", lo_datetime=datetime.now() - timedelta(hours=1),
+                      lo_location="/", lo_url="/"))
+    session.commit()
+
+    yield session
+    session.close()
+
+
+def fetch_logins(db):
+    db.expire_all()
+    return {login.lo_ip: login for login in db.scalars(select(Login)).all()}
+
+
+def test_save_presences(db):
+    """기존 IP는 갱신, 새 IP는 추가"""
+    now = datetime.now()
+    save_presences(db, {
+        "10.0.0.1": ("member1", "/bbs/board/free", now),
+        "10.0.0.2": ("", "/", now),
+    })
+
+    logins = fetch_logins(db)
+    assert len(logins) == 3
+    assert logins["10.0.0.1"].mb_id == "member1"
+    assert logins["10.0.0.1"].lo_url == "/bbs/board/free"
+    assert logins["10.0.0.2"].lo_datetime == now
+
+
+def test_save_presences_keeps_newer(db):
+    """다른 워커가 더 최근에 저장한 정보는 덮어쓰지 않음"""
+    save_presences(db, {"10.0.0.1": ("member1", "/old", datetime.now() - timedelta(minutes=5))})
+
+    assert fetch_logins(db)["10.0.0.1"].mb_id == ""
+
+
+def test_save_presences_from_workers(tmp_path):
+    """여러 워커가 같은 새 IP를 저장해도 1건만 남고 최근 정보가 유지됨"""
+    engine = create_engine(f"sqlite:///{tmp_path}/login.db")
+    Login.__table__.create(bind=engine)
+    factory = sessionmaker(bind=engine)
+    now = datetime.now()
+
+    with factory() as worker1, factory() as worker2:
+        save_presences(worker1, {"10.0.0.5": ("member1", "/new", now)})
+        save_presences(worker2, {"10.0.0.5": ("member2", "/old", now - timedelta(seconds=3))})
+        save_presences(worker2, {"10.0.0.5": ("member2", "/newer", now + timedelta(seconds=3))})
+
+    with factory() as session:
+        logins = session.scalars(select(Login)).all()
+        assert [(login.mb_id, login.lo_url) for login in logins] == [("member2", "/newer")]
+
+
+def test_upsert_mysql():
+    """MySQL은 ON DUPLICATE KEY UPDATE로 저장하고 접속 시간을 마지막에 갱신"""
+    db = SimpleNamespace(bind=SimpleNamespace(dialect=mysql.dialect()))
+    sql = str(_upsert_presences(db, [{"lo_ip": "10.0.0.1", "mb_id": "", "lo_datetime": datetime.now(),
+                                      "lo_location": "/", "lo_url": "/"}]).compile(dialect=mysql.dialect()))
+
+    assert "ON DUPLICATE KEY UPDATE" in sql
+    assert sql.rstrip().split("ON DUPLICATE KEY UPDATE")[1].strip().split(", ")[-1].startswith("lo_datetime")
+
+
+def test_delete_expired_connects(db):
+    """접속 유지시간이 지난 정보 삭제"""
+    assert delete_expired_connects(db, 10) == 1
+    assert list(fetch_logins(db)) == ["10.0.0.1"]
+
+
+def test_presence_touch_overwrites():
+    """같은 IP의 접속 정보는 최근 정보로 덮어씀"""
+    presence_table = PresenceTable()
+    presence_table.touch("10.0.0.1", "", "/")
+    presence_table.touch("10.0.0.1", "member1", "/bbs/board/free")
+    presence_table.touch("10.0.0.2", None, "/")
+
+    assert len(presence_table._presences) == 2
+    assert presence_table._presences["10.0.0.1"][:2] == ("member1", "/bbs/board/free")
+    assert presence_table._presences["10.0.0.2"][0] == ""
@@ -0,0 +1,143 @@
+"""
+게시글 조회수 일괄 반영 테스트
+- 워커 메모리에 모은 조회수 증가량이 `wr_hit = wr_hit + n` 쿼리로 반영되는지 확인합니다.
+- 조회수 중복 확인 기록이 워커(ReadDedupeStore 객체)간에 공유되는지 확인합니다.
+- 조회수 중복 확인 기록을 이벤트 루프가 아닌 스레드 풀에서 기록하는지 확인합니다.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from conftest import create_write_board, write_values
+from lib.common import dynamic_create_write_table
+from service import hit_counter_service
+from service.board import read_post
+from service.board.read_post import ReadPostService
+from service.hit_counter_service import READ_DEDUPE_PATH, HitCounter, ReadDedupeStore, save_hits
+
+BO_TABLE = "hit_test"
+
+
+@pytest.fixture
+def session_factory(monkeypatch):
+    engine, write_model = create_write_board(BO_TABLE)
+    factory = sessionmaker(bind=engine)
+
+    with factory() as session:
+        for wr_id in (1, 2):
+            session.add(write_model(**write_values(wr_id=wr_id, wr_subject="제목", wr_content="내용", wr_hit=10)))
+        session.commit()
+
+    monkeypatch.setattr(hit_counter_service, "DBConnect", lambda: SimpleNamespace(sessionLocal=factory))
+    return factory
+
+
+def fetch_hits(session_factory):
+    write_model = dynamic_create_write_table(BO_TABLE)
+    with session_factory() as session:
+        return dict(session.execute(select(write_model.wr_id, write_model.wr_hit)).all())
+
+
+def test_save_hits_adds_deltas(session_factory):
+    """조회수 증가량을 현재 값에 더한다."""
+    with session_factory() as session:
+        assert save_hits(session, {(BO_TABLE, 1): 3, (BO_TABLE, 2): 1}) == 2
+        save_hits(session, {(BO_TABLE, 1): 2})
+
+    assert fetch_hits(session_factory) == {1: 15, 2: 11}
+
+
+def test_hit_counters_from_workers_are_not_lost(session_factory):
+    """여러 워커의 증가량을 각각 반영해도 누락되지 않는다."""
+    workers = [HitCounter(), HitCounter()]
+    for worker in workers:
+        for _ in range(5):
+            worker.increment(BO_TABLE, 1)
+    assert workers[0].pending(BO_TABLE, 1) == 5
+
+    for worker in workers:
+        assert worker.flush() == 1
+        assert worker.pending(BO_TABLE, 1) == 0
+        assert worker.flush() == 0
+
+    assert fetch_hits(session_factory)[1] == 20
+
+
+def test_read_dedupe_shared_between_workers(tmp_path):
+    """같은 파일을 사용하는 다른 워커에서도 중복으로 판단한다."""
+    path = str(tmp_path / "read_dedupe.sqlite3")
+    worker1 = ReadDedupeStore(path, window=60)
+    worker2 = ReadDedupeStore(path, window=60)
+
+    assert worker1.first_hit("1.1.1.1:free:1") is True
+    assert worker2.first_hit("1.1.1.1:free:1") is False
+    assert worker2.first_hit("1.1.1.1:free:2") is True
+
+    worker1.close()
+    worker2.close()
+
+
+def test_read_dedupe_reopens_deleted_file(tmp_path):
+    """파일이 삭제되면(캐시 일괄삭제 등) 기존 워커도 새 파일을 열어 다른 워커와 공유한다."""
+    path = str(tmp_path / "read_dedupe.sqlite3")
+    worker1 = ReadDedupeStore(path, window=60)
+    assert worker1.first_hit("1.1.1.1:free:1") is True
+
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+    worker2 = ReadDedupeStore(path, window=60)
+    assert worker2.first_hit("1.1.1.1:free:2") is True
+    assert worker1.first_hit("1.1.1.1:free:2") is False
+    assert worker1.first_hit("1.1.1.1:free:1") is True
+    assert worker2.first_hit("1.1.1.1:free:1") is False
+
+    worker1.close()
+    worker2.close()
+
+
+def test_read_dedupe_outside_cache_directory():
+    """캐시 일괄삭제(data/cache)와 공개 경로(/data)에 포함되지 않는 위치에 저장한다."""
+    path = os.path.normpath(READ_DEDUPE_PATH)
+    assert not path.startswith(os.path.join("data", ""))
+
+
+def test_read_dedupe_window_expires(tmp_path):
+    """중복 확인 기간이 지나면 다시 조회수를 증가시킨다."""
+    store = ReadDedupeStore(str(tmp_path / "read_dedupe.sqlite3"), window=0)
+
+    assert store.first_hit("1.1.1.1:free:1") is True
+    assert store.first_hit("1.1.1.1:free:1") is True
+    assert store.cleanup(force=True) == 1
+    store.close()
+
+
+def test_read_dedupe_off_event_loop(monkeypatch):
+    """API 글 조회시 중복 확인 기록은 스레드 풀에서 실행한다."""
+    threads = []
+
+    class RecordingStore:
+        def first_hit(self, key):
+            threads.append((key, threading.current_thread()))
+            return False
+
+    monkeypatch.setattr(read_post, "read_dedupe", RecordingStore())
+    service = ReadPostService.__new__(ReadPostService)
+    service.request = SimpleNamespace(headers={}, client=SimpleNamespace(host="1.1.1.1"))
+    service.bo_table, service.wr_id = BO_TABLE, 1
+
+    asyncio.run(service.validate_repeat_with_slowapi())
+
+    [(key, thread)] = threads
+    assert key == f"1.1.1.1:{BO_TABLE}:1"
+    assert thread is not threading.main_thread()
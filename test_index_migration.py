@@ -0,0 +1,155 @@
+"""
+테이블/인덱스 마이그레이션 테스트
+- 기존 설치본에 없는 모델 테이블을 생성하고, 기존 데이터로 채워야 하는 테이블은 채우는지 확인합니다.
+- 기존 설치본(인덱스가 없는 테이블)에 모델에 선언된 인덱스를 생성하는지 확인합니다.
+- 게시판 write_* 테이블의 인덱스도 생성하는지 확인합니다.
+- 같은 컬럼의 인덱스가 이미 있으면 생성하지 않는지 확인합니다.
+- 유니크 인덱스는 중복 데이터를 정리한 뒤 생성하고, 생성에 실패한 인덱스가 있어도 나머지를 생성하는지 확인합니다.
+"""
+
+import os
+import sys
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, insert, inspect, select, text
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.models import (
+    Base, Board, BoardNew, Login, MailQueue, Point, PointExpire, Scrap, SearchIndexToken, Visit
+)
+from lib.common import dynamic_create_write_table
+from lib.index_migration import migrate_indexes, migrate_tables
+
+BO_TABLE = "indexmigration"
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    write_model = dynamic_create_write_table(BO_TABLE)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(insert(Board).values(bo_table=BO_TABLE, gr_id="community", bo_subject="테스트"))
+
+    # 인덱스가 추가되기 전의 기존 설치본
+    missing = {
+        Point.__tablename__: "idx_point_rel",
+        BoardNew.__tablename__: "idx_board_new_write",
+        Login.__tablename__: "idx_login_ip",
+        Visit.__tablename__: "idx_visit_date_ip",
+        Scrap.__tablename__: "idx_scrap_member_write",
+        write_model.__tablename__: f"idx_wr_parent_comment_{BO_TABLE}",
+    }
+    with engine.begin() as connection:
+        for name in missing.values():
+            connection.execute(text(f"DROP INDEX {name}"))
+    yield engine, missing
+    engine.dispose()
+
+
+def index_names(engine, table_name):
+    return {index["name"] for index in inspect(engine).get_indexes(table_name)}
+
+
+def test_migrate_tables(engine):
+    """없는 테이블만 생성하고, 만료 예정 포인트는 기존 포인트 내역으로 채움"""
+    engine, _ = engine
+    expire_date = date.today() + timedelta(days=10)
+    tables = (MailQueue.__table__, PointExpire.__table__, SearchIndexToken.__table__)
+    for table in tables:
+        table.drop(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(insert(Point).values(mb_id="user", po_point=100, po_use_point=0,
+                                                po_expire_date=expire_date, po_datetime=datetime.now()))
+
+    expected = sorted(table.name for table in tables)
+    assert sorted(migrate_tables(engine, dry_run=True)) == expected
+    assert sorted(migrate_tables(engine)) == expected
+    assert migrate_tables(engine) == []
+
+    assert index_names(engine, MailQueue.__tablename__) == {index.name for index in MailQueue.__table__.indexes}
+    with engine.connect() as connection:
+        assert connection.execute(select(PointExpire.mb_id, PointExpire.pe_point)).all() == [("user", 100)]
+
+
+def test_migrate_indexes(engine):
+    """없는 인덱스만 생성하고, 다시 실행하면 생성하지 않음"""
+    engine, missing = engine
+    expected = sorted(f"{table}.{name}" for table, name in missing.items())
+
+    assert sorted(migrate_indexes(engine, dry_run=True)) == expected
+    assert all(name not in index_names(engine, table) for table, name in missing.items())
+
+    assert sorted(migrate_indexes(engine)) == expected
+    assert all(name in index_names(engine, table) for table, name in missing.items())
+    assert migrate_indexes(engine) == []
+
+
+def test_skip_equivalent_index(engine):
+    """같은 컬럼으로 시작하는 인덱스가 있으면 생성하지 않음"""
+    engine, _ = engine
+    with engine.begin() as connection:
+        connection.execute(text(
+            f"CREATE INDEX legacy_scrap ON {Scrap.__tablename__} (mb_id, bo_table, wr_id, ms_datetime)"))
+
+    names = migrate_indexes(engine)
+
+    assert f"{Scrap.__tablename__}.idx_scrap_member_write" not in names
+    assert "idx_scrap_member_write" not in index_names(engine, Scrap.__tablename__)
+
+
+def test_unique_index_removes_duplicates(engine):
+    """유니크 인덱스는 같은 컬럼의 일반 인덱스가 있어도 중복 데이터를 정리한 뒤 생성"""
+    engine, _ = engine
+    now = datetime.now()
+    with engine.begin() as connection:
+        connection.execute(text(f"CREATE INDEX idx_login_ip ON {Login.__tablename__} (lo_ip)"))
+        connection.execute(insert(Login), [
+            {"lo_ip": "10.0.0.1", "mb_id": "older", "lo_datetime": now - timedelta(minutes=1),
+             "lo_location": "/", "lo_url": "/"},
+            {"lo_ip": "10.0.0.1", "mb_id": "newer", "lo_datetime": now, "lo_location": "/", "lo_url": "/"},
+        ])
+
+    assert f"{Login.__tablename__}.idx_login_ip" in migrate_indexes(engine)
+
+    indexes = {index["name"]: index for index in inspect(engine).get_indexes(Login.__tablename__)}
+    assert indexes["idx_login_ip"]["unique"]
+    with engine.connect() as connection:
+        assert connection.execute(text(f"SELECT mb_id FROM {Login.__tablename__}")).scalars().all() == ["newer"]
+
+
+def test_continue_after_failure(engine, monkeypatch):
+    """인덱스 생성에 실패해도 나머지 인덱스를 생성"""
+    engine, missing = engine
+    from lib import index_migration
+    create_index_online = index_migration.create_index_online
+
+    def fail_login(operations, index):
+        if index.table.name == Login.__tablename__:
+            raise RuntimeError("failed")
+        create_index_online(operations, index)
+
+    monkeypatch.setattr(index_migration, "create_index_online", fail_login)
+
+    names = migrate_indexes(engine)
+
+    assert f"{Login.__tablename__}.idx_login_ip" not in names
+    assert len(names) == len(missing) - 1
+
+
+def test_continue_after_table_failure(engine, monkeypatch):
+    """테이블 생성에 실패해도 나머지 테이블을 생성"""
+    engine, _ = engine
+    from lib import index_migration
+    for table in (MailQueue.__table__, PointExpire.__table__):
+        table.drop(bind=engine)
+
+    def fail(db):
+        raise RuntimeError("failed")
+
+    monkeypatch.setitem(index_migration.TABLE_CREATORS, PointExpire.__tablename__, fail)
+
+    assert migrate_tables(engine) == [MailQueue.__tablename__]
+    assert not inspect(engine).has_table(PointExpire.__tablename__)
@@ -0,0 +1,82 @@
+"""
+접근허용/차단 IP 목록 검사 테스트
+- 미리 컴파일한 IPMatcher가 기존 정규식 방식과 같은 결과를 반환하는지 확인합니다.
+- CIDR 범위와 목록별 캐시를 확인합니다.
+"""
+
+import os
+import re
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from lib.ip_matcher import IPMatcher, get_ip_matcher
+
+
+def legacy_match(ip_list: str, current_ip: str) -> bool:
+    """기존 check_ip_list 의 목록 검사 방식"""
+    for pattern in ip_list.strip().split("\n"):
+        pattern = pattern.strip()
+        if not pattern:
+            continue
+        pattern = pattern.replace(".", r"\.")
+        pattern = pattern.replace("+", r"[0-9\.]+")
+        if re.match(f"^{pattern}$", current_ip):
+            return True
+    return False
+
+
+IP_LIST = "\n".join([
+    "123.123.123.123",
+    " 10.0.+ ",
+    "192.168.1.1+",
+    "172.16.+.1",
+    "",
+    "1.2.3.[45]",
+    "::1",
+])
+
+IPS = [
+    "123.123.123.123", "123.123.123.12", "123.123.123.1234",
+    "10.0.0.1", "10.0.", "10.0", "10.01.0.1", "10.0.255.255",
+    "192.168.1.1", "192.168.1.10", "192.168.1.199", "192.168.1.2",
+    "172.16.0.1", "172.16.0.2", "172.16.1.2.1",
+    "1.2.3.4", "1.2.3.5", "1.2.3.6",
+    "::1", "::2", "fe80::1", "",
+]
+
+
+@pytest.mark.parametrize("ip", IPS)
+def test_same_result_as_legacy_regex(ip):
+    """기존 정규식 방식과 결과가 같다."""
+    assert IPMatcher(IP_LIST).match(ip) == legacy_match(IP_LIST, ip)
+
+
+def test_cidr_ranges():
+    """CIDR 범위(IPv4, IPv6)를 검사한다."""
+    matcher = IPMatcher("192.168.0.0/16\n10.1.2.3/32\n2001:db8::/32\n8.8.8.8/24")
+
+    assert matcher.match("192.168.10.20")
+    assert not matcher.match("192.169.0.1")
+    assert matcher.match("10.1.2.3")
+    assert not matcher.match("10.1.2.4")
+    assert matcher.match("2001:db8::1")
+    assert not matcher.match("2001:db9::1")
+    # strict=False: 호스트 비트가 있어도 네트워크로 처리
+    assert matcher.match("8.8.8.1")
+    assert not matcher.match("not-an-ip")
+
+
+def test_empty_list():
+    """공백만 있는 목록은 비어있는 것으로 판단한다."""
+    assert not IPMatcher(" \n \n")
+    assert IPMatcher("1.1.1.1")
+
+
+def test_matcher_is_cached_per_list():
+    """같은 목록은 같은 객체를, 변경된 목록은 새 객체를 사용한다."""
+    first = get_ip_matcher("1.1.1.1")
+    assert get_ip_matcher("1.1.1.1") is first
+    assert get_ip_matcher("1.1.1.2") is not first
@@ -0,0 +1,82 @@
+"""
+레이아웃 데이터 캐시 테스트
+- 메뉴 트리를 1회의 쿼리로 구성하는지 확인합니다.
+- 캐시 적중/실패 통계와 버전 파일을 통한 무효화를 확인합니다.
+"""
+
+import os
+import sys
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.models import Menu, Poll, Popular
+from lib import layout_cache
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    engine = create_engine("sqlite://")
+    for table in (Menu.__table__, Poll.__table__, Popular.__table__):
+        table.create(bind=engine)
+
+    session_factory = sessionmaker(bind=engine)
+    with session_factory() as session:
+        for no, code in enumerate(["10", "20", "1010", "1020", "2010", "101010"]):
+            session.add(Menu(me_code=code, me_name=f"menu{code}", me_order=no))
+        # 날짜 컬럼의 기본값(func.now())은 SQLite Date 타입으로 읽을 수 없으므로 날짜를 지정
+        today = date.today()
+        session.add(Poll(po_subject="poll1", po_use=1, po_date=today))
+        session.add(Poll(po_subject="poll2", po_use=0, po_date=today))
+        for word, day in [("python", 0), ("python", 1), ("sui", 2), ("old", 10)]:
+            session.add(Popular(pp_word=word, pp_date=today - timedelta(days=day), pp_ip="127.0.0.1"))
+        session.commit()
+
+    # 레이아웃 캐시가 테스트 DB를 사용하도록 설정
+    monkeypatch.setattr(layout_cache, "DBConnect", lambda: type("DB", (), {"sessionLocal": session_factory}))
+    monkeypatch.setattr(layout_cache, "LAYOUT_VERSION_FILE_PATH", str(tmp_path / "layout_version.txt"))
+    layout_cache.invalidate_layout_cache()
+    return engine
+
+
+def test_menu_tree_single_query(engine, query_counter):
+    """메뉴 트리를 1회 쿼리로 구성"""
+    counter = query_counter(engine)
+    menus = layout_cache.get_cached_menus()
+
+    assert counter.count == 1
+    assert [menu.me_code for menu in menus] == ["10", "20"]
+    assert [sub.me_code for sub in menus[0].sub] == ["1010", "1020"]
+    assert [sub.me_code for sub in menus[1].sub] == ["2010"]
+
+
+def test_cache_hit(engine, query_counter):
+    """두 번째 조회부터는 캐시 사용"""
+    layout_cache.get_layout_data()
+    counter = query_counter(engine)
+    data = layout_cache.get_layout_data()
+
+    assert counter.count == 0
+    assert data["poll"].po_subject == "poll1"
+    assert [(row.pp_word, row.count) for row in data["populars"]] == [("python", 2), ("sui", 1)]
+    stats = {stat["name"]: stat for stat in layout_cache.get_layout_cache_stats()}
+    assert stats["menus"]["hits"] >= 1
+    assert stats["poll"]["misses"] >= 1
+
+
+def test_invalidate_from_other_worker(engine, query_counter):
+    """버전 파일이 변경되면 다시 조회"""
+    layout_cache.get_cached_latest_poll()
+
+    # 다른 워커에서 무효화 (버전 파일만 변경)
+    with open(layout_cache.LAYOUT_VERSION_FILE_PATH, "w", encoding="utf-8") as f:
+        f.write("other")
+    os.utime(layout_cache.LAYOUT_VERSION_FILE_PATH, ns=(0, 1))
+
+    counter = query_counter(engine)
+    layout_cache.get_cached_latest_poll()
+    assert counter.count == 1
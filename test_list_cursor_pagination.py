@@ -0,0 +1,133 @@
+"""
+게시글 목록 커서(keyset) 페이지네이션 테스트
+- 커서를 따라 조회한 목록이 OFFSET 방식으로 조회한 목록과 같은지 확인합니다.
+- 커서에 담긴 목록의 위치(글 번호, 현재 페이지 계산용)가 OFFSET 방식과 같은지 확인합니다.
+- 전체 게시글 수가 캐시되어 반복 조회시 COUNT 쿼리를 실행하지 않는지 확인합니다.
+"""
+
+import base64
+import json
+import os
+import sys
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from conftest import create_write_board, write_values
+from lib.board_lib import (
+    cache_list_count, decode_list_cursor, delete_list_count_cache, encode_list_cursor
+)
+from service.board.list_post import ListPostService
+
+BO_TABLE = "cursortest"
+PAGE_ROWS = 7
+
+
+@pytest.fixture
+def service():
+    engine, write_model = create_write_board(BO_TABLE)
+
+    session = sessionmaker(bind=engine)()
+    wr_id = 0
+    for num in range(1, 11):
+        # 원글 1개와 답변글 2개
+        for reply in ("", "A", "B"):
+            wr_id += 1
+            session.add(write_model(**write_values(wr_id=wr_id, wr_num=-num, wr_reply=reply,
+                                                   wr_parent=wr_id, wr_is_comment=0)))
+    session.commit()
+
+    instance = ListPostService.__new__(ListPostService)
+    instance.db = session
+    instance.bo_table = BO_TABLE
+    instance.write_model = write_model
+    instance.is_default_sort = True
+    instance.is_search = False
+    instance.prev_cursor = None
+    instance.next_cursor = None
+    instance.query = (select().where(write_model.wr_is_comment == 0)
+                      .order_by(write_model.wr_num, write_model.wr_reply))
+    cache_list_count.clear()
+    yield instance, engine
+    session.close()
+
+
+def test_cursor_round_trip():
+    """커서 인코딩/디코딩"""
+    cursor = encode_list_cursor(-3, "A", "next", 14)
+    assert decode_list_cursor(cursor) == (-3, "A", "next", 14)
+    assert decode_list_cursor("invalid!") is None
+    assert decode_list_cursor(encode_list_cursor(-3, "A", "sideways")) is None
+
+
+def test_cursor_pages_match_offset_pages(service):
+    """커서로 조회한 목록과 OFFSET으로 조회한 목록이 동일"""
+    instance, _ = service
+    model = instance.write_model
+    expected = instance.db.scalars(instance.query.add_columns(model)).all()
+
+    pages = []
+    writes = instance.db.scalars(instance.query.add_columns(model).limit(PAGE_ROWS)).all()
+    instance.set_cursors(writes, has_prev=False, has_next=True, offset=0, page_rows=PAGE_ROWS)
+    pages.extend(writes)
+    while instance.next_cursor:
+        writes, _ = instance.get_writes_by_cursor(instance.next_cursor, PAGE_ROWS)
+        pages.extend(writes)
+    assert [w.wr_id for w in pages] == [w.wr_id for w in expected]
+
+    # 마지막 목록에서 이전 커서로 돌아가면 직전 목록과 동일
+    last_page, _ = instance.get_writes_by_cursor(
+        encode_list_cursor(expected[-1].wr_num, expected[-1].wr_reply, "prev"), PAGE_ROWS)
+    assert [w.wr_id for w in last_page] == [w.wr_id for w in expected[-PAGE_ROWS - 1:-1]]
+
+
+def test_cursor_offset_matches_page_offset(service):
+    """커서로 조회한 목록의 위치가 OFFSET 방식의 위치와 동일하고 COUNT 쿼리를 실행하지 않음"""
+    instance, engine = service
+    model = instance.write_model
+    writes = instance.db.scalars(instance.query.add_columns(model).limit(PAGE_ROWS)).all()
+    instance.set_cursors(writes, has_prev=False, has_next=True, offset=0, page_rows=PAGE_ROWS)
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    expected = 0
+    while instance.next_cursor:
+        writes, offset = instance.get_writes_by_cursor(instance.next_cursor, PAGE_ROWS)
+        expected += PAGE_ROWS
+        assert offset == expected
+
+    # 이전 커서로 돌아가도 위치가 동일
+    writes, offset = instance.get_writes_by_cursor(instance.prev_cursor, PAGE_ROWS)
+    assert offset == expected - PAGE_ROWS
+    while instance.prev_cursor:
+        writes, offset = instance.get_writes_by_cursor(instance.prev_cursor, PAGE_ROWS)
+    assert offset == 0
+
+    assert statements
+    assert not [s for s in statements if "count(" in s.lower()]
+
+
+def test_legacy_cursor_without_offset():
+    """위치가 없는 이전 형식의 커서는 위치 0으로 해석"""
+    data = json.dumps({"n": -3, "r": "A", "d": "prev"}).encode("utf-8")
+    cursor = base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+    assert decode_list_cursor(cursor) == (-3, "A", "prev", 0)
+
+
+def test_total_count_cached(service):
+    """전체 게시글 수는 캐시되어 COUNT 쿼리를 반복하지 않음"""
+    instance, engine = service
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    assert instance.get_total_count() == 30
+    assert instance.get_total_count() == 30
+    assert len(statements) == 1
+
+    delete_list_count_cache(BO_TABLE)
+    assert instance.get_total_count() == 30
+    assert len(statements) == 2
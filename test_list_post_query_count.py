@@ -0,0 +1,113 @@
+"""
+게시글 목록 부가정보 일괄 조회 쿼리 수 테스트
+- ListPostService로 목록 한 페이지를 조회할 때 게시글 수와 관계없이 쿼리 수가 일정한지 확인합니다.
+- 일괄 조회 결과가 게시글별 조회 결과와 같은지 확인합니다.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+from starlette.requests import Request
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from conftest import create_write_board, write_values
+from core.models import Board, BoardFile, BoardGood, Config, ThumbnailManifest
+from lib.board_lib import cache_list_count
+from service import thumbnail_service
+from service.ajax import AJAXService
+from service.board.list_post import ListPostService
+from service.board_file_service import BoardFileService
+
+BO_TABLE = "querycount"
+PAGE_ROWS = 20
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    # 이미지 없음 섬네일은 임시 경로에 생성
+    monkeypatch.setattr(thumbnail_service, "DUMMY_THUMBNAIL_PATH", str(tmp_path / "thumbnail_tmp"))
+    monkeypatch.setattr(thumbnail_service, "_dummy_thumbnails", {})
+    engine, write_model = create_write_board(BO_TABLE, Board.__table__, BoardFile.__table__,
+                                             BoardGood.__table__, ThumbnailManifest.__table__)
+
+    session = sessionmaker(bind=engine)()
+    session.add(Board(bo_table=BO_TABLE, gr_id="community", bo_subject="query count",
+                      bo_list_level=1, bo_page_rows=PAGE_ROWS, bo_mobile_page_rows=PAGE_ROWS))
+    for wr_id in range(1, PAGE_ROWS + 1):
+        session.add(write_model(**write_values(wr_id=wr_id, wr_num=-wr_id, wr_parent=wr_id, wr_is_comment=0)))
+        for no in range(3):
+            session.add(write_model(**write_values(wr_id=1000 + wr_id * 10 + no, wr_num=-wr_id, wr_parent=wr_id,
+                                                   wr_is_comment=1, wr_comment=no, wr_comment_reply="")))
+            session.add(BoardFile(bo_table=BO_TABLE, wr_id=wr_id, bf_no=no,
+                                  bf_source=f"file{no}.jpg", bf_content=""))
+        session.add(BoardGood(bo_table=BO_TABLE, wr_id=wr_id, mb_id="a", bg_flag="good"))
+        session.add(BoardGood(bo_table=BO_TABLE, wr_id=wr_id, mb_id="b", bg_flag="nogood"))
+    session.commit()
+
+    yield session, engine, write_model
+    session.close()
+
+
+def make_request():
+    config = SimpleNamespace(cf_image_extension="gif|jpg|jpeg|png")
+    return SimpleNamespace(state=SimpleNamespace(config=config))
+
+
+def make_list_service(session):
+    """실제 ListPostService (기본 정렬의 일반 목록)"""
+    request = Request({"type": "http", "method": "GET", "path": f"/board/{BO_TABLE}",
+                       "query_string": b"", "headers": [], "session": {}})
+    request.state.config = Config(cf_image_extension="gif|jpg|jpeg|png", cf_cut_name=15,
+                                  cf_new_rows=0, cf_search_part=10000)
+    request.state.is_mobile = False
+    request.state.login_member = None
+    # common_search_query_params의 기본값
+    search_params = {"sst": "", "sod": "and", "sfl": "wr_subject||wr_content", "stx": "", "sca": "",
+                     "current_page": 1}
+    return ListPostService(request, session, BO_TABLE, BoardFileService(request, session), search_params)
+
+
+def count_page_queries(session, engine, query_counter, per_page: int) -> int:
+    """목록 한 페이지(게시글 + 부가정보)를 조회하는 쿼리 수"""
+    cache_list_count.clear()
+    service = make_list_service(session)
+    counter = query_counter(engine)
+    writes = service.get_writes(page=1, per_page=per_page)
+
+    assert len(writes) == per_page
+    assert all([c.wr_comment for c in write.comments] == [0, 1, 2] for write in writes)
+    assert all((write.good, write.nogood) == (1, 1) for write in writes)
+    assert all(len(write.board_files) == 3 and write.icon_file for write in writes)
+    return counter.count
+
+
+def test_list_page_query_count_constant(db, query_counter):
+    """목록 한 페이지의 쿼리 수는 게시글 수와 관계없이 일정"""
+    session, engine, _ = db
+
+    small = count_page_queries(session, engine, query_counter, 2)
+    large = count_page_queries(session, engine, query_counter, PAGE_ROWS)
+
+    assert small == large
+
+
+def test_batched_results_match_per_row(db):
+    """일괄 조회 결과가 게시글별 조회 결과와 동일"""
+    session, _, _ = db
+    request = make_request()
+    file_service = BoardFileService(request, session)
+    ajax_service = AJAXService(request, session)
+    wr_ids = list(range(1, PAGE_ROWS + 1))
+
+    files_map = file_service.get_board_files_map(BO_TABLE, wr_ids)
+    good_map = ajax_service.get_ajax_good_data_map(BO_TABLE, wr_ids)
+
+    for wr_id in wr_ids:
+        write = SimpleNamespace(wr_id=wr_id)
+        assert good_map[wr_id] == ajax_service.get_ajax_good_data(BO_TABLE, write)
+        assert (file_service.split_board_files_by_type(files_map[wr_id])
+                == file_service.get_board_files_by_type(BO_TABLE, wr_id))
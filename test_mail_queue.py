@@ -0,0 +1,219 @@
+"""
+메일 발송 대기열 테스트
+- 실제 SMTP 서버 대신 받은 메일을 기록하는 로컬 SMTP 서버(SMTPSink)를 사용합니다.
+- 대기중인 메일을 하나의 SMTP 연결로 발송하는지 확인합니다.
+- 발송 실패시 재시도 대기/실패 처리를 확인합니다.
+- 인증 정보가 있으면 STARTTLS 없이 로그인하지 않는지 확인합니다.
+"""
+
+import os
+import socketserver
+import sys
+import threading
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.models import MailQueue
+from service import mail_queue_service
+from service.mail_queue_service import (
+    MAIL_MAX_ATTEMPTS, SMTPMailSender, enqueue_mail, enqueue_mails, process_mail_queue
+)
+
+
+class _SMTPSinkHandler(socketserver.StreamRequestHandler):
+    """SMTP 명령에 응답하고 받은 메일을 기록하는 최소한의 SMTP 서버"""
+
+    def reply(self, line: str):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        sink = self.server.sink
+        sink.connections += 1
+        self.reply("220 sink ready")
+        mail_from, rcpt_to = None, []
+        while True:
+            line = self.rfile.readline().decode().rstrip("\r\n")
+            if not line:
+                return
+            command = line[:4].upper()
+            if command in ("EHLO", "HELO"):
+                self.reply("250-sink")
+                self.reply("250 AUTH PLAIN")
+            elif command == "AUTH":
+                sink.logins += 1
+                self.reply("235 Authentication successful")
+            elif command == "MAIL":
+                mail_from, rcpt_to = line.split(":", 1)[1].strip(" <>"), []
+                self.reply("250 OK")
+            elif command == "RCPT":
+                address = line.split(":", 1)[1].strip(" <>")
+                if address in sink.refused:
+                    self.reply("550 No such user")
+                    continue
+                rcpt_to.append(address)
+                self.reply("250 OK")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                data = []
+                while True:
+                    data_line = self.rfile.readline().decode()
+                    if data_line.rstrip("\r\n") == ".":
+                        break
+                    data.append(data_line)
+                sink.messages.append((mail_from, rcpt_to, "".join(data)))
+                self.reply("250 OK")
+            elif command in ("RSET", "NOOP"):
+                self.reply("250 OK")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+
+class SMTPSink:
+    """로컬 SMTP 서버 (테스트용)"""
+
+    def __init__(self):
+        self.messages = []
+        self.refused = set()
+        self.connections = 0
+        self.logins = 0
+        self.server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _SMTPSinkHandler)
+        self.server.daemon_threads = True
+        self.server.sink = self
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def smtp_sink():
+    sink = SMTPSink()
+    yield sink
+    sink.close()
+
+
+@pytest.fixture
+def sender(smtp_sink):
+    mail_sender = SMTPMailSender(host="127.0.0.1", port=smtp_sink.port, username="", password="")
+    yield mail_sender
+    mail_sender.close()
+
+
+@pytest.fixture
+def session_factory(monkeypatch):
+    engine = create_engine("sqlite://")
+    MailQueue.__table__.create(bind=engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(mail_queue_service, "DBConnect",
+                        lambda: SimpleNamespace(sessionLocal=factory, engine=engine))
+    return factory
+
+
+def fetch_mails(session_factory):
+    with session_factory() as db:
+        return {mail.mq_to_email: mail for mail in db.scalars(select(MailQueue)).all()}
+
+
+def test_enqueue_mails_splits_recipients(session_factory):
+    """,로 구분된 받는 사람은 각각 등록"""
+    with session_factory() as db:
+        count = enqueue_mails(db, [
+            {"from_email": "admin@test.com", "to_email": "a@test.com, b@test.com", "subject": "제목", "body": "내용"},
+            {"from_email": "admin@test.com", "to_email": "", "subject": "제목", "body": "내용"},
+        ])
+
+    assert count == 2
+    mails = fetch_mails(session_factory)
+    assert set(mails) == {"a@test.com", "b@test.com"}
+    assert all(mail.mq_status == "pending" for mail in mails.values())
+
+
+def test_process_mail_queue_reuses_connection(session_factory, smtp_sink, sender):
+    """대기중인 메일을 하나의 SMTP 연결로 발송"""
+    with session_factory() as db:
+        for index in range(5):
+            enqueue_mail(db, "admin@test.com", f"user{index}@test.com", "제목", "<p>내용</p>", "관리자")
+
+    assert process_mail_queue(sender=sender) == 5
+    assert process_mail_queue(sender=sender) == 0
+
+    assert smtp_sink.connections == 1
+    assert sorted(rcpt[0] for _, rcpt, _ in smtp_sink.messages) == [f"user{i}@test.com" for i in range(5)]
+    mails = fetch_mails(session_factory)
+    assert all(mail.mq_status == "sent" and mail.mq_sent_datetime for mail in mails.values())
+
+
+def test_refused_recipient_fails_without_retry(session_factory, smtp_sink, sender):
+    """받는 사람이 거부되면 재시도하지 않고 실패 처리, 나머지 메일은 발송"""
+    smtp_sink.refused.add("nobody@test.com")
+    with session_factory() as db:
+        enqueue_mail(db, "admin@test.com", "nobody@test.com", "제목", "내용")
+        enqueue_mail(db, "admin@test.com", "user@test.com", "제목", "내용")
+
+    assert process_mail_queue(sender=sender) == 1
+
+    mails = fetch_mails(session_factory)
+    assert mails["nobody@test.com"].mq_status == "failed"
+    assert mails["user@test.com"].mq_status == "sent"
+
+
+def test_connection_error_retries_with_backoff(session_factory, smtp_sink):
+    """SMTP 서버에 연결할 수 없으면 다음 재시도 시간으로 미루고, 최대 시도 횟수를 넘으면 실패 처리"""
+    port = smtp_sink.port
+    smtp_sink.close()
+    sender = SMTPMailSender(host="127.0.0.1", port=port, username="", password="", timeout=1)
+    with session_factory() as db:
+        enqueue_mail(db, "admin@test.com", "user@test.com", "제목", "내용")
+
+    assert process_mail_queue(sender=sender) == 0
+    mail = fetch_mails(session_factory)["user@test.com"]
+    assert mail.mq_status == "pending"
+    assert mail.mq_attempts == 1
+    assert mail.mq_next_datetime > datetime.now() + timedelta(seconds=30)
+
+    # 재시도 시간이 되기 전에는 발송하지 않음
+    assert process_mail_queue(sender=sender) == 0
+    assert fetch_mails(session_factory)["user@test.com"].mq_attempts == 1
+
+    with session_factory() as db:
+        mail = db.scalar(select(MailQueue))
+        mail.mq_attempts = MAIL_MAX_ATTEMPTS - 1
+        mail.mq_next_datetime = datetime.now()
+        db.commit()
+
+    process_mail_queue(sender=sender)
+    assert fetch_mails(session_factory)["user@test.com"].mq_status == "failed"
+
+
+def test_login_requires_starttls(session_factory, smtp_sink):
+    """인증 정보가 있는데 STARTTLS를 지원하지 않으면 로그인하지 않고 재시도 대기"""
+    sender = SMTPMailSender(host="127.0.0.1", port=smtp_sink.port, username="user", password="secret")
+    with session_factory() as db:
+        enqueue_mail(db, "admin@test.com", "user@test.com", "제목", "내용")
+
+    assert process_mail_queue(sender=sender) == 0
+    assert smtp_sink.logins == 0
+    assert smtp_sink.messages == []
+    assert fetch_mails(session_factory)["user@test.com"].mq_status == "pending"
+
+    # 평문 인증을 허용하면 로그인 후 발송
+    plain_sender = SMTPMailSender(host="127.0.0.1", port=smtp_sink.port, username="user",
+                                  password="secret", allow_plain_auth=True)
+    with session_factory() as db:
+        db.scalar(select(MailQueue)).mq_next_datetime = datetime.now()
+        db.commit()
+    assert process_mail_queue(sender=plain_sender) == 1
+    assert smtp_sink.logins == 1
+    plain_sender.close()
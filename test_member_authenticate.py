@@ -0,0 +1,65 @@
+"""
+회원 로그인 테스트
+- 이전 설정으로 생성된 비밀번호 해시를 로그인시 현재 설정으로 갱신하는지 확인합니다.
+- 탈퇴/차단된 회원은 비밀번호 해시를 갱신하지 않는지 확인합니다.
+"""
+
+import asyncio
+import base64
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.exception import AlertException
+from core.models import Member
+from lib.pbkdf2 import needs_upgrade, pbkdf2_default, validate_password
+from service.member_service import MemberService
+
+SALT = "c2FsdA=="
+# 반복 횟수가 적은 이전 설정의 해시
+LEGACY_HASH = f"sha256:1000:{SALT}:{base64.b64encode(pbkdf2_default('sha256', 'password', SALT, 1000, 24)).decode()}"
+
+
+@pytest.fixture
+def service():
+    engine = create_engine("sqlite://")
+    Member.__table__.create(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        Member(mb_id="user", mb_password=LEGACY_HASH),
+        Member(mb_id="blocked", mb_password=LEGACY_HASH, mb_intercept_date="20240101"),
+    ])
+    session.commit()
+
+    config = SimpleNamespace(cf_use_email_certify=0)
+    yield MemberService(SimpleNamespace(state=SimpleNamespace(config=config)), session)
+    session.close()
+
+
+def fetch_password(service, mb_id):
+    return service.db.scalar(select(Member.mb_password).where(Member.mb_id == mb_id))
+
+
+def test_upgrade_hash_on_login(service):
+    """로그인에 성공하면 비밀번호 해시를 현재 설정으로 갱신"""
+    asyncio.run(service.authenticate_member_async("user", "password"))
+
+    mb_password = fetch_password(service, "user")
+    assert not needs_upgrade(mb_password)
+    assert validate_password("password", mb_password)
+
+
+def test_blocked_member_keeps_hash(service):
+    """차단된 회원은 로그인하지 못하고 비밀번호 해시도 갱신하지 않음"""
+    with pytest.raises(AlertException):
+        service.authenticate_member("blocked", "password")
+    with pytest.raises(AlertException):
+        asyncio.run(service.authenticate_member_async("blocked", "password"))
+
+    assert fetch_password(service, "blocked") == LEGACY_HASH
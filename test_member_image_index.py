@@ -0,0 +1,75 @@
+"""
+회원 아이콘/이미지 경로 색인 테스트
+- glob() 없이 색인에서 이미지 경로를 조회하는지 확인합니다.
+- 다른 워커에서 변경된 디렉토리가 확인 주기마다 다시 반영되는지 확인합니다.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from service.member_service import MemberImageIndex
+
+
+def save_image(directory, mb_id, ext="gif"):
+    sub_directory = os.path.join(directory, mb_id[:2])
+    os.makedirs(sub_directory, exist_ok=True)
+    path = os.path.join(sub_directory, f"{mb_id}.{ext}")
+    with open(path, "wb") as f:
+        f.write(b"GIF89a")
+    return path
+
+
+def remove_images(directory, mb_id):
+    sub_directory = os.path.join(directory, mb_id[:2])
+    for name in os.listdir(sub_directory):
+        if name.startswith(f"{mb_id}."):
+            os.remove(os.path.join(sub_directory, name))
+
+
+@pytest.fixture
+def image_dir(tmp_path):
+    directory = str(tmp_path / "member")
+    os.makedirs(directory)
+    return directory
+
+
+def test_lookup(image_dir):
+    """색인 생성 후 회원별 경로 조회"""
+    path = save_image(image_dir, "admin")
+    save_image(image_dir, "adminer", "png")
+    index = MemberImageIndex(image_dir)
+
+    assert index.get("admin").startswith(f"/{path}?")
+    assert index.get("adminer").split("?")[0].endswith("adminer.png")
+    assert index.get("nobody") is None
+
+
+def test_update(image_dir):
+    """이미지 변경시 해당 디렉토리만 다시 읽음"""
+    index = MemberImageIndex(image_dir, check_interval=3600)
+    assert index.get("tester") is None
+
+    save_image(image_dir, "tester")
+    index.update("tester")
+    assert index.get("tester").split("?")[0].endswith("tester.gif")
+
+    remove_images(image_dir, "tester")
+    index.update("tester")
+    assert index.get("tester") is None
+
+
+def test_refresh_by_directory_mtime(image_dir):
+    """다른 워커에서 변경된 디렉토리는 확인 주기마다 반영"""
+    save_image(image_dir, "user1")
+    index = MemberImageIndex(image_dir, check_interval=0)
+    assert index.get("user2") is None
+
+    save_image(image_dir, "user2")
+    assert index.get("user2") is not None
+
+    remove_images(image_dir, "user1")
+    assert index.get("user1") is None
@@ -0,0 +1,89 @@
+"""
+비밀번호 해시(PBKDF2) 호환성 및 벤치마크
+- hashlib.pbkdf2_hmac 결과가 기존 순수 파이썬 구현과 바이트 단위로 같은지 확인합니다.
+- 기존 구현과 hashlib 구현의 실행 시간을 비교합니다.
+- 측정 결과는 record_property로 기록됩니다. (pytest --junitxml 사용시 확인 가능)
+"""
+
+import asyncio
+import base64
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from lib.pbkdf2 import (
+    PBKDF2_COMPAT_HASH_BYTES, PBKDF2_COMPAT_ITERATIONS, create_hash, needs_upgrade,
+    pbkdf2_default, pbkdf2_python, validate_password, validate_password_async
+)
+
+ROUNDS = 5
+
+
+@pytest.mark.parametrize("algo", ["sha1", "sha256", "sha512"])
+@pytest.mark.parametrize("key_length", [20, 24, 64, 100])
+def test_same_as_python_implementation(algo, key_length):
+    """hashlib 구현과 기존 구현의 결과가 같음"""
+    salt = base64.b64encode(os.urandom(24)).decode("utf-8")
+    assert (pbkdf2_default(algo, "비밀번호", salt, 1000, key_length)
+            == pbkdf2_python(algo, "비밀번호", salt, 1000, key_length))
+
+
+def test_validate_legacy_hash():
+    """기존 구현으로 생성한 해시 검증"""
+    salt = base64.b64encode(os.urandom(24)).decode("utf-8")
+    legacy = pbkdf2_python("sha256", "password", salt, PBKDF2_COMPAT_ITERATIONS, PBKDF2_COMPAT_HASH_BYTES)
+    hash = f"sha256:{PBKDF2_COMPAT_ITERATIONS}:{salt}:{base64.b64encode(legacy).decode('utf-8')}"
+
+    assert validate_password("password", hash)
+    assert not validate_password("wrong", hash)
+
+
+def test_validate_password_async():
+    """스레드 풀에서 비밀번호 검증"""
+    hash = create_hash("password")
+
+    async def run():
+        return await asyncio.gather(
+            validate_password_async("password", hash),
+            validate_password_async("wrong", hash),
+        )
+
+    assert asyncio.run(run()) == [True, False]
+
+
+def test_needs_upgrade():
+    """현재 설정과 다른 해시는 갱신 대상"""
+    salt = "c2FsdA=="
+    weak = base64.b64encode(pbkdf2_default("sha256", "pw", salt, 1000, 24)).decode("utf-8")
+    sha1 = base64.b64encode(pbkdf2_default("sha1", "pw", salt, PBKDF2_COMPAT_ITERATIONS, 24)).decode("utf-8")
+
+    assert not needs_upgrade(create_hash("pw"))
+    assert needs_upgrade(f"sha256:1000:{salt}:{weak}")
+    assert needs_upgrade(f"sha1:{PBKDF2_COMPAT_ITERATIONS}:{salt}:{sha1}")
+    assert needs_upgrade("*2470C0C06DEE42FD1618BB99005ADCA2EC9D1E19")
+
+
+def test_pbkdf2_benchmark(record_property):
+    """hashlib 구현이 기존 구현보다 빠름"""
+    salt = base64.b64encode(os.urandom(24)).decode("utf-8")
+    args = ("sha256", "password", salt, PBKDF2_COMPAT_ITERATIONS, PBKDF2_COMPAT_HASH_BYTES)
+
+    def measure(func):
+        started = time.perf_counter()
+        for _ in range(ROUNDS):
+            result = func(*args)
+        return result, (time.perf_counter() - started) / ROUNDS
+
+    legacy_result, legacy_time = measure(pbkdf2_python)
+    native_result, native_time = measure(pbkdf2_default)
+
+    record_property("legacy_seconds", round(legacy_time, 5))
+    record_property("native_seconds", round(native_time, 5))
+    print(f"\nlegacy: {legacy_time * 1000:.2f}ms, native: {native_time * 1000:.2f}ms")
+
+    assert native_result == legacy_result
+    assert native_time < legacy_time
@@ -0,0 +1,173 @@
+"""
+포인트 잔액/만료 예정 포인트 테스트
+- 포인트 적립시 전체 포인트 내역을 합산(SUM)하지 않고 회원 포인트 잔액에 더하는지 확인합니다.
+- 만료 예정 포인트가 적립/사용/삭제에 맞게 유지되고, 스케줄러 작업으로 소멸되는지 확인합니다.
+"""
+
+import os
+import sys
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, event, select, update
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.models import Member, Point, PointExpire
+from service import point_service
+from service.member_service import MemberService
+from service.point_service import (
+    PointService, create_point_expire_table, delete_member_points, expire_points
+)
+
+
+@pytest.fixture
+def session_factory(monkeypatch):
+    engine = create_engine("sqlite://")
+    for table in (Member.__table__, Point.__table__, PointExpire.__table__):
+        table.create(bind=engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as db:
+        db.add(Member(mb_id="user", mb_point=0))
+        db.commit()
+
+    monkeypatch.setattr(point_service, "DBConnect", lambda: SimpleNamespace(sessionLocal=factory, engine=engine))
+    return factory
+
+
+def make_service(db, point_term=0):
+    config = SimpleNamespace(cf_use_point=1, cf_point_term=point_term)
+    request = SimpleNamespace(state=SimpleNamespace(config=config))
+    return PointService(request, db, MemberService(request, db))
+
+
+def fetch_buckets(db):
+    return {row.pe_expire_date: row.pe_point for row in db.scalars(select(PointExpire)).all()}
+
+
+def test_save_point_without_sum(session_factory):
+    """포인트 적립시 포인트 내역을 합산하지 않고 잔액에 더함"""
+    with session_factory() as db:
+        service = make_service(db)
+        for no in range(3):
+            service.save_point("user", 100, "적립", "@test", "user", f"save-{no}")
+        service.save_point("user", -50, "사용", "@test", "user", "use")
+
+        statements = []
+        event.listen(db.get_bind(), "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        service.save_point("user", 10, "적립", "@test", "user", "save-last")
+
+        assert not any("sum(" in statement.lower() for statement in statements)
+        points = db.scalars(select(Point).order_by(Point.po_id)).all()
+        assert [point.po_mb_point for point in points] == [100, 200, 300, 250, 260]
+        assert service.get_total_point("user") == 260
+
+
+def test_expire_buckets(session_factory):
+    """만료 예정 포인트 유지 및 소멸"""
+    with session_factory() as db:
+        service = make_service(db, point_term=30)
+        service.save_point("user", 100, "적립", "@test", "user", "a")
+        service.save_point("user", 50, "적립", "@test", "user", "b", expire=1)
+        today = date.today()
+        assert fetch_buckets(db) == {today + timedelta(days=29): 100, today: 50}
+
+        # 사용한 포인트는 만료일이 빠른 내역부터 차감
+        service.insert_use_point("user", 70)
+        db.commit()
+        assert fetch_buckets(db) == {today + timedelta(days=29): 80, today: 0}
+
+        # 만료일 당일까지는 소멸하지 않음
+        assert expire_points(db, today) == 0
+        assert service.get_total_point("user") == 150
+
+        assert expire_points(db, today + timedelta(days=30)) == 1
+        expired = db.scalar(select(Point).where(Point.po_rel_table == "@expire"))
+        assert expired.po_point == -80
+        assert expired.po_mb_point == 70
+        assert service.get_total_point("user") == 70
+        assert fetch_buckets(db) == {}
+        assert all(point.po_expired == 1 for point in db.scalars(select(Point)).all())
+
+
+def test_spend_then_expire(session_factory):
+    """사용한 포인트는 소멸하지 않고, 소멸 내역 삭제시 소멸한 포인트만 되살림"""
+    with session_factory() as db:
+        service = make_service(db, point_term=30)
+        service.save_point("user", 100, "적립", "@test", "user", "a")
+        service.save_point("user", -30, "사용", "@test", "user", "use")
+        today = date.today()
+        assert fetch_buckets(db) == {today + timedelta(days=29): 70}
+
+        assert expire_points(db, today + timedelta(days=30)) == 1
+        expired = db.scalar(select(Point).where(Point.po_rel_table == "@expire"))
+        assert expired.po_point == -70
+        assert service.get_total_point("user") == 0
+
+        service.delete_point_row(expired)
+        assert service.get_total_point("user") == 70
+        assert sum(fetch_buckets(db).values()) == 70
+        earned = db.scalar(select(Point).where(Point.po_rel_action == "a"))
+        assert (earned.po_use_point, earned.po_expired) == (30, 0)
+
+
+def test_delete_point_updates_balance(session_factory):
+    """포인트 내역 삭제시 이후 내역, 회원 포인트, 만료 예정 포인트에 반영"""
+    with session_factory() as db:
+        service = make_service(db, point_term=30)
+        service.save_point("user", 100, "적립", "@test", "user", "a")
+        service.save_point("user", 30, "적립", "@test", "user", "b")
+
+        assert service.delete_point("user", "@test", "user", "a") is True
+        assert service.delete_point("user", "@test", "user", "a") is False
+
+        point = db.scalar(select(Point))
+        assert point.po_mb_point == 30
+        assert service.get_total_point("user") == 30
+        assert sum(fetch_buckets(db).values()) == 30
+
+
+def test_deleted_member_not_expired(session_factory):
+    """삭제된 회원은 만료 예정 포인트가 남아 있어도 포인트를 소멸시키지 않음"""
+    with session_factory() as db:
+        service = make_service(db, point_term=30)
+        service.save_point("user", 100, "적립", "@test", "user", "a")
+        db.add(Member(mb_id="deleted", mb_point=0))
+        db.commit()
+        service.save_point("deleted", 100, "적립", "@test", "deleted", "a")
+
+        # 회원 삭제 (관리자)
+        delete_member_points(db, "deleted")
+        db.execute(update(Member).where(Member.mb_id == "deleted").values(mb_point=0))
+        db.commit()
+        assert db.scalar(select(PointExpire.mb_id).where(PointExpire.mb_id == "deleted")) is None
+
+        # 삭제 전부터 남아 있던 만료 예정 포인트
+        point_service.add_expire_point(db, "deleted", date.today(), 100)
+        db.commit()
+
+        assert expire_points(db, date.today() + timedelta(days=30)) == 2
+        assert service.get_total_point("deleted") == 0
+        assert db.scalar(select(Point).where(Point.mb_id == "deleted")) is None
+        assert service.get_total_point("user") == 0
+        assert fetch_buckets(db) == {}
+
+
+def test_fill_buckets_for_existing_points(session_factory):
+    """테이블 생성시(마이그레이션) 기존 포인트 내역으로 만료 예정 포인트를 채움"""
+    expire_date = date.today() + timedelta(days=10)
+    with session_factory() as db:
+        PointExpire.__table__.drop(bind=db.get_bind())
+        db.add_all([
+            Point(mb_id="user", po_point=100, po_use_point=40, po_expire_date=expire_date),
+            Point(mb_id="user", po_point=100, po_use_point=0, po_expired=1, po_expire_date=expire_date),
+            Point(mb_id="user", po_point=100, po_use_point=0, po_expire_date=date(9999, 12, 31)),
+        ])
+        db.commit()
+        create_point_expire_table(db)
+
+    with session_factory() as db:
+        assert fetch_buckets(db) == {expire_date: 60}
@@ -0,0 +1,140 @@
+"""
+이전글/다음글 조회 테스트 및 벤치마크
+- 이전글/다음글을 1회의 쿼리로 조회하는지 확인합니다.
+- 기존 방식(최대 4회 쿼리)과 같은 게시글을 반환하는지 확인합니다.
+- PREV_NEXT_BENCHMARK_ROWS 환경변수를 지정하면 (예: 1000000)
+  해당 건수의 게시판에서 두 방식의 실행 시간을 비교합니다. (record_property로 기록)
+"""
+
+import os
+import random
+import sys
+import time
+
+import pytest
+from sqlalchemy import asc, create_engine, desc, insert, select
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from conftest import create_write_board, write_values
+from lib.common import dynamic_create_write_table
+from service.board.read_post import fetch_prev_next
+
+BO_TABLE = "prevnext"
+BENCHMARK_ROWS = int(os.environ.get("PREV_NEXT_BENCHMARK_ROWS", "0"))
+
+
+def legacy_prev_next(db, write_model, write, sca=None, sfl=None, stx=None):
+    """기존 방식 (같은 wr_num 내에서 조회 후, 없으면 이전/다음 wr_num에서 조회)
+    - 결과 비교를 위해 다른 wr_num에서 조회할 때도 wr_reply 순서로 정렬한다.
+    """
+    query = select(write_model).where(write_model.wr_is_comment == 0)
+    if sca:
+        query = query.where(write_model.ca_name == sca)
+    if sfl and stx:
+        query = query.where(getattr(write_model, sfl).like(f"%{stx}%"))
+    prev = db.scalar(query.where(write_model.wr_num == write.wr_num, write_model.wr_reply < write.wr_reply)
+                     .order_by(desc(write_model.wr_reply)))
+    if not prev:
+        prev = db.scalar(query.where(write_model.wr_num < write.wr_num)
+                         .order_by(desc(write_model.wr_num), desc(write_model.wr_reply)))
+    next = db.scalar(query.where(write_model.wr_num == write.wr_num, write_model.wr_reply > write.wr_reply)
+                     .order_by(asc(write_model.wr_reply)))
+    if not next:
+        next = db.scalar(query.where(write_model.wr_num > write.wr_num)
+                         .order_by(asc(write_model.wr_num), asc(write_model.wr_reply)))
+    return prev, next
+
+
+def seed(engine, write_model, rows: int):
+    """rows건의 게시글(원글 1건, 답글 2건, 댓글 1건씩 반복)을 생성한다."""
+    categories = ["공지", "자유", "질문"]
+    random.seed(0)
+    batch = []
+    with engine.begin() as conn:
+        for wr_id in range(1, rows + 1):
+            thread = (wr_id + 3) // 4
+            position = (wr_id - 1) % 4
+            batch.append(write_values(
+                wr_id=wr_id,
+                wr_num=-thread,
+                wr_reply="" if position == 0 else "A" * position,
+                wr_parent=wr_id,
+                wr_is_comment=1 if position == 3 else 0,
+                ca_name=random.choice(categories),
+                wr_subject=f"제목 {wr_id} {random.choice(['python', 'fastapi', 'sui'])}",
+                wr_content="내용",
+            ))
+            if len(batch) >= 10000:
+                conn.execute(insert(write_model.__table__), batch)
+                batch = []
+        if batch:
+            conn.execute(insert(write_model.__table__), batch)
+
+
+@pytest.fixture(scope="module")
+def board():
+    engine, write_model = create_write_board(BO_TABLE)
+    seed(engine, write_model, 200)
+    session = sessionmaker(bind=engine)()
+    yield session, engine, write_model
+    session.close()
+
+
+def test_single_query(board, query_counter):
+    """이전글/다음글을 1회 쿼리로 조회"""
+    db, engine, write_model = board
+    write = db.get(write_model, 50)
+    counter = query_counter(engine)
+
+    prev, next = fetch_prev_next(db, write_model, write.wr_num, write.wr_reply)
+
+    assert counter.count == 1
+    assert (prev.wr_id, next.wr_id) == (49, 51)
+
+
+@pytest.mark.parametrize("filters", [
+    {},
+    {"sca": "자유"},
+    {"sfl": "wr_subject", "stx": "python"},
+    {"sca": "질문", "sfl": "wr_subject", "stx": "sui"},
+])
+def test_same_as_legacy(board, filters):
+    """기존 방식과 같은 게시글을 반환"""
+    db, _, write_model = board
+    for wr_id in (1, 2, 3, 5, 50, 101, 198, 199):
+        write = db.get(write_model, wr_id)
+        prev, next = fetch_prev_next(db, write_model, write.wr_num, write.wr_reply, **filters)
+        legacy_prev, legacy_next = legacy_prev_next(db, write_model, write, **filters)
+
+        assert getattr(prev, "wr_id", None) == getattr(legacy_prev, "wr_id", None)
+        assert getattr(next, "wr_id", None) == getattr(legacy_next, "wr_id", None)
+
+
+@pytest.mark.skipif(not BENCHMARK_ROWS, reason="PREV_NEXT_BENCHMARK_ROWS 환경변수 지정시 실행")
+def test_prev_next_benchmark(tmp_path, record_property):
+    """기존 방식과 1회 쿼리 방식의 실행 시간 비교"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'benchmark.db'}")
+    write_model = dynamic_create_write_table(BO_TABLE)
+    write_model.__table__.create(bind=engine)
+    seed(engine, write_model, BENCHMARK_ROWS)
+
+    db = sessionmaker(bind=engine)()
+    targets = [db.get(write_model, wr_id) for wr_id in random.sample(range(1, BENCHMARK_ROWS + 1), 20)]
+    filters = {"sfl": "wr_subject", "stx": "fastapi"}
+
+    start = time.perf_counter()
+    for write in targets:
+        legacy_prev_next(db, write_model, write, **filters)
+    legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for write in targets:
+        fetch_prev_next(db, write_model, write.wr_num, write.wr_reply, **filters)
+    single = time.perf_counter() - start
+    db.close()
+
+    record_property("legacy_seconds", round(legacy, 4))
+    record_property("single_query_seconds", round(single, 4))
+    print(f"\n{BENCHMARK_ROWS} rows, 20 lookups: legacy {legacy:.4f}s, single query {single:.4f}s")
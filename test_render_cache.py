@@ -0,0 +1,88 @@
+"""
+렌더링 캐시 테스트
+- 메모리/파일 캐시 적중과 태그 단위 무효화를 확인합니다.
+- 다른 워커(프로세스)의 무효화가 버전 파일로 전달되는지 확인합니다.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from lib import render_cache
+from lib.render_cache import RenderCache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(render_cache, "RENDER_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_memory_and_file_hit(cache_dir):
+    """저장한 HTML을 메모리, 파일 순서로 조회"""
+    cache = RenderCache("latest")
+    assert cache.get("free", "pc-basic-10-40") is None
+
+    cache.set("free", "pc-basic-10-40", "<ul>free</ul>")
+    assert cache.get("free", "pc-basic-10-40") == "<ul>free</ul>"
+
+    # 다른 워커는 파일 캐시를 사용
+    other = RenderCache("latest")
+    assert other.get("free", "pc-basic-10-40") == "<ul>free</ul>"
+
+    assert cache.stats()["memory_hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert other.stats()["file_hits"] == 1
+
+
+def test_invalidate_tag(cache_dir):
+    """태그 무효화시 해당 태그의 캐시만 만료"""
+    cache = RenderCache("latest")
+    cache.set("free", "pc", "free")
+    cache.set("notice", "pc", "notice")
+
+    cache.invalidate("free")
+
+    assert cache.get("free", "pc") is None
+    assert cache.get("notice", "pc") == "notice"
+
+
+def test_invalidate_from_other_worker(cache_dir):
+    """다른 워커의 무효화도 메모리 캐시에 반영"""
+    cache = RenderCache("latest")
+    other = RenderCache("latest")
+    cache.set("free", "pc", "old")
+    assert cache.get("free", "pc") == "old"
+
+    other.invalidate("free")
+    assert cache.get("free", "pc") is None
+
+    cache.set("free", "pc", "new")
+    assert other.get("free", "pc") == "new"
+
+
+def test_clear(cache_dir):
+    """전체 무효화"""
+    cache = RenderCache("latest")
+    cache.set("free", "pc", "free")
+    cache.set("notice", "mobile", "notice")
+
+    RenderCache("latest").clear()
+
+    assert cache.get("free", "pc") is None
+    assert cache.get("notice", "mobile") is None
+
+
+def test_ttl_expired_file(cache_dir):
+    """유지 시간이 지난 파일 캐시는 사용하지 않음"""
+    cache = RenderCache("latest", ttl=60)
+    cache.set("free", "pc", "free")
+
+    file_path = cache._file_path("free", "pc")
+    stat = os.stat(file_path)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 120 * 1_000_000_000))
+
+    assert RenderCache("latest", ttl=60).get("free", "pc") is None
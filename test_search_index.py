@@ -0,0 +1,136 @@
+"""
+전체검색 색인 테스트
+- n-gram 토큰 분리를 확인합니다.
+- 여러 게시판을 색인으로 한번에 검색하고, 작성/삭제시 색인이 갱신되는지 확인합니다.
+- 토큰만 일치하는 후보는 LIKE 조건으로 다시 확인하여 제외하는지 확인합니다.
+"""
+
+import os
+import sys
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from conftest import write_values
+from core.models import SearchIndexBoard, SearchIndexToken
+from lib.common import dynamic_create_write_table
+from lib.search_index import DBSearchIndex, tokenize, tokenize_query
+
+BO_TABLES = ["indexfree", "indexqa"]
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    SearchIndexToken.__table__.create(bind=engine)
+    SearchIndexBoard.__table__.create(bind=engine)
+    models = {}
+    for bo_table in BO_TABLES:
+        models[bo_table] = dynamic_create_write_table(bo_table)
+        models[bo_table].__table__.create(bind=engine)
+
+    session = sessionmaker(bind=engine)()
+    posts = {
+        "indexfree": [
+            (1, "대한민국 만세", "<p>대한민국의 수도는 서울</p>"),
+            (2, "오늘의 날씨", "서울은 맑음"),
+            (3, "Python 질문", "대한민국 python 모임"),
+        ],
+        "indexqa": [
+            (1, "서울 맛집", "대한민국 서울 맛집 추천"),
+        ],
+    }
+    for bo_table, rows in posts.items():
+        for wr_id, subject, content in rows:
+            session.add(models[bo_table](**write_values(wr_id=wr_id, wr_num=-wr_id, wr_parent=wr_id,
+                                                        wr_is_comment=0, wr_subject=subject, wr_content=content)))
+    session.commit()
+
+    index = DBSearchIndex()
+    for bo_table in BO_TABLES:
+        index.rebuild_board(session, bo_table)
+
+    yield session, engine, index, models
+    session.close()
+
+
+def test_tokenize():
+    """한글 2-gram 토큰 분리"""
+    assert tokenize("대한민국") == {"대한": 1, "한민": 1, "민국": 1}
+    assert tokenize("<b>서울</b> 서울") == {"서울": 2}
+    assert tokenize_query("대한민국") == {"대한", "한민", "민국"}
+    assert tokenize_query("a") is None
+
+
+def test_search_across_boards(db):
+    """여러 게시판을 하나의 쿼리로 검색하고 제목 일치가 상위에 위치"""
+    session, engine, index, _ = db
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    result = index.search(session, BO_TABLES, ["대한민국"], {"wr_subject", "wr_content"}, "and", 0, 10)
+
+    assert len(statements) == 1
+    assert result["counts"] == {"indexfree": 2, "indexqa": 1}
+    assert result["hits"][0][:2] == ("indexfree", 1)
+    assert {hit[:2] for hit in result["hits"]} == {("indexfree", 1), ("indexfree", 3), ("indexqa", 1)}
+
+
+def test_search_operator_and_fields(db):
+    """and/or 검색과 필드 제한"""
+    session, _, index, _ = db
+    both = index.search(session, BO_TABLES, ["서울", "맛집"], {"wr_subject", "wr_content"}, "and", 0, 10)
+    either = index.search(session, BO_TABLES, ["날씨", "맛집"], {"wr_subject", "wr_content"}, "or", 0, 10)
+    subject_only = index.search(session, BO_TABLES, ["서울"], {"wr_subject"}, "and", 0, 10)
+
+    assert {hit[:2] for hit in both["hits"]} == {("indexqa", 1)}
+    assert {hit[:2] for hit in either["hits"]} == {("indexfree", 2), ("indexqa", 1)}
+    assert {hit[:2] for hit in subject_only["hits"]} == {("indexqa", 1)}
+    # 색인으로 처리할 수 없는 검색은 None (LIKE 검색 사용)
+    assert index.search(session, BO_TABLES, ["서"], {"wr_subject"}, "and", 0, 10) is None
+    assert index.search(session, BO_TABLES, ["서울"], {"mb_id"}, "and", 0, 10) is None
+
+
+def test_candidates_rechecked_with_like(db):
+    """토큰은 모두 포함하지만 검색어가 없는 게시글은 제외 (LIKE 검색과 같은 결과)"""
+    session, _, index, models = db
+    # "서울산"의 토큰(서울, 울산)이 제목과 내용에 나뉘어 있음
+    post = models["indexfree"](**write_values(wr_id=4, wr_num=-4, wr_parent=4, wr_is_comment=0,
+                                             wr_subject="서울 여행", wr_content="울산 여행"))
+    session.add(post)
+    session.flush()
+    index.index_write(session, "indexfree", post)
+    session.commit()
+
+    result = index.search(session, BO_TABLES, ["서울산"], {"wr_subject", "wr_content"}, "and", 0, 10)
+    assert result == {"counts": {}, "hits": []}
+
+    post.wr_content = "서울산 여행"
+    index.index_write(session, "indexfree", post)
+    session.commit()
+    result = index.search(session, BO_TABLES, ["서울산"], {"wr_subject", "wr_content"}, "and", 0, 10)
+    assert [hit[:2] for hit in result["hits"]] == [("indexfree", 4)]
+
+
+def test_incremental_update(db):
+    """작성/수정/삭제시 색인 갱신"""
+    session, _, index, models = db
+    write = models["indexqa"](**write_values(wr_id=2, wr_num=-2, wr_parent=2, wr_is_comment=0,
+                                             wr_subject="부산 여행", wr_content=""))
+    session.add(write)
+    index.index_write(session, "indexqa", write)
+    session.commit()
+    assert index.search(session, ["indexqa"], ["부산"], {"wr_subject"}, "and", 0, 10)["counts"] == {"indexqa": 1}
+
+    write.wr_subject = "제주 여행"
+    index.index_write(session, "indexqa", write)
+    session.commit()
+    assert index.search(session, ["indexqa"], ["부산"], {"wr_subject"}, "and", 0, 10)["counts"] == {}
+
+    index.delete_write(session, "indexqa", 2)
+    session.commit()
+    assert index.search(session, ["indexqa"], ["제주"], {"wr_subject"}, "and", 0, 10)["counts"] == {}
+    assert index.is_ready(session, BO_TABLES) == set(BO_TABLES)
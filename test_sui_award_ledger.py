@@ -0,0 +1,106 @@
+"""
+SUIBOARD 토큰 지급 원장 테스트
+- 로그인 보상이 원장의 유니크키로 1일 1회만 대기열에 등록되는지 확인합니다.
+- 지급 전에 트랜잭션 로그를 날짜 함수로 조회하지 않는지 확인합니다.
+- 중복 지급으로 INSERT가 실패해도 같은 트랜잭션의 다른 변경은 유지되는지 확인합니다.
+- 원장 테이블 생성시 기존 트랜잭션 로그와 대기중인 발행 작업으로 원장을 채우는지 확인합니다.
+"""
+
+import asyncio
+import os
+import sys
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.models import SuiAwardLedger, SuiMintJob, SuiTransactionlog
+from service import sui_mint_queue_service
+from service.sui_award_ledger_service import create_award_ledger_table, record_daily_award
+from service.sui_token_service import SuiTokenService
+
+MEMBER = SimpleNamespace(mb_id="user", mb_sui_address="0x" + "ab" * 32)
+
+
+@pytest.fixture
+def session_factory(monkeypatch):
+    engine = create_engine("sqlite://")
+    for table in (SuiTransactionlog.__table__, SuiMintJob.__table__, SuiAwardLedger.__table__):
+        table.create(bind=engine)
+    factory = sessionmaker(bind=engine)
+
+    monkeypatch.setattr(sui_mint_queue_service, "DBConnect",
+                        lambda: SimpleNamespace(sessionLocal=factory, engine=engine))
+    return factory
+
+
+def award(db, member=MEMBER):
+    service = SuiTokenService(SimpleNamespace(), db)
+    return asyncio.run(service.award_login_tokens(member, amount=2))
+
+
+def test_award_once_per_day(session_factory):
+    """같은 날 여러 번 로그인해도 한번만 대기열에 등록함"""
+    with session_factory() as db:
+        assert award(db)
+
+        statements = []
+        event.listen(db.get_bind(), "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        assert award(db)
+        assert award(db)
+
+        jobs = db.scalars(select(SuiMintJob)).all()
+        ledgers = db.scalars(select(SuiAwardLedger)).all()
+        assert [(job.mb_id, job.smj_reason, job.smj_amount) for job in jobs] == [("user", "daily_login", 2)]
+        assert [(row.mb_id, row.sal_reason, row.sal_award_date) for row in ledgers] == \
+            [("user", "daily_login", date.today())]
+        # 중복 확인은 원장 INSERT로 처리 (트랜잭션 로그/대기열 조회 없음)
+        assert not any(SuiTransactionlog.__tablename__ in statement for statement in statements)
+        assert not any("date(" in statement.lower() for statement in statements)
+
+
+def test_backfill_from_transaction_log(session_factory):
+    """원장 테이블 생성시(마이그레이션) 기존 로그인 보상 로그와 대기중인 작업으로 원장을 채움"""
+    yesterday = datetime.now() - timedelta(days=1)
+    with session_factory() as db:
+        SuiAwardLedger.__table__.drop(bind=db.get_bind())
+        db.add_all([
+            SuiTransactionlog(mb_id="user", stl_amount=2, stl_reason="daily_login",
+                              stl_status="success", stl_datetime=yesterday),
+            SuiTransactionlog(mb_id="user", stl_amount=1, stl_reason="post_creation",
+                              stl_status="success", stl_datetime=yesterday),
+            SuiMintJob(mb_id="user", smj_recipient=MEMBER.mb_sui_address, smj_amount=2,
+                       smj_reason="daily_login", smj_status="pending", smj_attempts=0,
+                       smj_datetime=datetime.now()),
+        ])
+        db.commit()
+        create_award_ledger_table(db)
+
+        # 오늘 대기중인 작업이 있으므로 다시 등록하지 않음
+        assert award(db)
+
+        ledgers = db.scalars(select(SuiAwardLedger).order_by(SuiAwardLedger.sal_award_date)).all()
+        assert [(row.sal_reason, row.sal_award_date) for row in ledgers] == [
+            ("daily_login", yesterday.date()),
+            ("daily_login", date.today()),
+        ]
+        assert len(db.scalars(select(SuiMintJob)).all()) == 1
+
+
+def test_duplicate_keeps_outer_transaction(session_factory):
+    """중복 지급이면 SAVEPOINT만 rollback 하고 호출하는 쪽의 변경은 유지"""
+    with session_factory() as db:
+        assert record_daily_award(db, "user", "daily_login", 2)
+        db.commit()
+
+        db.add(SuiTransactionlog(mb_id="user", stl_amount=1, stl_reason="post_creation",
+                                 stl_status="success", stl_datetime=datetime.now()))
+        assert not record_daily_award(db, "user", "daily_login", 2)
+        db.commit()
+
+        assert [log.stl_reason for log in db.scalars(select(SuiTransactionlog)).all()] == ["post_creation"]
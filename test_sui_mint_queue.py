@@ -0,0 +1,290 @@
+"""
+SUIBOARD 토큰 일괄 발행/회수(PTB) 테스트
+- 실제 SUI CLI 대신 호출 인자를 기록하는 가짜 sui 실행파일을 사용합니다.
+- 수신자별로 합산된 발행량이 하나의 `sui client ptb` 호출로 전달되는지 확인합니다.
+- 회수(발행+소각)가 active-address 조회 없이 한 번의 호출로 처리되는지 확인합니다.
+- SUI CLI가 응답하지 않으면 시간 초과 후 SuiOutcomeUnknown이 발생하는지 확인합니다.
+- 처리중 상태로 남은 작업과 응답 시간 초과 작업을 다시 발행하지 않고 확인 필요 상태로 두는지 확인합니다.
+- 제출 후 기록에 실패해도 예약을 취소하거나 작업을 다시 대기시키지 않는지 확인합니다.
+- 제출 전 발행 실패시 예약을 취소하고 작업을 대기 상태로 되돌리는지 확인합니다.
+- 발행 한도 초과로 실패 처리한 작업이 발행 실패시에도 유지되는지 확인합니다.
+"""
+
+import json
+import os
+import stat
+import sys
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.models import (
+    SuiMintJob, SuiTransactionlog, TokenBudget, TokenReservation, TokenSupply
+)
+from core.settings import settings
+from lib.sui_service import (
+    SuiInteractionError, SuiOutcomeUnknown, mint_suiboard_token_batch, reclaim_suiboard_token
+)
+from service import sui_mint_queue_service, token_supply_service
+from service.sui_mint_queue_service import (
+    MINT_PROCESSING_TIMEOUT, enqueue_token_award, enqueue_token_reclaim, process_mint_jobs,
+    process_reclaim_jobs, resolve_unknown_jobs
+)
+
+TEST_DIGEST = "0x" + "ab" * 32
+
+FAKE_SUI_SCRIPT = f"""#!{sys.executable}
+import json, os, sys
+with open(os.environ["FAKE_SUI_LOG"], "a", encoding="utf-8") as f:
+    f.write(json.dumps(sys.argv[1:]) + "\\n")
+if os.environ.get("FAKE_SUI_SLEEP"):
+    import time
+    time.sleep(float(os.environ["FAKE_SUI_SLEEP"]))
+if os.environ.get("FAKE_SUI_FAIL"):
+    sys.stderr.write("fake failure")
+    sys.exit(1)
+print(json.dumps({{"digest": "{TEST_DIGEST}", "effects": {{"status": {{"status": "success"}}}}}}))
+"""
+
+
+@pytest.fixture
+def fake_sui(tmp_path, monkeypatch):
+    """가짜 sui 실행파일과 호출 기록 파일을 생성합니다."""
+    bin_path = tmp_path / "sui"
+    bin_path.write_text(FAKE_SUI_SCRIPT, encoding="utf-8")
+    bin_path.chmod(bin_path.stat().st_mode | stat.S_IEXEC)
+
+    log_path = tmp_path / "calls.log"
+    monkeypatch.setenv("FAKE_SUI_LOG", str(log_path))
+
+    config = {
+        "package_id": "0xpackage",
+        "treasury_cap_id": "0xtreasury",
+        "gas_budget": 1000,
+        "sui_bin_path": str(bin_path),
+    }
+    return config, log_path
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    """발행 대기열과 발행량 예약 테이블을 파일 DB에 생성합니다."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'queue.db'}")
+    tables = (SuiMintJob, SuiTransactionlog, TokenSupply, TokenBudget, TokenReservation)
+    for model in tables:
+        model.__table__.create(bind=engine)
+    factory = sessionmaker(bind=engine)
+
+    connect = lambda: SimpleNamespace(sessionLocal=factory, engine=engine)
+    for module in (sui_mint_queue_service, token_supply_service):
+        monkeypatch.setattr(module, "DBConnect", connect)
+    monkeypatch.setattr(settings, "TOKEN_DAILY_MINT_LIMIT", 0)
+    monkeypatch.setattr(settings, "TOKEN_MEMBER_DAILY_MINT_LIMIT", 0)
+    yield factory
+    engine.dispose()
+
+
+def fetch_jobs(factory):
+    with factory() as db:
+        return db.scalars(select(SuiMintJob).order_by(SuiMintJob.smj_id)).all()
+
+
+def read_calls(log_path):
+    with open(log_path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_batch_mint_single_ptb(fake_sui):
+    """여러 수신자의 발행이 한 번의 PTB 호출로 처리되는지 확인"""
+    config, log_path = fake_sui
+    awards = {"0xaaa": 3, "0xbbb": 1}
+
+    tx_hash = mint_suiboard_token_batch(awards, config)
+
+    assert tx_hash == TEST_DIGEST
+    calls = read_calls(log_path)
+    assert len(calls) == 1
+    args = calls[0]
+    assert args[:2] == ["client", "ptb"]
+    assert args.count("--move-call") == 2
+    assert ["0xpackage::suiboard_token::mint", "@0xtreasury", "3u64", "@0xaaa"] == args[3:7]
+    assert ["0xpackage::suiboard_token::mint", "@0xtreasury", "1u64", "@0xbbb"] == args[8:12]
+
+
+def test_batch_mint_failure(fake_sui, monkeypatch):
+    """CLI 실패시 SuiInteractionError 발생"""
+    config, _ = fake_sui
+    monkeypatch.setenv("FAKE_SUI_FAIL", "1")
+
+    with pytest.raises(SuiInteractionError):
+        mint_suiboard_token_batch({"0xaaa": 1}, config)
+
+
+def test_batch_mint_timeout(fake_sui, monkeypatch):
+    """CLI가 응답하지 않으면 cli_timeout 후 SuiOutcomeUnknown 발생 (실행되었을 수 있음)"""
+    config, _ = fake_sui
+    monkeypatch.setenv("FAKE_SUI_SLEEP", "5")
+
+    with pytest.raises(SuiOutcomeUnknown, match="시간 초과"):
+        mint_suiboard_token_batch({"0xaaa": 1}, {**config, "cli_timeout": 0.5})
+    with pytest.raises(SuiOutcomeUnknown, match="시간 초과"):
+        reclaim_suiboard_token(1, {**config, "cli_timeout": 0.5})
+
+
+def test_batch_mint_invalid_address(fake_sui):
+    """잘못된 주소는 CLI를 호출하지 않고 ValueError 발생"""
+    config, log_path = fake_sui
+
+    with pytest.raises(ValueError):
+        mint_suiboard_token_batch({"invalid": 1}, config)
+    assert not os.path.exists(log_path)
+
+
+def test_reclaim_single_ptb(fake_sui):
+    """회수는 발행+소각을 하나의 PTB로 실행"""
+    config, log_path = fake_sui
+
+    tx_hash = reclaim_suiboard_token(5, config)
+
+    assert tx_hash == TEST_DIGEST
+    calls = read_calls(log_path)
+    assert len(calls) == 1
+    args = calls[0]
+    assert args[:2] == ["client", "ptb"]
+    assert "active-address" not in args
+    assert args[3:8] == [
+        "0x2::coin::mint", "<0xpackage::suiboard_token::SUIBOARD_TOKEN>", "@0xtreasury", "5u64", "--assign"
+    ]
+    assert args[9:13] == [
+        "--move-call", "0xpackage::suiboard_token::burn", "@0xtreasury", "reclaim_coin"
+    ]
+
+
+def test_stale_processing_jobs_held(fake_sui, session_factory):
+    """처리중 상태로 MINT_PROCESSING_TIMEOUT 이 지난 작업은 다시 발행하지 않고 확인 필요 상태로 변경"""
+    config, log_path = fake_sui
+    stale_datetime = datetime.now() - timedelta(seconds=MINT_PROCESSING_TIMEOUT + 1)
+    with session_factory() as db:
+        for mb_id, claimed_datetime in (("stale", stale_datetime), ("running", datetime.now())):
+            job = enqueue_token_award(db, mb_id, "0xaaa", 1, "daily_login", commit=False)
+            job.smj_status = "processing"
+            job.smj_attempts = 1
+            job.smj_claimed_datetime = claimed_datetime
+        db.commit()
+
+    assert process_mint_jobs(sui_config=config) == 0
+
+    jobs = {job.mb_id: job for job in fetch_jobs(session_factory)}
+    assert (jobs["stale"].smj_status, jobs["stale"].smj_attempts) == ("unknown", 1)
+    assert jobs["running"].smj_status == "processing"
+    assert not os.path.exists(log_path)
+
+
+def test_timeout_holds_jobs_and_reservations(fake_sui, session_factory, monkeypatch):
+    """응답 시간 초과시 재시도하지 않고 예약을 유지, 확인 결과에 따라 확정"""
+    config, log_path = fake_sui
+    monkeypatch.setenv("FAKE_SUI_SLEEP", "5")
+    with session_factory() as db:
+        enqueue_token_award(db, "user", "0xaaa", 3, "daily_login")
+
+    process_mint_jobs(sui_config={**config, "cli_timeout": 0.5})
+    process_mint_jobs(sui_config={**config, "cli_timeout": 0.5})
+
+    [job] = fetch_jobs(session_factory)
+    assert job.smj_status == "unknown"
+    assert len(read_calls(log_path)) == 1
+    with session_factory() as db:
+        assert db.scalar(select(TokenReservation.tr_status)) == "reserved"
+        assert db.scalar(select(TokenSupply.total_minted)) == 3
+
+    assert resolve_unknown_jobs([job.smj_id], TEST_DIGEST) == 1
+
+    [job] = fetch_jobs(session_factory)
+    assert (job.smj_status, job.smj_tx_hash) == ("success", TEST_DIGEST)
+    with session_factory() as db:
+        assert db.scalar(select(TokenReservation.tr_status)) == "confirmed"
+
+
+def test_resolve_not_submitted_releases(session_factory):
+    """제출되지 않은 것으로 확인한 작업은 예약을 취소하고 대기 상태로 되돌림"""
+    with session_factory() as db:
+        job = enqueue_token_award(db, "user", "0xaaa", 3, "daily_login")
+        job.smj_status = "unknown"
+        job.smj_reservation_id = token_supply_service.reserve_tokens(3, "user")
+        db.commit()
+        smj_id = job.smj_id
+
+    assert resolve_unknown_jobs([smj_id]) == 1
+
+    [job] = fetch_jobs(session_factory)
+    assert (job.smj_status, job.smj_reservation_id) == ("pending", None)
+    with session_factory() as db:
+        assert db.scalar(select(TokenReservation.tr_status)) == "released"
+        assert db.scalar(select(TokenSupply.total_minted)) == 0
+
+
+def test_record_failure_after_submit_not_retried(fake_sui, session_factory, monkeypatch):
+    """발행/회수 후 기록에 실패하면 예약을 취소하거나 재시도하지 않고 다이제스트와 함께 확인 필요 상태로 변경"""
+    config, log_path = fake_sui
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(sui_mint_queue_service, "confirm_reservations", fail)
+    monkeypatch.setattr(sui_mint_queue_service, "add_burned_tokens", fail)
+    with session_factory() as db:
+        enqueue_token_award(db, "user", "0xaaa", 3, "daily_login")
+        enqueue_token_reclaim(db, "user", 1, "post_deletion")
+
+    process_mint_jobs(sui_config=config)
+    process_reclaim_jobs(sui_config=config)
+    process_mint_jobs(sui_config=config)
+    process_reclaim_jobs(sui_config=config)
+
+    assert len(read_calls(log_path)) == 2
+    for job in fetch_jobs(session_factory):
+        assert (job.smj_status, job.smj_tx_hash) == ("unknown", TEST_DIGEST)
+    with session_factory() as db:
+        assert db.scalar(select(TokenReservation.tr_status)) == "reserved"
+
+
+def test_unexpected_error_releases_and_requeues(session_factory, monkeypatch):
+    """예상하지 못한 오류도 발행량 예약을 취소하고 작업을 대기 상태로 되돌림"""
+    def fail(awards, sui_config):
+        raise RuntimeError("unexpected")
+
+    monkeypatch.setattr(sui_mint_queue_service, "mint_suiboard_token_batch", fail)
+    with session_factory() as db:
+        enqueue_token_award(db, "user", "0xaaa", 3, "daily_login")
+
+    assert process_mint_jobs(sui_config={}) == 1
+
+    [job] = fetch_jobs(session_factory)
+    assert (job.smj_status, job.smj_error_message) == ("pending", "unexpected")
+    with session_factory() as db:
+        assert db.scalar(select(TokenReservation.tr_status)) == "released"
+        assert db.scalar(select(TokenSupply.total_minted)) == 0
+
+
+def test_budget_failures_kept_after_mint_failure(fake_sui, session_factory, monkeypatch):
+    """발행 한도 초과로 실패한 작업은 이후 발행이 실패해도 실패 상태와 로그가 남음"""
+    config, _ = fake_sui
+    monkeypatch.setenv("FAKE_SUI_FAIL", "1")
+    monkeypatch.setattr(settings, "TOKEN_MEMBER_DAILY_MINT_LIMIT", 5)
+    with session_factory() as db:
+        enqueue_token_award(db, "user", "0xaaa", 3, "daily_login")
+        enqueue_token_award(db, "user", "0xaaa", 3, "post_creation")
+
+    assert process_mint_jobs(sui_config=config) == 2
+
+    allowed, exceeded = fetch_jobs(session_factory)
+    assert allowed.smj_status == "pending"
+    assert exceeded.smj_status == "failed"
+    with session_factory() as db:
+        logs = db.scalars(select(SuiTransactionlog)).all()
+        assert [(log.stl_reason, log.stl_status) for log in logs] == [("post_creation", "failed")]
@@ -0,0 +1,219 @@
+"""
+게시글 목록 섬네일 테스트
+- JPEG은 디코딩시 축소(draft), 그 외 이미지는 정수배 축소(reduce) 후 섬네일을 생성하는지 확인합니다.
+- 섬네일 목록에 있으면 원본 파일을 확인하지 않고 기록된 섬네일을 사용하는지 확인합니다.
+- 섬네일 목록에 있어도 섬네일 파일이 없으면 다시 생성하는지 확인합니다.
+- 섬네일 목록에 없으면 생성 후 섬네일 목록에 기록하는지, 생성 전에는 원본 대신 이미지 없음 섬네일을 출력하는지 확인합니다.
+- 첨부파일을 삭제하면 섬네일 목록도 삭제하는지 확인합니다.
+- 섬네일을 기록하면 최신글 캐시를 무효화하고, 생성중인 섬네일이 있는 최신글은 캐시하지 않는지 확인합니다.
+- 미리 생성할 섬네일 크기에 최신글 스킨의 크기가 포함되는지 확인합니다.
+"""
+
+import os
+import sys
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.models import BoardFile, ThumbnailManifest
+from core.settings import settings
+from lib import board_lib
+from lib.board_lib import get_list_thumbnail, render_latest_posts
+from lib.common import reduce_image, thumbnail
+from lib.render_cache import get_board_version, latest_cache
+from service.board_file_service import BoardFileService
+from service import thumbnail_service
+
+BO_TABLE = "gallery"
+REQUEST = SimpleNamespace(state=SimpleNamespace(config=SimpleNamespace(cf_image_extension="gif|jpg|jpeg|png")))
+BOARD = SimpleNamespace(bo_table=BO_TABLE)
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs(f"data/file/{BO_TABLE}")
+
+    engine = create_engine("sqlite://")
+    ThumbnailManifest.__table__.create(bind=engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(thumbnail_service, "DBConnect", lambda: SimpleNamespace(sessionLocal=factory, engine=engine))
+    monkeypatch.setattr(settings, "THUMBNAIL_WORKERS", 0)
+    return factory
+
+
+def make_write(source_file, manifest):
+    board_file = BoardFile(bo_table=BO_TABLE, wr_id=1, bf_no=0, bf_source="photo.jpg",
+                           bf_file=source_file, bf_content="사진")
+    return SimpleNamespace(wr_id=1, wr_content="", board_files=[board_file], thumbnail_manifest=manifest)
+
+
+def test_reduce_image(tmp_path):
+    """섬네일 크기보다 작아지지 않는 범위에서 축소"""
+    jpeg_file = tmp_path / "photo.jpg"
+    png_file = tmp_path / "photo.png"
+    Image.new("RGB", (1600, 1200), (255, 0, 0)).save(jpeg_file)
+    Image.new("RGB", (1600, 1200), (0, 255, 0)).save(png_file)
+
+    with Image.open(jpeg_file) as image:
+        reduced = reduce_image(image, 200, 150)
+        assert reduced.size == (200, 150)
+    with Image.open(png_file) as image:
+        reduced = reduce_image(image, 300, 150)
+        assert reduced.size == (320, 240)
+
+    thumbnail_file = thumbnail(str(jpeg_file), width=200, height=100)
+    with Image.open(thumbnail_file) as image:
+        assert image.size == (200, 100)
+
+
+def test_manifest_hit_without_filesystem(session_factory, monkeypatch):
+    """섬네일 목록에 대표 이미지의 섬네일이 있으면 섬네일 파일 외에는 파일시스템을 확인하지 않음"""
+    source_file = f"data/file/{BO_TABLE}/photo.jpg"
+    manifest = {(200, 150): ThumbnailManifest(tm_source=source_file, tm_thumbnail="thumb.jpg")}
+
+    def fail(*args, **kwargs):
+        raise AssertionError("filesystem access")
+
+    def exists(path):
+        assert path == "thumb.jpg"
+        return True
+
+    monkeypatch.setattr(os.path, "exists", exists)
+    monkeypatch.setattr(os.path, "getmtime", fail)
+
+    result = get_list_thumbnail(REQUEST, BOARD, make_write(source_file, manifest), 200, 150)
+
+    assert result == {"src": "thumb.jpg", "alt": "사진", "noimg": ""}
+
+
+def test_manifest_missing_thumbnail_file(session_factory):
+    """섬네일 목록에 있어도 섬네일 파일이 지워졌으면 다시 생성"""
+    source_file = f"data/file/{BO_TABLE}/photo.jpg"
+    Image.new("RGB", (800, 600), (0, 0, 255)).save(source_file)
+    manifest = {(200, 150): ThumbnailManifest(tm_source=source_file, tm_thumbnail="deleted.jpg")}
+
+    result = get_list_thumbnail(REQUEST, BOARD, make_write(source_file, manifest), 200, 150)
+
+    expected = os.path.join(f"data/file/{BO_TABLE}", "thumbnail_200x150_photo.jpg")
+    assert result["src"] == expected
+    assert os.path.exists(expected)
+
+
+def test_manifest_miss_shows_placeholder(session_factory, monkeypatch):
+    """섬네일 생성을 예약한 경우 생성될 때까지 원본 대신 이미지 없음 섬네일을 출력"""
+    source_file = f"data/file/{BO_TABLE}/photo.jpg"
+    Image.new("RGB", (800, 600), (0, 0, 255)).save(source_file)
+    monkeypatch.setattr("lib.board_lib.schedule_thumbnails", lambda *args: {})
+    monkeypatch.setattr("lib.board_lib.get_dummy_thumbnail", lambda width, height: f"dummy_{width}x{height}.png")
+    request = SimpleNamespace(state=SimpleNamespace(config=REQUEST.state.config))
+
+    result = get_list_thumbnail(request, BOARD, make_write(source_file, {}), 200, 150)
+
+    assert result["src"] == "dummy_200x150.png"
+    assert result["alt"] == "사진"
+    assert request.state.thumbnail_pending is True
+
+
+def test_manifest_miss_generates_and_records(session_factory):
+    """섬네일 목록에 없으면 생성하고 섬네일 목록에 기록"""
+    source_file = f"data/file/{BO_TABLE}/photo.jpg"
+    Image.new("RGB", (800, 600), (0, 0, 255)).save(source_file)
+
+    # 대표 이미지가 바뀐 경우 (기록된 원본 경로가 다름)
+    stale = {(200, 150): ThumbnailManifest(tm_source="data/file/old.jpg", tm_thumbnail="old.jpg")}
+    result = get_list_thumbnail(REQUEST, BOARD, make_write(source_file, stale), 200, 150)
+
+    expected = os.path.join(f"data/file/{BO_TABLE}", "thumbnail_200x150_photo.jpg")
+    assert result["src"] == expected
+    assert os.path.exists(expected)
+    with session_factory() as db:
+        rows = db.scalars(select(ThumbnailManifest)).all()
+        assert [(row.bo_table, row.wr_id, row.tm_width, row.tm_height, row.tm_source, row.tm_thumbnail)
+                for row in rows] == [(BO_TABLE, 1, 200, 150, source_file, expected)]
+
+        manifest_map = thumbnail_service.get_thumbnail_manifest_map(db, BO_TABLE, [1, 2])
+        assert manifest_map[2] == {}
+        assert manifest_map[1][(200, 150)].tm_thumbnail == expected
+
+
+def test_delete_board_file_deletes_manifest(session_factory):
+    """첨부파일을 삭제하면 게시글의 섬네일 목록도 삭제"""
+    source_file = f"data/file/{BO_TABLE}/photo.jpg"
+    Image.new("RGB", (800, 600), (0, 0, 255)).save(source_file)
+    with session_factory() as db:
+        BoardFile.__table__.create(bind=db.get_bind())
+        db.add(BoardFile(bo_table=BO_TABLE, wr_id=1, bf_no=0, bf_source="photo.jpg", bf_file=source_file,
+                         bf_content="", bf_filesize=0, bf_width=0, bf_height=0, bf_type=0, bf_datetime=datetime.now()))
+        db.commit()
+        thumbnail_service.save_thumbnail_manifest(db, BO_TABLE, 1, source_file, {(200, 150): "thumb.jpg"})
+        thumbnail_service.save_thumbnail_manifest(db, BO_TABLE, 2, "other.jpg", {(200, 150): "other.jpg"})
+
+        BoardFileService(REQUEST, db).delete_board_file(BO_TABLE, 1, 0)
+
+        rows = db.scalars(select(ThumbnailManifest)).all()
+        assert [row.wr_id for row in rows] == [2]
+
+
+def test_record_thumbnails_invalidates_latest_cache(session_factory):
+    """섬네일을 기록하면 게시판의 최신글 캐시를 무효화"""
+    version = get_board_version(BO_TABLE)
+
+    thumbnail_service._record_thumbnails(BO_TABLE, 1, "photo.jpg", {(210, 150): "thumb.jpg"})
+
+    assert get_board_version(BO_TABLE) != version
+
+
+def test_latest_with_pending_thumbnail_not_cached(session_factory, monkeypatch):
+    """생성중인 섬네일이 있는 최신글 HTML은 캐시하지 않음"""
+    pending = {"value": True}
+    board = SimpleNamespace(bo_table=BO_TABLE)
+    with session_factory() as db:
+        monkeypatch.setattr(db, "get", lambda model, bo_table: board)
+        monkeypatch.setattr(db, "scalars", lambda query: SimpleNamespace(all=lambda: []))
+        monkeypatch.setattr(board_lib, "DBConnect", lambda: SimpleNamespace(sessionLocal=lambda: db))
+        monkeypatch.setattr(board_lib, "BoardConfig", lambda request, board: SimpleNamespace(subject=""))
+
+        def template_response(name, context):
+            context["request"].state.thumbnail_pending = pending["value"]
+            return SimpleNamespace(body=b"<ul></ul>")
+
+        monkeypatch.setattr(board_lib.latest_templates, "TemplateResponse", template_response)
+        request = SimpleNamespace(state=SimpleNamespace(device="pc"))
+
+        assert render_latest_posts(request, "pic_block", BO_TABLE) == "<ul></ul>"
+        assert latest_cache.get(BO_TABLE, "pc-pic_block-10-40") is None
+
+        pending["value"] = False
+        render_latest_posts(request, "pic_block", BO_TABLE)
+        assert latest_cache.get(BO_TABLE, "pc-pic_block-10-40") == "<ul></ul>"
+
+
+def test_warm_sizes_include_latest_skins():
+    """미리 생성할 섬네일 크기에 게시판 목록과 최신글 스킨의 크기가 모두 포함"""
+    board = SimpleNamespace(bo_gallery_width=202, bo_gallery_height=150,
+                            bo_mobile_gallery_width=0, bo_mobile_gallery_height=0)
+
+    sizes = thumbnail_service.get_warm_thumbnail_sizes(board)
+
+    assert sizes[:2] == [(202, 150), (200, 150)]
+    assert set(thumbnail_service.LATEST_THUMBNAIL_SIZES) <= set(sizes)
+    assert len(sizes) == len(set(sizes))
+
+
+def test_shutdown_thumbnail_executor(monkeypatch):
+    """서버 종료시 섬네일 생성 프로세스 풀을 종료"""
+    monkeypatch.setattr(settings, "THUMBNAIL_WORKERS", 1)
+    executor = thumbnail_service._get_executor()
+
+    thumbnail_service.shutdown_thumbnail_executor()
+
+    assert thumbnail_service._executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(int)
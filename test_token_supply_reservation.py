@@ -0,0 +1,148 @@
+"""
+토큰 발행량 예약 동시성 테스트
+- 여러 스레드에서 동시에 예약/취소해도 최대 발행량과 발행 한도를 넘지 않고
+  총 발행량이 예약 합계와 일치하는지 확인합니다.
+- SQLite(파일 DB)로 실행하며, TOKEN_SUPPLY_TEST_DATABASE_URL 환경변수에
+  PostgreSQL 주소를 지정하면 PostgreSQL로도 실행합니다.
+"""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.models import TokenBudget, TokenReservation, TokenSupply
+from core.settings import settings
+from service import token_supply_service
+from service.token_supply_service import (
+    TokenBudgetExceeded, release_reservations, reserve_tokens
+)
+
+THREADS = 16
+POSTGRES_URL = os.getenv("TOKEN_SUPPLY_TEST_DATABASE_URL")
+
+
+@pytest.fixture(params=["sqlite", "postgresql"])
+def session_factory(request, tmp_path, monkeypatch):
+    if request.param == "sqlite":
+        engine = create_engine(f"sqlite:///{tmp_path / 'token.db'}",
+                               connect_args={"check_same_thread": False, "timeout": 30})
+    elif POSTGRES_URL:
+        engine = create_engine(POSTGRES_URL, pool_size=THREADS)
+    else:
+        pytest.skip("TOKEN_SUPPLY_TEST_DATABASE_URL is not set")
+
+    tables = [TokenSupply.__table__, TokenBudget.__table__, TokenReservation.__table__]
+    for table in tables:
+        table.drop(bind=engine, checkfirst=True)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(token_supply_service, "DBConnect",
+                        lambda: SimpleNamespace(sessionLocal=factory, engine=engine))
+    monkeypatch.setattr(settings, "TOKEN_DAILY_MINT_LIMIT", 0)
+    monkeypatch.setattr(settings, "TOKEN_MEMBER_DAILY_MINT_LIMIT", 0)
+    for table in tables:
+        table.create(bind=engine)
+    yield factory
+
+    for table in reversed(tables):
+        table.drop(bind=engine, checkfirst=True)
+    engine.dispose()
+
+
+def set_max_supply(factory, max_supply):
+    with factory() as db:
+        supply = token_supply_service.get_supply_record(db)
+        supply.max_supply = max_supply
+        db.commit()
+
+
+def try_reserve(amount, mb_id=""):
+    try:
+        return reserve_tokens(amount, mb_id)
+    except TokenBudgetExceeded:
+        return None
+
+
+def run_concurrently(func, args_list):
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        return list(executor.map(lambda args: func(*args), args_list))
+
+
+def fetch_state(factory):
+    with factory() as db:
+        supply = db.scalar(select(TokenSupply))
+        reserved = db.scalar(
+            select(func.coalesce(func.sum(TokenReservation.tr_amount), 0))
+            .where(TokenReservation.tr_status != "released")
+        )
+        budgets = {row.tb_key: row.tb_used for row in db.scalars(select(TokenBudget)).all()}
+        return supply.total_minted, supply.max_supply, reserved, budgets
+
+
+def test_concurrent_reserve_respects_max_supply(session_factory):
+    """동시에 예약해도 최대 발행량까지만 예약되고 증가량이 누락되지 않음"""
+    set_max_supply(session_factory, 100)
+
+    results = run_concurrently(try_reserve, [(3,)] * 80)
+
+    succeeded = [tr_id for tr_id in results if tr_id]
+    total_minted, max_supply, reserved, _ = fetch_state(session_factory)
+    assert len(succeeded) == 33
+    assert len(set(succeeded)) == len(succeeded)
+    assert total_minted == reserved == 99
+    assert total_minted <= max_supply
+
+
+def test_concurrent_reserve_and_release(session_factory):
+    """예약과 취소가 섞여도 총 발행량이 취소되지 않은 예약 합계와 일치함"""
+    set_max_supply(session_factory, 200)
+
+    def reserve_and_release(no):
+        tr_id = try_reserve(no % 5 + 1)
+        if tr_id and no % 2:
+            release_reservations([tr_id])
+        return tr_id
+
+    run_concurrently(reserve_and_release, [(no,) for no in range(120)])
+
+    total_minted, max_supply, reserved, _ = fetch_state(session_factory)
+    assert total_minted == reserved
+    assert total_minted <= max_supply
+
+
+def test_concurrent_budgets(session_factory, monkeypatch):
+    """일일 전체/회원별 발행 한도를 넘지 않음"""
+    monkeypatch.setattr(settings, "TOKEN_DAILY_MINT_LIMIT", 30)
+    monkeypatch.setattr(settings, "TOKEN_MEMBER_DAILY_MINT_LIMIT", 10)
+    members = [f"user{no}" for no in range(5)]
+
+    results = run_concurrently(try_reserve, [(1, mb_id) for mb_id in members * 20])
+
+    total_minted, _, reserved, budgets = fetch_state(session_factory)
+    assert len([tr_id for tr_id in results if tr_id]) == 30
+    assert total_minted == reserved == 30
+    daily = [used for key, used in budgets.items() if key.startswith("daily:")]
+    assert daily == [30]
+    member_used = [used for key, used in budgets.items() if key.startswith("member:")]
+    assert len(member_used) == len(members)
+    assert all(used <= 10 for used in member_used)
+    assert sum(member_used) == 30
+
+
+def test_concurrent_release_is_idempotent(session_factory, monkeypatch):
+    """같은 예약을 동시에 여러 번 취소해도 한번만 되돌림"""
+    monkeypatch.setattr(settings, "TOKEN_DAILY_MINT_LIMIT", 100)
+    tr_ids = [reserve_tokens(2, "user") for _ in range(5)]
+
+    released = run_concurrently(release_reservations, [(tr_ids,)] * THREADS)
+
+    total_minted, _, reserved, budgets = fetch_state(session_factory)
+    assert sum(released) == len(tr_ids)
+    assert total_minted == reserved == 0
+    assert all(used == 0 for used in budgets.values())
@@ -0,0 +1,131 @@
+"""
+사용자 템플릿(UserTemplates) 테스트
+- PC/모바일 요청이 번갈아 와도 각 템플릿 환경의 로더를 바꾸지 않고, 컴파일된 템플릿 캐시가 유지되는지 확인합니다.
+- 테마 변경시(set_directories) PC/모바일 로더를 다시 생성하고 캐시를 비우는지 확인합니다.
+- 바이트코드 캐시 설정시 컴파일된 템플릿을 파일로 저장하고, 캐시 디렉토리가 삭제되어도 다시 생성하는지 확인합니다.
+"""
+
+import os
+import shutil
+import sys
+
+import pytest
+from jinja2 import Environment, FileSystemLoader
+from starlette.requests import Request
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core import template
+from core.settings import settings
+from core.template import TemplateBytecodeCache, TemplateService, UserTemplates
+
+
+def make_theme(path, name):
+    """PC/모바일 템플릿이 있는 테마 디렉토리를 생성한다."""
+    os.makedirs(path / "mobile")
+    (path / "page.html").write_text(f"{name} pc {{{{ value }}}}", encoding="utf-8")
+    (path / "mobile" / "page.html").write_text(f"{name} mobile {{{{ value }}}}", encoding="utf-8")
+    (path / "pc_only.html").write_text(f"{name} pc only", encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def templates(tmp_path, monkeypatch):
+    """테스트 테마를 사용하는 새 UserTemplates (싱글톤 초기화)"""
+    theme_dir = make_theme(tmp_path / "theme", "basic")
+    monkeypatch.setattr(UserTemplates, "_instance", None)
+    monkeypatch.setattr(UserTemplates, "mobile_env", None)
+    monkeypatch.setattr(UserTemplates, "default_directories", [theme_dir])
+    monkeypatch.setattr(TemplateService, "_templates_dir", theme_dir)
+    monkeypatch.setattr(settings, "IS_RESPONSIVE", False)
+    monkeypatch.setattr(settings, "TEMPLATE_BYTECODE_CACHE", False)
+    return UserTemplates()
+
+
+def render(templates, name, is_mobile, value="1"):
+    request = Request({"type": "http", "method": "GET", "path": "/", "query_string": b"", "headers": []})
+    request.state.is_mobile = is_mobile
+    response = templates.TemplateResponse(name, {"request": request, "value": value})
+    return response.body.decode("utf-8")
+
+
+def test_alternating_devices_keep_loaders_and_caches(templates):
+    """PC/모바일 요청이 번갈아 와도 로더를 바꾸지 않고 컴파일된 템플릿을 재사용"""
+    env, mobile_env = templates.env, templates.mobile_env
+    pc_loader, mobile_loader = env.loader, mobile_env.loader
+
+    assert render(templates, "page.html", False) == "basic pc 1"
+    assert render(templates, "page.html", True) == "basic mobile 1"
+    pc_template = env.get_template("page.html")
+    mobile_template = mobile_env.get_template("page.html")
+    assert pc_template is not mobile_template
+
+    for no in range(3):
+        assert render(templates, "page.html", False, no) == f"basic pc {no}"
+        assert render(templates, "page.html", True, no) == f"basic mobile {no}"
+
+    assert env.loader is pc_loader
+    assert mobile_env.loader is mobile_loader
+    assert env.get_template("page.html") is pc_template
+    assert mobile_env.get_template("page.html") is mobile_template
+    # 모바일 환경은 PC 환경의 필터/전역 설정을 공유
+    assert mobile_env.filters["number_format"] is env.filters["number_format"]
+    assert mobile_env.globals["theme_asset"] is env.globals["theme_asset"]
+
+
+def test_mobile_falls_back_to_pc_template(templates):
+    """모바일 템플릿이 없으면 PC 템플릿을 사용"""
+    assert render(templates, "pc_only.html", True) == "basic pc only"
+    assert render(templates, "pc_only.html", False) == "basic pc only"
+
+
+def test_responsive_uses_pc_environment(templates, monkeypatch):
+    """적응형(IS_RESPONSIVE) 설정시 모바일 요청도 PC 템플릿 사용"""
+    monkeypatch.setattr(settings, "IS_RESPONSIVE", True)
+
+    assert render(templates, "page.html", True) == "basic pc 1"
+
+
+def test_set_directories(templates, tmp_path, monkeypatch):
+    """테마 변경시 PC/모바일 로더를 새 경로로 다시 생성하고 캐시를 비움"""
+    render(templates, "page.html", False)
+    render(templates, "page.html", True)
+    assert templates.env.cache and templates.mobile_env.cache
+
+    theme_dir = make_theme(tmp_path / "other", "other")
+    monkeypatch.setattr(TemplateService, "_templates_dir", theme_dir)
+    templates.set_directories([theme_dir])
+
+    assert not templates.env.cache and not templates.mobile_env.cache
+    assert templates.env.loader.searchpath == [theme_dir]
+    assert templates.mobile_env.loader.searchpath == [f"{theme_dir}/mobile", theme_dir]
+    assert render(templates, "page.html", False) == "other pc 1"
+    assert render(templates, "page.html", True) == "other mobile 1"
+
+
+def test_bytecode_cache(tmp_path, monkeypatch):
+    """바이트코드 캐시 설정시 컴파일된 템플릿을 파일로 저장하고 삭제된 디렉토리를 다시 생성"""
+    cache_dir = str(tmp_path / "jinja")
+    monkeypatch.setattr(template, "TEMPLATE_BYTECODE_CACHE_DIR", cache_dir)
+    monkeypatch.setattr(template, "_bytecode_cache", None)
+
+    monkeypatch.setattr(settings, "TEMPLATE_BYTECODE_CACHE", False)
+    assert template.get_bytecode_cache() is None
+
+    monkeypatch.setattr(settings, "TEMPLATE_BYTECODE_CACHE", True)
+    bytecode_cache = template.get_bytecode_cache()
+    assert isinstance(bytecode_cache, TemplateBytecodeCache)
+    assert template.get_bytecode_cache() is bytecode_cache
+
+    theme_dir = make_theme(tmp_path / "theme", "basic")
+    shutil.rmtree(cache_dir)  # 관리자 캐시파일 일괄삭제
+    env = Environment(loader=FileSystemLoader(theme_dir), bytecode_cache=bytecode_cache)
+    assert env.get_template("page.html").render(value=1) == "basic pc 1"
+    assert os.listdir(cache_dir)
+
+    # 새 환경(워커 재시작)은 저장된 바이트코드를 사용
+    compiled = []
+    monkeypatch.setattr(Environment, "compile", lambda *args, **kwargs: compiled.append(args))
+    env = Environment(loader=FileSystemLoader(theme_dir), bytecode_cache=bytecode_cache)
+    assert env.get_template("page.html").render(value=2) == "basic pc 2"
+    assert not compiled
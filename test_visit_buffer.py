@@ -0,0 +1,153 @@
+"""
+방문자 이력 버퍼 일괄 저장 테스트
+- 버퍼/DB에 이미 기록된 (날짜, IP)는 다시 저장하지 않는지 확인합니다.
+- 방문자 합계와 기본설정의 방문자 수가 집계 쿼리 없이 누적 갱신되는지 확인합니다.
+- 버퍼 저장시 기본환경설정 캐시를 무효화하지 않는지 확인합니다.
+- 버퍼가 가득 차면 이력을 버리고 개수를 기록하며, 저장 실패시 최대 크기를 넘겨 다시 넣지 않는지 확인합니다.
+"""
+
+import os
+import sys
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import lib.visit
+from core.models import Config, Visit, VisitSum
+from lib import config_cache
+from service import visit_service
+from service.visit_service import VisitBuffer, VisitService, save_visits
+
+TODAY = date.today()
+YESTERDAY = TODAY - timedelta(days=1)
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0 Safari/537.36"
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    for table in (Config.__table__, Visit.__table__, VisitSum.__table__):
+        table.create(bind=engine)
+
+    session = sessionmaker(bind=engine)()
+    session.add(Config(cf_id=1, cf_visit="오늘:1,어제:7,최대:9,전체:100"))
+    session.add(VisitSum(vs_date=TODAY, vs_count=1))
+    session.add(VisitSum(vs_date=YESTERDAY, vs_count=7))
+    session.add(Visit(vi_ip="10.0.0.1", vi_date=TODAY, vi_time=datetime.now().time(),
+                      vi_referer="", vi_agent=USER_AGENT))
+    session.commit()
+
+    yield session
+    session.close()
+
+
+def make_visit(ip, visit_date=TODAY):
+    return {
+        "vi_ip": ip,
+        "vi_date": visit_date,
+        "vi_time": datetime.now().time(),
+        "vi_referer": "https://www.example.com/",
+        "vi_agent": USER_AGENT,
+    }
+
+
+def test_save_visits_skips_duplicates(db):
+    """버퍼 내 중복과 이미 기록된 IP는 저장하지 않음"""
+    visits = [make_visit("10.0.0.1"), make_visit("10.0.0.2"), make_visit("10.0.0.2"), make_visit("10.0.0.3")]
+
+    assert save_visits(db, visits) == 2
+    assert db.scalar(select(func.count(Visit.vi_id))) == 3
+    visit = db.scalar(select(Visit).where(Visit.vi_ip == "10.0.0.2"))
+    assert visit.vi_browser == "Chrome"
+    assert visit.vi_device == "pc"
+
+
+def test_save_visits_increases_counts(db):
+    """방문자 합계와 cf_visit을 누적 갱신"""
+    save_visits(db, [make_visit(f"10.0.1.{no}") for no in range(10)])
+
+    assert db.scalar(select(VisitSum.vs_count).where(VisitSum.vs_date == TODAY)) == 11
+    visit = VisitService.parse_visit_data(db.scalar(select(Config.cf_visit)))
+    assert visit == {"today": 11, "yesterday": 7, "max": 11, "total": 110}
+
+
+def test_save_visits_creates_visit_sum(db):
+    """방문자 합계가 없는 날짜는 새로 생성"""
+    old_date = TODAY - timedelta(days=10)
+    save_visits(db, [make_visit("10.0.2.1", old_date)])
+
+    assert db.scalar(select(VisitSum.vs_count).where(VisitSum.vs_date == old_date)) == 1
+    visit = VisitService.parse_visit_data(db.scalar(select(Config.cf_visit)))
+    assert visit["total"] == 101
+
+
+def test_buffer_push_dedupes():
+    """같은 날 같은 IP는 버퍼에 한번만 추가"""
+    buffer = VisitBuffer()
+    buffer.push(make_visit("10.0.3.1"))
+    buffer.push(make_visit("10.0.3.1"))
+    buffer.push(make_visit("10.0.3.2"))
+
+    assert len(buffer._visits) == 2
+
+
+def test_flush_keeps_config_cache(db, monkeypatch, tmp_path):
+    """버퍼 저장시 기본환경설정 캐시를 무효화하지 않고, 방문자 수는 DB에서 조회"""
+    connect = lambda: SimpleNamespace(sessionLocal=sessionmaker(bind=db.get_bind()))
+    monkeypatch.setattr(visit_service, "DBConnect", connect)
+    monkeypatch.setattr(lib.visit, "DBConnect", connect)
+    monkeypatch.chdir(tmp_path)
+    lib.visit.get_total_visit.cache_clear()
+
+    buffer = VisitBuffer()
+    buffer.push(make_visit("10.0.4.1"))
+    assert buffer.flush() == 1
+    assert not os.path.exists(config_cache.CONFIG_VERSION_FILE_PATH)
+    assert lib.visit.get_total_visit() == {"today": 2, "yesterday": 7, "max": 9, "total": 101}
+    lib.visit.get_total_visit.cache_clear()
+
+
+def test_buffer_full_drops_and_counts(caplog):
+    """버퍼가 가득 차면 기존 이력은 유지하고 새 이력을 버린 수를 기록"""
+    buffer = VisitBuffer(max_size=2)
+    for no in range(4):
+        buffer.push(make_visit(f"10.0.5.{no}"))
+
+    assert [visit["vi_ip"] for visit in buffer._visits] == ["10.0.5.0", "10.0.5.1"]
+    assert buffer.dropped == 2
+    assert "가득" in caplog.text
+
+    # 버린 IP는 다음 방문시 다시 추가할 수 있음
+    buffer._visits.clear()
+    buffer.push(make_visit("10.0.5.3"))
+    assert [visit["vi_ip"] for visit in buffer._visits] == ["10.0.5.3"]
+
+
+def test_failed_flush_requeues_within_capacity(monkeypatch):
+    """저장 실패시 버퍼의 남은 공간만큼만 다시 넣고 나머지는 버린 수로 기록"""
+    def fail():
+        raise RuntimeError("db down")
+    monkeypatch.setattr(visit_service, "DBConnect", fail)
+
+    buffer = VisitBuffer(max_size=3)
+    for no in range(3):
+        buffer.push(make_visit(f"10.0.6.{no}"))
+
+    # 저장하는 동안 새 방문자가 추가되는 상황
+    original_requeue = buffer._requeue
+
+    def requeue(visits):
+        buffer.push(make_visit("10.0.6.9"))
+        buffer.push(make_visit("10.0.6.8"))
+        original_requeue(visits)
+    monkeypatch.setattr(buffer, "_requeue", requeue)
+
+    assert buffer.flush() == 0
+    assert len(buffer._visits) == 3
+    assert [visit["vi_ip"] for visit in buffer._visits] == ["10.0.6.0", "10.0.6.9", "10.0.6.8"]
+    assert buffer.dropped == 2
@@ -0,0 +1,101 @@
+"""
+방문자 집계(rollup) 테스트
+- 새로 기록된 방문자 이력만 집계에 누적되는지 확인합니다.
+- 집계 결과가 방문자 이력을 직접 합산한 결과와 같은지 확인합니다.
+- 최근 방문자 이력은 늦게 커밋된 이력을 건너뛰지 않도록 다음 집계로 미루는지 확인합니다.
+"""
+
+import os
+import sys
+from collections import Counter
+from datetime import date, datetime, time, timedelta
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.models import Visit, VisitRollup, VisitRollupState, VisitSum
+from service.visit_rollup_service import delete_visit_rollups, get_rollup_counts, rollup_visits
+
+AGENTS = [
+    ("Chrome", "Windows", "pc", "https://www.google.com/search?q=a"),
+    ("Chrome", "Android", "mobile", ""),
+    ("Safari", "iOS", "mobile", "https://m.naver.com/"),
+]
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    for table in (Visit.__table__, VisitSum.__table__, VisitRollup.__table__, VisitRollupState.__table__):
+        table.create(bind=engine)
+
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def add_visits(db, visit_date: date, count: int):
+    for i in range(count):
+        browser, os_name, device, referer = AGENTS[i % len(AGENTS)]
+        db.add(Visit(vi_ip=f"10.0.0.{i}", vi_date=visit_date, vi_time=time(12, 0),
+                     vi_referer=referer, vi_agent="", vi_browser=browser, vi_os=os_name, vi_device=device))
+    db.commit()
+
+
+def test_rollup_is_incremental(db):
+    """새로 추가된 이력만 누적"""
+    add_visits(db, date(2024, 1, 1), 30)
+    assert rollup_visits(db) == 30
+    assert rollup_visits(db) == 0
+
+    add_visits(db, date(2024, 1, 1), 3)
+    add_visits(db, date(2024, 1, 2), 6)
+    assert rollup_visits(db) == 9
+
+    browsers = {row["value"]: row["count"] for row in get_rollup_counts(db, "browser", "2024-01-01", "2024-01-02")}
+    raw = Counter(db.scalars(select(Visit.vi_browser)).all())
+    assert browsers == dict(raw)
+
+    devices = get_rollup_counts(db, "device", "2024-01-02", "2024-01-02")
+    assert devices == [{"value": "mobile", "count": 4}, {"value": "pc", "count": 2}]
+
+    referers = {row["value"]: row["count"] for row in get_rollup_counts(db, "referer", "2024-01-01", "2024-01-01")}
+    assert referers == {"https://www.google.com/search?q=a": 11, "": 11, "https://m.naver.com/": 11}
+
+
+def test_recent_visits_wait_for_safety_lag(db):
+    """늦게 커밋된 이력(작은 vi_id)을 건너뛰지 않도록 최근 이력은 집계 위치를 옮기지 않음"""
+    add_visits(db, date(2024, 1, 1), 3)
+    now = datetime.now()
+    # vi_id 4번 이력은 아직 커밋되지 않았다고 가정 (5번 이력만 먼저 커밋)
+    db.add(Visit(vi_id=5, vi_ip="10.0.1.5", vi_date=now.date(), vi_time=now.time(),
+                 vi_referer="", vi_agent="", vi_browser="Chrome", vi_os="Android", vi_device="mobile"))
+    db.commit()
+
+    assert rollup_visits(db, safety_lag=60) == 3
+    assert db.scalar(select(VisitRollupState.vrs_last_vi_id)) == 3
+
+    # 늦게 커밋된 4번 이력도 집계됨
+    db.add(Visit(vi_id=4, vi_ip="10.0.1.4", vi_date=now.date(), vi_time=now.time(),
+                 vi_referer="", vi_agent="", vi_browser="Safari", vi_os="iOS", vi_device="mobile"))
+    db.commit()
+    assert rollup_visits(db, safety_lag=0) == 2
+    today = now.date().isoformat()
+    browsers = {row["value"]: row["count"] for row in get_rollup_counts(db, "browser", today, today)}
+    assert browsers == {"Chrome": 1, "Safari": 1}
+
+
+def test_delete_rollups(db):
+    """이력 삭제시 같은 기간의 집계 삭제"""
+    add_visits(db, date(2024, 1, 31), 3)
+    add_visits(db, date(2024, 2, 1), 3)
+    rollup_visits(db)
+
+    delete_visit_rollups(db, year=2024, month=1)
+    db.commit()
+
+    assert get_rollup_counts(db, "os", "2024-01-01", "2024-01-31") == []
+    assert sum(row["count"] for row in get_rollup_counts(db, "os", "2024-02-01", "2024-02-29")) == 3
@@ -0,0 +1,97 @@
+"""
+댓글 검색 필터 벤치마크
+- 대용량 게시판을 생성하고, 일치하는 댓글을 Python으로 가져와 IN (...) 목록을 만드는 기존 방식과
+  서브쿼리(semi-join) 방식의 메모리 사용량과 실행 시간을 비교합니다.
+- 측정 결과는 record_property로 기록됩니다. (pytest --junitxml 사용시 확인 가능)
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.orm import sessionmaker
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from conftest import create_write_board, write_values
+from lib.board_lib import write_search_filter
+
+BO_TABLE = "benchsearch"
+POST_COUNT = 2000
+COMMENTS_PER_POST = 10
+SEARCH_FIELD = "wr_content,0"
+KEYWORD = "common"
+
+
+@pytest.fixture(scope="module")
+def large_board():
+    """모든 댓글에 검색어가 포함된 대용량 게시판"""
+    engine, write_model = create_write_board(BO_TABLE)
+
+    rows = []
+    wr_id = 0
+    for post in range(1, POST_COUNT + 1):
+        wr_id += 1
+        parent_id = wr_id
+        rows.append(write_values(wr_id=parent_id, wr_num=-post, wr_parent=parent_id,
+                                 wr_is_comment=0, wr_subject=f"post {post}", wr_content="body"))
+        for no in range(COMMENTS_PER_POST):
+            wr_id += 1
+            rows.append(write_values(wr_id=wr_id, wr_num=-post, wr_parent=parent_id, wr_is_comment=1,
+                                     wr_comment=no, wr_content=f"{KEYWORD} comment {no} " + "x" * 200))
+
+    session = sessionmaker(bind=engine)()
+    session.execute(insert(write_model), rows)
+    session.commit()
+    yield session, write_model
+    session.close()
+
+
+def legacy_comment_search(db, model):
+    """기존 방식: 일치하는 댓글 전체를 가져와 wr_parent 목록으로 IN 조건 생성"""
+    query = select().where(model.wr_content.like(f"%{KEYWORD}%"), model.wr_is_comment == 1)
+    parents = db.scalars(query.add_columns(model)).all()
+    return select().where(model.wr_id.in_([row.wr_parent for row in parents]))
+
+
+def measure(func):
+    """함수 실행의 최대 메모리 사용량(byte)과 실행 시간(초)을 측정"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak, elapsed
+
+
+def test_comment_search_semi_join(large_board, record_property):
+    """서브쿼리 방식은 댓글을 메모리로 가져오지 않고 같은 결과를 반환"""
+    db, model = large_board
+
+    def run_legacy():
+        query = legacy_comment_search(db, model)
+        result = db.scalars(query.add_columns(model.wr_id).order_by(model.wr_id)).all()
+        db.expunge_all()
+        return result
+
+    def run_semi_join():
+        query = write_search_filter(model, search_field=SEARCH_FIELD, keyword=KEYWORD)
+        return db.scalars(query.add_columns(model.wr_id).order_by(model.wr_id)).all()
+
+    legacy_ids, legacy_peak, legacy_time = measure(run_legacy)
+    semi_join_ids, semi_join_peak, semi_join_time = measure(run_semi_join)
+
+    record_property("legacy_peak_bytes", legacy_peak)
+    record_property("legacy_seconds", round(legacy_time, 4))
+    record_property("semi_join_peak_bytes", semi_join_peak)
+    record_property("semi_join_seconds", round(semi_join_time, 4))
+    print(f"\nlegacy: {legacy_peak / 1024:.0f}KiB {legacy_time:.3f}s, "
+          f"semi-join: {semi_join_peak / 1024:.0f}KiB {semi_join_time:.3f}s")
+
+    assert semi_join_ids == legacy_ids
+    assert len(semi_join_ids) == POST_COUNT
+    assert semi_join_peak < legacy_peak
@@ -0,0 +1,38 @@
+"""
+섬네일 미리 생성 스크립트
+- 게시판 게시글의 목록 섬네일(갤러리 PC/모바일 크기)과 최신글 스킨 크기의 섬네일을
+  프로세스 풀에서 생성하고 섬네일 목록에 기록합니다.
+- 이미 섬네일 목록에 있는 섬네일은 생성하지 않으므로 여러 번 실행해도 됩니다.
+
+사용법:
+    python warm_thumbnails.py                     # 전체 게시판
+    python warm_thumbnails.py --bo-table gallery  # 지정한 게시판
+    python warm_thumbnails.py --workers 4         # 프로세스 수 지정
+"""
+import argparse
+import logging
+
+from lib.config_cache import get_cached_config
+from service.thumbnail_service import warm_thumbnails
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게시판 게시글의 목록 섬네일을 미리 생성합니다.")
+    parser.add_argument("--bo-table", action="append", dest="bo_tables", help="게시판 테이블명 (여러 번 지정 가능)")
+    parser.add_argument("--workers", type=int, default=None, help="섬네일 생성 프로세스 수")
+    args = parser.parse_args()
+
+    config = get_cached_config()
+    if not config:
+        logger.error("기본환경설정이 없습니다. 설치 후 실행해주세요.")
+        return
+
+    warmed = warm_thumbnails(config.cf_image_extension, args.bo_tables, args.workers)
+    logger.info(f"섬네일을 생성한 게시글: {warmed}개")
+
+
+if __name__ == "__main__":
+    main()